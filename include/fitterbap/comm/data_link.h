@@ -123,6 +123,17 @@
  * skipped frame, it replies with ACK_ALL with the most recent frame_id
  * corresponding with no skips.
  *
+ * When both sides support ACK_BITMAP, which port0 negotiates using
+ * fbp_dl_tx_ack_bitmap_set(), the receiver replaces the per-frame
+ * NACK_FRAME_ID and ACK_ONE responses with a single ACK_BITMAP.
+ * The ACK_BITMAP contains the ACK_ALL frame_id along with a bitmap of the
+ * stored future frames.  The receiver constructs the ACK_BITMAP when
+ * it is sent, so multiple updates pending transmission
+ * coalesce into one link frame.  Since the byte stream preserves order,
+ * the transmitter immediately retransmits each missing frame that it sent
+ * before any acknowledged frame.  A burst error that drops several frames
+ * then costs a single link frame and a single round trip.
+ *
  * If the receiver receives a framing error,
  * it immediately sends a NACK_FRAMING_ERROR containing the frame_id
  * of the expected frame.
@@ -137,6 +148,26 @@
  * The transmitter will retransmit indefinitely, but will indicate an
  * error after a threshold.
  *
+ * The retransmit timeout adapts to the link.  The transmitter measures
+ * the round-trip time from each frame transmission to its acknowledgement
+ * and maintains a smoothed round-trip time and mean deviation
+ * (Jacobson/Karels).  Retransmitted frames do not provide samples (Karn).
+ * The timeout is the smoothed round-trip time plus four times the deviation,
+ * starting from fbp_dl_config_s.tx_timeout.  Each timeout doubles the
+ * retransmit timeout until the next valid sample.  The timeout is limited
+ * to the reset timeout, 16 * fbp_dl_config_s.tx_timeout.
+ * fbp_dl_status_get() reports the current values.
+ *
+ * The transmitter also limits the number of outstanding frames with
+ * a congestion window that never exceeds the negotiated window.
+ * The congestion window starts at 8 frames and grows by one frame per
+ * acknowledged frame up to the slow start threshold, then by one frame
+ * per window of acknowledged frames (additive increase).  A loss reported
+ * by NACK or ACK_BITMAP halves the window (multiplicative decrease),
+ * and a retransmit timeout reduces the window to 2 frames.  Losses of
+ * frames sent before the previous decrease do not reduce it again.
+ * fbp_dl_send() returns FBP_ERROR_FULL while the congestion window is full.
+ *
  * This framer contains support for backpressure by providing notifications
  * when the recipient acknowledge the frame transmission.
  * The application can configure the desired number of pending
@@ -205,7 +236,7 @@ FBP_CPP_GUARD_START
 
 
 #define FBP_DL_VERSION_MAJOR 1
-#define FBP_DL_VERSION_MINOR 0
+#define FBP_DL_VERSION_MINOR 1
 #define FBP_DL_VERSION_PATCH 0
 #define FBP_DL_VERSION  FBP_VERSION_ENCODE_U32(FBP_DL_VERSION_MAJOR, FBP_DL_VERSION_MINOR, FBP_DL_VERSION_PATCH)
 
@@ -218,21 +249,51 @@ struct fbp_dl_config_s {
     uint32_t tx_link_size;    // in frames, normally the same as rx_window_size
     uint32_t tx_window_size;  // in frames
     uint32_t rx_window_size;  // in frames
-    int64_t tx_timeout;       // transmit timeout in FBP time 34Q30.
+    int64_t tx_timeout;       // initial transmit timeout in FBP time 34Q30.
+    uint32_t payload_max_size;  // in bytes, 0 for FBP_FRAMER_PAYLOAD_MAX_SIZE
 };
 
+/**
+ * @brief The number of latency histogram buckets.
+ *
+ * Bucket 0 counts latencies below 2 microseconds.  Bucket i counts
+ * latencies from 2^i up to 2^(i+1) microseconds.  The last bucket
+ * also counts all longer latencies.
+ */
+#define FBP_DL_LATENCY_HISTOGRAM_SIZE (20)
+
 /// The data link transmit status.
 struct fbp_dl_tx_status_s {
     uint64_t bytes;
     uint64_t msg_bytes;
     uint64_t data_frames;
     uint64_t retransmissions;
+    int64_t rtt;      // smoothed round-trip time in FBP time 34Q30, 0 if no sample
+    int64_t rtt_var;  // round-trip time mean deviation in FBP time 34Q30
+    int64_t rto;      // current retransmit timeout in FBP time 34Q30
+    uint32_t window;      // current effective transmit window in frames
+    uint32_t window_max;  // negotiated transmit window in frames
+    uint64_t nack_frame_id;       // NACK_FRAME_ID link frames sent
+    uint64_t nack_framing_error;  // NACK_FRAMING_ERROR link frames sent
+    uint64_t ack_bitmap;          // ACK_BITMAP frames sent
+    uint32_t window_high_water;   // most outstanding frames
+    uint32_t reserved;
+    /// Histogram of the time from data frame transmission to acknowledgement.
+    uint32_t ack_latency[FBP_DL_LATENCY_HISTOGRAM_SIZE];
 };
 
 /// The data link receive status.
 struct fbp_dl_rx_status_s {
     uint64_t msg_bytes;
     uint64_t data_frames;
+    uint64_t duplicate_frames;    // data frames received more than once
+    uint64_t nack_frame_id;       // NACK_FRAME_ID link frames received
+    uint64_t nack_framing_error;  // NACK_FRAMING_ERROR link frames received
+    uint64_t ack_bitmap;          // ACK_BITMAP frames received
+    uint32_t window_high_water;   // most frames held for in-order delivery
+    uint32_t reserved;
+    /// Histogram of the time from data frame reception to acknowledgement transmission.
+    uint32_t ack_latency[FBP_DL_LATENCY_HISTOGRAM_SIZE];
 };
 
 /**
@@ -244,6 +305,7 @@ struct fbp_dl_status_s {
     struct fbp_dl_rx_status_s rx;
     struct fbp_framer_status_s rx_framer;
     struct fbp_dl_tx_status_s tx;
+    int64_t disconnected_time;  // total time disconnected in FBP time 34Q30
 };
 
 /**
@@ -329,7 +391,9 @@ struct fbp_dl_api_s {
  * @param msg The msg_buffer containing the message.  The driver
  *      copies this buffer, so it only needs to be valid for the duration
  *      of the function call.
- * @param msg_size The size of msg_buffer in total_bytes.
+ * @param msg_size The size of msg_buffer in total_bytes.  Messages larger
+ *      than FBP_FRAMER_PAYLOAD_MAX_SIZE are sent as jumbo frames, which
+ *      requires fbp_dl_tx_payload_max_set().
  * @param timeout_ms The timeout duration in milliseconds.  Values <= 0 do not
  *      retry and fail immediately if the buffer is full.  Values > 0 will
  *      retry until success or until the timeout_ms elapses.
@@ -481,6 +545,8 @@ FBP_API uint32_t fbp_dl_tx_window_max_get(struct fbp_dl_s * self);
  * negotiate the effective window size.  The transmit window size can
  * be increased up to the maximum provided to fbp_dl_initialize().
  * After being set, the window size cannot change until reset.
+ * The congestion window further limits the outstanding frames
+ * at runtime, see fbp_dl_status_s tx.window.
  */
 FBP_API void fbp_dl_tx_window_set(struct fbp_dl_s * self, uint32_t tx_window_size);
 
@@ -495,6 +561,53 @@ FBP_API void fbp_dl_tx_window_set(struct fbp_dl_s * self, uint32_t tx_window_siz
  */
 FBP_API uint32_t fbp_dl_rx_window_get(struct fbp_dl_s * self);
 
+/**
+ * @brief Get the configured maximum payload size.
+ *
+ * @param self The data link instance.
+ * @return The maximum payload size in bytes that this instance can
+ *      receive and transmit.
+ *
+ * This method is provided for the higher-level MAC layer to negotiate
+ * the payload size.  No other modules should use this function.
+ */
+FBP_API uint32_t fbp_dl_payload_max_get(struct fbp_dl_s * self);
+
+/**
+ * @brief Set the effective TX payload size.
+ *
+ * @param self The data link instance.
+ * @param payload_max_size The maximum payload size in bytes supported
+ *      by the remote receiver.
+ *
+ * When the data link layer starts, it always starts with the effective
+ * TX payload size set to FBP_FRAMER_PAYLOAD_MAX_SIZE, which only uses
+ * standard data frames.  This allows a higher-level MAC protocol to
+ * negotiate jumbo frames.  The value is limited to
+ * fbp_dl_payload_max_get() and reverts on reset.
+ */
+FBP_API void fbp_dl_tx_payload_max_set(struct fbp_dl_s * self, uint32_t payload_max_size);
+
+/**
+ * @brief Get the effective TX payload size.
+ *
+ * @param self The data link instance.
+ * @return The largest msg_size allowed by fbp_dl_send().
+ */
+FBP_API uint32_t fbp_dl_tx_payload_max_get(struct fbp_dl_s * self);
+
+/**
+ * @brief Enable ACK_BITMAP link frames.
+ *
+ * @param self The data link instance.
+ * @param enable True when the remote supports ACK_BITMAP frames.
+ *
+ * When the data link layer starts, it always starts with ACK_BITMAP
+ * disabled and acknowledges out-of-order frames individually.  This allows
+ * a higher-level MAC protocol to negotiate selective acknowledgements.
+ * The value reverts on reset.
+ */
+FBP_API void fbp_dl_tx_ack_bitmap_set(struct fbp_dl_s * self, bool enable);
 
 FBP_CPP_GUARD_END
 
@@ -24,6 +24,7 @@
 #define FBP_COMM_FRAMER_H_
 
 #include "fitterbap/cmacro_inc.h"
+#include "fitterbap/config.h"
 #include <stdint.h>
 #include <stdbool.h>
 
@@ -33,9 +34,11 @@
  *
  * @brief Provide reliable byte stream framing with robust error detection.
  *
- * This framer protocol provides two different frame formats:
+ * This framer protocol provides three different frame formats:
  * - data frame
+ * - jumbo data frame for payloads up to 4096 bytes (optional)
  * - link frame used by acks, nacks, and reset
+ * - ack bitmap frame for selective acknowledgements (optional)
  *
  * The data frame format is variable length:
  *
@@ -67,10 +70,10 @@
  *   Typical values are 0x55 and 0xAA.
  * - "SOF2" is the second start of frame byte.  The SOF2 value can be selected
  *   to ensure proper UART framing.  Typical values are 0x00.
- * - "frame_type" is the frame type identifier.  Although only 6 values are
+ * - "frame_type" is the frame type identifier.  Although only 8 values are
  *   needed, they are encoded to ensure that the data frame requires 4 bit flips
- *   to become any ACK frame.  ACK frames are all separated by at least
- *   2 bit flips.
+ *   to become any ACK frame except ACK_BITMAP.  All frame types are
+ *   separated by at least 2 bit flips.
  * - "frame_id" contains an identifier that is temporally unique for all
  *   DATA frames across all ports.  The frame_id increments sequentially with
  *   each new frame and is assigned by the framer implementation.
@@ -101,6 +104,46 @@
  *   framing.  Repeated SOF/EOF total_bytes between frames are ignored
  *   by the framer and can be used for autobaud detection.
  *
+ * The jumbo data frame format is also variable length:
+ *
+ * <table class="doxtable message">
+ *  <tr><th>7</td><th>6</td><th>5</td><th>4</td>
+ *      <th>3</td><th>2</td><th>1</td><th>0</td></tr>
+ *  <tr><td colspan="8">SOF1[7:0]</td></tr>
+ *  <tr><td colspan="8">SOF2[7:0]</td></tr>
+ *  <tr>
+ *      <td colspan="5">frame_type[4:0]</td>
+ *      <td colspan="3">frame_id[10:8]</td>
+ *  </tr>
+ *  <tr><td colspan="8">frame_id[7:0]</td></tr>
+ *  <tr><td colspan="8">length[7:0]</td></tr>
+ *  <tr><td colspan="4">rsv=0</td><td colspan="4">length[11:8]</td></tr>
+ *  <tr><td colspan="8">length_crc[7:0]</td></tr>
+ *  <tr><td colspan="8">metadata[7:0]</td></tr>
+ *  <tr><td colspan="8">metadata[15:8]</td></tr>
+ *  <tr><td colspan="8">... payload ...</td></tr>
+ *  <tr><td colspan="8">frame_crc[7:0]</td></tr>
+ *  <tr><td colspan="8">...</td></tr>
+ *  <tr><td colspan="8">frame_crc[63:56]</td></tr>
+ *  <tr><td colspan="8">EOF</td></tr>
+ * </table>
+ *
+ * The jumbo data frame fields match the data frame with the following
+ * exceptions:
+ * - "frame_type" is DATA_JUMBO.
+ * - "length" is 12 bits, the payload length minus 1.  The payload length
+ *   ranges from 1 to FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE total_bytes.
+ * - "length_crc" is the same CRC-8 computed over both length bytes.
+ * - "frame_crc" is the 64-bit CRC-64/XZ.  At 4096 bytes, CRC-32 only provides
+ *   HD=4 and each frame carries 16 times as many bits which may be corrupted.
+ *   The 64-bit CRC restores a false-positive rate well below the
+ *   256-byte data frame with CRC-32.
+ *
+ * Jumbo frames are disabled unless fitterbap/config.h defines
+ * FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE and FBP_FRAMER_CRC64.  A transmitter
+ * must only send jumbo frames after the receiver indicates support,
+ * which the data link negotiates using @ref FBP_PORT0_OP_NEGOTIATE.
+ *
  * The link frame format is a fixed-length frame with
  * 8 total_bytes:
  *
@@ -134,6 +177,40 @@
  *   Note that this may not be lowest frame_id.
  * - RESET: Reset all state.
  *
+ * The ack bitmap frame format is a fixed-length frame with
+ * 16 total_bytes:
+ *
+ * <table class="doxtable message">
+ *  <tr><th>7</td><th>6</td><th>5</td><th>4</td>
+ *      <th>3</td><th>2</td><th>1</td><th>0</td></tr>
+ *  <tr><td colspan="8">SOF1[7:0]</td></tr>
+ *  <tr><td colspan="8">SOF2[7:0]</td></tr>
+ *  <tr>
+ *      <td colspan="5">frame_type[4:0]</td>
+ *      <td colspan="3">frame_id[10:8]</td>
+ *  </tr>
+ *  <tr><td colspan="8">frame_id[7:0]</td></tr>
+ *  <tr><td colspan="8">bitmap[7:0]</td></tr>
+ *  <tr><td colspan="8">...</td></tr>
+ *  <tr><td colspan="8">bitmap[63:56]</td></tr>
+ *  <tr><td colspan="8">frame_crc[7:0]</td></tr>
+ *  <tr><td colspan="8">frame_crc[15:8]</td></tr>
+ *  <tr><td colspan="8">frame_crc[23:16]</td></tr>
+ *  <tr><td colspan="8">frame_crc[31:24]</td></tr>
+ *  <tr><td colspan="8">EOF </td></tr>
+ * </table>
+ *
+ * - ACK_BITMAP: Receiver has all frame_ids up to and including the
+ *   indicated frame_id, the same as ACK_ALL.  Bit i of bitmap
+ *   is set when the receiver also holds frame_id + 1 + i.
+ *   Clear bits below the most significant set bit indicate missing frames.
+ *   A single ACK_BITMAP replaces the NACK_FRAME_ID and ACK_ONE frames
+ *   that the receiver would otherwise send for each frame in the window.
+ *
+ * A transmitter must only send ACK_BITMAP frames after the receiver
+ * indicates support, which the data link negotiates using
+ * @ref FBP_PORT0_OP_NEGOTIATE.
+ *
  *
  * ## Framing algorithm
  *
@@ -153,6 +230,13 @@
  * The fitterbap/config.h file allows for a configuration options.  The
  * following options affect the framer:
  *
+ * ### Jumbo frames:
+ *
+ * Define FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE to the maximum jumbo payload
+ * size, up to 4096, and FBP_FRAMER_CRC64 to the function that computes
+ * the 64-bit CRC, normally fbp_crc64 with FBP_CRC_CRC64 1.  The framer
+ * receive buffer grows to hold the largest jumbo frame.
+ *
  * ### 32-bit CRC:
  *
  * The 32-bit CRC uses a table-based CRC-32-CCITT by default.  As discussed
@@ -353,9 +437,36 @@ FBP_CPP_GUARD_START
     FBP_FRAMER_FOOTER_SIZE)
 /// The framer link message (ACK) size in bytes, excluding EOF
 #define FBP_FRAMER_LINK_SIZE (8)
+/// The framer ack bitmap message size in bytes, excluding EOF
+#define FBP_FRAMER_ACK_BITMAP_SIZE (16)
+/// The number of frames represented by the ack bitmap.
+#define FBP_FRAMER_ACK_BITMAP_COUNT (64)
 #define FBP_FRAMER_OVERHEAD_SIZE (FBP_FRAMER_HEADER_SIZE + FBP_FRAMER_FOOTER_SIZE)
 #define FBP_FRAMER_FRAME_ID_MAX ((1 << 11) - 1)
 
+#ifndef FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE
+/// The maximum jumbo payload size in total_bytes, 0 when disabled.
+#define FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE (0)
+#endif
+/// The largest jumbo payload size supported by the frame format.
+#define FBP_FRAMER_JUMBO_PAYLOAD_LIMIT (4096)
+#if FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE > FBP_FRAMER_JUMBO_PAYLOAD_LIMIT
+#error FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE too large
+#endif
+/// The jumbo framer header size in total_bytes.
+#define FBP_FRAMER_JUMBO_HEADER_SIZE (9)
+/// The jumbo framer footer size in total_bytes.
+#define FBP_FRAMER_JUMBO_FOOTER_SIZE (8)
+#define FBP_FRAMER_JUMBO_OVERHEAD_SIZE (FBP_FRAMER_JUMBO_HEADER_SIZE + FBP_FRAMER_JUMBO_FOOTER_SIZE)
+/// The maximum payload size for any data frame in total_bytes.
+#define FBP_FRAMER_LARGEST_PAYLOAD_SIZE \
+    ((FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE > FBP_FRAMER_PAYLOAD_MAX_SIZE) ? \
+     FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE : FBP_FRAMER_PAYLOAD_MAX_SIZE)
+/// The maximum size for any frame in bytes, excluding EOF.
+#define FBP_FRAMER_LARGEST_SIZE \
+    ((FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE > FBP_FRAMER_PAYLOAD_MAX_SIZE) ? \
+     (FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE + FBP_FRAMER_JUMBO_OVERHEAD_SIZE) : FBP_FRAMER_MAX_SIZE)
+
 /**
  * @brief The frame types.
  *
@@ -364,6 +475,8 @@ FBP_CPP_GUARD_START
  */
 enum fbp_framer_type_e {
     FBP_FRAMER_FT_DATA = 0x00,
+    FBP_FRAMER_FT_DATA_JUMBO = 0x03,
+    FBP_FRAMER_FT_ACK_BITMAP = 0x18,
     FBP_FRAMER_FT_ACK_ALL = 0x0F,
     FBP_FRAMER_FT_ACK_ONE = 0x17,
     FBP_FRAMER_FT_NACK_FRAME_ID = 0x1B,
@@ -391,7 +504,8 @@ struct fbp_framer_api_s {
      * @param user_data The arbitrary user data.
      * @param frame_id The frame id.
      * @param metadata The metadata.
-     * @param msg The message buffer.
+     * @param msg The message buffer, which is only valid for the duration
+     *      of the callback.  The callee must not modify the contents.
      * @param msg_size The size of msg_buffer in bytes.
      */
     void (*data_fn)(void *user_data, uint16_t frame_id, uint16_t metadata,
@@ -412,6 +526,18 @@ struct fbp_framer_api_s {
      * @param user_data The arbitrary user data.
      */
     void (*framing_error_fn)(void *user_data);
+
+    /**
+     * @brief The function to call on ack bitmap frames.
+     *
+     * @param user_data The arbitrary user data.
+     * @param frame_id The frame id for all frames received.
+     * @param bitmap The bitmap of future frames received, where bit i
+     *      corresponds to frame_id + 1 + i.
+     *
+     * When NULL, the framer ignores ack bitmap frames.
+     */
+    void (*ack_bitmap_fn)(void *user_data, uint16_t frame_id, uint64_t bitmap);
 };
 
 /// The framer instance.
@@ -420,7 +546,7 @@ struct fbp_framer_s {
     uint8_t state;    // fbp_framer_state_e
     uint8_t is_sync;
     uint16_t length;        // the current frame length or 0
-    uint8_t buf[FBP_FRAMER_MAX_SIZE + 1];  // frame + EOF
+    uint8_t buf[FBP_FRAMER_LARGEST_SIZE + 1];  // frame + EOF
     uint16_t buf_offset;    // the size of the buffer
     struct fbp_framer_status_s status;
 };
@@ -468,6 +594,32 @@ FBP_API bool fbp_framer_validate_data(uint16_t frame_id, uint16_t metadata, uint
 FBP_API int32_t fbp_framer_construct_data(uint8_t *b, uint16_t frame_id, uint16_t metadata,
                                           uint8_t const *msg, uint32_t msg_size);
 
+/**
+ * @brief Validate the fbp_framer_construct_jumbo() parameters.
+ *
+ * @param frame_id The frame id for the frame.
+ * @param metadata The message metadata.
+ * @param msg_size The size of msg_buffer in bytes.
+ * @return True if parameters are valid, otherwise false.
+ *
+ * Always returns false when jumbo frames are disabled.
+ */
+FBP_API bool fbp_framer_validate_jumbo(uint16_t frame_id, uint16_t metadata, uint32_t msg_size);
+
+/**
+ * @brief Construct a jumbo data frame.
+ *
+ * @param b The output buffer, which must be at least
+ *      msg_size + FBP_FRAMER_JUMBO_OVERHEAD_SIZE bytes.
+ * @param frame_id The frame id for the frame.
+ * @param metadata The message metadata
+ * @param msg The payload buffer.
+ * @param msg_size The size of msg_buffer in bytes.
+ * @return 0 or error code.
+ */
+FBP_API int32_t fbp_framer_construct_jumbo(uint8_t *b, uint16_t frame_id, uint16_t metadata,
+                                           uint8_t const *msg, uint32_t msg_size);
+
 /**
  * @brief Validate the fbp_framer_construct_link() parameters.
  *
@@ -487,6 +639,17 @@ FBP_API bool fbp_framer_validate_link(enum fbp_framer_type_e frame_type, uint16_
  */
 FBP_API int32_t fbp_framer_construct_link(uint8_t *b, enum fbp_framer_type_e frame_type, uint16_t frame_id);
 
+/**
+ * @brief Construct an ack bitmap frame.
+ *
+ * @param b The output buffer, which must be at least FBP_FRAMER_ACK_BITMAP_SIZE bytes.
+ * @param frame_id The frame id for all frames received.
+ * @param bitmap The bitmap of future frames received, where bit i
+ *      corresponds to frame_id + 1 + i.
+ * @return 0 or error code.
+ */
+FBP_API int32_t fbp_framer_construct_ack_bitmap(uint8_t *b, uint16_t frame_id, uint64_t bitmap);
+
 /**
  * @brief Compute the difference between frame ids.
  *
@@ -152,9 +152,20 @@ enum fbp_port0_op_e {
      * then adjusts their transmit message queue to the minimum of
      * the received queue size and their local transmit queue size.
      *
+     * Both sides also exchange their maximum data frame payload size.
+     * The transmitter only sends jumbo frames when both sides support
+     * payloads larger than FBP_FRAMER_PAYLOAD_MAX_SIZE.  When the other
+     * side reports data link 1.1 or newer, the receiver acknowledges
+     * out-of-order frames using ACK_BITMAP link frames.
+     *
      * The payload consists of 32-bit values:
      * - version: major8.minor8.patch16
-     * - sender's maximum receive window size
+     * - status: 0 or error code (response only)
+     * - down_window_size: server to client window size
+     * - up_window_size: client to server window size
+     * - payload_max_size: maximum data frame payload size in bytes.
+     *   Added in data link 1.1.  When omitted, the receiver assumes
+     *   FBP_FRAMER_PAYLOAD_MAX_SIZE.
      */
     FBP_PORT0_OP_NEGOTIATE = 5,
 
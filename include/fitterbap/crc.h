@@ -24,6 +24,7 @@
 #define FBP_CRC_H__
 
 #include "fitterbap/cmacro_inc.h"
+#include <stdbool.h>
 #include <stdint.h>
 
 /**
@@ -32,6 +33,29 @@
  *
  * @brief Cyclic Redundancy Codes (CRC).
  *
+ * The CRC implementation is selected at compile time using
+ * FBP_CRC_SLICE_BY in fitterbap/config.h:
+ * - 0 (default): Compact bitwise CRC-8 and CRC-16 with no tables.
+ *   CRC-32 uses a single 1 KiB table.
+ * - 1: Table-driven, one byte at a time.
+ * - 4: Slice-by-4 tables for CRC-16 and CRC-32.
+ * - 8: Slice-by-8 tables for CRC-16 and CRC-32.
+ *
+ * CRC-8 only uses the single byte table for FBP_CRC_SLICE_BY >= 1.
+ * The CRC-32 functions are only available when FBP_CRC_CRC32 is 1.
+ * The CRC-64 functions are only available when FBP_CRC_CRC64 is 1.
+ * CRC-64 uses a single 2 KiB table, or slice-by-8 tables for
+ * FBP_CRC_SLICE_BY >= 8.
+ * On x86-64 hosts compiled with GCC or clang, define
+ * FBP_CRC_CRC32_PCLMUL to 1 to enable the carry-less multiply
+ * implementation which fbp_crc32() selects at runtime when the
+ * processor supports it.
+ *
+ * The fbp_crc_ccitt_8(), fbp_crc_ccitt_16() and fbp_crc32()
+ * functions use the fastest configured implementation.  The
+ * implementation-specific functions are also available
+ * for testing and benchmarking.
+ *
  * @{
  */
 
@@ -82,6 +106,75 @@ FBP_API uint16_t fbp_crc_ccitt_16(uint16_t crc, uint8_t const *data, uint32_t le
  */
 FBP_API uint32_t fbp_crc32(uint32_t crc, uint8_t const *data, uint32_t length);
 
+/**
+ * @brief Compute the CRC-64/XZ
+ *
+ * @param crc The existing value for the crc which is used for continued block
+ *      computations.  Pass 0 for the first block.
+ * @param data The data for the CRC computation.
+ * @param length The number of total_bytes in data.
+ * @return The computed CRC-64.
+ *
+ * This function uses the reflected ECMA-182 0x42F0E1EBA9EA3693 polynomial
+ * with the input and output inverted, which is the same CRC-64 used
+ * by the xz file format.
+ */
+FBP_API uint64_t fbp_crc64(uint64_t crc, uint8_t const *data, uint32_t length);
+
+/// fbp_crc_ccitt_8() computed one bit at a time.
+FBP_API uint8_t fbp_crc_ccitt_8_bitwise(uint8_t crc, uint8_t const *data, uint32_t length);
+
+/// fbp_crc_ccitt_8() computed one byte at a time, requires FBP_CRC_SLICE_BY >= 1.
+FBP_API uint8_t fbp_crc_ccitt_8_slice1(uint8_t crc, uint8_t const *data, uint32_t length);
+
+/// fbp_crc_ccitt_16() computed using shifts, one byte at a time.
+FBP_API uint16_t fbp_crc_ccitt_16_bitwise(uint16_t crc, uint8_t const *data, uint32_t length);
+
+/// fbp_crc_ccitt_16() computed one byte at a time, requires FBP_CRC_SLICE_BY >= 1.
+FBP_API uint16_t fbp_crc_ccitt_16_slice1(uint16_t crc, uint8_t const *data, uint32_t length);
+
+/// fbp_crc_ccitt_16() computed 4 bytes at a time, requires FBP_CRC_SLICE_BY >= 4.
+FBP_API uint16_t fbp_crc_ccitt_16_slice4(uint16_t crc, uint8_t const *data, uint32_t length);
+
+/// fbp_crc_ccitt_16() computed 8 bytes at a time, requires FBP_CRC_SLICE_BY >= 8.
+FBP_API uint16_t fbp_crc_ccitt_16_slice8(uint16_t crc, uint8_t const *data, uint32_t length);
+
+/// fbp_crc32() computed one byte at a time.
+FBP_API uint32_t fbp_crc32_slice1(uint32_t crc, uint8_t const *data, uint32_t length);
+
+/// fbp_crc32() computed 4 bytes at a time, requires FBP_CRC_SLICE_BY >= 4.
+FBP_API uint32_t fbp_crc32_slice4(uint32_t crc, uint8_t const *data, uint32_t length);
+
+/// fbp_crc32() computed 8 bytes at a time, requires FBP_CRC_SLICE_BY >= 8.
+FBP_API uint32_t fbp_crc32_slice8(uint32_t crc, uint8_t const *data, uint32_t length);
+
+/// fbp_crc64() computed one byte at a time.
+FBP_API uint64_t fbp_crc64_slice1(uint64_t crc, uint8_t const *data, uint32_t length);
+
+/// fbp_crc64() computed 8 bytes at a time, requires FBP_CRC_SLICE_BY >= 8.
+FBP_API uint64_t fbp_crc64_slice8(uint64_t crc, uint8_t const *data, uint32_t length);
+
+/**
+ * @brief Check for runtime support of fbp_crc32_pclmul().
+ *
+ * @return True if compiled with FBP_CRC_CRC32_PCLMUL and the processor
+ *      supports PCLMULQDQ and SSE4.1.
+ */
+FBP_API bool fbp_crc32_pclmul_supported();
+
+/**
+ * @brief fbp_crc32() computed using the PCLMULQDQ instruction.
+ *
+ * @param crc The existing value for the crc.
+ * @param data The data for the CRC computation.
+ * @param length The number of total_bytes in data.
+ * @return The computed CRC-32.
+ *
+ * When fbp_crc32_pclmul_supported() is false, or for blocks shorter
+ * than 64 bytes, this function uses the configured table implementation.
+ */
+FBP_API uint32_t fbp_crc32_pclmul(uint32_t crc, uint8_t const *data, uint32_t length);
+
 FBP_CPP_GUARD_END
 
 /** @} */
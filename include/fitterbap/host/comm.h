@@ -27,6 +27,7 @@
 #include "fitterbap/pubsub.h"
 #include "fitterbap/comm/data_link.h"
 #include "fitterbap/comm/log_port.h"
+#include "fitterbap/host/loopback.h"
 #include <stdint.h>
 
 /**
@@ -81,6 +82,51 @@ FBP_API int32_t fbp_comm_publish(
     const char * topic,
     const struct fbp_union_s * value);
 
+/**
+ * @brief Publish to multiple topics.
+ *
+ * @param self The communications instance.
+ * @param topics The array of topics to update.
+ * @param values The array of new values, one for each topic.
+ * @param count The number of entries in topics and values.
+ * @return 0 or error code.  On error, publishing stops at the failed
+ *      entry, and the preceding entries remain queued.
+ *
+ * All entries are queued while holding the pubsub lock once, so the
+ * pubsub thread processes them together and in order.
+ */
+FBP_API int32_t fbp_comm_publish_many(
+    struct fbp_comm_s * self,
+    const char * const * topics,
+    const struct fbp_union_s * values,
+    uint32_t count);
+
+/**
+ * @brief Get a handle for repeatedly publishing to a topic.
+ *
+ * @param self The communications instance.
+ * @param topic The topic name.
+ * @return The topic handle or NULL.  The handle remains valid
+ *      until fbp_comm_finalize().
+ * @see fbp_pubsub_topic_handle()
+ */
+FBP_API struct fbp_pubsub_topic_s * fbp_comm_topic_handle(
+    struct fbp_comm_s * self,
+    const char * topic);
+
+/**
+ * @brief Publish to a topic using a handle.
+ *
+ * @param self The communications instance.
+ * @param handle The topic handle from fbp_comm_topic_handle().
+ * @param value The new value for the topic.
+ * @return 0 or error code.
+ */
+FBP_API int32_t fbp_comm_publish_h(
+    struct fbp_comm_s * self,
+    struct fbp_pubsub_topic_s * handle,
+    const struct fbp_union_s * value);
+
 /**
  * @brief Get the retained value for a topic.
  *
@@ -96,6 +142,27 @@ FBP_API int32_t fbp_comm_query(
         const char * topic,
         struct fbp_union_s * value);
 
+/**
+ * @brief Get a copy of the retained value for a topic.
+ *
+ * @param self The communications instance.
+ * @param topic The topic name.
+ * @param[out] value The current value for topic.  For str, json and bin
+ *      values, value points to buf.
+ * @param buf The caller-owned buffer for str, json and bin values.
+ * @param buf_size The size of buf in bytes.
+ * @return 0 or error code.  See fbp_pubsub_query_copy().
+ *
+ * Unlike fbp_comm_query(), the value remains valid while the comm
+ * thread publishes new values to topic.
+ */
+FBP_API int32_t fbp_comm_query_copy(
+        struct fbp_comm_s * self,
+        const char * topic,
+        struct fbp_union_s * value,
+        uint8_t * buf,
+        uint32_t buf_size);
+
 /**
  * @brief Get the status for the data link.
  *
@@ -107,6 +174,18 @@ FBP_API int32_t fbp_comm_status_get(
         struct fbp_comm_s * self,
         struct fbp_dl_status_s * status);
 
+/**
+ * @brief Get the loopback device statistics.
+ *
+ * @param self The communications instance.
+ * @param status The status instance to populate.
+ * @return 0, FBP_ERROR_NOT_SUPPORTED if the device is not
+ *      FBP_LOOPBACK_PREFIX, or error code.
+ */
+FBP_API int32_t fbp_comm_loopback_status_get(
+        struct fbp_comm_s * self,
+        struct fbp_loopback_status_s * status);
+
 /**
  * @brief Forward remote log messages to the local handler.
  *
@@ -27,6 +27,11 @@
 
 #define FBP_FRAMER_CRC32 fbp_crc32
 #define FBP_CRC_CRC32 1
+#define FBP_CRC_SLICE_BY 8
+#define FBP_CRC_CRC32_PCLMUL 1
+#define FBP_FRAMER_CRC64 fbp_crc64
+#define FBP_CRC_CRC64 1
+#define FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE 4096
 
 #define FBP_PLATFORM_STDLIB 1
 #define FBP_CSTR_FLOAT_ENABLE 0
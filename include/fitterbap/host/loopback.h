@@ -0,0 +1,164 @@
+/*
+ * Copyright 2021 Jetperch LLC
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+/**
+ * @file
+ *
+ * @brief In-process loopback device for the host comm stack.
+ */
+
+#ifndef FBP_HOST_LOOPBACK_H_
+#define FBP_HOST_LOOPBACK_H_
+
+#include "fitterbap/cmacro_inc.h"
+#include "fitterbap/comm/data_link.h"
+#include "fitterbap/pubsub.h"
+#include <stdbool.h>
+#include <stdint.h>
+
+/**
+ * @ingroup fbp_host
+ * @defgroup fbp_host_loopback Host loopback device
+ *
+ * @brief Connect the host comm stack to an in-process client stack.
+ *
+ * The loopback device allows the full framer, data link, transport
+ * and pubsub path to run without hardware.  The client stack
+ * runs in its own thread and connects to the host over a
+ * pseudo-terminal.  The client optionally injects byte drops and
+ * bit errors into both directions to exercise retransmission.
+ *
+ * Select the loopback device by passing a device string of the form
+ * "loop://[?key=value[&key=value]]" to fbp_comm_initialize().
+ * Supported keys are:
+ * - byte_drop_rate: drop 1 byte out of every N, on average.  0 disables.
+ * - bit_error_rate: corrupt 1 byte out of every N with a single
+ *   bit error, on average.  0 disables.
+ * - seed: The pseudo-random number generator seed.
+ *
+ * When the client transmit buffer is full, the client drops the
+ * remaining bytes of that send, logs a warning and counts them in
+ * fbp_loopback_status_s.tx_overflow_bytes.  The data link recovers
+ * these bytes by retransmission, just like bytes lost on a real UART.
+ * Use fbp_comm_loopback_status_get() to read the statistics through
+ * the host comm instance.
+ *
+ * @{
+ */
+
+FBP_CPP_GUARD_START
+
+/// The loopback device string prefix.
+#define FBP_LOOPBACK_PREFIX "loop://"
+
+/// The topic prefix for the loopback client pubsub instance.
+#define FBP_LOOPBACK_TOPIC_PREFIX "d/"
+
+/// The loopback configuration.
+struct fbp_loopback_config_s {
+    /// Drop 1 byte out of every byte_drop_rate bytes on average, 0 to disable.
+    uint32_t byte_drop_rate;
+    /// Flip 1 bit in 1 byte out of every bit_error_rate bytes on average, 0 to disable.
+    uint32_t bit_error_rate;
+    /// The pseudo-random number generator seed.
+    uint32_t seed;
+};
+
+/// The loopback error injection statistics.
+struct fbp_loopback_status_s {
+    uint64_t bytes;             ///< Total bytes transferred in both directions.
+    uint64_t bytes_dropped;     ///< Total bytes dropped by error injection.
+    uint64_t bit_errors;        ///< Total bit errors injected.
+    uint64_t tx_overflow_bytes; ///< Total client bytes dropped due to a full transmit buffer.
+};
+
+/// The opaque instance.
+struct fbp_loopback_s;
+
+/**
+ * @brief Check if a device string selects the loopback device.
+ *
+ * @param device The device string.
+ * @return True if device starts with FBP_LOOPBACK_PREFIX.
+ */
+FBP_API bool fbp_loopback_is_device(const char * device);
+
+/**
+ * @brief Parse a loopback device string.
+ *
+ * @param device The device string starting with FBP_LOOPBACK_PREFIX.
+ * @param[out] config The parsed configuration.
+ * @return 0 or error code.
+ */
+FBP_API int32_t fbp_loopback_parse(const char * device, struct fbp_loopback_config_s * config);
+
+/**
+ * @brief Create and start a new loopback client.
+ *
+ * @param dl_config The data link configuration for the client stack.
+ * @param config The loopback configuration.
+ * @return The new instance or NULL.
+ */
+FBP_API struct fbp_loopback_s * fbp_loopback_initialize(
+        struct fbp_dl_config_s const * dl_config,
+        struct fbp_loopback_config_s const * config);
+
+/**
+ * @brief Stop the loopback client and free all resources.
+ *
+ * @param self The loopback instance.
+ */
+FBP_API void fbp_loopback_finalize(struct fbp_loopback_s * self);
+
+/**
+ * @brief Get the UART device path for the host side of the loopback.
+ *
+ * @param self The loopback instance.
+ * @return The device path, valid until fbp_loopback_finalize().
+ */
+FBP_API const char * fbp_loopback_device_path(struct fbp_loopback_s * self);
+
+/**
+ * @brief Get the client pubsub instance.
+ *
+ * @param self The loopback instance.
+ * @return The client pubsub instance with FBP_LOOPBACK_TOPIC_PREFIX.
+ */
+FBP_API struct fbp_pubsub_s * fbp_loopback_pubsub(struct fbp_loopback_s * self);
+
+/**
+ * @brief Get the client data link status.
+ *
+ * @param self The loopback instance.
+ * @param status The status instance to populate.
+ * @return 0 or error code.
+ */
+FBP_API int32_t fbp_loopback_dl_status_get(struct fbp_loopback_s * self, struct fbp_dl_status_s * status);
+
+/**
+ * @brief Get the error injection statistics.
+ *
+ * @param self The loopback instance.
+ * @param status The status instance to populate.
+ * @return 0 or error code.
+ */
+FBP_API int32_t fbp_loopback_status_get(struct fbp_loopback_s * self, struct fbp_loopback_status_s * status);
+
+FBP_CPP_GUARD_END
+
+/** @} */
+
+#endif  /* FBP_HOST_LOOPBACK_H_ */
@@ -46,6 +46,39 @@ FBP_CPP_GUARD_START
 #define FBP_PUBSUB_TOPIC_LENGTH_MAX (32)
 /// The maximum topic length between '/' separators.
 #define FBP_PUBSUB_TOPIC_LENGTH_PER_LEVEL (8)
+/**
+ * @brief The number of children that triggers a hashed child index.
+ *
+ * Topics with more children than this threshold lazily build a hash
+ * index to find children without a linear scan.  0 disables the index.
+ */
+#ifndef FBP_PUBSUB_CHILD_INDEX_THRESHOLD
+#define FBP_PUBSUB_CHILD_INDEX_THRESHOLD (8)
+#endif
+/**
+ * @brief The number of entries in the published topic cache.
+ *
+ * Each instance caches the most recently resolved topic strings to skip
+ * the topic tree traversal for repeated publishes.  Must be a power of 2.
+ * 0 disables the cache.
+ */
+#ifndef FBP_PUBSUB_TOPIC_CACHE_SIZE
+#define FBP_PUBSUB_TOPIC_CACHE_SIZE (8)
+#endif
+/**
+ * @brief Support the single-producer, single-consumer queue mode.
+ *
+ * Requires C11 atomics or the GCC / clang __atomic builtins along with
+ * thread-local storage.  Defaults to enabled on hosted platforms.
+ * See fbp_pubsub_register_spsc().
+ */
+#ifndef FBP_PUBSUB_SPSC
+#if defined(__linux__) || defined(__APPLE__) || defined(_WIN32)
+#define FBP_PUBSUB_SPSC (1)
+#else
+#define FBP_PUBSUB_SPSC (0)
+#endif
+#endif
 /// The unit separator character
 #define FBP_PUBSUB_UNIT_SEP_CHR ((char) 0x1f)
 /// The unit separator as a single character string
@@ -77,6 +110,9 @@ enum fbp_pubsub_sflag_e {
 /// The opaque PubSub instance.
 struct fbp_pubsub_s;
 
+/// The opaque topic handle, see fbp_pubsub_topic_handle().
+struct fbp_pubsub_topic_s;
+
 /**
  * @brief Function called on topic updates.
  *
@@ -121,6 +157,50 @@ typedef int32_t (*fbp_pubsub_publish_fn)(
         const char * topic, const struct fbp_union_s * value,
         fbp_pubsub_subscribe_fn src_fn, void * src_user_data);
 
+/**
+ * @brief The PubSub object pool configuration.
+ *
+ * By default, the PubSub instance allocates messages and subscribers
+ * from the heap as needed and keeps them for reuse.  A nonzero count
+ * preallocates that many objects at initialization and never allocates
+ * more, which provides deterministic latency and bounded memory.
+ */
+struct fbp_pubsub_config_s {
+    /**
+     * @brief The number of preallocated messages.
+     *
+     * When exhausted, publish, subscribe and meta return
+     * FBP_ERROR_NOT_ENOUGH_MEMORY.  0 allocates from the heap.
+     */
+    uint32_t message_count;
+    /**
+     * @brief The number of preallocated subscribers.
+     *
+     * Includes the two subscribers used internally for the topic list.
+     * When exhausted, fbp_pubsub_process() logs an error and drops the
+     * subscription.  0 allocates from the heap.
+     */
+    uint32_t subscriber_count;
+};
+
+/**
+ * @brief The object allocation status.
+ */
+struct fbp_pubsub_alloc_status_s {
+    uint32_t size;          ///< The preallocated count or 0 for heap.
+    uint32_t in_use;        ///< The number of objects currently in use.
+    uint32_t high_water;    ///< The maximum number of objects in use.
+    uint32_t alloc_fail;    ///< The number of failed allocations.
+};
+
+/**
+ * @brief The PubSub instance status.
+ */
+struct fbp_pubsub_status_s {
+    struct fbp_pubsub_alloc_status_s message;
+    struct fbp_pubsub_alloc_status_s subscriber;
+};
+
 /**
  * @brief Create and initialize a new PubSub instance.
  *
@@ -133,6 +213,20 @@ typedef int32_t (*fbp_pubsub_publish_fn)(
  */
 FBP_API struct fbp_pubsub_s * fbp_pubsub_initialize(const char * topic_prefix, uint32_t buffer_size);
 
+/**
+ * @brief Create and initialize a new PubSub instance with preallocated objects.
+ *
+ * @param topic_prefix The topic prefix that is owned by this
+ *      pubsub instance.  See fbp_pubsub_initialize().
+ * @param buffer_size The buffer size for dynamic pointer messages.
+ *      0 prohibits non-CONST pointer types.
+ * @param config The object pool configuration.  NULL is equivalent to
+ *      fbp_pubsub_initialize().
+ * @return The new PubSub instance.
+ */
+FBP_API struct fbp_pubsub_s * fbp_pubsub_initialize_config(const char * topic_prefix, uint32_t buffer_size,
+                                                           const struct fbp_pubsub_config_s * config);
+
 /**
  * @brief Finalize the instance and free resources.
  *
@@ -166,7 +260,8 @@ FBP_API void fbp_pubsub_register_on_publish(struct fbp_pubsub_s * self,
  * @brief Subscribe to a topic.
  *
  * @param self The PubSub instance.
- * @param topic The topic to subscribe.
+ * @param topic The topic to subscribe, which may contain the
+ *      MQTT-style wildcards described below.
  * @param flags The fbp_pubsub_subscribe_flag_e flags:
  *      - FBP_PUBSUB_SFLAG_RETAIN: The cbk_fn will be called with any existing
  *        retained values.
@@ -182,6 +277,15 @@ FBP_API void fbp_pubsub_register_on_publish(struct fbp_pubsub_s * self,
  * If the topic does not already exist, this function will
  * automatically create it.
  *
+ * The topic may contain wildcards.  A "+" level matches any single
+ * topic level, such as "+/h/c/+/din".  A final "#" level matches the
+ * parent topic and all of its children, so "h/#" is the same as "h".
+ * Wildcards must be an entire level, and "#" must be the final level,
+ * or this function returns FBP_ERROR_PARAMETER_INVALID.  Subscriptions
+ * containing "+" are compiled once and matched against each topic on
+ * its first publish, so later publishes to that topic do not
+ * re-evaluate the pattern.
+ *
  * Note that the FBP_PUBSUB_SFLAG_LINK flag is critical to the distributed
  * architecture.  The system constructs the polytree architecture with
  * LINK topic subscriptions.
@@ -197,7 +301,7 @@ FBP_API int32_t fbp_pubsub_subscribe(struct fbp_pubsub_s * self, const char * to
  * @brief Unsubscribe from a topic.
  *
  * @param self The PubSub instance.
- * @param topic The topic to unsubscribe.
+ * @param topic The topic provided to fbp_pubsub_subscribe().
  * @param cbk_fn The function provided to fbp_pubsub_subscribe().
  * @param cbk_user_data The arbitrary data provided to fbp_pubsub_subscribe().
  * @return 0 or error code.
@@ -271,8 +375,11 @@ FBP_API int32_t fbp_pubsub_unsubscribe_from_all(struct fbp_pubsub_s * self,
  * callback and do not hold on to it.
  *
  * The second pointer type is dynamically managed by the pubsub instance.
- * FBP_UNION_FLAG_RETAIN is NOT allowed for these pointer types as
- * they are only temporarily allocated in a circular buffer.
+ * These pointer types are temporarily allocated in a circular buffer.
+ * When also marked with FBP_UNION_FLAG_RETAIN, the topic keeps its own
+ * heap copy of the value, which it retains as const.  The next value
+ * published to the topic frees this copy, so use fbp_pubsub_query_copy()
+ * to read it from other threads.
  * If the item is too big to ever fit, this function returns
  * FBP_ERROR_PARAMETER_INVALID.
  * If the circular buffer is full, this function returns
@@ -282,6 +389,82 @@ FBP_API int32_t fbp_pubsub_publish(struct fbp_pubsub_s * self,
         const char * topic, const struct fbp_union_s * value,
         fbp_pubsub_subscribe_fn src_fn, void * src_user_data);
 
+/**
+ * @brief Get a handle for repeatedly publishing to a topic.
+ *
+ * @param self The PubSub instance.
+ * @param topic The normal topic name, which must not end with
+ *      a reserved character.
+ * @return The topic handle or NULL on invalid topic.  The handle remains
+ *      valid until fbp_pubsub_finalize().  Calling this function again
+ *      with the same topic returns the same handle.
+ *
+ * Use fbp_pubsub_publish_h() to publish with the handle.  Since this
+ * function allocates, call it once and then keep the handle.
+ */
+FBP_API struct fbp_pubsub_topic_s * fbp_pubsub_topic_handle(struct fbp_pubsub_s * self, const char * topic);
+
+/**
+ * @brief Get the topic name for a handle.
+ *
+ * @param handle The topic handle.
+ * @return The topic name.
+ */
+FBP_API const char * fbp_pubsub_topic_handle_name(struct fbp_pubsub_topic_s * handle);
+
+/**
+ * @brief Configure coalescing for a topic handle.
+ *
+ * @param handle The topic handle from fbp_pubsub_topic_handle().
+ * @param enable When true, a retained value published with
+ *      fbp_pubsub_publish_h() replaces any retained value for this handle
+ *      that is still pending for fbp_pubsub_process().  The message keeps
+ *      its original queue position, and subscribers only receive the
+ *      newest value.  When false (default), every value is delivered.
+ *
+ * Coalescing bounds the queue depth and latency for fast-changing
+ * settings and status topics.  Unretained values and values published
+ * with fbp_pubsub_publish() are never coalesced.
+ * @see fbp_pubsub_coalesced()
+ */
+FBP_API void fbp_pubsub_topic_coalesce(struct fbp_pubsub_topic_s * handle, bool enable);
+
+/**
+ * @brief Get the number of coalesced messages.
+ *
+ * @param self The PubSub instance.
+ * @return The total number of pending values replaced by newer values.
+ */
+FBP_API uint64_t fbp_pubsub_coalesced(struct fbp_pubsub_s * self);
+
+/**
+ * @brief Get the instance status.
+ *
+ * @param self The PubSub instance.
+ * @param[out] status The status including the message and subscriber
+ *      allocation high-water marks.
+ */
+FBP_API void fbp_pubsub_status(struct fbp_pubsub_s * self, struct fbp_pubsub_status_s * status);
+
+/**
+ * @brief Publish to a topic using a handle.
+ *
+ * @param handle The topic handle from fbp_pubsub_topic_handle().
+ * @param value The new value for the topic.
+ * @param src_fn The callback function for the source subscriber
+ *      that is publishing the update.  Can be NULL.
+ * @param src_user_data The arbitrary user data for the source subscriber
+ *      callback function.
+ * @return 0 or error code.
+ *
+ * This function is equivalent to fbp_pubsub_publish() for the handle's
+ * topic, but it skips copying the topic string and, after the first
+ * message, the topic tree traversal in fbp_pubsub_process().
+ */
+FBP_API int32_t fbp_pubsub_publish_h(struct fbp_pubsub_topic_s * handle,
+        const struct fbp_union_s * value,
+        fbp_pubsub_subscribe_fn src_fn, void * src_user_data);
+
 /**
  * @brief Convenience function to set the topic metadata.
  *
@@ -308,10 +491,58 @@ FBP_API int32_t fbp_pubsub_meta(struct fbp_pubsub_s * self, const char * topic,
  * @return 0 or error code.
  *
  * For a distributed PubSub implementation, use topic? to get the retained
- * value directly from the owning PubSub instance.
+ * value directly from the owning PubSub instance.  Publish "topic/?" to
+ * query all retained values under topic, or "?" to query all instances.
+ * The owning instance responds to FBP_PUBSUB_SFLAG_RSP subscribers
+ * with "topic?" for each retained value.
+ *
+ * For str, json and bin values, value points to the retained data
+ * which the next publish to topic may free.  Use fbp_pubsub_query_copy()
+ * unless the value is static const or fbp_pubsub_process() cannot
+ * run concurrently.
  */
 FBP_API int32_t fbp_pubsub_query(struct fbp_pubsub_s * self, const char * topic, struct fbp_union_s * value);
 
+/**
+ * @brief Get a copy of the local, retained value for a topic.
+ *
+ * @param self The PubSub instance.
+ * @param topic The topic name.
+ * @param[out] value The current value for topic.  For str, json and bin
+ *      values, value points to buf.
+ * @param buf The caller-owned buffer for str, json and bin values.
+ * @param buf_size The size of buf in bytes.
+ * @return 0, FBP_ERROR_PARAMETER_INVALID if topic has no retained value,
+ *      or FBP_ERROR_TOO_SMALL if buf cannot hold the value.  For
+ *      FBP_ERROR_TOO_SMALL, value->size contains the required size.
+ *
+ * This function copies the value while holding the mutex, so the
+ * result remains valid regardless of later publishes to topic.
+ */
+FBP_API int32_t fbp_pubsub_query_copy(struct fbp_pubsub_s * self, const char * topic, struct fbp_union_s * value,
+                                      uint8_t * buf, uint32_t buf_size);
+
+/**
+ * @brief Get all local, retained values under a topic.
+ *
+ * @param self The PubSub instance.
+ * @param prefix The topic name.  NULL or "" gets all retained values.
+ * @param cbk_fn The function called with each retained topic and value,
+ *      including prefix itself.
+ * @param cbk_user_data The arbitrary data for cbk_fn.
+ * @return 0, FBP_ERROR_NOT_FOUND if prefix does not exist, or error code.
+ *
+ * Like fbp_pubsub_query(), this function runs in the caller's context
+ * and does not account for any updates queued for fbp_pubsub_process().
+ * It traverses the topic tree once while holding the mutex, so use it
+ * to resynchronize many values, such as when a user interface
+ * reconnects, instead of calling fbp_pubsub_query() for each topic.
+ * The cbk_fn must not block.  The value is only valid for the
+ * duration of the cbk_fn call.
+ */
+FBP_API int32_t fbp_pubsub_snapshot(struct fbp_pubsub_s * self, const char * prefix,
+        fbp_pubsub_subscribe_fn cbk_fn, void * cbk_user_data);
+
 /**
  * @brief Process all outstanding topic updates.
  *
@@ -332,6 +563,30 @@ FBP_API void fbp_pubsub_process(struct fbp_pubsub_s * self);
  */
 FBP_API void fbp_pubsub_register_mutex(struct fbp_pubsub_s * self, fbp_os_mutex_t mutex);
 
+/**
+ * @brief Use the lock-free, single-producer, single-consumer queue.
+ *
+ * @param self The instance.
+ * @param capacity The maximum number of pending messages, which must be
+ *      a power of 2.
+ * @return 0, FBP_ERROR_NOT_SUPPORTED when the platform does not provide
+ *      atomics, FBP_ERROR_BUSY when messages are pending or the queue
+ *      is already registered, or other error code.
+ *
+ * In this mode, a preallocated message ring and the instance buffer
+ * pass messages from one producer thread to the thread that calls
+ * fbp_pubsub_process() without taking the mutex.  At most one thread
+ * may call fbp_pubsub_subscribe(), fbp_pubsub_publish(),
+ * fbp_pubsub_publish_h() and fbp_pubsub_meta() outside of
+ * fbp_pubsub_process().  Subscriber callbacks may publish from within
+ * fbp_pubsub_process().  When the ring is full, these functions
+ * return FBP_ERROR_FULL.  Topic handle coalescing is disabled.
+ *
+ * Call this function once after fbp_pubsub_initialize() and before
+ * any other thread uses the instance.
+ */
+FBP_API int32_t fbp_pubsub_register_spsc(struct fbp_pubsub_s * self, uint32_t capacity);
+
 FBP_CPP_GUARD_END
 
 /** @} */
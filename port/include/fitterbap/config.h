@@ -54,6 +54,26 @@
 //#define FBP_FRAMER_CRC32 fbp_crc32
 //#define FBP_CRC_CRC32 1
 
+/**
+ * @brief The maximum payload size for jumbo data frames.
+ *
+ * Use 0 (default) to disable jumbo frames or up to 4096 to enable.
+ * Jumbo frames also require FBP_FRAMER_CRC64 with the signature:
+ *   uint64_t (*fn)(uint64_t crc, uint8_t const *data, uint32_t length)
+ *
+ * See fitterbap/comm/framer.h for details.
+ */
+// #define FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE 4096
+// #define FBP_FRAMER_CRC64 fbp_crc64
+// #define FBP_CRC_CRC64 1
+
+/**
+ * @brief The CRC table size / speed tradeoff: 0, 1, 4 or 8.
+ *
+ * See fitterbap/crc.h for details.
+ */
+// #define FBP_CRC_SLICE_BY 0
+
 
 // Uncomment for your platform
 //#define FBP_PLATFORM_STDLIB 1
@@ -14,7 +14,7 @@
 
 from libc.stdint cimport uint8_t, uint16_t, uint32_t
 
-cdef extern from "fitterbap/crc.h":
+cdef extern from "fitterbap/crc.h" nogil:
 
     uint8_t fbp_crc_ccitt_8(uint8_t crc, const uint8_t  *data, uint32_t length)
     uint16_t fbp_crc_ccitt_16(uint16_t crc, const uint8_t *data, uint32_t length)
@@ -0,0 +1,274 @@
+# Copyright 2021 Jetperch LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Asyncio front-end for :class:`pyfitterbap.comm.comm.Comm`.
+
+The comm stack delivers topic updates from its own threads.  This module
+batches those updates and hands each batch to the asyncio event loop
+with a single loop.call_soon_threadsafe(), so one event loop can service
+many devices.  Blocking calls into the comm stack run in the loop's
+default executor.
+
+Example::
+
+    async with AsyncComm('COM3') as comm:
+        async for topic, value, retain in comm.subscribe('c/'):
+            print(topic, value)
+"""
+
+import asyncio
+import functools
+import logging
+from .comm import Comm
+
+
+log = logging.getLogger(__name__)
+QUEUE_SIZE_DEFAULT = 1000
+
+
+def _topic_match(prefix, topic):
+    if not prefix:
+        return True
+    if prefix[-1] == '/':
+        return topic.startswith(prefix)
+    return topic == prefix or topic.startswith(prefix + '/')
+
+
+class Subscription:
+    """An async iterator over the topic updates matching a prefix.
+
+    :param owner: The parent :class:`AsyncComm` instance.
+    :param prefix: The topic prefix.  '' matches all topics.
+    :param maxsize: The maximum number of queued updates.
+
+    Use :meth:`AsyncComm.subscribe` to create instances.  The comm
+    stack cannot wait on a slow consumer, so when the queue is full,
+    the oldest update is dropped and counted in :attr:`stats`.
+    Iteration yields (topic, value, retain) tuples and ends after
+    :meth:`close`.
+    """
+
+    _CLOSE = object()
+
+    def __init__(self, owner, prefix, maxsize):
+        self._owner = owner
+        self.prefix = prefix
+        self.maxsize = maxsize
+        self._queue = asyncio.Queue()  # bounded by _put to drop oldest
+        self._closed = False
+        self._received = 0
+        self._dropped = 0
+        self._high_water = 0
+
+    def __str__(self):
+        return f'Subscription({self.prefix})'
+
+    @property
+    def stats(self):
+        """The back-pressure statistics dict.
+
+        * received: The total number of matching updates.
+        * dropped: The number of updates dropped due to a full queue.
+        * queued: The number of updates currently queued.
+        * high_water: The maximum number of queued updates.
+        """
+        return {
+            'prefix': self.prefix,
+            'maxsize': self.maxsize,
+            'received': self._received,
+            'dropped': self._dropped,
+            'queued': self._queue.qsize(),
+            'high_water': self._high_water,
+        }
+
+    def _put(self, msg):
+        if self._closed:
+            return
+        self._received += 1
+        if self._queue.qsize() >= self.maxsize:
+            self._queue.get_nowait()
+            self._dropped += 1
+        self._queue.put_nowait(msg)
+        self._high_water = max(self._high_water, self._queue.qsize())
+
+    async def get(self):
+        """Get the next update.
+
+        :return: The (topic, value, retain) tuple.
+        :raise StopAsyncIteration: When closed and no updates remain.
+        """
+        msg = await self._queue.get()
+        if msg is self._CLOSE:
+            self._queue.put_nowait(msg)  # wake any other waiters
+            raise StopAsyncIteration
+        return msg
+
+    def close(self):
+        """Stop receiving updates.
+
+        Updates that are already queued remain available.
+        """
+        if not self._closed:
+            self._closed = True
+            self._owner._unsubscribe(self)
+            self._queue.put_nowait(self._CLOSE)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.get()
+
+
+class AsyncComm:
+    """Asyncio host communications instance.
+
+    :param device: The device name, see :class:`Comm`.
+    :param queue_size: The default maximum number of queued updates
+        for each subscription.  None uses QUEUE_SIZE_DEFAULT.
+    :param kwargs: The additional keyword arguments for :class:`Comm`.
+        This class always uses batched delivery, so batch_count and
+        batch_latency control how often the event loop is woken.
+
+    Call :meth:`open` and :meth:`close` from the event loop, or use
+    this instance as an async context manager.
+    """
+
+    def __init__(self, device: str, queue_size=None, **kwargs):
+        self._device = device
+        self._kwargs = kwargs
+        self._queue_size = QUEUE_SIZE_DEFAULT if queue_size is None else int(queue_size)
+        if self._queue_size <= 0:
+            raise ValueError(f'queue_size must be > 0: {queue_size}')
+        self._loop = None
+        self._comm = None
+        self._subscriptions = []
+        self._batches = 0
+        self._messages = 0
+
+    def __str__(self):
+        return f'AsyncComm({self._device})'
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _call(self, name, *args):
+        if self._comm is None:
+            raise RuntimeError('not open')
+        fn = functools.partial(getattr(self._comm, name), *args)
+        return await self._loop.run_in_executor(None, fn)
+
+    async def open(self):
+        """Open the comm stack."""
+        if self._comm is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        fn = functools.partial(Comm, self._device, None, subscriber_batch=self._on_batch, **self._kwargs)
+        self._comm = await self._loop.run_in_executor(None, fn)
+
+    async def close(self):
+        """Close the comm stack and all subscriptions."""
+        comm, self._comm = self._comm, None
+        if comm is not None:
+            await self._loop.run_in_executor(None, comm.close)
+        for subscription in list(self._subscriptions):
+            subscription.close()
+
+    def _on_batch(self, msgs):
+        # Called from the comm batch thread
+        try:
+            self._loop.call_soon_threadsafe(self._dispatch, msgs)
+        except RuntimeError:
+            log.debug('event loop closed, drop %d messages', len(msgs))
+
+    def _dispatch(self, msgs):
+        self._batches += 1
+        self._messages += len(msgs)
+        subscriptions = self._subscriptions
+        for msg in msgs:
+            topic = msg[0]
+            for subscription in subscriptions:
+                if _topic_match(subscription.prefix, topic):
+                    subscription._put(msg)
+
+    def _unsubscribe(self, subscription):
+        try:
+            self._subscriptions.remove(subscription)
+        except ValueError:
+            pass
+
+    def subscribe(self, prefix='', maxsize=None) -> Subscription:
+        """Subscribe to topic updates.
+
+        :param prefix: The topic prefix.  '' subscribes to all topics.
+        :param maxsize: The maximum number of queued updates.
+            None uses the queue_size provided to the constructor.
+        :return: The :class:`Subscription` async iterator.
+
+        Subscriptions only receive updates that arrive after this call.
+        Use :meth:`query` for the current retained value.
+        """
+        maxsize = self._queue_size if maxsize is None else int(maxsize)
+        if maxsize <= 0:
+            raise ValueError(f'maxsize must be > 0: {maxsize}')
+        subscription = Subscription(self, prefix, maxsize)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    async def publish(self, topic: str, value, retain=None):
+        """Publish to a topic.
+
+        :param topic: The topic name.
+        :param value: The new value for the topic.
+        :param retain: True to retain the value.
+        """
+        await self._call('publish', topic, value, retain)
+
+    async def publish_many(self, items, retain=None):
+        """Publish to multiple topics.
+
+        :param items: The iterable of (topic, value) pairs.
+        :param retain: True to retain all values.
+        """
+        await self._call('publish_many', list(items), retain)
+
+    async def query(self, topic: str):
+        """Query the retained value for a topic.
+
+        :param topic: The topic name.
+        :return: The (value, retain) tuple.
+        """
+        return await self._call('query', topic)
+
+    async def status(self):
+        """Get the data link status, see :meth:`Comm.status`."""
+        return await self._call('status')
+
+    def stats(self):
+        """Get the delivery and back-pressure statistics.
+
+        :return: The dict with 'batches' and 'messages' delivered to the
+            event loop, and 'subscriptions', a list of
+            :attr:`Subscription.stats`.
+        """
+        return {
+            'batches': self._batches,
+            'messages': self._messages,
+            'subscriptions': [s.stats for s in self._subscriptions],
+        }
@@ -15,6 +15,11 @@
 from libc.stdint cimport int8_t, int16_t, int32_t, int64_t, uint8_t, uint16_t, uint32_t, uint64_t
 
 
+cdef extern from "fitterbap/ec.h":
+    enum fbp_error_code_e:
+        FBP_ERROR_TOO_SMALL
+
+
 cdef extern from "fitterbap/comm/framer.h":
     struct fbp_framer_status_s:
         uint64_t total_bytes
@@ -68,6 +73,8 @@ cdef extern from "fitterbap/union.h":
 
 cdef extern from "fitterbap/pubsub.h":
 
+    enum: FBP_PUBSUB_TOPIC_LENGTH_MAX
+
     enum fbp_pubsub_sflag_e:
         FBP_PUBSUB_SFLAG_NONE = 0
         FBP_PUBSUB_SFLAG_RETAIN = (1 << 0)
@@ -78,24 +85,46 @@ cdef extern from "fitterbap/pubsub.h":
     ctypedef uint8_t (*fbp_pubsub_subscribe_fn)(void * user_data,
             const char * topic, const fbp_union_s * value) nogil
 
+    struct fbp_pubsub_topic_s
+    void fbp_pubsub_topic_coalesce(fbp_pubsub_topic_s * handle, bint enable) nogil
+
 
 cdef extern from "fitterbap/comm/data_link.h":
 
+    enum: FBP_DL_LATENCY_HISTOGRAM_SIZE
+
     struct fbp_dl_config_s:
         uint32_t tx_link_size
         uint32_t tx_window_size
         uint32_t rx_window_size
         uint32_t tx_timeout
+        uint32_t payload_max_size
 
     struct fbp_dl_tx_status_s:
         uint64_t bytes
         uint64_t msg_bytes
         uint64_t data_frames
         uint64_t retransmissions
+        int64_t rtt
+        int64_t rtt_var
+        int64_t rto
+        uint32_t window
+        uint32_t window_max
+        uint64_t nack_frame_id
+        uint64_t nack_framing_error
+        uint64_t ack_bitmap
+        uint32_t window_high_water
+        uint32_t ack_latency[FBP_DL_LATENCY_HISTOGRAM_SIZE]
 
     struct fbp_dl_rx_status_s:
         uint64_t msg_bytes
         uint64_t data_frames
+        uint64_t duplicate_frames
+        uint64_t nack_frame_id
+        uint64_t nack_framing_error
+        uint64_t ack_bitmap
+        uint32_t window_high_water
+        uint32_t ack_latency[FBP_DL_LATENCY_HISTOGRAM_SIZE]
 
     struct fbp_dl_status_s:
         uint32_t version
@@ -103,6 +132,7 @@ cdef extern from "fitterbap/comm/data_link.h":
         fbp_dl_rx_status_s rx
         fbp_framer_status_s rx_framer
         fbp_dl_tx_status_s tx
+        int64_t disconnected_time
 
     enum fbp_dl_event_e:
         FBP_DL_EV_UNKNOWN
@@ -119,6 +149,14 @@ cdef extern from "fitterbap/comm/data_link.h":
                         uint8_t *msg, uint32_t msg_size) nogil
 
 
+cdef extern from "fitterbap/os/mutex.h":
+    ctypedef void * fbp_os_mutex_t
+    fbp_os_mutex_t fbp_os_mutex_alloc() nogil
+    void fbp_os_mutex_free(fbp_os_mutex_t mutex) nogil
+    void fbp_os_mutex_lock(fbp_os_mutex_t mutex) nogil
+    void fbp_os_mutex_unlock(fbp_os_mutex_t mutex) nogil
+
+
 cdef extern from "fitterbap/logh.h":
     struct fbp_logh_header_s:
         uint8_t version
@@ -135,6 +173,13 @@ cdef extern from "fitterbap/comm/log_port.h":
         const char * filename, const char * message)
 
 
+cdef extern from "fitterbap/host/loopback.h":
+    struct fbp_loopback_status_s:
+        uint64_t bytes
+        uint64_t bytes_dropped
+        uint64_t bit_errors
+        uint64_t tx_overflow_bytes
+
 cdef extern from "fitterbap/host/comm.h":
     struct fbp_comm_s
     fbp_comm_s * fbp_comm_initialize(const fbp_dl_config_s * config,
@@ -145,6 +190,16 @@ cdef extern from "fitterbap/host/comm.h":
     void fbp_comm_finalize(fbp_comm_s * self) nogil
     int32_t fbp_comm_publish(fbp_comm_s * self,
                              const char * topic, const fbp_union_s * value) nogil
+    int32_t fbp_comm_publish_many(fbp_comm_s * self,
+                                  const char * const * topics,
+                                  const fbp_union_s * values,
+                                  uint32_t count) nogil
+    fbp_pubsub_topic_s * fbp_comm_topic_handle(fbp_comm_s * self, const char * topic) nogil
+    int32_t fbp_comm_publish_h(fbp_comm_s * self,
+                               fbp_pubsub_topic_s * handle, const fbp_union_s * value) nogil
     int32_t fbp_comm_query(fbp_comm_s * self, const char * topic, fbp_union_s * value) nogil
+    int32_t fbp_comm_query_copy(fbp_comm_s * self, const char * topic, fbp_union_s * value,
+                                uint8_t * buf, uint32_t buf_size) nogil
     int32_t fbp_comm_status_get(fbp_comm_s * self, fbp_dl_status_s * status) nogil
+    int32_t fbp_comm_loopback_status_get(fbp_comm_s * self, fbp_loopback_status_s * status) nogil
     void fbp_comm_log_recv_register(fbp_comm_s * self, fbp_logp_publish_formatted fn, void * user_data)
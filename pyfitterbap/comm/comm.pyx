@@ -14,11 +14,14 @@
 
 
 from .c_comm cimport *
+from libc.string cimport memcpy, strncpy
+from cpython.buffer cimport PyBuffer_FillInfo
 import numpy as np
 cimport numpy as np
 include "../module.pxi"
 import json
 import logging
+import threading
 
 
 # From fitterbap/time.h
@@ -29,44 +32,114 @@ FBP_TIME_EPOCH_UNIX_OFFSET_SECONDS = 1514764800
 
 log = logging.getLogger(__name__)
 TX_TIMEOUT_DEFAULT = 16 * FBP_TIME_MILLISECOND
+BATCH_COUNT_DEFAULT = 1000
+BATCH_LATENCY_DEFAULT = 0.010  # seconds
+_BATCH_ARENA_ENTRY_SIZE = 256  # payload bytes reserved per batch entry
+_BATCH_ARENA_SIZE_MIN = 65536
+cdef enum:
+    _QUERY_BUFFER_SIZE = 256  # query() buffer, larger values use the heap
 LOG_TOPIC = 'h/log/msg'
+cdef bytes _LOG_TOPIC_BYTES = LOG_TOPIC.encode('utf-8')
+
+
+_NP_TYPE_MAP = {
+    np.bool_: FBP_UNION_U8,
+    np.float32: FBP_UNION_F32,
+    np.float64: FBP_UNION_F64,
+    np.uint8: FBP_UNION_U8,
+    np.uint16: FBP_UNION_U16,
+    np.uint32: FBP_UNION_U32,
+    np.uint64: FBP_UNION_U64,
+    np.int8: FBP_UNION_I8,
+    np.int16: FBP_UNION_I16,
+    np.int32: FBP_UNION_I32,
+    np.int64: FBP_UNION_I64,
+}
+
+
+cdef int _value_pack_scalar(fbp_union_s * value, uint8_t dtype, data) except -1:
+    value[0].type = dtype
+    if dtype == FBP_UNION_F32:
+        value[0].value.f32 = <float> data
+        value[0].size = 4
+    elif dtype == FBP_UNION_F64:
+        value[0].value.f64 = <double> data
+        value[0].size = 8
+    elif dtype == FBP_UNION_U8:
+        value[0].value.u8 = <uint8_t> data
+        value[0].size = 1
+    elif dtype == FBP_UNION_U16:
+        value[0].value.u16 = <uint16_t> data
+        value[0].size = 2
+    elif dtype == FBP_UNION_U32:
+        value[0].value.u32 = <uint32_t> data
+        value[0].size = 4
+    elif dtype == FBP_UNION_U64:
+        value[0].value.u64 = <uint64_t> data
+        value[0].size = 8
+    elif dtype == FBP_UNION_I8:
+        value[0].value.i8 = <int8_t> data
+        value[0].size = 1
+    elif dtype == FBP_UNION_I16:
+        value[0].value.i16 = <int16_t> data
+        value[0].size = 2
+    elif dtype == FBP_UNION_I32:
+        value[0].value.i32 = <int32_t> data
+        value[0].size = 4
+    elif dtype == FBP_UNION_I64:
+        value[0].value.i64 = <int64_t> data
+        value[0].size = 8
+    else:
+        raise ValueError(f'Unsupported scalar type: {dtype}')
+    return 0
 
 
 cdef _value_pack(fbp_union_s * value, data, retain=None):
     s = None
+    value[0].flags = 0
+    value[0].op = 0
+    value[0].app = 0
     if data is None:
         value[0].type = FBP_UNION_NULL
         value[0].size = 0
-    elif isinstance(data, int):
-        if data < 0:
-            value[0].type = FBP_UNION_I32
-            value[0].value.i32 = <int32_t> data
-            value[0].size = 4
+    elif isinstance(data, bool):
+        _value_pack_scalar(value, FBP_UNION_U8, data)
+    elif isinstance(data, int) and -0x8000000000000000 <= data <= 0xffffffffffffffff:
+        if data < -0x80000000:
+            _value_pack_scalar(value, FBP_UNION_I64, data)
+        elif data < 0:
+            _value_pack_scalar(value, FBP_UNION_I32, data)
+        elif data <= 0xffffffff:
+            _value_pack_scalar(value, FBP_UNION_U32, data)
         else:
-            value[0].type = FBP_UNION_U32
-            value[0].value.u32 = <uint32_t> data
-            value[0].size = 4
+            _value_pack_scalar(value, FBP_UNION_U64, data)
+    elif isinstance(data, float):
+        _value_pack_scalar(value, FBP_UNION_F64, data)
     elif isinstance(data, str):
         s = data.encode('utf-8')
         value[0].type = FBP_UNION_STR
         value[0].value.str = s
         value[0].size = <uint32_t> (len(s) + 1)
     elif isinstance(data, bytes):
+        s = data
         value[0].type = FBP_UNION_BIN
-        value[0].value.bin = data
+        value[0].value.bin = s
         value[0].size = <uint32_t> len(s)
+    elif isinstance(data, np.generic) and type(data) in _NP_TYPE_MAP:
+        _value_pack_scalar(value, _NP_TYPE_MAP[type(data)], data)
     else:
+        if isinstance(data, np.generic):
+            data = data.item()
         s = json.dumps(data).encode('utf-8')
         value[0].type = FBP_UNION_JSON
         value[0].value.str = s
         value[0].size = <uint32_t> (len(s) + 1)
-    log.info("_value_pack(type=%d, size=%d)", value[0].type, value[0].size)
     if bool(retain):
         value[0].flags |= FBP_UNION_FLAG_RETAIN
     return s  # so that caller can keep valid until used.
 
 
-cdef _value_unpack(const fbp_union_s * value):
+cdef _value_unpack(const fbp_union_s * value, bin_memoryview=False):
     retain = (0 != (value[0].flags & FBP_UNION_FLAG_RETAIN))
     dtype = value[0].type & 0x0f
     if dtype == FBP_UNION_NULL:
@@ -78,6 +151,8 @@ cdef _value_unpack(const fbp_union_s * value):
             v = value[0].value.str[:(value[0].size - 1)].decode('utf-8')
     elif dtype == FBP_UNION_BIN:
         v = value[0].value.bin[:value[0].size]
+        if bin_memoryview:
+            v = memoryview(v)
     elif dtype == FBP_UNION_JSON:
         if value[0].size <= 1:
             v = None
@@ -119,6 +194,12 @@ cdef _dl_status_decode(fbp_dl_status_s * status):
         'rx': {
             'msg_bytes': status[0].rx.msg_bytes,
             'data_frames': status[0].rx.data_frames,
+            'duplicate_frames': status[0].rx.duplicate_frames,
+            'nack_frame_id': status[0].rx.nack_frame_id,
+            'nack_framing_error': status[0].rx.nack_framing_error,
+            'ack_bitmap': status[0].rx.ack_bitmap,
+            'window_high_water': status[0].rx.window_high_water,
+            'ack_latency': np.array(status[0].rx.ack_latency, dtype=np.uint32),
         },
         'rx_framer': {
             'total_bytes': status[0].rx_framer.total_bytes,
@@ -130,10 +211,125 @@ cdef _dl_status_decode(fbp_dl_status_s * status):
             'msg_bytes': status[0].tx.msg_bytes,
             'data_frames': status[0].tx.data_frames,
             'retransmissions': status[0].tx.retransmissions,
+            'rtt': status[0].tx.rtt / FBP_TIME_SECOND,
+            'rtt_var': status[0].tx.rtt_var / FBP_TIME_SECOND,
+            'rto': status[0].tx.rto / FBP_TIME_SECOND,
+            'window': status[0].tx.window,
+            'window_max': status[0].tx.window_max,
+            'nack_frame_id': status[0].tx.nack_frame_id,
+            'nack_framing_error': status[0].tx.nack_framing_error,
+            'ack_bitmap': status[0].tx.ack_bitmap,
+            'window_high_water': status[0].tx.window_high_water,
+            'ack_latency': np.array(status[0].tx.ack_latency, dtype=np.uint32),
         },
+        'disconnected_time': status[0].disconnected_time / FBP_TIME_SECOND,
     }
 
 
+cdef class _Arena:
+    """A read-only buffer that owns malloc'd memory.
+
+    Memoryviews and numpy arrays created from this buffer keep it
+    alive.  The memory is freed when the last reference is released.
+    """
+    cdef uint8_t * data
+    cdef Py_ssize_t size
+
+    def __dealloc__(self):
+        free(self.data)
+        self.data = NULL
+
+    def __getbuffer__(self, Py_buffer * buffer, int flags):
+        PyBuffer_FillInfo(buffer, self, self.data, self.size, 1, flags)
+
+    def __releasebuffer__(self, Py_buffer * buffer):
+        pass
+
+
+cdef struct _batch_entry_s:
+    char topic[FBP_PUBSUB_TOPIC_LENGTH_MAX]
+    fbp_union_s value       # str, json and bin point into the arena
+
+
+cdef struct _batch_s:
+    _batch_entry_s * entries
+    uint8_t * arena
+    uint32_t count
+    uint32_t arena_used
+
+
+cdef struct _batcher_s:
+    void * comm             # borrowed reference to the owning Comm
+    fbp_os_mutex_t mutex    # protects active and batch[active]
+    _batch_s batch[2]       # the subscriber callback fills batch[active]
+    uint32_t active
+    uint32_t count_max
+    uint32_t arena_size
+
+
+cdef int _batch_add(_batcher_s * b, const char * topic, const fbp_union_s * value) nogil:
+    # Copy the message into the active batch with b.mutex held.
+    # Return 0 when added, 1 when added and the batch is now full,
+    # or -1 when the batch does not have room for the message.
+    cdef _batch_s * batch = &b.batch[b.active]
+    cdef _batch_entry_s * entry
+    cdef uint32_t sz = 0
+    cdef uint8_t dtype = value[0].type & 0x0f
+    if dtype == FBP_UNION_STR or dtype == FBP_UNION_JSON or dtype == FBP_UNION_BIN:
+        sz = value[0].size
+    if batch.count >= b.count_max or (batch.arena_used + sz) > b.arena_size:
+        return -1
+    entry = &batch.entries[batch.count]
+    strncpy(entry.topic, topic, FBP_PUBSUB_TOPIC_LENGTH_MAX)
+    entry.topic[FBP_PUBSUB_TOPIC_LENGTH_MAX - 1] = 0
+    entry.value = value[0]
+    if sz:
+        memcpy(batch.arena + batch.arena_used, value[0].value.bin, sz)
+        entry.value.value.bin = batch.arena + batch.arena_used
+        batch.arena_used += sz
+    batch.count += 1
+    return 1 if batch.count >= b.count_max else 0
+
+
+cdef uint8_t _batch_subscriber_cbk(void * user_data, const char * topic, const fbp_union_s * value) nogil:
+    cdef _batcher_s * b = <_batcher_s *> user_data
+    cdef int rc
+    cdef bint first
+    fbp_os_mutex_lock(b.mutex)
+    rc = _batch_add(b, topic, value)
+    first = (rc == 0) and (b.batch[b.active].count == 1)
+    fbp_os_mutex_unlock(b.mutex)
+    if rc:
+        _batch_flush_from_cbk(b, topic, value, rc)
+    elif first:
+        _batch_notify(b)
+    return 0
+
+
+cdef void _batch_notify(_batcher_s * b) with gil:
+    # wake the batch thread to start the batch_latency window
+    cdef Comm self = <Comm> b.comm
+    self._batch_pending.set()
+
+
+cdef void _batch_flush_from_cbk(_batcher_s * b, const char * topic, const fbp_union_s * value, int rc) with gil:
+    cdef Comm self = <Comm> b.comm
+    try:
+        self._batch_deliver()
+        if rc < 0:
+            with nogil:
+                fbp_os_mutex_lock(b.mutex)
+                rc = _batch_add(b, topic, value)
+                fbp_os_mutex_unlock(b.mutex)
+            if rc < 0:  # larger than the arena, deliver by itself
+                v, retain = _value_unpack(value, self._bin_memoryview)
+                self._batch_call([(topic.decode('utf-8'), v, retain)])
+            elif rc > 0:
+                self._batch_deliver()
+    except Exception:
+        log.exception('_batch_flush_from_cbk')
+
+
 class Port0Events:
     UNKNOWN = FBP_DL_EV_UNKNOWN
     RESET_REQUEST = FBP_DL_EV_RESET_REQUEST
@@ -146,7 +342,10 @@ class Port0Events:
 cdef class Comm:
     """A Communication Device using the FBP stack.
 
-    :param device: The device string.
+    :param device: The device string.  On Linux, use
+        "loop://[?byte_drop_rate=N&bit_error_rate=N&seed=N]" to connect
+        to an in-process loopback client stack with optional
+        error injection.
     :param subscriber: The subscriber callback(topic, value, retain, src_cbk)
         for topic updates.  This function is called from the comm thread
         and must return quickly.  The authors recommend posting to a queue
@@ -154,40 +353,187 @@ cdef class Comm:
         Qt has some series issues with resynchronization from non-Qt threads.
         See ui.resync for an example of how to resynchronize safely.
     :param baudrate: The baud rate for COM / UART ports.
+    :param tx_timeout: The initial data link retransmit timeout in
+        FBP time 34Q30.  The data link then adapts the timeout to the
+        measured round-trip time.  None (default) uses 16 ms.
+    :param payload_max_size: The maximum message payload size in bytes.
+        Messages larger than 256 bytes use jumbo frames when both
+        sides support them.  None (default) uses 4096.
+    :param subscriber_batch: The optional callback(msgs) that enables
+        batched delivery of topic updates.  The comm thread copies each
+        update into a buffer without the GIL, and this callback
+        receives a list of (topic, value, retain) tuples in order.
+        Log messages on LOG_TOPIC are delivered through the same
+        batches, in order with the topic updates.
+    :param batch_count: The maximum number of updates per batch.
+        None (default) uses BATCH_COUNT_DEFAULT.
+    :param batch_latency: The maximum time in seconds that an update
+        waits before delivery.  None (default) uses
+        BATCH_LATENCY_DEFAULT.
+    :param bin_memoryview: When True, deliver binary values as read-only
+        memoryview instances rather than bytes.  With subscriber_batch,
+        the memoryviews reference the batch buffer directly without
+        another copy, and the buffer remains valid until the last
+        memoryview or numpy array created from it is released.
+        Only batched delivery is zero-copy.  Without subscriber_batch,
+        the comm stack only guarantees the value during the callback,
+        so each memoryview wraps a bytes copy.
+        None (default) delivers bytes.
     """
 
     cdef fbp_comm_s * _comm
     cdef object _subscriber
     cdef object _device
+    cdef object _subscriber_batch
+    cdef _batcher_s * _batcher
+    cdef object _batch_latency
+    cdef object _batch_lock     # serializes batch delivery
+    cdef object _batch_quit
+    cdef object _batch_pending  # set when the active batch receives its first entry
+    cdef object _batch_thread
+    cdef object _bin_memoryview
 
     def __init__(self, device: str, subscriber,
             baudrate=None,
             tx_link_size=None,
             tx_window_size=None,
             rx_window_size=None,
-            tx_timeout=None):
+            tx_timeout=None,
+            payload_max_size=None,
+            subscriber_batch=None,
+            batch_count=None,
+            batch_latency=None,
+            bin_memoryview=None):
 
         cdef fbp_dl_config_s config
+        cdef fbp_pubsub_subscribe_fn cbk_fn = Comm._subscriber_cbk
+        cdef void * cbk_user_data = <void *> self
         log.debug('Comm.__init__ start')
         self._subscriber = subscriber
         self._device = device
+        self._subscriber_batch = subscriber_batch
+        self._bin_memoryview = bool(bin_memoryview)
+        if subscriber_batch is not None:
+            self._batch_open(batch_count, batch_latency)
+            cbk_fn = _batch_subscriber_cbk
+            cbk_user_data = <void *> self._batcher
 
         baudrate = 3000000 if baudrate is None else int(baudrate)
         config.tx_link_size = 256 if tx_link_size is None else int(tx_link_size)
         config.tx_window_size = 256 if tx_window_size is None else int(tx_window_size)
         config.rx_window_size = 256 if rx_window_size is None else int(rx_window_size)
         config.tx_timeout = TX_TIMEOUT_DEFAULT if tx_timeout is None else int(tx_timeout)
+        config.payload_max_size = 4096 if payload_max_size is None else int(payload_max_size)
         device_str = device.encode('utf-8')
         log.info('comm_initialize(%s, %s)', device_str, baudrate)
-        self._comm = fbp_comm_initialize(&config, device_str, baudrate, Comm._subscriber_cbk, <void *> self)
+        self._comm = fbp_comm_initialize(&config, device_str, baudrate, cbk_fn, cbk_user_data)
         if not self._comm:
+            self._batch_close()
             raise RuntimeError('Could not allocate instance')
         fbp_comm_log_recv_register(self._comm, Comm._on_logp_recv, <void *> self)
+        if self._batcher:
+            self._batch_thread = threading.Thread(target=self._batch_run, name='fbp_comm_batch', daemon=True)
+            self._batch_thread.start()
+
+    def _batch_open(self, batch_count, batch_latency):
+        cdef _batcher_s * b
+        count_max = BATCH_COUNT_DEFAULT if batch_count is None else int(batch_count)
+        if count_max < 1:
+            raise ValueError(f'invalid batch_count {batch_count}')
+        self._batch_latency = BATCH_LATENCY_DEFAULT if batch_latency is None else float(batch_latency)
+        if self._batch_latency <= 0:
+            raise ValueError(f'invalid batch_latency {batch_latency}')
+        self._batch_lock = threading.Lock()
+        self._batch_quit = threading.Event()
+        self._batch_pending = threading.Event()
+        b = <_batcher_s *> malloc(sizeof(_batcher_s))
+        if not b:
+            raise MemoryError()
+        self._batcher = b
+        b.comm = <void *> self
+        b.active = 0
+        b.count_max = count_max
+        b.arena_size = max(_BATCH_ARENA_SIZE_MIN, count_max * _BATCH_ARENA_ENTRY_SIZE)
+        b.mutex = fbp_os_mutex_alloc()
+        for i in range(2):
+            b.batch[i].entries = <_batch_entry_s *> malloc(count_max * sizeof(_batch_entry_s))
+            b.batch[i].arena = <uint8_t *> malloc(b.arena_size)
+            b.batch[i].count = 0
+            b.batch[i].arena_used = 0
+        if not b.mutex or not b.batch[0].entries or not b.batch[0].arena \
+                or not b.batch[1].entries or not b.batch[1].arena:
+            self._batch_close()
+            raise MemoryError()
+
+    def _batch_close(self):
+        cdef _batcher_s * b = self._batcher
+        if not b:
+            return
+        self._batcher = NULL
+        for i in range(2):
+            free(b.batch[i].entries)
+            free(b.batch[i].arena)
+        if b.mutex:
+            fbp_os_mutex_free(b.mutex)
+        free(b)
+
+    def _batch_run(self):
+        while True:
+            self._batch_pending.wait()  # sleep until the first entry arrives
+            self._batch_pending.clear()
+            if self._batch_quit.wait(self._batch_latency):
+                break
+            self._batch_deliver()
+
+    cdef _batch_call(self, msgs):
+        try:
+            self._subscriber_batch(msgs)
+        except Exception:
+            log.exception('subscriber_batch')
+
+    cdef _batch_deliver(self):
+        cdef _batcher_s * b = self._batcher
+        cdef _batch_s * batch
+        cdef _batch_entry_s * entry
+        cdef uint32_t idx
+        cdef uint8_t * arena_next
+        cdef _Arena arena
+        cdef Py_ssize_t offset
+        with self._batch_lock:
+            with nogil:
+                fbp_os_mutex_lock(b.mutex)
+                batch = &b.batch[b.active]
+                b.active = 1 - b.active
+                fbp_os_mutex_unlock(b.mutex)
+            arena_view = None
+            if self._bin_memoryview and batch.arena_used:
+                # hand the filled arena to Python and continue with a new one
+                arena_next = <uint8_t *> malloc(b.arena_size)
+                if arena_next:
+                    arena = _Arena.__new__(_Arena)
+                    arena.data = batch.arena
+                    arena.size = batch.arena_used
+                    batch.arena = arena_next
+                    arena_view = memoryview(arena)
+            msgs = []
+            for idx in range(batch.count):
+                entry = &batch.entries[idx]
+                if arena_view is not None and (entry.value.type & 0x0f) == FBP_UNION_BIN:
+                    offset = entry.value.value.bin - arena.data
+                    v = arena_view[offset:offset + entry.value.size]
+                    retain = (0 != (entry.value.flags & FBP_UNION_FLAG_RETAIN))
+                else:
+                    v, retain = _value_unpack(&entry.value, self._bin_memoryview)
+                msgs.append(((<char *> entry.topic).decode('utf-8'), v, retain))
+            batch.count = 0
+            batch.arena_used = 0
+            if msgs:
+                self._batch_call(msgs)
 
     @staticmethod
     cdef uint8_t _subscriber_cbk(void * user_data, const char * topic, const fbp_union_s * value) with gil:
         cdef Comm self = <object> user_data
-        v, retain = _value_unpack(value)
+        v, retain = _value_unpack(value, self._bin_memoryview)
         topic_str = topic.decode('utf-8')
         try:
             self._subscriber(topic_str, v, retain, self.publish)
@@ -198,6 +544,9 @@ cdef class Comm:
     cdef int32_t _on_logp_recv(void * user_data, const fbp_logh_header_s * header,
             const char * filename, const char * message) with gil:
         cdef Comm self = <object> user_data
+        cdef _batcher_s * b = self._batcher
+        cdef const char * topic_ptr = _LOG_TOPIC_BYTES
+        cdef fbp_union_s v
         msg = {
             'timestamp': (header[0].timestamp / FBP_TIME_SECOND) + FBP_TIME_EPOCH_UNIX_OFFSET_SECONDS,
             'level': header[0].level,
@@ -208,6 +557,15 @@ cdef class Comm:
             'line': header[0].line,
             'message': message.decode('utf-8'),
         }
+        if b:
+            try:
+                s = _value_pack(&v, msg, 0)
+            except Exception:
+                log.exception(f'_on_logp_recv({LOG_TOPIC})')
+                return 0
+            with nogil:
+                _batch_subscriber_cbk(<void *> b, topic_ptr, &v)
+            return 0
         try:
             self._subscriber(LOG_TOPIC, msg, 0, self.publish)
         except Exception:
@@ -215,27 +573,201 @@ cdef class Comm:
         return 0
 
     def close(self):
-        fbp_comm_finalize(self._comm)
+        if self._batch_thread is not None:
+            self._batch_quit.set()
+            self._batch_pending.set()
+            self._batch_thread.join()
+            self._batch_thread = None
+        if self._comm != NULL:
+            with nogil:
+                fbp_comm_finalize(self._comm)
+            self._comm = NULL
+        if self._batcher:
+            self._batch_deliver()  # flush the remaining messages
+            self._batch_close()
 
     def publish(self, topic: str, value, retain=None, src_cbk=None):
         # ignore src_cbk since already implemented in comm
         cdef int32_t rc
         cdef fbp_union_s v
+        cdef const char * topic_ptr
+        if self._comm == NULL:
+            raise RuntimeError('closed')
         s = _value_pack(&v, value, retain)
         topic_str = topic.encode('utf-8')
-        rc = fbp_comm_publish(self._comm, topic_str, &v)
+        topic_ptr = topic_str
+        with nogil:
+            rc = fbp_comm_publish(self._comm, topic_ptr, &v)
         if rc:
             raise RuntimeError(f'publish({topic}) failed with {rc}')
 
+    def publish_many(self, items, retain=None):
+        """Publish to multiple topics.
+
+        :param items: The iterable of (topic, value) pairs.
+        :param retain: True to retain all values, False or None otherwise.
+        :raise RuntimeError: On publish failure.  The items preceding
+            the failed item remain queued.
+
+        The items are queued together under a single pubsub lock,
+        which is much faster than calling publish() for each item.
+        """
+        cdef int32_t rc
+        cdef uint32_t idx
+        cdef uint32_t count
+        cdef const char ** topics
+        cdef fbp_union_s * values
+        if self._comm == NULL:
+            raise RuntimeError('closed')
+        items = list(items)
+        count = <uint32_t> len(items)
+        if not count:
+            return
+        refs = []  # keep packed bytes valid until published
+        topics = <const char **> malloc(count * sizeof(char *))
+        values = <fbp_union_s *> malloc(count * sizeof(fbp_union_s))
+        if not topics or not values:
+            free(topics)
+            free(values)
+            raise MemoryError()
+        try:
+            for idx, (topic, value) in enumerate(items):
+                topic_str = topic.encode('utf-8')
+                refs.append(topic_str)
+                topics[idx] = topic_str
+                refs.append(_value_pack(&values[idx], value, retain))
+            with nogil:
+                rc = fbp_comm_publish_many(self._comm, topics, values, count)
+        finally:
+            free(topics)
+            free(values)
+        if rc:
+            raise RuntimeError(f'publish_many failed with {rc}')
+
+    def topic(self, topic: str, coalesce=None):
+        """Get a handle for repeatedly publishing to a topic.
+
+        :param topic: The topic name.
+        :param coalesce: When True, a retained value replaces the previous
+            retained value for this topic if it is still queued, so
+            subscribers may skip intermediate values.  When False, stop
+            coalescing.  None (default) leaves the setting unchanged.
+        :return: The :class:`Topic` instance.
+        :raise ValueError: On invalid topic.
+
+        Topic.publish() skips the topic string copy and topic tree
+        traversal in the comm stack, which helps high-rate publishers.
+        """
+        cdef fbp_pubsub_topic_s * handle
+        cdef Topic t
+        if self._comm == NULL:
+            raise RuntimeError('closed')
+        topic_str = topic.encode('utf-8')
+        handle = fbp_comm_topic_handle(self._comm, topic_str)
+        if handle == NULL:
+            raise ValueError(f'invalid topic: {topic}')
+        if coalesce is not None:
+            fbp_pubsub_topic_coalesce(handle, bool(coalesce))
+        t = Topic.__new__(Topic)
+        t._parent = self
+        t._handle = handle
+        t._name = topic
+        return t
+
     def query(self, topic):
         cdef int32_t rc
         cdef fbp_union_s v
-        rc = fbp_comm_query(self._comm, topic, &v)
-        if rc:
-            raise RuntimeError(f'query({topic}) failed with {rc}')
-        return _value_unpack(&v)
+        cdef const char * topic_ptr
+        cdef uint8_t buf[_QUERY_BUFFER_SIZE]
+        cdef uint8_t * heap_buf = NULL
+        if self._comm == NULL:
+            raise RuntimeError('closed')
+        topic_str = topic.encode('utf-8')
+        topic_ptr = topic_str
+        # copy under the pubsub mutex, since the comm thread frees
+        # retained str, json and bin values when it publishes new ones.
+        with nogil:
+            rc = fbp_comm_query_copy(self._comm, topic_ptr, &v, buf, _QUERY_BUFFER_SIZE)
+        try:
+            while rc == FBP_ERROR_TOO_SMALL:
+                free(heap_buf)
+                heap_buf = <uint8_t *> malloc(v.size)
+                if not heap_buf:
+                    raise MemoryError()
+                with nogil:
+                    rc = fbp_comm_query_copy(self._comm, topic_ptr, &v, heap_buf, v.size)
+            if rc:
+                raise RuntimeError(f'query({topic}) failed with {rc}')
+            return _value_unpack(&v)
+        finally:
+            free(heap_buf)
 
     def status(self):
+        """Get the data link status.
+
+        :return: The status dict with 'version', 'rx', 'rx_framer', 'tx'
+            and 'disconnected_time' keys.  Times are in seconds.
+            For the loop:// device, the 'loopback' key contains the
+            'bytes', 'bytes_dropped', 'bit_errors' and
+            'tx_overflow_bytes' error injection statistics.
+            The 'rx' and 'tx' 'ack_latency' entries are numpy uint32
+            histograms.  Bucket 0 counts latencies below 2 microseconds,
+            and bucket i counts latencies from 2**i to 2**(i + 1)
+            microseconds.  The last bucket also counts longer latencies.
+        """
         cdef fbp_dl_status_s status
-        fbp_comm_status_get(self._comm, &status)
-        return _dl_status_decode(&status)
+        cdef fbp_loopback_status_s loopback
+        cdef int32_t rc
+        if self._comm == NULL:
+            raise RuntimeError('closed')
+        with nogil:
+            fbp_comm_status_get(self._comm, &status)
+            rc = fbp_comm_loopback_status_get(self._comm, &loopback)
+        s = _dl_status_decode(&status)
+        if rc == 0:
+            s['loopback'] = {
+                'bytes': loopback.bytes,
+                'bytes_dropped': loopback.bytes_dropped,
+                'bit_errors': loopback.bit_errors,
+                'tx_overflow_bytes': loopback.tx_overflow_bytes,
+            }
+        return s
+
+
+cdef class Topic:
+    """A topic handle for repeatedly publishing to one topic.
+
+    Use :meth:`Comm.topic` to create instances.  The handle is only
+    valid while the parent :class:`Comm` remains open.
+    """
+
+    cdef Comm _parent
+    cdef fbp_pubsub_topic_s * _handle
+    cdef object _name
+
+    def __init__(self):
+        raise TypeError('Use Comm.topic()')
+
+    def __str__(self):
+        return f'Topic({self._name})'
+
+    @property
+    def name(self):
+        return self._name
+
+    def publish(self, value, retain=None):
+        """Publish to this topic.
+
+        :param value: The new value for the topic.
+        :param retain: True to retain the value.
+        """
+        cdef int32_t rc
+        cdef fbp_union_s v
+        cdef fbp_comm_s * c = self._parent._comm
+        if c == NULL:
+            raise RuntimeError(f'publish({self._name}) failed: closed')
+        s = _value_pack(&v, value, retain)
+        with nogil:
+            rc = fbp_comm_publish_h(c, self._handle, &v)
+        if rc:
+            raise RuntimeError(f'publish({self._name}) failed with {rc}')
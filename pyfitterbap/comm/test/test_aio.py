@@ -0,0 +1,96 @@
+# Copyright 2021 Jetperch LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import sys
+import unittest
+from pyfitterbap.comm.aio import AsyncComm, _topic_match
+
+
+CONNECT_TIMEOUT = 5.0
+CONNECTED_TOPIC = 'h/c/0/state'
+
+
+class TopicMatchTest(unittest.TestCase):
+
+    def test_match(self):
+        self.assertTrue(_topic_match('', 'h/c/0/state'))
+        self.assertTrue(_topic_match('h/c', 'h/c'))
+        self.assertTrue(_topic_match('h/c', 'h/c/0/state'))
+        self.assertTrue(_topic_match('h/c/', 'h/c/0/state'))
+        self.assertFalse(_topic_match('h/c', 'h/cx'))
+        self.assertFalse(_topic_match('h/c/0', 'h/c'))
+
+
+@unittest.skipUnless(sys.platform.startswith('linux'), 'loop:// requires Linux')
+class AsyncCommLoopbackTest(unittest.IsolatedAsyncioTestCase):
+
+    async def _wait_for_topic(self, subscription, topic):
+        async def fn():
+            async for t, value, retain in subscription:
+                if t == topic:
+                    return value
+        return await asyncio.wait_for(fn(), CONNECT_TIMEOUT)
+
+    async def test_subscribe(self):
+        async with AsyncComm('loop://', batch_latency=0.005) as comm:
+            s_all = comm.subscribe()
+            s_other = comm.subscribe('h/other')
+            await self._wait_for_topic(s_all, CONNECTED_TOPIC)
+            stats = comm.stats()
+            self.assertGreater(stats['batches'], 0)
+            self.assertLess(stats['batches'], stats['messages'])
+            self.assertEqual(0, s_other.stats['received'])
+        self.assertEqual([], comm.stats()['subscriptions'])
+        with self.assertRaises(StopAsyncIteration):
+            while True:
+                await s_all.get()
+
+    async def test_queue_overflow(self):
+        comm = AsyncComm('loop://', queue_size=2, batch_latency=0.005)
+        s = comm.subscribe()
+        await comm.open()
+        try:
+            for _ in range(100):
+                if comm.stats()['messages'] > 8:
+                    break
+                await asyncio.sleep(0.01)
+            stats = s.stats
+            self.assertEqual(2, stats['queued'])
+            self.assertEqual(2, stats['high_water'])
+            self.assertEqual(stats['received'] - 2, stats['dropped'])
+        finally:
+            await comm.close()
+
+    async def test_publish_query(self):
+        async with AsyncComm('loop://') as comm:
+            await comm.publish('h/test/x', 42, retain=True)
+            await comm.publish_many([('h/test/y', 1.5)], retain=True)
+            for _ in range(100):
+                try:
+                    if (1.5, True) == await comm.query('h/test/y'):
+                        break
+                except RuntimeError:
+                    pass
+                await asyncio.sleep(0.01)
+            self.assertEqual((42, True), await comm.query('h/test/x'))
+            self.assertEqual((1.5, True), await comm.query('h/test/y'))
+            self.assertIn('version', await comm.status())
+
+    async def test_not_open(self):
+        comm = AsyncComm('loop://')
+        with self.assertRaises(RuntimeError):
+            await comm.publish('h/test/x', 1)
+        with self.assertRaises(ValueError):
+            comm.subscribe(maxsize=0)
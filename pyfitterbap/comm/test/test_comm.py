@@ -0,0 +1,222 @@
+# Copyright 2021 Jetperch LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import threading
+import time
+import unittest
+import numpy as np
+from pyfitterbap.comm.comm import Comm
+
+
+CONNECT_TIMEOUT = 5.0
+CONNECTED_TOPIC = 'h/c/0/state'
+
+
+def _wait_for(fn, timeout=CONNECT_TIMEOUT):
+    t_end = time.time() + timeout
+    while time.time() < t_end:
+        if fn():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@unittest.skipUnless(sys.platform.startswith('linux'), 'loop:// requires Linux')
+class CommLoopbackTest(unittest.TestCase):
+
+    def setUp(self):
+        self.comm = None
+        self.msgs = []
+        self.batches = []
+
+    def tearDown(self):
+        if self.comm is not None:
+            self.comm.close()
+
+    def _on_batch(self, msgs):
+        self.batches.append(msgs)
+
+    def _topics(self):
+        return [topic for batch in self.batches for topic, _, _ in batch]
+
+    def test_unbatched(self):
+        self.comm = Comm('loop://', lambda topic, value, retain, src_cbk: self.msgs.append(topic))
+        self.assertTrue(_wait_for(lambda: CONNECTED_TOPIC in self.msgs))
+
+    def test_batched(self):
+        self.comm = Comm('loop://', None, subscriber_batch=self._on_batch, batch_latency=0.05)
+        self.assertTrue(_wait_for(lambda: CONNECTED_TOPIC in self._topics()))
+        for batch in self.batches:
+            self.assertGreater(len(batch), 0)
+            for topic, value, retain in batch:
+                self.assertIsInstance(topic, str)
+                self.assertIsInstance(retain, bool)
+        self.assertLess(len(self.batches), len(self._topics()))
+
+    def test_batched_thread(self):
+        names = set()
+
+        def on_batch(msgs):
+            names.add(threading.current_thread().name)
+            self.batches.append(msgs)
+
+        self.comm = Comm('loop://', None, subscriber_batch=on_batch, batch_latency=0.05)
+        self.assertTrue(_wait_for(lambda: CONNECTED_TOPIC in self._topics()))
+        self.assertEqual({'fbp_comm_batch'}, names)
+
+    def test_batch_count(self):
+        self.comm = Comm('loop://', None, subscriber_batch=self._on_batch, batch_count=4, batch_latency=10.0)
+        self.assertTrue(_wait_for(lambda: len(self.batches) >= 2))
+        for batch in self.batches:
+            self.assertEqual(4, len(batch))
+        self.comm.close()  # delivers the remainder
+        self.comm = None
+        self.assertLessEqual(len(self.batches[-1]), 4)
+
+    def test_batched_bin_memoryview(self):
+        self.comm = Comm('loop://', None, subscriber_batch=self._on_batch, batch_latency=0.05,
+                         bin_memoryview=True)
+        self.assertTrue(_wait_for(lambda: CONNECTED_TOPIC in self._topics()))
+        values = dict((topic, value) for batch in self.batches for topic, value, _ in batch)
+        self.assertEqual('h/', values['_/topic/prefix'])
+
+        def bin_rsp(topic):
+            return [v for batch in self.batches for t, v, _ in batch if t == topic]
+
+        # retained queries respond to the comm subscriber with the binary value
+        data = bytes(range(64))
+        self.comm.publish('h/test/b', data, retain=True)
+        self.comm.publish('h/test/b?', None)
+        self.assertTrue(_wait_for(lambda: len(bin_rsp('h/test/b?'))))
+        v = bin_rsp('h/test/b?')[0]
+        self.assertIsInstance(v, memoryview)
+        self.assertTrue(v.readonly)
+        self.assertNotIsInstance(v.obj, bytes)  # references the batch buffer
+        self.assertEqual(data, v.tobytes())
+
+        # the view remains valid after later batches reuse the batcher
+        for idx in range(4):
+            self.comm.publish(f'h/test/b{idx}', bytes([idx]) * 64, retain=True)
+            self.comm.publish(f'h/test/b{idx}?', None)
+            self.assertTrue(_wait_for(lambda: len(bin_rsp(f'h/test/b{idx}?'))))
+        self.comm.close()
+        self.comm = None
+        self.assertEqual(data, v.tobytes())
+        self.assertEqual(bytes([3]) * 64, bin_rsp('h/test/b3?')[0].tobytes())
+
+    def test_invalid_batch_args(self):
+        with self.assertRaises(ValueError):
+            Comm('loop://', None, subscriber_batch=self._on_batch, batch_count=0)
+        with self.assertRaises(ValueError):
+            Comm('loop://', None, subscriber_batch=self._on_batch, batch_latency=0)
+
+    def _query(self, topic):
+        try:
+            return self.comm.query(topic)
+        except RuntimeError:
+            return None
+
+    def test_publish_query(self):
+        self.comm = Comm('loop://', lambda topic, value, retain, src_cbk: self.msgs.append(topic))
+        self.comm.publish('h/test/x', 42, retain=True)
+        self.assertTrue(_wait_for(lambda: self._query('h/test/x') == (42, True)))
+        self.assertIn('version', self.comm.status())
+
+    def test_use_after_close(self):
+        self.comm = Comm('loop://', lambda topic, value, retain, src_cbk: self.msgs.append(topic))
+        self.comm.close()
+        with self.assertRaises(RuntimeError):
+            self.comm.publish('h/test/x', 1)
+        with self.assertRaises(RuntimeError):
+            self.comm.publish_many([('h/test/x', 1)])
+        with self.assertRaises(RuntimeError):
+            self.comm.query('h/test/x')
+        with self.assertRaises(RuntimeError):
+            self.comm.status()
+        with self.assertRaises(RuntimeError):
+            self.comm.topic('h/test/x')
+        self.comm.close()  # second close is allowed
+        self.comm = None
+
+    def test_loopback_status(self):
+        self.comm = Comm('loop://', lambda topic, value, retain, src_cbk: self.msgs.append(topic))
+        self.assertTrue(_wait_for(lambda: CONNECTED_TOPIC in self.msgs))
+        status = self.comm.status()['loopback']
+        self.assertGreater(status['bytes'], 0)
+        self.assertEqual(0, status['bytes_dropped'])
+        self.assertEqual(0, status['tx_overflow_bytes'])
+
+    def test_publish_value_types(self):
+        self.comm = Comm('loop://', lambda topic, value, retain, src_cbk: self.msgs.append(topic))
+        values = [True, 1, -1, 2 ** 40, -2 ** 40, 2 ** 64 - 1, 1.5,
+                  np.bool_(True), np.float32(1.25), np.uint64(2 ** 63), np.int8(-3), np.int64(-5)]
+        expect = [1, 1, -1, 2 ** 40, -2 ** 40, 2 ** 64 - 1, 1.5,
+                  1, 1.25, 2 ** 63, -3, -5]
+        items = [(f'h/test/{idx}', value) for idx, value in enumerate(values)]
+        self.comm.publish_many(items, retain=True)
+        self.comm.publish('h/test/bin', b'\x00\x01\x02')
+        self.comm.publish('h/test/json', {'hello': 'world'})
+        topic_last = items[-1][0]
+        self.assertTrue(_wait_for(lambda: self._query(topic_last) is not None))
+        for (topic, _), value in zip(items, expect):
+            self.assertEqual((value, True), self.comm.query(topic))
+
+    def test_publish_many(self):
+        self.comm = Comm('loop://', lambda topic, value, retain, src_cbk: self.msgs.append(topic))
+        items = [(f'h/test/{idx}', idx) for idx in range(10)]
+        self.comm.publish_many(items, retain=True)
+        self.assertTrue(_wait_for(lambda: self._query('h/test/9') == (9, True)))
+        for topic, value in items:
+            self.assertEqual((value, True), self.comm.query(topic))
+        self.comm.publish_many([])
+
+    def test_publish_many_error(self):
+        self.comm = Comm('loop://', lambda topic, value, retain, src_cbk: self.msgs.append(topic))
+        items = [('h/test/a', 1), ('h/test/' + 'x' * 64, 'topic too long'), ('h/test/b', 2)]
+        with self.assertRaises(RuntimeError):
+            self.comm.publish_many(items, retain=True)
+        self.assertTrue(_wait_for(lambda: self._query('h/test/a') == (1, True)))
+        self.assertIsNone(self._query('h/test/b'))
+
+    def test_publish_retained_ptr(self):
+        self.comm = Comm('loop://', lambda topic, value, retain, src_cbk: self.msgs.append(topic))
+        self.comm.publish('h/test/s', 'hello', retain=True)
+        self.comm.publish_many([('h/test/j', {'a': 1}), ('h/test/b', b'\x01\x02')], retain=True)
+        self.assertTrue(_wait_for(lambda: self._query('h/test/s') == ('hello', True)))
+        self.assertTrue(_wait_for(lambda: self._query('h/test/j') == ({'a': 1}, True)))
+        self.assertTrue(_wait_for(lambda: self._query('h/test/b') == (b'\x01\x02', True)))
+        self.comm.publish('h/test/s', 'world', retain=True)
+        self.assertTrue(_wait_for(lambda: self._query('h/test/s') == ('world', True)))
+        data = bytes(range(256)) * 4  # larger than the query stack buffer
+        self.comm.publish('h/test/b', data, retain=True)
+        self.assertTrue(_wait_for(lambda: self._query('h/test/b') == (data, True)))
+
+    def test_topic_handle(self):
+        self.comm = Comm('loop://', lambda topic, value, retain, src_cbk: self.msgs.append(topic))
+        t = self.comm.topic('h/test/h')
+        self.assertEqual('h/test/h', t.name)
+        for idx in range(10):
+            t.publish(idx, retain=True)
+        self.assertTrue(_wait_for(lambda: self._query('h/test/h') == (9, True)))
+        c = self.comm.topic('h/test/c', coalesce=True)
+        for idx in range(1000):
+            c.publish(idx, retain=True)
+        self.assertTrue(_wait_for(lambda: self._query('h/test/c') == (999, True)))
+        with self.assertRaises(ValueError):
+            self.comm.topic('h/test/h$')
+        self.comm.close()
+        self.comm = None
+        with self.assertRaises(RuntimeError):
+            t.publish(1)
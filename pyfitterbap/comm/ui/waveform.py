@@ -76,7 +76,7 @@ class WaveformWidget(QtWidgets.QWidget):
             if topic == self._source_combobox.currentText():
                 sample_id_bytes = value[:4]
                 d = self._buffer
-                d_next = np.frombuffer(value[4:], dtype=np.float32)
+                d_next = np.frombuffer(value, dtype=np.float32, offset=4)
                 d_len = len(d_next)
                 d_end = self._index + d_len
                 if d_end > len(d):
@@ -13,27 +13,192 @@
 # limitations under the License.
 
 
+"""
+Compute CRCs using the fitterbap C library.
+
+All functions accept any object supporting the buffer protocol with
+unsigned byte format, such as bytes, bytearray, memoryview and
+numpy.uint8 arrays, without copying.  Other iterables are converted
+using numpy.ascontiguousarray.  Computations on larger inputs release
+the GIL.
+"""
+
 from .c_crc cimport *
-from libc.stdint cimport uint8_t, uint16_t, uint32_t
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, int64_t
 cimport numpy as np
 import numpy as np
 
 
+GIL_RELEASE_SIZE = 4096
+"""Release the GIL when the total number of bytes is at least this size."""
+
+cdef int64_t _GIL_RELEASE_SIZE = GIL_RELEASE_SIZE
+cdef int64_t _CHUNK_SIZE = 0x40000000  # length is uint32_t
+
+cdef enum _crc_type_e:
+    _CRC8 = 0
+    _CRC16 = 1
+    _CRC32 = 2
+
+
+cdef uint32_t _crc_compute(int crc_type, uint32_t crc, const uint8_t * data, int64_t length) nogil:
+    cdef uint32_t sz
+    while length > 0:
+        sz = <uint32_t> (_CHUNK_SIZE if length > _CHUNK_SIZE else length)
+        if crc_type == _CRC8:
+            crc = fbp_crc_ccitt_8(<uint8_t> crc, data, sz)
+        elif crc_type == _CRC16:
+            crc = fbp_crc_ccitt_16(<uint16_t> crc, data, sz)
+        else:
+            crc = fbp_crc32(crc, data, sz)
+        data += sz
+        length -= sz
+    return crc
+
+
+cdef void _crc_batch_compute(int crc_type, uint32_t crc, size_t[::1] ptrs, int64_t[::1] lengths,
+                             uint32_t[::1] result) nogil:
+    cdef Py_ssize_t idx
+    for idx in range(result.shape[0]):
+        result[idx] = _crc_compute(crc_type, crc, <const uint8_t *> ptrs[idx], lengths[idx])
+
+
+cdef const uint8_t[::1] _as_u8(data):
+    cdef const uint8_t[::1] d_c
+    try:
+        d_c = data  # zero copy for contiguous, unsigned byte buffers
+    except (TypeError, ValueError, BufferError):
+        d_c = np.ascontiguousarray(data, dtype=np.uint8)
+    return d_c
+
+
+cdef object _crc(int crc_type, uint32_t crc, data):
+    cdef const uint8_t[::1] d_c = _as_u8(data)
+    cdef int64_t length = d_c.shape[0]
+    cdef const uint8_t * p
+    if length == 0:
+        return crc
+    p = &d_c[0]
+    if length >= _GIL_RELEASE_SIZE:
+        with nogil:
+            crc = _crc_compute(crc_type, crc, p, length)
+    else:
+        crc = _crc_compute(crc_type, crc, p, length)
+    return crc
+
+
+cdef object _crc_batch(int crc_type, uint32_t crc, data, offsets, dtype):
+    cdef const uint8_t[::1] d_c
+    cdef int64_t[::1] offsets_c
+    cdef size_t[::1] ptrs
+    cdef int64_t[::1] lengths
+    cdef uint32_t[::1] result_c
+    cdef Py_ssize_t idx
+    cdef Py_ssize_t count
+    cdef int64_t total = 0
+    cdef size_t base
+
+    if offsets is None:
+        buffers = [_as_u8(b) for b in data]  # hold references until complete
+        count = len(buffers)
+        ptrs = np.zeros(count, dtype=np.uintp)
+        lengths = np.zeros(count, dtype=np.int64)
+        for idx in range(count):
+            d_c = buffers[idx]
+            lengths[idx] = d_c.shape[0]
+            if lengths[idx]:
+                ptrs[idx] = <size_t> &d_c[0]
+                total += lengths[idx]
+    else:
+        d_c = _as_u8(data)
+        offsets_c = np.ascontiguousarray(offsets, dtype=np.int64)
+        count = offsets_c.shape[0] - 1
+        if count < 0:
+            raise ValueError('offsets must contain at least one entry')
+        base = <size_t> &d_c[0] if d_c.shape[0] else 0
+        ptrs = np.zeros(count, dtype=np.uintp)
+        lengths = np.zeros(count, dtype=np.int64)
+        for idx in range(count):
+            if offsets_c[idx] < 0 or offsets_c[idx] > offsets_c[idx + 1] or offsets_c[idx + 1] > d_c.shape[0]:
+                raise ValueError(f'invalid offsets at index {idx}')
+            ptrs[idx] = base + <size_t> offsets_c[idx]
+            lengths[idx] = offsets_c[idx + 1] - offsets_c[idx]
+        total = offsets_c[count] - offsets_c[0] if count else 0
+
+    result = np.empty(count, dtype=np.uint32)
+    result_c = result
+    if total >= _GIL_RELEASE_SIZE:
+        with nogil:
+            _crc_batch_compute(crc_type, crc, ptrs, lengths, result_c)
+    else:
+        _crc_batch_compute(crc_type, crc, ptrs, lengths, result_c)
+    return result.astype(dtype, copy=False)
+
+
 def crc_ccitt_8(crc, data):
-    cdef np.uint8_t [::1] d_c
-    data = np.ascontiguousarray(data, dtype=np.uint8)
-    d_c = data
-    return fbp_crc_ccitt_8(<uint8_t> crc, &d_c[0], len(data))
+    """Compute the CRC-CCITT-8.
+
+    :param crc: The existing CRC value, 0 for the first block.
+    :param data: The data buffer.
+    :return: The CRC-CCITT-8 value.
+    """
+    return _crc(_CRC8, <uint8_t> crc, data)
 
 
 def crc_ccitt_16(crc, data):
-    cdef np.uint8_t [::1] d_c
-    data = np.ascontiguousarray(data, dtype=np.uint8)
-    d_c = data
-    return fbp_crc_ccitt_16(<uint16_t> crc, &d_c[0], len(data))
+    """Compute the CRC-CCITT-16.
+
+    :param crc: The existing CRC value, 0 for the first block.
+    :param data: The data buffer.
+    :return: The CRC-CCITT-16 value.
+    """
+    return _crc(_CRC16, <uint16_t> crc, data)
+
 
 def crc32(crc, data):
-    cdef np.uint8_t [::1] d_c
-    data = np.ascontiguousarray(data, dtype=np.uint8)
-    d_c = data
-    return fbp_crc32(<uint32_t> crc, &d_c[0], len(data))
+    """Compute the CRC-32.
+
+    :param crc: The existing CRC value, 0 for the first block.
+    :param data: The data buffer.
+    :return: The CRC-32 value.
+    """
+    return _crc(_CRC32, <uint32_t> crc, data)
+
+
+def crc_ccitt_8_batch(data, offsets=None, crc=0):
+    """Compute the CRC-CCITT-8 for many blocks in one call.
+
+    :param data: The list of data buffers when offsets is None.  Otherwise,
+        a single data buffer containing all blocks.
+    :param offsets: The optional array of N + 1 byte offsets into data
+        where block i is data[offsets[i]:offsets[i + 1]].
+    :param crc: The initial CRC value for each block.
+    :return: The np.uint8 array of N CRC values.
+    """
+    return _crc_batch(_CRC8, <uint8_t> crc, data, offsets, np.uint8)
+
+
+def crc_ccitt_16_batch(data, offsets=None, crc=0):
+    """Compute the CRC-CCITT-16 for many blocks in one call.
+
+    :param data: The list of data buffers when offsets is None.  Otherwise,
+        a single data buffer containing all blocks.
+    :param offsets: The optional array of N + 1 byte offsets into data
+        where block i is data[offsets[i]:offsets[i + 1]].
+    :param crc: The initial CRC value for each block.
+    :return: The np.uint16 array of N CRC values.
+    """
+    return _crc_batch(_CRC16, <uint16_t> crc, data, offsets, np.uint16)
+
+
+def crc32_batch(data, offsets=None, crc=0):
+    """Compute the CRC-32 for many blocks in one call.
+
+    :param data: The list of data buffers when offsets is None.  Otherwise,
+        a single data buffer containing all blocks.
+    :param offsets: The optional array of N + 1 byte offsets into data
+        where block i is data[offsets[i]:offsets[i + 1]].
+    :param crc: The initial CRC value for each block.
+    :return: The np.uint32 array of N CRC values.
+    """
+    return _crc_batch(_CRC32, <uint32_t> crc, data, offsets, np.uint32)
@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import queue
+import threading
 import weakref
-from collections.abc import Mapping
+
+
+STRIPES_DEFAULT = 16
 
 
 def _as_bool(x):
@@ -26,8 +30,55 @@ def _as_bool(x):
     raise ValueError(f'Invalid boolean value: {x}')
 
 
+def _pattern_parse(topic):
+    """Parse an MQTT-style subscription topic.
+
+    :param topic: The subscription topic.  A '+' level matches any
+        single level, and a final '#' level matches the parent and
+        any number of child levels.
+    :return: The (levels, multi) tuple, excluding any final '#'.
+        Trailing '/' separators are ignored.
+    :raise ValueError: On invalid wildcard usage.
+    """
+    levels = topic.rstrip('/').split('/')
+    multi = False
+    for idx, level in enumerate(levels):
+        if '#' in level:
+            if level != '#' or idx != len(levels) - 1:
+                raise ValueError(f'# must be the entire final level: {topic}')
+            multi = True
+        elif '+' in level and level != '+':
+            raise ValueError(f'+ must be an entire level: {topic}')
+    if multi:
+        levels.pop()
+    return levels, multi
+
+
+class _Pattern:
+    """A compiled wildcard subscription containing '+' levels."""
+
+    __slots__ = ['levels', 'multi', 'subscribers']
+
+    def __init__(self, levels, multi):
+        self.levels = levels
+        self.multi = multi
+        self.subscribers = []  # list of tuples of callback, forward
+
+    def match(self, topic):
+        parts = topic.split('/')
+        if len(parts) < len(self.levels) or (len(parts) > len(self.levels) and not self.multi):
+            return False
+        for level, part in zip(self.levels, parts):
+            if level != '+' and level != part:
+                return False
+        return True
+
+
 class _Topic:
 
+    # Hosts may hold tens of thousands of topics, so keep them compact.
+    __slots__ = ['_topic', '_value', 'meta', '_parent', 'children', '_subscribers', '_dispatch', '__weakref__']
+
     def __init__(self, parent, topic, value=None):
         """Hold a single Topic entry for :class:`PubSub`.
 
@@ -40,9 +91,10 @@ class _Topic:
         self.meta = None
         if parent is not None:
             parent = weakref.ref(parent)
-        self.parent = parent
-        self.children: Mapping[str, _Topic] = {}
-        self._subscribers = []  # list of tuples of callback, forward
+        self._parent = parent
+        self.children = ()  # list of _Topic on first child, PubSub indexes by name
+        self._subscribers = ()  # list of tuples of callback, forward on first subscribe
+        self._dispatch = None  # cached subscribers for self, parents and patterns
 
     def __str__(self):
         return f'Topic({self._topic}, value={self._value})'
@@ -51,6 +103,13 @@ class _Topic:
     def name(self):
         return self._topic
 
+    @property
+    def parent(self):
+        parent = self._parent
+        if parent is not None:
+            parent = parent()  # weakref to parent
+        return parent
+
     @property
     def value(self):
         return self._value
@@ -59,35 +118,70 @@ class _Topic:
     def value(self, x):
         self.publish(x)
 
-    def publish(self, x, retain=None, src_cbk=None):
+    def publish(self, x, retain=None, src_cbk=None, patterns=None):
         if bool(retain):
             if self._value == x:  # deduplicate
                 return
             self._value = x
         else:
             self._value = None
-        topic = self
-        while topic is not None:
-            for subscriber, forward in topic._subscribers:
-                if subscriber == src_cbk:
-                    continue
-                subscriber(self._topic, x, retain)
-            topic = topic.parent
-            if topic is not None:
-                topic = topic()  # weakref to parent
+        dispatch = self._dispatch
+        if dispatch is None:
+            dispatch = self._dispatch_update(patterns)
+        for subscriber, forward in dispatch:
+            if subscriber == src_cbk:
+                continue
+            subscriber(self._topic, x, retain)
+
+    def _dispatch_update(self, patterns=None):
+        """Compute the subscribers for this topic.
+
+        :param patterns: The iterable of :class:`_Pattern` instances.
+        :return: The tuple of subscribers for this topic, followed by its
+            parents, followed by matching patterns.
+        """
+        subscribers = []
+        t = self
+        while t is not None:
+            subscribers.extend(t._subscribers)
+            t = t.parent
+        if patterns:
+            for pattern in patterns:
+                if pattern.subscribers and pattern.match(self._topic):
+                    subscribers.extend(pattern.subscribers)
+        dispatch = tuple(subscribers)
+        parent = self.parent
+        if parent is not None:
+            parent_dispatch = parent._dispatch
+            if parent_dispatch is None:
+                parent_dispatch = parent._dispatch_update(patterns)
+            if parent_dispatch == dispatch:
+                dispatch = parent_dispatch  # leaf topics share their parent's tuple
+        self._dispatch = dispatch
+        return dispatch
+
+    def _dispatch_invalidate(self):
+        self._dispatch = None
+        for child in self.children:
+            child._dispatch_invalidate()
 
     def forward(self, topic, value, retain=None, src_cbk=None, traverse_parent=False):
         for subscriber, forward in self._subscribers:
             if subscriber == src_cbk or not forward:
                 continue
             subscriber(topic, value, retain)
-        if traverse_parent and self.parent is not None:
-            parent = self.parent()
+        if traverse_parent:
+            parent = self.parent
             if parent is not None:
                 parent.forward(topic, value, retain, src_cbk, traverse_parent)
 
+    def _child_add(self, child):
+        if not self.children:
+            self.children = []
+        self.children.append(child)
+
     def _publish_new_subscriber(self, cbk):
-        for child in self.children.values():
+        for child in self.children:
             child._publish_new_subscriber(cbk)
         if self._value is not None:
             cbk(self._topic, self._value)
@@ -96,7 +190,10 @@ class _Topic:
         if not callable(cbk):
             raise ValueError('subscribers must be callable')
         if cbk not in self._subscribers:
+            if not self._subscribers:
+                self._subscribers = []
             self._subscribers.append((cbk, forward))
+            self._dispatch_invalidate()
         if not bool(skip_retained):
             self._publish_new_subscriber(cbk)
 
@@ -107,6 +204,8 @@ class _Topic:
                 unsub.append(idx)
         for idx in reversed(unsub):
             self._subscribers.pop(idx)
+        if unsub:
+            self._dispatch_invalidate()
 
 
 class PubSub:
@@ -127,54 +226,74 @@ class PubSub:
     Metadata is returned as 'my/path/var$'
     Query the current value using '?' or 'my/path/?'.
     The query values are returned as 'my/path/var?'
+    Use :meth:`snapshot` to get all local retained values at once.
+
+    Subscriptions support the MQTT wildcards.  A '+' level matches
+    any single topic level, such as '+/din' or 'h/c/+/din'.  A final
+    '#' level, such as 'h/#', matches the parent and all of its
+    children, which is the same as subscribing to 'h'.  Wildcard
+    subscriptions containing '+' do not receive forwarded $ and ?
+    requests.
     """
     def __init__(self, topic_prefix: str = None):
         self._topic_prefix = '' if topic_prefix is None else str(topic_prefix)
         self._root = _Topic(None, '')
+        self._topics = {'': self._root}  # flat index: topic name to _Topic
+        self._patterns = {}  # wildcard subscription topic to _Pattern
 
     def _topic_find(self, topic, create=False):
-        t = self._root
+        t = self._topics.get(topic)
+        if t is not None:
+            return t
         while len(topic) and topic[-1] in '/$?':
             topic = topic[:-1]
-        if len(topic):
-            parts_so_far = []
-            parts = topic.split('/')
-            for part in parts:
-                parts_so_far.append(part)
-                child = t.children.get(part)
-                if child is None:
-                    if create:
-                        subtopic = '/'.join(parts_so_far)
-                        child = _Topic(t, subtopic)
-                        t.children[part] = child
-                    else:
-                        return None
-                t = child
+        t = self._topics.get(topic)
+        if t is None and create:
+            t = self._topic_create(topic)
+        return t
+
+    def _topic_create(self, topic):
+        parent_name = topic.rpartition('/')[0]
+        parent = self._topics.get(parent_name)
+        if parent is None:
+            parent = self._topic_create(parent_name)
+        t = _Topic(parent, topic)
+        parent._child_add(t)
+        self._topics[topic] = t
         return t
 
     def _topic_find_existing_base(self, topic):
-        t = self._root
         while len(topic) and topic[-1] in '/$?':
             topic = topic[:-1]
-        if len(topic):
-            parts_so_far = []
-            parts = topic.split('/')
-            for part in parts:
-                parts_so_far.append(part)
-                child = t.children.get(part)
-                if child is None:
-                    return t
-                t = child
-        return t
+        while True:
+            t = self._topics.get(topic)
+            if t is not None:
+                return t
+            topic = topic.rpartition('/')[0]
 
     def _meta_send_all(self, topic: _Topic, src_cbk=None):
         if topic is None:
             return
         if topic.meta is not None:
             topic.forward(topic.name + '$', topic.meta, retain=False, src_cbk=src_cbk, traverse_parent=True)
-        for child in topic.children.values():
+        for child in topic.children:
             self._meta_send_all(child, src_cbk)
 
+    def _query_send_all(self, topic: _Topic, src_cbk=None):
+        for name, value in self._snapshot(topic).items():
+            self._topics[name].forward(name + '?', value, retain=True, src_cbk=src_cbk, traverse_parent=True)
+
+    @staticmethod
+    def _snapshot(topic: _Topic):
+        values = {}
+        stack = [topic]
+        while stack:
+            t = stack.pop()
+            if t._value is not None:
+                values[t._topic] = t._value
+            stack.extend(reversed(t.children))
+        return values
+
     def publish(self, topic, value, retain=None, src_cbk=None):
         """Publish to a topic.
 
@@ -207,11 +326,28 @@ class PubSub:
                     t.forward(topic, value, retain=True, src_cbk=src_cbk, traverse_parent=True)
             else:  # get or set for another pubsub instance relay
                 t.forward(topic, value, retain=True, src_cbk=src_cbk, traverse_parent=True)
-        elif topic[-1] == '?':
-            pass  # todo, topic query
+        elif topic == '?':
+            self._query_send_all(self._topic_find(self._topic_prefix, create=True), src_cbk)
+            self._root.forward(topic, None, retain=retain, src_cbk=src_cbk)
+        elif topic.endswith('/?'):
+            if topic.startswith(self._topic_prefix):  # for us
+                t = self._topic_find(topic, create=False)
+                if t is not None:
+                    self._query_send_all(t, src_cbk)
+            else:
+                t = self._topic_find_existing_base(topic)
+                t.forward(topic, None, retain=retain, src_cbk=src_cbk, traverse_parent=True)
+        elif topic[-1] == '?':  # endswith
+            if topic.startswith(self._topic_prefix):  # query for us
+                t = self._topic_find(topic, create=False)
+                if t is not None and t.value is not None:
+                    t.forward(topic, t.value, retain=True, src_cbk=src_cbk, traverse_parent=True)
+            else:  # query or response for another pubsub instance relay
+                t = self._topic_find_existing_base(topic)
+                t.forward(topic, value, retain=True, src_cbk=src_cbk, traverse_parent=True)
         else:
             t = self._topic_find(topic, create=True)
-            t.publish(value, retain, src_cbk)
+            t.publish(value, retain, src_cbk, self._patterns.values())
 
     def meta(self, topic, meta):
         if topic[-1] != '$':
@@ -230,27 +366,87 @@ class PubSub:
             raise KeyError(f'topic {topic} does not exist')
         return t.value
 
+    def snapshot(self, prefix=None):
+        """Get all retained values under a topic.
+
+        :param prefix: The topic name.  None (default) or '' gets all
+            retained values.
+        :return: The dict of topic name to retained value, including
+            prefix itself, in topic tree order.  The dict is empty
+            if prefix does not exist.
+
+        Unlike subscribing with retained values or calling :meth:`get`
+        for each topic, this method traverses the topic tree once.
+        """
+        t = self._topic_find(prefix or '', create=False)
+        if t is None:
+            return {}
+        return self._snapshot(t)
+
+    def _pattern_retained(self, pattern):
+        return [(t._topic, t._value) for t in self._topics.values()
+                if t._value is not None and pattern.match(t._topic)]
+
+    def _pattern_replay(self, pattern, cbk):
+        for topic, value in self._pattern_retained(pattern):
+            cbk(topic, value)
+
+    def _subscribe(self, topic, cbk, forward=None):
+        """Add a subscriber without publishing retained values.
+
+        :return: The callable(cbk) that publishes the retained values.
+        """
+        levels, multi = _pattern_parse(topic)
+        if '+' not in levels:
+            t = self._topic_find('/'.join(levels), create=True)
+            t.subscribe(cbk, skip_retained=True, forward=forward)
+            return t._publish_new_subscriber
+        if not callable(cbk):
+            raise ValueError('subscribers must be callable')
+        topic = topic.rstrip('/')
+        pattern = self._patterns.get(topic)
+        if pattern is None:
+            pattern = _Pattern(levels, multi)
+            self._patterns[topic] = pattern
+        if cbk not in [s for s, _ in pattern.subscribers]:
+            pattern.subscribers.append((cbk, forward))
+            self._root._dispatch_invalidate()
+        return lambda fn: self._pattern_replay(pattern, fn)
+
     def subscribe(self, topic, cbk, skip_retained=None, forward=None):
         """Subscribe to a topic and its children.
 
-        :param topic: The topic name.
+        :param topic: The topic name, which may contain wildcards.
         :param cbk: The callable(topic, value, retain) called on value changes.
         :param skip_retained: Skip the update of all retained values
             that normally occurs when subscribing.
         :param forward: When true, forward $ and ? requests to this subscriber.
             Use True for distributed PubSub instances and user interfaces.
+        :raise ValueError: If topic contains invalid wildcards.
         """
-        t = self._topic_find(topic, create=True)
-        t.subscribe(cbk, skip_retained=skip_retained, forward=forward)
+        replay = self._subscribe(topic, cbk, forward)
+        if not bool(skip_retained):
+            replay(cbk)
 
     def unsubscribe(self, topic, cbk):
         """Unsubscribe from a topic.
 
-        :param topic: The topic name.
+        :param topic: The topic name provided to subscribe.
         :param cbk: The callable provided to subscribe.
         """
-        t = self._topic_find(topic, create=True)
-        t.unsubscribe(cbk)
+        levels, _ = _pattern_parse(topic)
+        if '+' not in levels:
+            t = self._topic_find('/'.join(levels), create=True)
+            t.unsubscribe(cbk)
+            return
+        topic = topic.rstrip('/')
+        pattern = self._patterns.get(topic)
+        if pattern is None:
+            return
+        pattern.subscribers = [x for x in pattern.subscribers if x[0] != cbk]
+        if not pattern.subscribers:
+            self._patterns.pop(topic)
+        self._root._dispatch_invalidate()
 
     def create(self, topic, meta=None, subscriber_cbk=None, skip_retained=None, forward=None):
         t = self._topic_find(topic, create=False)
@@ -261,6 +457,186 @@ class PubSub:
         if meta is not None and 'default' in meta:
             retain = _as_bool(meta.get('retain', 0))
             x = meta['default']
-            t.publish(x, retain, subscriber_cbk)
+            t.publish(x, retain, subscriber_cbk, self._patterns.values())
         if subscriber_cbk is not None:
             t.subscribe(subscriber_cbk, skip_retained=skip_retained, forward=forward)
+
+
+class SubscriberQueue:
+    """Deliver subscriber callbacks on the thread that calls :meth:`process`.
+
+    :param maxsize: The maximum number of pending callbacks.
+        0 (default) is unlimited.
+
+    Provide this instance as the executor to
+    :meth:`ThreadSafePubSub.subscribe`.  Any object with a compatible
+    submit(fn, *args) method, such as a concurrent.futures.Executor,
+    also works.
+    """
+
+    def __init__(self, maxsize=0):
+        self._queue = queue.Queue(maxsize)
+
+    def submit(self, fn, *args):
+        """Queue a callback.
+
+        :param fn: The callable.
+        :param args: The positional arguments for fn.
+        """
+        self._queue.put((fn, args))
+
+    def process(self, timeout=None):
+        """Call all pending callbacks.
+
+        :param timeout: The time in seconds to wait for the first callback.
+            None (default) does not wait.
+        :return: The number of callbacks called.
+        """
+        count = 0
+        try:
+            if timeout:
+                fn, args = self._queue.get(timeout=timeout)
+                fn(*args)
+                count += 1
+            while True:
+                fn, args = self._queue.get_nowait()
+                fn(*args)
+                count += 1
+        except queue.Empty:
+            pass
+        return count
+
+
+class _ExecutorSubscriber:
+    """Submit subscriber callbacks to an executor.
+
+    Compares equal to the wrapped callback, so unsubscribe and src_cbk
+    work with the callback provided to subscribe.
+    """
+
+    __slots__ = ['cbk', 'executor']
+
+    def __init__(self, cbk, executor):
+        self.cbk = cbk
+        self.executor = executor
+
+    def __call__(self, topic, value, retain=None):
+        self.executor.submit(self.cbk, topic, value, retain)
+
+    def __eq__(self, other):
+        if isinstance(other, _ExecutorSubscriber):
+            other = other.cbk
+        return self.cbk == other
+
+    def __hash__(self):
+        return hash(self.cbk)
+
+
+class ThreadSafePubSub(PubSub):
+    """A :class:`PubSub` that allows publishing from any thread.
+
+    :param topic_prefix: The topic prefix string owned by this
+        implementation, see :class:`PubSub`.
+    :param stripes: The number of publish locks.  None uses STRIPES_DEFAULT.
+
+    Publishes to existing topics only hold the lock for the stripe
+    selected by the first topic level while updating the retained
+    value, so device threads that each own a subtree, such as
+    'dev1/...', publish in parallel.  Topic creation, subscribe,
+    unsubscribe, metadata and queries use a single lock.
+
+    By default, subscribers are called on the publishing thread without
+    holding any lock, so subscribers may publish.  Each thread's
+    publishes are delivered in order, but subscribers may be called
+    concurrently from different threads.  Subscribers that are slow or
+    not thread-safe should provide an executor to :meth:`subscribe`,
+    such as :class:`SubscriberQueue`.  Callbacks for metadata and query
+    requests are called while holding the topic lock.
+    """
+
+    def __init__(self, topic_prefix: str = None, stripes=None):
+        self._lock = threading.RLock()
+        stripes = STRIPES_DEFAULT if stripes is None else int(stripes)
+        if stripes <= 0:
+            raise ValueError(f'stripes must be > 0: {stripes}')
+        self._stripes = [threading.RLock() for _ in range(stripes)]
+        super().__init__(topic_prefix)
+
+    def _stripe(self, topic):
+        return self._stripes[hash(topic.partition('/')[0]) % len(self._stripes)]
+
+    def publish(self, topic, value, retain=None, src_cbk=None):
+        """Publish to a topic, see :meth:`PubSub.publish`.
+
+        This method may be called from any thread.
+        """
+        if not len(topic):
+            raise ValueError('Empty topic not allowed')
+        if topic[-1] in '$?':
+            with self._lock:
+                return super().publish(topic, value, retain, src_cbk)
+        t = self._topics.get(topic)
+        dispatch = None if t is None else t._dispatch
+        if dispatch is None:
+            with self._lock:
+                t = self._topic_find(topic, create=True)
+                dispatch = t._dispatch
+                if dispatch is None:
+                    dispatch = t._dispatch_update(self._patterns.values())
+        with self._stripe(topic):
+            if bool(retain):
+                if t._value == value:  # deduplicate
+                    return
+                t._value = value
+            else:
+                t._value = None
+        for subscriber, _ in dispatch:
+            if subscriber == src_cbk:
+                continue
+            subscriber(t._topic, value, retain)
+
+    def get(self, topic):
+        with self._lock:
+            return super().get(topic)
+
+    def snapshot(self, prefix=None):
+        with self._lock:
+            return super().snapshot(prefix)
+
+    def _pattern_retained(self, pattern):
+        with self._lock:
+            return super()._pattern_retained(pattern)
+
+    def subscribe(self, topic, cbk, skip_retained=None, forward=None, executor=None):
+        """Subscribe to a topic and its children, see :meth:`PubSub.subscribe`.
+
+        :param executor: The object with a submit(fn, *args) method used
+            to call cbk, such as :class:`SubscriberQueue` or a
+            concurrent.futures.Executor.  None (default) calls cbk
+            on the publishing thread.
+        """
+        if executor is not None:
+            if not callable(cbk):
+                raise ValueError('subscribers must be callable')
+            cbk = _ExecutorSubscriber(cbk, executor)
+        with self._lock:
+            replay = self._subscribe(topic, cbk, forward)
+        if not bool(skip_retained):
+            replay(cbk)
+
+    def unsubscribe(self, topic, cbk):
+        with self._lock:
+            super().unsubscribe(topic, cbk)
+
+    def create(self, topic, meta=None, subscriber_cbk=None, skip_retained=None, forward=None):
+        with self._lock:
+            t = self._topic_find(topic, create=False)
+            if t is not None:
+                raise ValueError(f'Topic {topic} already exists')
+            t = self._topic_find(topic, create=True)
+            t.meta = meta
+        if meta is not None and 'default' in meta:
+            retain = _as_bool(meta.get('retain', 0))
+            self.publish(topic, meta['default'], retain, subscriber_cbk)
+        if subscriber_cbk is not None:
+            self.subscribe(topic, subscriber_cbk, skip_retained=skip_retained, forward=forward)
@@ -0,0 +1,87 @@
+# Copyright 2021 Jetperch LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Report the pyfitterbap.pubsub.PubSub publish rate and memory per topic.
+
+Usage: python -m pyfitterbap.test.pubsub_benchmark [--count N] [--topics N] [--memory-topics N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from pyfitterbap.pubsub import PubSub
+
+
+DEVICES = 10
+
+
+def get_parser():
+    p = argparse.ArgumentParser(description='PubSub publish benchmark.')
+    p.add_argument('--count', type=int, default=1000000,
+                   help='The total number of publishes.')
+    p.add_argument('--topics', type=int, default=1000,
+                   help='The number of topics.')
+    p.add_argument('--memory-topics', type=int, default=50000,
+                   help='The number of topics for the memory measurement.')
+    return p
+
+
+def run(count, topic_count):
+    pubsub = PubSub('h')
+    received = [0]
+
+    def on_update(topic, value, retain=None):
+        received[0] += 1
+
+    pubsub.subscribe('', on_update, skip_retained=True)
+    pubsub.subscribe('h/dev0', on_update, skip_retained=True)
+    topics = [f'h/dev{idx % DEVICES}/value{idx}' for idx in range(topic_count)]
+    for topic in topics:
+        pubsub.publish(topic, 0, retain=True)
+
+    iterations = count // topic_count
+    publish = pubsub.publish
+    t_start = time.perf_counter()
+    for value in range(1, iterations + 1):
+        for topic in topics:
+            publish(topic, value, retain=True)
+    duration = time.perf_counter() - t_start
+    total = iterations * topic_count
+    print(f'{total} publishes across {topic_count} topics in {duration:.3f} s')
+    print(f'{total / duration / 1e6:.3f} M publishes/s, {received[0]} callbacks')
+
+
+def memory(topic_count):
+    # create the names first to only measure the topic tree and index
+    topics = [f'h/dev{idx % DEVICES}/value{idx}' for idx in range(topic_count)]
+    tracemalloc.start()
+    pubsub = PubSub('h')
+    for topic in topics:
+        pubsub.publish(topic, 1, retain=True)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{size / topic_count:.1f} bytes per topic for {topic_count} topics')
+    return pubsub
+
+
+def main():
+    args = get_parser().parse_args()
+    run(args.count, args.topics)
+    memory(args.memory_topics)
+    return 0
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# Copyright 2021 Jetperch LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test the CRC module.
+"""
+
+import unittest
+import numpy as np
+from pyfitterbap import crc
+
+
+MSG = b'123456789'
+
+
+class TestCrc(unittest.TestCase):
+
+    def test_well_known(self):
+        self.assertEqual(0x2f, crc.crc_ccitt_8(0, MSG))
+        self.assertEqual(0xffff & ~0x29B1, crc.crc_ccitt_16(0, MSG))
+        self.assertEqual(0xCBF43926, crc.crc32(0, MSG))
+
+    def test_buffer_types(self):
+        for data in [MSG, bytearray(MSG), memoryview(MSG), np.frombuffer(MSG, dtype=np.uint8), list(MSG)]:
+            self.assertEqual(0xCBF43926, crc.crc32(0, data))
+
+    def test_non_contiguous(self):
+        data = np.frombuffer(MSG + MSG, dtype=np.uint8).reshape((2, -1))[:, 0]
+        self.assertEqual(crc.crc32(0, bytes(data)), crc.crc32(0, data))
+
+    def test_empty(self):
+        self.assertEqual(0, crc.crc32(0, b''))
+        self.assertEqual(0x1234, crc.crc32(0x1234, b''))
+
+    def test_large_releases_gil(self):
+        data = bytes(range(256)) * 64
+        self.assertGreater(len(data), crc.GIL_RELEASE_SIZE)
+        expect = crc.crc32(0, data[:100])
+        expect = crc.crc32(expect, data[100:])
+        self.assertEqual(expect, crc.crc32(0, data))
+
+    def test_batch_list(self):
+        frames = [MSG, b'', bytes(range(200))]
+        for fn, fn_batch, dtype in [(crc.crc_ccitt_8, crc.crc_ccitt_8_batch, np.uint8),
+                                    (crc.crc_ccitt_16, crc.crc_ccitt_16_batch, np.uint16),
+                                    (crc.crc32, crc.crc32_batch, np.uint32)]:
+            result = fn_batch(frames)
+            self.assertEqual(dtype, result.dtype)
+            self.assertEqual([fn(0, f) for f in frames], result.tolist())
+
+    def test_batch_offsets(self):
+        data = bytes(range(256)) * 4
+        offsets = [0, 9, 9, 100, 1024]
+        result = crc.crc32_batch(data, offsets)
+        expect = [crc.crc32(0, data[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)]
+        self.assertEqual(expect, result.tolist())
+
+    def test_batch_offsets_invalid(self):
+        with self.assertRaises(ValueError):
+            crc.crc32_batch(MSG, [0, 5, 2])
+        with self.assertRaises(ValueError):
+            crc.crc32_batch(MSG, [0, 20])
@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import unittest
-from pyfitterbap.pubsub import PubSub
+from pyfitterbap.pubsub import PubSub, SubscriberQueue, ThreadSafePubSub
 
 
 class PubSubTest(unittest.TestCase):
@@ -68,6 +69,22 @@ class PubSubTest(unittest.TestCase):
         self.p.publish('hello/world', 'there')
         self.assertEqual([], self.sub1)
 
+    def test_subscribe_after_publish(self):
+        self.p.publish('hello/there/world', 'value')
+        self.p.subscribe('hello', self.sub1_fn)
+        self.p.publish('hello/there/world', 'value2')
+        self.p.unsubscribe('hello', self.sub1_fn)
+        self.p.publish('hello/there/world', 'value3')
+        self.assertEqual([('hello/there/world', 'value2')], self.sub1)
+
+    def test_topic_suffix(self):
+        self.p.subscribe('hello/there/', self.sub1_fn)
+        self.p.publish('hello/there/world', 'value', retain=True)
+        self.assertEqual('value', self.p.get('hello/there/world/'))
+        self.assertEqual([('hello/there/world', 'value')], self.sub1)
+        with self.assertRaises(KeyError):
+            self.p.get('hello/missing')
+
     def test_get(self):
         self.p.publish('hello/world', 'there', retain=True)
         self.assertEqual('there', self.p.get('hello/world'))
@@ -76,6 +93,13 @@ class PubSubTest(unittest.TestCase):
         self.p.publish('hello/world', 'newer')  # not retained!
         self.assertIsNone(self.p.get('hello/world'))
 
+    def test_topic_value_setter(self):
+        self.p.subscribe('hello', self.sub1_fn)
+        t = self.p._topic_find('hello/world', create=True)
+        self.assertIs(self.p._topic_find('hello'), t.parent)
+        t.value = 'there'
+        self.assertEqual([('hello/world', 'there')], self.sub1)
+
     def test_meta(self):
         meta1 = {'type': 'u32'}
         self.p.meta('hello/world', meta1)
@@ -93,4 +117,136 @@ class PubSubTest(unittest.TestCase):
         self.p.publish('other/$', None)
         self.assertEqual([('other/$', None)], self.sub1)
 
-    # def test_query(self):  # todo
+    def test_wildcard_single_level(self):
+        self.p.subscribe('+/din', self.sub1_fn)
+        self.p.publish('dev/din', 1)
+        self.p.publish('dev/log', 2)
+        self.p.publish('dev/din/x', 3)
+        self.p.publish('din', 4)
+        self.assertEqual([('dev/din', 1)], self.sub1)
+
+    def test_wildcard_nested(self):
+        self.p.subscribe('+/h/c/+/din', self.sub1_fn)
+        self.p.publish('dev/h/c/1/din', 1)
+        self.p.publish('dev/h/c/1/dout', 2)
+        self.p.publish('dev/h/s/1/din', 3)
+        self.assertEqual([('dev/h/c/1/din', 1)], self.sub1)
+
+    def test_wildcard_multi_level(self):
+        self.p.subscribe('+/h/#', self.sub1_fn)
+        self.p.subscribe('hello/#', self.sub2_fn)
+        self.p.publish('dev/h', 1)
+        self.p.publish('dev/h/c/1/din', 2)
+        self.p.publish('dev/x', 3)
+        self.p.publish('hello/world', 4)
+        self.assertEqual([('dev/h', 1), ('dev/h/c/1/din', 2)], self.sub1)
+        self.assertEqual([('hello/world', 4)], self.sub2)
+
+    def test_wildcard_retained(self):
+        self.p.publish('a/din', 1, retain=True)
+        self.p.publish('b/din', 2, retain=True)
+        self.p.publish('b/log', 3, retain=True)
+        self.p.subscribe('+/din', self.sub1_fn)
+        self.assertEqual([('a/din', 1), ('b/din', 2)], self.sub1)
+        self.p.subscribe('+/log', self.sub2_fn, skip_retained=True)
+        self.assertEqual([], self.sub2)
+
+    def test_wildcard_unsub(self):
+        self.p.publish('a/din', 1)
+        self.p.subscribe('+/din', self.sub1_fn)
+        self.p.subscribe('a', self.sub2_fn)
+        self.p.publish('a/din', 2)
+        self.p.unsubscribe('+/din', self.sub1_fn)
+        self.p.publish('a/din', 3)
+        self.assertEqual([('a/din', 2)], self.sub1)
+        self.assertEqual([('a/din', 2), ('a/din', 3)], self.sub2)
+
+    def test_wildcard_trailing_separator(self):
+        self.p.subscribe('+/din/', self.sub1_fn)
+        self.p.subscribe('hello/#/', self.sub2_fn)
+        self.p.publish('dev/din', 1)
+        self.p.publish('hello/world', 2)
+        self.p.unsubscribe('+/din', self.sub1_fn)
+        self.p.publish('dev/din', 3)
+        self.assertEqual([('dev/din', 1)], self.sub1)
+        self.assertEqual([('hello/world', 2)], self.sub2)
+
+    def test_wildcard_invalid(self):
+        for topic in ['a/#/b', 'a/b#', 'a+/b', 'a/+b']:
+            with self.assertRaises(ValueError):
+                self.p.subscribe(topic, self.sub1_fn)
+
+    def test_query(self):
+        self.p.publish('hello/a/v1', 1, retain=True)
+        self.p.publish('hello/a/v2', 2, retain=True)
+        self.p.publish('hello/b', 3, retain=True)
+        self.p.subscribe('', self.sub1_fn, forward=True)
+        self.sub1.clear()
+        self.p.publish('hello/a/?', None)
+        self.assertEqual([('hello/a/v1?', 1), ('hello/a/v2?', 2)], self.sub1)
+        self.sub1.clear()
+        self.p.publish('hello/b?', None)
+        self.assertEqual([('hello/b?', 3)], self.sub1)
+        self.sub1.clear()
+        self.p.publish('?', None)
+        self.assertEqual([('hello/a/v1?', 1), ('hello/a/v2?', 2), ('hello/b?', 3), ('?', None)], self.sub1)
+
+    def test_query_other(self):
+        self.p.subscribe('other', self.sub1_fn, forward=True)
+        self.p.publish('other/?', None)
+        self.p.publish('other/v?', 4)
+        self.assertEqual([('other/?', None), ('other/v?', 4)], self.sub1)
+
+    def test_snapshot(self):
+        self.p.publish('hello/a/v1', 1, retain=True)
+        self.p.publish('hello/a/v2', 2)  # not retained
+        self.p.publish('hello/a/v3/x', 3, retain=True)
+        self.p.publish('hello/b', 4, retain=True)
+        self.assertEqual({'hello/a/v1': 1, 'hello/a/v3/x': 3}, self.p.snapshot('hello/a'))
+        self.assertEqual({'hello/a/v1': 1, 'hello/a/v3/x': 3, 'hello/b': 4}, self.p.snapshot())
+        self.assertEqual({}, self.p.snapshot('hello/missing'))
+
+
+class ThreadSafePubSubTest(PubSubTest):
+
+    def setUp(self):
+        super().setUp()
+        self.p = ThreadSafePubSub(topic_prefix='hello')
+
+    def test_publish_threads(self):
+        thread_count, count = 8, 1000
+        self.p.subscribe('', self.sub1_fn)
+        self.p.subscribe('dev3', self.sub2_fn)
+
+        def run(idx):
+            for value in range(count):
+                self.p.publish(f'dev{idx}/value', value, retain=True)
+
+        threads = [threading.Thread(target=run, args=(idx,)) for idx in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(thread_count * count, len(self.sub1))
+        self.assertEqual([('dev3/value', value) for value in range(count)], self.sub2)
+        for idx in range(thread_count):
+            self.assertEqual(count - 1, self.p.get(f'dev{idx}/value'))
+
+    def test_subscriber_queue(self):
+        q = SubscriberQueue()
+        self.p.publish('hello/world', 'there', retain=True)
+        self.p.subscribe('hello', self.sub1_fn, executor=q)
+        thread = threading.Thread(target=self.p.publish, args=('hello/world', 'again'))
+        thread.start()
+        thread.join()
+        self.assertEqual([], self.sub1)
+        self.assertEqual(2, q.process())
+        self.assertEqual([('hello/world', 'there'), ('hello/world', 'again')], self.sub1)
+        self.p.publish('hello/world', 'src', src_cbk=self.sub1_fn)
+        self.p.unsubscribe('hello', self.sub1_fn)
+        self.p.publish('hello/world', 'unsubscribed')
+        self.assertEqual(0, q.process())
+
+    def test_invalid_stripes(self):
+        with self.assertRaises(ValueError):
+            ThreadSafePubSub(stripes=0)
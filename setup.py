@@ -39,6 +39,7 @@ VERSION_PATH = os.path.join(MYPATH, 'pyfitterbap', 'version.py')
 C_INC_PATH = os.path.join(MYPATH, 'include')
 C_INC2_PATH = os.path.join(MYPATH, 'pyfitterbap', 'include')
 C_INC3_PATH = os.path.join(MYPATH, 'third-party', 'tinyprintf')
+C_INC4_PATH = os.path.join(MYPATH, 'third-party', 'uthash', 'src')
 
 
 try:
@@ -53,7 +54,7 @@ with open(VERSION_PATH, 'r', encoding='utf-8') as f:
     exec(f.read(), about)
 
 
-C_INCS = [C_INC_PATH, C_INC2_PATH, C_INC3_PATH, np.get_include()]
+C_INCS = [C_INC_PATH, C_INC2_PATH, C_INC3_PATH, C_INC4_PATH, np.get_include()]
 
 if sys.platform.startswith('win'):
     platform_sources = [
@@ -66,7 +67,13 @@ if sys.platform.startswith('win'):
     ]
 elif sys.platform.startswith('linux'):
     platform_sources = [
-        'src/host/linux/platform.c'
+        'src/host/linux/comm.c',
+        'src/host/linux/loopback.c',
+        'src/host/linux/os_mutex.c',
+        'src/host/linux/os_task.c',
+        'src/host/linux/platform.c',
+        'src/host/linux/uart.c',
+        'src/host/linux/uart_thread.c',
     ]
 elif sys.platform.startswith('darwin'):  # macos
     platform_sources = []
@@ -95,6 +102,7 @@ extensions = [
             'src/fsm.c',
             'src/log.c',
             'src/logh.c',
+            'src/memory/pool.c',
             'src/pubsub.c',
             'src/topic.c',
             'src/topic_list.c',
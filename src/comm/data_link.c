@@ -41,6 +41,9 @@
 
 #define SEND_COUNT_MAX (25)
 #define INTERVAL_MIN (FBP_TIME_MICROSECOND * 100)
+#define TX_RTO_MIN (FBP_TIME_MILLISECOND * 1)
+#define TX_CWND_MIN (2)
+#define TX_CWND_INIT (8)
 
 
 enum state_e {
@@ -63,17 +66,19 @@ enum rx_frame_state_e {
 
 struct tx_frame_s {
     int64_t last_send_time;
+    uint32_t send_seq;  // the value of tx_send_seq for the most recent send
     uint8_t state;
     uint8_t send_count;
-    uint8_t msg[FBP_FRAMER_MAX_SIZE];
+    uint16_t frame_sz;
+    uint8_t msg[];  // sized for payload_max
 };
 
 struct rx_frame_s {
     uint8_t state;
-    uint8_t msg_size;  // minus 1
+    uint16_t msg_size;  // minus 1
     uint16_t frame_id;
     uint16_t metadata;
-    uint8_t msg[FBP_FRAMER_PAYLOAD_MAX_SIZE];
+    uint8_t msg[];  // sized for payload_max
 };
 
 struct fbp_dl_s {
@@ -88,16 +93,34 @@ struct fbp_dl_s {
 
     struct fbp_rbu64_s tx_link_buf;
 
-    struct tx_frame_s * tx_frames;
+    uint8_t * tx_frames;
+    uint32_t tx_frame_stride;
     uint16_t tx_frame_count;
     uint16_t tx_frame_count_max;
-    int64_t tx_timeout;
-    struct rx_frame_s * rx_frames;
+    uint32_t tx_payload_max;
+    uint32_t tx_send_seq;
+    uint8_t tx_ack_bitmap;         // remote supports ACK_BITMAP
+    uint8_t tx_ack_bitmap_pending;
+    int64_t tx_timeout;  // configured initial retransmit timeout
+    int64_t tx_rtt;      // smoothed round-trip time, 0 until first sample
+    int64_t tx_rtt_var;  // round-trip time mean deviation
+    int64_t tx_rto;      // current retransmit timeout, including backoff
+    uint16_t tx_cwnd;      // congestion window in frames
+    uint16_t tx_ssthresh;  // slow start threshold in frames
+    uint16_t tx_cwnd_acc;  // acknowledged frames towards the next additive increase
+    uint32_t tx_cwnd_recover_seq;  // losses for frames sent before this already reduced tx_cwnd
+    uint8_t * rx_frames;
+    uint32_t rx_frame_stride;
     uint16_t rx_frame_count;
+    uint32_t payload_max;
     uint8_t tx_eof_pending;
 
     enum state_e state;
     int64_t tx_reset_last;
+    int64_t disconnected_start;
+    int64_t disconnected_time;
+    int64_t rx_ack_time;    // reception time of the oldest unacknowledged data frame
+    uint8_t rx_ack_timing;  // 1 when rx_ack_time is valid
 
     struct fbp_evm_api_s evm;
     int32_t event_id;
@@ -110,6 +133,73 @@ struct fbp_dl_s {
 
 static void tx_reset(struct fbp_dl_s * self);
 
+static inline struct tx_frame_s * tx_frame_at(struct fbp_dl_s * self, uint32_t idx) {
+    return (struct tx_frame_s *) (self->tx_frames + idx * self->tx_frame_stride);
+}
+
+static inline struct rx_frame_s * rx_frame_at(struct fbp_dl_s * self, uint32_t idx) {
+    return (struct rx_frame_s *) (self->rx_frames + idx * self->rx_frame_stride);
+}
+
+static inline uint16_t tx_window(struct fbp_dl_s * self) {
+    return (self->tx_cwnd < self->tx_frame_count) ? self->tx_cwnd : self->tx_frame_count;
+}
+
+static void tx_cwnd_init(struct fbp_dl_s * self) {
+    self->tx_cwnd = (TX_CWND_INIT < self->tx_frame_count) ? TX_CWND_INIT : self->tx_frame_count;
+    self->tx_ssthresh = self->tx_frame_count;
+    self->tx_cwnd_acc = 0;
+    self->tx_cwnd_recover_seq = self->tx_send_seq;
+}
+
+/**
+ * @brief Grow the congestion window for an acknowledged frame.
+ *
+ * @param self The instance.
+ *
+ * Below the slow start threshold, the window grows by one frame per
+ * acknowledged frame.  Above it, the window grows by one frame per
+ * window of acknowledged frames (additive increase).
+ */
+static void tx_cwnd_on_ack(struct fbp_dl_s * self) {
+    if (self->tx_cwnd >= self->tx_frame_count) {
+        return;
+    } else if (self->tx_cwnd < self->tx_ssthresh) {
+        ++self->tx_cwnd;
+    } else if (++self->tx_cwnd_acc >= self->tx_cwnd) {
+        self->tx_cwnd_acc = 0;
+        ++self->tx_cwnd;
+    }
+}
+
+/**
+ * @brief Shrink the congestion window for a lost frame.
+ *
+ * @param self The instance.
+ * @param f The frame that will be retransmitted.
+ * @param timeout True for a retransmit timeout, false for a loss
+ *      reported by the receiver.
+ *
+ * Halve the window (multiplicative decrease) on reported losses and
+ * collapse it to TX_CWND_MIN on timeouts.  All losses for frames sent
+ * before the previous decrease belong to the same congestion event and
+ * only reduce the window once.
+ */
+static void tx_cwnd_on_loss(struct fbp_dl_s * self, struct tx_frame_s * f, bool timeout) {
+    if ((int32_t) (f->send_seq - self->tx_cwnd_recover_seq) < 0) {
+        return;
+    }
+    self->tx_cwnd_recover_seq = self->tx_send_seq;
+    uint16_t cwnd = self->tx_cwnd / 2;
+    if (cwnd < TX_CWND_MIN) {
+        cwnd = TX_CWND_MIN;
+    }
+    self->tx_ssthresh = cwnd;
+    self->tx_cwnd = timeout ? TX_CWND_MIN : cwnd;
+    self->tx_cwnd_acc = 0;
+    FBP_LOGD2("tx_cwnd_on_loss: cwnd=%d, ssthresh=%d", (int) self->tx_cwnd, (int) self->tx_ssthresh);
+}
+
 static inline void lock(struct fbp_dl_s * self) {
     if (self->mutex) {
         fbp_os_mutex_lock(self->mutex);
@@ -135,9 +225,13 @@ static void on_event(void * user_data, int32_t event_id) {
     fbp_dl_process(self);
 }
 
+static inline bool is_link_pending(struct fbp_dl_s * self) {
+    return (fbp_rbu64_size(&self->tx_link_buf) != 0) || self->tx_ack_bitmap_pending;
+}
+
 static void event_schedule(struct fbp_dl_s * self, int64_t next_event) {
     int64_t now = time_get(self);
-    if (fbp_rbu64_size(&self->tx_link_buf)) {
+    if (is_link_pending(self)) {
         next_event = now;
     }
     if (self->event_id) {
@@ -155,9 +249,19 @@ static void event_schedule_immediate(struct fbp_dl_s * self) {
     self->event_id = self->evm.schedule(self->evm.evm, time_get(self), on_event, self);
 }
 
+static void latency_histogram_add(uint32_t * histogram, int64_t latency) {
+    int64_t us = FBP_TIME_TO_MICROSECONDS(latency);
+    uint32_t idx = 0;
+    while ((us > 1) && (idx < (FBP_DL_LATENCY_HISTOGRAM_SIZE - 1))) {
+        us >>= 1;
+        ++idx;
+    }
+    ++histogram[idx];
+}
+
 static bool is_any_send_pending(struct fbp_dl_s * self) {
     for (uint16_t offset = 0; offset < self->tx_frame_count; ++offset) {
-        if (self->tx_frames[offset].state == TX_FRAME_ST_SEND) {
+        if (tx_frame_at(self, offset)->state == TX_FRAME_ST_SEND) {
             return true;
         }
     }
@@ -170,21 +274,31 @@ static int32_t send_inner(struct fbp_dl_s * self,
     lock(self);
     uint16_t frame_id = self->tx_frame_next_id;
     uint16_t idx = frame_id & (self->tx_frame_count - 1);
-    struct tx_frame_s * f = &self->tx_frames[idx];
+    struct tx_frame_s * f = tx_frame_at(self, idx);
 
-    if (fbp_framer_frame_id_subtract(frame_id, self->tx_frame_last_id) >= self->tx_frame_count) {
+    if (fbp_framer_frame_id_subtract(frame_id, self->tx_frame_last_id) >= tx_window(self)) {
         unlock(self);
         FBP_LOGD1("fbp_dl_send(0x%02" PRIx16 ") too many frames outstanding", metadata);
         return FBP_ERROR_FULL;
     }
 
-    if (!fbp_framer_validate_data(frame_id, metadata, msg_size)) {
+    bool is_jumbo = (msg_size > FBP_FRAMER_PAYLOAD_MAX_SIZE);
+    if ((msg_size > self->tx_payload_max)
+            || (is_jumbo && !fbp_framer_validate_jumbo(frame_id, metadata, msg_size))
+            || (!is_jumbo && !fbp_framer_validate_data(frame_id, metadata, msg_size))) {
         unlock(self);
         FBP_LOGW("fbp_framer_send invalid parameters");
         return FBP_ERROR_PARAMETER_INVALID;
     }
 
-    int32_t rv = fbp_framer_construct_data(f->msg, frame_id, metadata, msg, msg_size);
+    int32_t rv;
+    if (is_jumbo) {
+        rv = fbp_framer_construct_jumbo(f->msg, frame_id, metadata, msg, msg_size);
+        f->frame_sz = (uint16_t) (msg_size + FBP_FRAMER_JUMBO_OVERHEAD_SIZE);
+    } else {
+        rv = fbp_framer_construct_data(f->msg, frame_id, metadata, msg, msg_size);
+        f->frame_sz = (uint16_t) (msg_size + FBP_FRAMER_OVERHEAD_SIZE);
+    }
     FBP_ASSERT(0 == rv);  // fbp_framer_validate already checked
     bool send_already_pending = is_any_send_pending(self);
 
@@ -195,6 +309,10 @@ static int32_t send_inner(struct fbp_dl_s * self,
 
     self->tx_status.msg_bytes += msg_size;
     self->tx_frame_next_id = (frame_id + 1) & FBP_FRAMER_FRAME_ID_MAX;
+    uint32_t outstanding = fbp_framer_frame_id_subtract(self->tx_frame_next_id, self->tx_frame_last_id);
+    if (outstanding > self->tx_status.window_high_water) {
+        self->tx_status.window_high_water = outstanding;
+    }
     // frame queued for send_data()
     if (!send_already_pending) {
         event_schedule_immediate(self);
@@ -234,10 +352,6 @@ int32_t fbp_dl_send(struct fbp_dl_s * self,
     }
 }
 
-static uint16_t tx_buf_frame_sz(struct tx_frame_s * f) {
-    return ((uint16_t) f->msg[4]) + 1 + FBP_FRAMER_OVERHEAD_SIZE;
-}
-
 static uint16_t tx_buf_frame_id(struct tx_frame_s * f) {
     return (((uint16_t) f->msg[2] & 0x7) << 8) | f->msg[3];
 }
@@ -255,7 +369,7 @@ static inline void send_ll(struct fbp_dl_s * self, uint8_t const * buffer, uint3
 
 static void send_data(struct fbp_dl_s * self, uint16_t frame_id) {
     uint16_t idx = frame_id & (self->tx_frame_count - 1);
-    struct tx_frame_s * f = &self->tx_frames[idx];
+    struct tx_frame_s * f = tx_frame_at(self, idx);
     if (TX_FRAME_ST_IDLE == f->state) {
         FBP_LOGW("send_data(%d) when idle", (int) frame_id);
         return;
@@ -263,7 +377,7 @@ static void send_data(struct fbp_dl_s * self, uint16_t frame_id) {
         FBP_LOGW("send_data(%d) when already ack", (int) frame_id);  // but do it anyway
     }
 
-    uint16_t frame_sz = tx_buf_frame_sz(f);
+    uint16_t frame_sz = f->frame_sz;
 
     uint32_t send_sz = self->ll_instance.send_available(self->ll_instance.user_data);
     if (send_sz < frame_sz) {
@@ -284,15 +398,51 @@ static void send_data(struct fbp_dl_s * self, uint16_t frame_id) {
                    (int) frame_id, (int) tx_buf_frame_id(f), (int) f->send_count,
                    (int) self->tx_frame_last_id, (int) self->tx_frame_next_id);
         f->last_send_time = time_get(self);
+        f->send_seq = self->tx_send_seq++;
         send_ll(self, f->msg, frame_sz);
         self->tx_eof_pending = 1;
     }
 }
 
+static uint64_t rx_ack_bitmap(struct fbp_dl_s * self) {
+    uint64_t bitmap = 0;
+    uint32_t count = self->rx_frame_count;
+    if (count > FBP_FRAMER_ACK_BITMAP_COUNT) {
+        count = FBP_FRAMER_ACK_BITMAP_COUNT;
+    }
+    for (uint32_t i = 0; i < count; ++i) {
+        uint16_t frame_id = (self->rx_next_frame_id + i) & FBP_FRAMER_FRAME_ID_MAX;
+        struct rx_frame_s * f = rx_frame_at(self, frame_id & (self->rx_frame_count - 1U));
+        if ((f->state == RX_FRAME_ST_ACK) && (f->frame_id == frame_id)) {
+            bitmap |= (1ULL << i);
+        }
+    }
+    return bitmap;
+}
+
+static int send_ack_bitmap_pending(struct fbp_dl_s * self) {
+    uint8_t b[FBP_FRAMER_ACK_BITMAP_SIZE];
+    if (!self->tx_ack_bitmap_pending) {
+        return 0;
+    }
+    if (self->ll_instance.send_available(self->ll_instance.user_data) < sizeof(b)) {
+        FBP_LOGD1("send_ack_bitmap_pending send_available too small");
+        return 1;
+    }
+    // construct now using the latest receive state
+    uint16_t frame_id = (self->rx_next_frame_id - 1U) & FBP_FRAMER_FRAME_ID_MAX;
+    fbp_framer_construct_ack_bitmap(b, frame_id, rx_ack_bitmap(self));
+    send_ll(self, b, sizeof(b));
+    ++self->tx_status.ack_bitmap;
+    self->tx_ack_bitmap_pending = 0;
+    self->tx_eof_pending = 1;
+    return 0;
+}
+
 static int send_link_pending(struct fbp_dl_s * self) {
     uint32_t pending_sz = fbp_rbu64_size(&self->tx_link_buf);
     if (!pending_sz) {
-        return 0;
+        return send_ack_bitmap_pending(self);
     }
     uint32_t send_sz = self->ll_instance.send_available(self->ll_instance.user_data) / FBP_FRAMER_LINK_SIZE;
     if (!send_sz) {
@@ -314,7 +464,10 @@ static int send_link_pending(struct fbp_dl_s * self) {
         fbp_rbu64_discard(&self->tx_link_buf, send_sz);
     }
     self->tx_eof_pending = 1;
-    return 0;
+    if (fbp_rbu64_size(&self->tx_link_buf)) {
+        return 0;
+    }
+    return send_ack_bitmap_pending(self);
 }
 
 static void send_link(struct fbp_dl_s * self, enum fbp_framer_type_e frame_type, uint16_t frame_id) {
@@ -322,16 +475,49 @@ static void send_link(struct fbp_dl_s * self, enum fbp_framer_type_e frame_type,
         return;
     }
     uint64_t b;
-    bool is_link_pending = (fbp_rbu64_size(&self->tx_link_buf) != 0);
+    bool link_pending = is_link_pending(self);
     int32_t rv = fbp_framer_construct_link((uint8_t *) &b, frame_type, frame_id);
     if (rv) {
         FBP_LOGW("send_link error: %d", (int) rv);
         return;
     } else if (!fbp_rbu64_push(&self->tx_link_buf, b)) {
         FBP_LOGW("link buffer full");
-    } else if (!is_link_pending) {
+        return;
+    } else if (!link_pending) {
+        event_schedule_immediate(self);
+    }
+    if (frame_type == FBP_FRAMER_FT_NACK_FRAME_ID) {
+        ++self->tx_status.nack_frame_id;
+    } else if (frame_type == FBP_FRAMER_FT_NACK_FRAMING_ERROR) {
+        ++self->tx_status.nack_framing_error;
+    }
+}
+
+static void send_ack_bitmap(struct fbp_dl_s * self) {
+    if (!is_link_pending(self)) {
         event_schedule_immediate(self);
     }
+    self->tx_ack_bitmap_pending = 1;  // coalesce, constructed on send
+}
+
+/**
+ * @brief Acknowledge all received frames.
+ *
+ * @param self The data link instance.
+ *
+ * Sends ACK_ALL for the most recent frame_id with no skips.  When
+ * the remote supports ACK_BITMAP and future frames are stored, send
+ * ACK_BITMAP instead so that the remote can retransmit all missing
+ * frames at once.
+ */
+static void send_ack(struct fbp_dl_s * self) {
+    uint16_t frame_id = (self->rx_next_frame_id - 1U) & FBP_FRAMER_FRAME_ID_MAX;
+    if (self->tx_ack_bitmap && (fbp_framer_frame_id_subtract(self->rx_max_frame_id, self->rx_next_frame_id) > 0)) {
+        send_ack_bitmap(self);
+    } else {
+        self->tx_ack_bitmap_pending = 0;  // ACK_ALL supersedes
+        send_link(self, FBP_FRAMER_FT_ACK_ALL, frame_id);
+    }
 }
 
 static inline int64_t reset_timeout_duration(struct fbp_dl_s * self) {
@@ -343,7 +529,7 @@ static bool is_reset(struct fbp_dl_s * self) {
         return false;
     }
     for (uint16_t f = 0; f < self->tx_frame_count_max; ++f) {
-        if (self->tx_frames[f].state != TX_FRAME_ST_IDLE) {
+        if (tx_frame_at(self, f)->state != TX_FRAME_ST_IDLE) {
             return false;
         }
     }
@@ -351,7 +537,7 @@ static bool is_reset(struct fbp_dl_s * self) {
         return false;
     }
     for (uint16_t f = 0; f < self->rx_frame_count; ++f) {
-        if (self->rx_frames[f].state != RX_FRAME_ST_IDLE) {
+        if (rx_frame_at(self, f)->state != RX_FRAME_ST_IDLE) {
             return false;
         }
     }
@@ -362,24 +548,40 @@ static void reset_state(struct fbp_dl_s * self) {
     FBP_LOGD1("reset_state");
     if (self->state != ST_DISCONNECTED) {
         event_emit(self, FBP_DL_EV_DISCONNECTED);
+        self->disconnected_start = time_get(self);
     }
     self->state = ST_DISCONNECTED;
+    self->rx_ack_timing = 0;
 
     // tx direction
     self->tx_frame_last_id = 0;
     self->tx_frame_next_id = 0;
     for (uint16_t f = 0; f < self->tx_frame_count_max; ++f) {
-        self->tx_frames[f].state = TX_FRAME_ST_IDLE;
+        tx_frame_at(self, f)->state = TX_FRAME_ST_IDLE;
     }
     self->tx_frame_count = 1;  // decrease window size, need to negotiate larger
+    tx_cwnd_init(self);
+    self->tx_payload_max = FBP_FRAMER_PAYLOAD_MAX_SIZE;  // need to negotiate jumbo
+    self->tx_ack_bitmap = 0;  // need to negotiate
+    self->tx_ack_bitmap_pending = 0;
+    self->tx_rtt = 0;
+    self->tx_rtt_var = 0;
+    self->tx_rto = self->tx_timeout;
 
     // rx direction
     self->rx_next_frame_id = 0;
     self->rx_max_frame_id = 0;
     fbp_rbu64_clear(&self->tx_link_buf);
     for (uint16_t f = 0; f < self->rx_frame_count; ++f) {
-        self->rx_frames[f].state = RX_FRAME_ST_IDLE;
+        rx_frame_at(self, f)->state = RX_FRAME_ST_IDLE;
+    }
+}
+
+static void state_connected(struct fbp_dl_s * self) {
+    if (self->state != ST_CONNECTED) {
+        self->disconnected_time += time_get(self) - self->disconnected_start;
     }
+    self->state = ST_CONNECTED;
 }
 
 static void send_reset_request(struct fbp_dl_s * self) {
@@ -406,27 +608,31 @@ static void on_recv_data(void * user_data, uint16_t frame_id, uint16_t metadata,
     struct fbp_dl_s * self = (struct fbp_dl_s *) user_data;
     uint16_t this_idx = frame_id & (self->rx_frame_count - 1U);
     uint16_t window_end = (self->rx_next_frame_id + self->rx_frame_count) & FBP_FRAMER_FRAME_ID_MAX;
+    if (!self->rx_ack_timing) {
+        self->rx_ack_time = time_get(self);
+        self->rx_ack_timing = 1;
+    }
 
     if (frame_id != (frame_id & FBP_FRAMER_FRAME_ID_MAX)) {
         FBP_LOGW("on_recv_data(%d) invalid frame_id", (int) frame_id);
-    } else if ((0 == msg_size) || (msg_size > FBP_FRAMER_PAYLOAD_MAX_SIZE)) {
+    } else if ((0 == msg_size) || (msg_size > self->payload_max)) {
         // should never happen, but check to be safe
         FBP_LOGW("on_recv_data(%d) invalid msg_size %d", (int) frame_id, (int) msg_size);
         send_link(self, FBP_FRAMER_FT_NACK_FRAME_ID, frame_id);
         return;
     } else if (self->rx_next_frame_id == frame_id) {
         // next expected frame, recv immediately without putting into ring buffer.
-        self->rx_frames[this_idx].state = RX_FRAME_ST_IDLE;
+        rx_frame_at(self, this_idx)->state = RX_FRAME_ST_IDLE;
         on_recv_msg_done(self, metadata, msg, msg_size);
         self->rx_next_frame_id = (self->rx_next_frame_id + 1) & FBP_FRAMER_FRAME_ID_MAX;
         if (self->rx_max_frame_id == frame_id) {
             FBP_LOGD2("on_recv_data(%d), ACK_ALL", (int) frame_id);
             self->rx_max_frame_id = self->rx_next_frame_id;
-            send_link(self, FBP_FRAMER_FT_ACK_ALL, frame_id);
+            send_ack(self);
         } else {
             while (1) {
                 this_idx = self->rx_next_frame_id & (self->rx_frame_count - 1U);
-                struct rx_frame_s * f = &self->rx_frames[this_idx];
+                struct rx_frame_s * f = rx_frame_at(self, this_idx);
                 if (f->state != RX_FRAME_ST_ACK) {
                     break;
                 }
@@ -435,14 +641,14 @@ static void on_recv_data(void * user_data, uint16_t frame_id, uint16_t metadata,
                 on_recv_msg_done(self, f->metadata, f->msg, 1 + (uint16_t) f->msg_size);
                 self->rx_next_frame_id = (self->rx_next_frame_id + 1) & FBP_FRAMER_FRAME_ID_MAX;
             }
-            frame_id = (self->rx_next_frame_id - 1U) & FBP_FRAMER_FRAME_ID_MAX;
-            send_link(self, FBP_FRAMER_FT_ACK_ALL, frame_id);
+            send_ack(self);
         }
     } else if (fbp_framer_frame_id_subtract(frame_id, self->rx_next_frame_id) < 0) {
         // we already have this frame.
         // ack with most recent successfully received frame_id
         FBP_LOGD3("on_recv_data(%d) old frame next=%d", (int) frame_id, (int) self->rx_next_frame_id);
-        send_link(self, FBP_FRAMER_FT_ACK_ALL, (self->rx_next_frame_id - 1) & FBP_FRAMER_FRAME_ID_MAX);
+        ++self->rx_status.duplicate_frames;
+        send_ack(self);
     } else if (fbp_framer_frame_id_subtract(window_end, frame_id) <= 0) {
         FBP_LOGD1("on_recv_data(%d) frame too far into the future: next=%d, end=%d",
                   (int) frame_id, (int) self->rx_next_frame_id, (int) window_end);
@@ -457,25 +663,38 @@ static void on_recv_data(void * user_data, uint16_t frame_id, uint16_t metadata,
 
         // nack missing frames not already NACK'ed
         uint16_t next_frame_id = self->rx_next_frame_id;
-        while (1) {
+        while (!self->tx_ack_bitmap) {  // ACK_BITMAP implicitly NACKs
             if (next_frame_id == frame_id) {
                 break;
             }
             uint16_t next_idx = next_frame_id & (self->rx_frame_count - 1U);
-            if (self->rx_frames[next_idx].state == RX_FRAME_ST_IDLE) {
-                self->rx_frames[next_idx].state = RX_FRAME_ST_NACK;
+            if (rx_frame_at(self, next_idx)->state == RX_FRAME_ST_IDLE) {
+                rx_frame_at(self, next_idx)->state = RX_FRAME_ST_NACK;
                 send_link(self, FBP_FRAMER_FT_NACK_FRAME_ID, next_frame_id);
             }
             next_frame_id = (next_frame_id + 1) & FBP_FRAMER_FRAME_ID_MAX;
         }
 
         // store
-        self->rx_frames[this_idx].state = RX_FRAME_ST_ACK;
-        self->rx_frames[this_idx].msg_size = msg_size - 1;
-        self->rx_frames[this_idx].frame_id = frame_id;
-        self->rx_frames[this_idx].metadata = metadata;
-        fbp_memcpy(self->rx_frames[this_idx].msg, msg, msg_size);
-        send_link(self, FBP_FRAMER_FT_ACK_ONE, frame_id);
+        struct rx_frame_s * f = rx_frame_at(self, this_idx);
+        if ((f->state == RX_FRAME_ST_ACK) && (f->frame_id == frame_id)) {
+            ++self->rx_status.duplicate_frames;
+        }
+        uint32_t held = fbp_framer_frame_id_subtract(self->rx_max_frame_id, self->rx_next_frame_id) + 1;
+        if (held > self->rx_status.window_high_water) {
+            self->rx_status.window_high_water = held;
+        }
+        rx_frame_at(self, this_idx)->state = RX_FRAME_ST_ACK;
+        rx_frame_at(self, this_idx)->msg_size = (uint16_t) (msg_size - 1);
+        rx_frame_at(self, this_idx)->frame_id = frame_id;
+        rx_frame_at(self, this_idx)->metadata = metadata;
+        fbp_memcpy(rx_frame_at(self, this_idx)->msg, msg, msg_size);
+        if (self->tx_ack_bitmap
+                && (fbp_framer_frame_id_subtract(frame_id, self->rx_next_frame_id) < FBP_FRAMER_ACK_BITMAP_COUNT)) {
+            send_ack_bitmap(self);
+        } else {
+            send_link(self, FBP_FRAMER_FT_ACK_ONE, frame_id);
+        }
     }
 }
 
@@ -502,7 +721,7 @@ static struct tx_frame_s * tx_frame_get(struct fbp_dl_s * self, uint16_t frame_i
     }
 
     uint16_t idx = frame_id & (self->tx_frame_count - 1);
-    struct tx_frame_s * f = &self->tx_frames[idx];
+    struct tx_frame_s * f = tx_frame_at(self, idx);
     return f;
 }
 
@@ -512,11 +731,52 @@ static bool retire_tx_frame(struct fbp_dl_s * self) {
         self->tx_frame_last_id = (self->tx_frame_last_id + 1) & FBP_FRAMER_FRAME_ID_MAX;
         ++self->tx_status.data_frames;
         f->state = TX_FRAME_ST_IDLE;
+        tx_cwnd_on_ack(self);
         return true;
     }
     return false;
 }
 
+static inline int64_t tx_rto_max(struct fbp_dl_s * self) {
+    return fbp_time_max(self->tx_timeout, reset_timeout_duration(self));
+}
+
+/**
+ * @brief Update the retransmit timeout from a round-trip time sample.
+ *
+ * @param self The instance.
+ * @param f The frame that was just acknowledged.
+ *
+ * Uses the Jacobson/Karels smoothed RTT and mean deviation estimators.
+ * Following Karn's algorithm, retransmitted frames do not provide
+ * samples since their acknowledgement is ambiguous.  A valid sample
+ * also clears any exponential backoff applied by tx_timeout().
+ */
+static void tx_rtt_sample(struct fbp_dl_s * self, struct tx_frame_s * f) {
+    if ((f->state != TX_FRAME_ST_SENT) || (f->send_count != 1)) {
+        return;
+    }
+    int64_t rtt = time_get(self) - f->last_send_time;
+    if (rtt < 0) {
+        return;
+    }
+    latency_histogram_add(self->tx_status.ack_latency, rtt);
+    if (!self->tx_rtt) {  // first sample
+        self->tx_rtt = rtt;
+        self->tx_rtt_var = rtt / 2;
+    } else {
+        int64_t err = rtt - self->tx_rtt;
+        self->tx_rtt += err / 8;
+        if (err < 0) {
+            err = -err;
+        }
+        self->tx_rtt_var += (err - self->tx_rtt_var) / 4;
+    }
+    int64_t rto = self->tx_rtt + fbp_time_max(INTERVAL_MIN, 4 * self->tx_rtt_var);
+    rto = fbp_time_max(rto, TX_RTO_MIN);
+    self->tx_rto = fbp_time_min(rto, tx_rto_max(self));
+}
+
 static void handle_ack_all(struct fbp_dl_s * self, uint16_t frame_id) {
     int32_t frame_delta = fbp_framer_frame_id_subtract(frame_id, self->tx_frame_last_id);
     if (frame_delta < 0) {
@@ -532,6 +792,10 @@ static void handle_ack_all(struct fbp_dl_s * self, uint16_t frame_id) {
         frame_id = frame_id_end; // only process what we have
     }
 
+    struct tx_frame_s * f = tx_frame_get(self, frame_id, "ack_all");
+    if (f) {
+        tx_rtt_sample(self, f);
+    }
     while (fbp_framer_frame_id_subtract(frame_id, self->tx_frame_last_id) >= 0) {
         retire_tx_frame(self);
     }
@@ -540,14 +804,63 @@ static void handle_ack_all(struct fbp_dl_s * self, uint16_t frame_id) {
 static void handle_ack_one(struct fbp_dl_s * self, uint16_t frame_id) {
     struct tx_frame_s * f = tx_frame_get(self, frame_id, "ack_one");
     if (f && ((f->state == TX_FRAME_ST_SEND) || (f->state == TX_FRAME_ST_SENT))) {
+        tx_rtt_sample(self, f);
         f->state = TX_FRAME_ST_ACK;
     }
 }
 
+static void handle_ack_bitmap(struct fbp_dl_s * self, uint16_t frame_id, uint64_t bitmap) {
+    handle_ack_all(self, frame_id);
+    if (!bitmap) {
+        return;
+    }
+
+    // The link delivers bytes in order.  A missing frame sent before
+    // any acknowledged frame was lost, so retransmit immediately.
+    bool seq_valid = false;
+    uint32_t seq_max = 0;
+    int32_t bit_max = 0;
+    for (int32_t i = 0; i < FBP_FRAMER_ACK_BITMAP_COUNT; ++i) {
+        if (0 == (bitmap & (1ULL << i))) {
+            continue;
+        }
+        bit_max = i;
+        struct tx_frame_s * f = tx_frame_get(self, (frame_id + 1 + i) & FBP_FRAMER_FRAME_ID_MAX, "ack_bitmap");
+        if (!f || (f->state == TX_FRAME_ST_IDLE)) {
+            continue;
+        }
+        if ((f->state == TX_FRAME_ST_SEND) || (f->state == TX_FRAME_ST_SENT)) {
+            tx_rtt_sample(self, f);
+            f->state = TX_FRAME_ST_ACK;
+        }
+        if (!seq_valid || ((int32_t) (f->send_seq - seq_max) > 0)) {
+            seq_max = f->send_seq;
+            seq_valid = true;
+        }
+    }
+    if (!seq_valid) {
+        return;
+    }
+    for (int32_t i = 0; i < bit_max; ++i) {
+        if (bitmap & (1ULL << i)) {
+            continue;
+        }
+        struct tx_frame_s * f = tx_frame_get(self, (frame_id + 1 + i) & FBP_FRAMER_FRAME_ID_MAX, "ack_bitmap");
+        if (f && (f->state == TX_FRAME_ST_SENT) && ((int32_t) (f->send_seq - seq_max) < 0)) {
+            FBP_LOGD2("handle_ack_bitmap nack %d", (int) ((frame_id + 1 + i) & FBP_FRAMER_FRAME_ID_MAX));
+            tx_cwnd_on_loss(self, f, false);
+            f->state = TX_FRAME_ST_SEND;
+        }
+    }
+}
+
 static void handle_nack_frame_id(struct fbp_dl_s * self, uint16_t frame_id) {
     struct tx_frame_s * f = tx_frame_get(self, frame_id, "nack_frame_id");
     if (f && (f->state != TX_FRAME_ST_IDLE)) {
         FBP_LOGD2("handle_nack_frame_id(%d)", (int) frame_id);
+        if (f->state == TX_FRAME_ST_SENT) {
+            tx_cwnd_on_loss(self, f, false);
+        }
         f->state = TX_FRAME_ST_SEND;
     }
 }
@@ -556,6 +869,9 @@ static void handle_nack_framing_error(struct fbp_dl_s * self, uint16_t frame_id)
     struct tx_frame_s * f = tx_frame_get(self, frame_id, "nack_framing");
     if (f && (f->state != TX_FRAME_ST_IDLE)) {
         FBP_LOGD2("handle_nack_framing_error(%d)", (int) frame_id);
+        if (f->state == TX_FRAME_ST_SENT) {
+            tx_cwnd_on_loss(self, f, false);
+        }
         f->state = TX_FRAME_ST_SEND;
     }
 }
@@ -574,7 +890,7 @@ static void handle_reset(struct fbp_dl_s * self, uint16_t frame_id) {
                 send_link(self, FBP_FRAMER_FT_RESET, 1);
                 // assume other side receives response, so now connected.
                 // otherwise, the other side will timeout and resend reset request.
-                self->state = ST_CONNECTED;
+                state_connected(self);
                 event_emit(self, FBP_DL_EV_CONNECTED);
             }
             break;
@@ -591,7 +907,7 @@ static void handle_reset(struct fbp_dl_s * self, uint16_t frame_id) {
             } else {
                 reset_state(self);
             }
-            self->state = ST_CONNECTED;
+            state_connected(self);
             event_emit(self, FBP_DL_EV_CONNECTED);
             break;
         default:
@@ -605,13 +921,25 @@ static void on_recv_link(void * user_data, enum fbp_framer_type_e frame_type, ui
     switch (frame_type) {
         case FBP_FRAMER_FT_ACK_ALL: handle_ack_all(self, frame_id); break;
         case FBP_FRAMER_FT_ACK_ONE: handle_ack_one(self, frame_id); break;
-        case FBP_FRAMER_FT_NACK_FRAME_ID: handle_nack_frame_id(self, frame_id); break;
-        case FBP_FRAMER_FT_NACK_FRAMING_ERROR: handle_nack_framing_error(self, frame_id); break;
+        case FBP_FRAMER_FT_NACK_FRAME_ID:
+            ++self->rx_status.nack_frame_id;
+            handle_nack_frame_id(self, frame_id);
+            break;
+        case FBP_FRAMER_FT_NACK_FRAMING_ERROR:
+            ++self->rx_status.nack_framing_error;
+            handle_nack_framing_error(self, frame_id);
+            break;
         case FBP_FRAMER_FT_RESET: handle_reset(self, frame_id); break;
         default: break;
     }
 }
 
+static void on_recv_ack_bitmap(void * user_data, uint16_t frame_id, uint64_t bitmap) {
+    struct fbp_dl_s * self = (struct fbp_dl_s *) user_data;
+    ++self->rx_status.ack_bitmap;
+    handle_ack_bitmap(self, frame_id, bitmap);
+}
+
 static void on_framing_error(void * user_data) {
     struct fbp_dl_s * self = (struct fbp_dl_s *) user_data;
     send_link(self, FBP_FRAMER_FT_NACK_FRAMING_ERROR, self->rx_next_frame_id);
@@ -642,17 +970,20 @@ static int64_t tx_timeout(struct fbp_dl_s * self, int64_t now) {
     struct tx_frame_s * f;
     int32_t frame_count = fbp_framer_frame_id_subtract(self->tx_frame_next_id, self->tx_frame_last_id);
     int64_t next_event = INT64_MAX;
+    bool timed_out = false;
 
     for (int32_t offset = 0; offset < frame_count; ++offset) {
         uint16_t frame_id = (self->tx_frame_last_id + offset) & FBP_FRAMER_FRAME_ID_MAX;
         uint16_t idx = frame_id & (self->tx_frame_count - 1);
-        f = &self->tx_frames[idx];
+        f = tx_frame_at(self, idx);
         if (f->state == TX_FRAME_ST_SENT) {
-            int64_t next = f->last_send_time + self->tx_timeout;
+            int64_t next = f->last_send_time + self->tx_rto;
             if (next <= now) {
                 FBP_LOGD3("tx timeout on %d", (int) frame_id);
+                tx_cwnd_on_loss(self, f, true);
                 f->state = TX_FRAME_ST_SEND;
                 next_event = now;
+                timed_out = true;
             } else {
                 next_event = tmin(next_event, next);
             }
@@ -660,6 +991,11 @@ static int64_t tx_timeout(struct fbp_dl_s * self, int64_t now) {
             next_event = now;
         }
     }
+    if (timed_out) {
+        // exponential backoff until the next valid round-trip time sample
+        self->tx_rto = fbp_time_min(self->tx_rto * 2, tx_rto_max(self));
+        FBP_LOGD2("tx timeout, rto=%d us", (int) FBP_TIME_TO_MICROSECONDS(self->tx_rto));
+    }
     return next_event;
 }
 
@@ -667,7 +1003,7 @@ static void tx_transmit(struct fbp_dl_s * self) {
     for (uint16_t offset = 0; offset < self->tx_frame_count; ++offset) {
         uint16_t frame_id = (self->tx_frame_last_id + offset) & FBP_FRAMER_FRAME_ID_MAX;
         uint16_t idx = (self->tx_frame_last_id + offset) & (self->tx_frame_count - 1);
-        struct tx_frame_s * f = &self->tx_frames[idx];
+        struct tx_frame_s * f = tx_frame_at(self, idx);
         if (f->state == TX_FRAME_ST_SEND) {
             send_data(self, frame_id);
             break;
@@ -676,11 +1012,11 @@ static void tx_transmit(struct fbp_dl_s * self) {
 }
 
 static bool is_tx_pending(struct fbp_dl_s * self) {
-    if (fbp_rbu64_size(&self->tx_link_buf)) {
+    if (is_link_pending(self)) {
         return true;
     }
     for (uint16_t idx = 0; idx < self->tx_frame_count; ++idx) {
-        if (self->tx_frames[idx].state == TX_FRAME_ST_SEND) {
+        if (tx_frame_at(self, idx)->state == TX_FRAME_ST_SEND) {
             return true;
         }
     }
@@ -711,6 +1047,10 @@ static void fbp_dl_process(struct fbp_dl_s * self) {
         tx_transmit(self);
     }
     tx_eof(self);
+    if (self->rx_ack_timing && !is_link_pending(self)) {
+        latency_histogram_add(self->rx_status.ack_latency, now - self->rx_ack_time);
+        self->rx_ack_timing = 0;
+    }
     next_event = fbp_time_max(next_event, earliest_next_event);
     event_schedule(self, next_event);
     unlock(self);
@@ -753,6 +1093,18 @@ struct fbp_dl_s * fbp_dl_initialize(
     }
     uint32_t rx_window_size = to_power_of_two(config->rx_window_size);
 
+    uint32_t payload_max = config->payload_max_size;
+    if (payload_max < FBP_FRAMER_PAYLOAD_MAX_SIZE) {
+        payload_max = FBP_FRAMER_PAYLOAD_MAX_SIZE;
+    } else if (payload_max > FBP_FRAMER_LARGEST_PAYLOAD_SIZE) {
+        payload_max = FBP_FRAMER_LARGEST_PAYLOAD_SIZE;
+    }
+    uint32_t tx_frame_stride = sizeof(struct tx_frame_s) + payload_max
+            + ((payload_max > FBP_FRAMER_PAYLOAD_MAX_SIZE) ? FBP_FRAMER_JUMBO_OVERHEAD_SIZE : FBP_FRAMER_OVERHEAD_SIZE);
+    tx_frame_stride = FBP_ROUND_UP_TO_MULTIPLE_UNSIGNED(tx_frame_stride, sizeof(uint64_t));
+    uint32_t rx_frame_stride = sizeof(struct rx_frame_s) + payload_max;
+    rx_frame_stride = FBP_ROUND_UP_TO_MULTIPLE_UNSIGNED(rx_frame_stride, sizeof(uint64_t));
+
     // Perform single allocation for fbp_dl_s and all buffers.
     size_t offset = 0;
     size_t sz;
@@ -761,12 +1113,12 @@ struct fbp_dl_s * fbp_dl_initialize(
     offset += sz;
 
     size_t tx_frame_buf_offset = offset;
-    sz = sizeof(struct tx_frame_s[2]) / 2 * tx_window_size;
+    sz = tx_frame_stride * tx_window_size;
     sz = FBP_ROUND_UP_TO_MULTIPLE_UNSIGNED(sz, sizeof(uint64_t));
     offset += sz;
 
     size_t rx_frame_buf_offset = offset;
-    sz = sizeof(struct rx_frame_s[2]) / 2 * rx_window_size;
+    sz = rx_frame_stride * rx_window_size;
     sz = FBP_ROUND_UP_TO_MULTIPLE_UNSIGNED(sz, sizeof(uint64_t));
     offset += sz;
 
@@ -785,9 +1137,12 @@ struct fbp_dl_s * fbp_dl_initialize(
     uint8_t * mem = (uint8_t *) self;
     self->tx_frame_count = 1;  // negotiate to larger sizes
     self->tx_frame_count_max = tx_window_size;
-    self->tx_frames = (struct tx_frame_s *) (mem + tx_frame_buf_offset);
+    self->tx_frames = mem + tx_frame_buf_offset;
+    self->tx_frame_stride = tx_frame_stride;
     self->rx_frame_count = rx_window_size;
-    self->rx_frames = (struct rx_frame_s *) (mem + rx_frame_buf_offset);
+    self->rx_frames = mem + rx_frame_buf_offset;
+    self->rx_frame_stride = rx_frame_stride;
+    self->payload_max = payload_max;
     fbp_rbu64_init(&self->tx_link_buf, (uint64_t *) (mem + tx_link_buffer_offset), tx_link_u64_size);
 
     self->tx_timeout = config->tx_timeout;
@@ -796,7 +1151,9 @@ struct fbp_dl_s * fbp_dl_initialize(
     self->rx_framer.api.framing_error_fn = on_framing_error;
     self->rx_framer.api.link_fn = on_recv_link;
     self->rx_framer.api.data_fn = on_recv_data;
+    self->rx_framer.api.ack_bitmap_fn = on_recv_ack_bitmap;
     self->evm = *evm;
+    self->disconnected_start = time_get(self);
     tx_reset(self);
 
     return self;
@@ -840,6 +1197,15 @@ int32_t fbp_dl_status_get(
     status->rx = self->rx_status;
     status->rx_framer = self->rx_framer.status;
     status->tx = self->tx_status;
+    status->tx.rtt = self->tx_rtt;
+    status->tx.rtt_var = self->tx_rtt_var;
+    status->tx.rto = self->tx_rto;
+    status->tx.window = tx_window(self);
+    status->tx.window_max = self->tx_frame_count;
+    status->disconnected_time = self->disconnected_time;
+    if (self->state == ST_DISCONNECTED) {
+        status->disconnected_time += time_get(self) - self->disconnected_start;
+    }
     unlock(self);
     return 0;
 }
@@ -849,6 +1215,8 @@ void fbp_dl_status_clear(struct fbp_dl_s * self) {
     fbp_memset(&self->rx_status, 0, sizeof(self->rx_status));
     fbp_memset(&self->rx_framer.status, 0, sizeof(self->rx_framer.status));
     fbp_memset(&self->tx_status, 0, sizeof(self->tx_status));
+    self->disconnected_time = 0;
+    self->disconnected_start = time_get(self);
     unlock(self);
 }
 
@@ -871,15 +1239,46 @@ void fbp_dl_tx_window_set(struct fbp_dl_s * self, uint32_t tx_window_size) {
         FBP_LOGI("fbp_dl_tx_window_set(%" PRIu32 ")", tx_window_size);
     }
     self->tx_frame_count = tx_window_size;
+    tx_cwnd_init(self);
 
     uint16_t frame_id = (self->tx_frame_last_id) & FBP_FRAMER_FRAME_ID_MAX;
     uint16_t idx = frame_id & (self->tx_frame_count - 1);
     if (idx) {
-        self->tx_frames[idx] = self->tx_frames[0];
-        self->tx_frames[0].state = TX_FRAME_ST_IDLE;
+        fbp_memcpy(tx_frame_at(self, idx), tx_frame_at(self, 0), self->tx_frame_stride);
+        tx_frame_at(self, 0)->state = TX_FRAME_ST_IDLE;
     }
 }
 
 uint32_t fbp_dl_rx_window_get(struct fbp_dl_s * self) {
     return self->rx_frame_count;
 }
+
+uint32_t fbp_dl_payload_max_get(struct fbp_dl_s * self) {
+    return self->payload_max;
+}
+
+void fbp_dl_tx_payload_max_set(struct fbp_dl_s * self, uint32_t payload_max_size) {
+    if (payload_max_size > self->payload_max) {
+        payload_max_size = self->payload_max;
+    } else if (payload_max_size < FBP_FRAMER_PAYLOAD_MAX_SIZE) {
+        payload_max_size = FBP_FRAMER_PAYLOAD_MAX_SIZE;
+    }
+    FBP_LOGI("fbp_dl_tx_payload_max_set(%" PRIu32 ")", payload_max_size);
+    lock(self);
+    self->tx_payload_max = payload_max_size;
+    unlock(self);
+}
+
+uint32_t fbp_dl_tx_payload_max_get(struct fbp_dl_s * self) {
+    return self->tx_payload_max;
+}
+
+void fbp_dl_tx_ack_bitmap_set(struct fbp_dl_s * self, bool enable) {
+    FBP_LOGI("fbp_dl_tx_ack_bitmap_set(%d)", enable ? 1 : 0);
+    lock(self);
+    self->tx_ack_bitmap = enable ? 1 : 0;
+    if (!enable) {
+        self->tx_ack_bitmap_pending = 0;
+    }
+    unlock(self);
+}
@@ -22,12 +22,22 @@
 #include "fitterbap/crc.h"
 #include "fitterbap/log.h"
 #include "fitterbap/platform.h"
+#include <string.h>
 
 
 #ifndef FBP_FRAMER_CRC32
 #error Must define FBP_FRAMER_CRC32 in fitterbap/config.h
 #endif
 
+#if FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE
+#define JUMBO_ENABLE 1
+#ifndef FBP_FRAMER_CRC64
+#error Must define FBP_FRAMER_CRC64 in fitterbap/config.h for jumbo frames
+#endif
+#else
+#define JUMBO_ENABLE 0
+#endif
+
 
 enum state_e {
     ST_SOF1,
@@ -39,7 +49,7 @@ enum state_e {
 
 struct recv_buf_s {
     uint8_t const * buf;
-    uint16_t size;
+    uint32_t size;
 };
 
 /**
@@ -80,43 +90,87 @@ static inline uint8_t length_crc(uint8_t length) {
     return length_crc_table[length];
 }
 
-static void recv(struct fbp_framer_s * self, struct recv_buf_s * buf);
+static void recv(struct fbp_framer_s * self, struct recv_buf_s * buf, bool stop_at_frame);
 
 static inline uint8_t parse_frame_type(uint8_t const * frame) {
     return (frame[2] >> 3) & 0x1f;
 }
 
+static inline bool is_jumbo(uint8_t const * frame) {
+    return JUMBO_ENABLE && (parse_frame_type(frame) == FBP_FRAMER_FT_DATA_JUMBO);
+}
+
 static inline uint16_t parse_frame_id(uint8_t const * frame) {
     return (((uint16_t) (frame[2] & 0x7)) << 8) | frame[3];
 }
 
-static inline uint8_t parse_data_payload_raw_length(uint8_t const * frame) {
+static inline uint16_t parse_data_payload_raw_length(uint8_t const * frame) {
+    if (is_jumbo(frame)) {
+        return frame[4] | (((uint16_t) frame[5]) << 8);
+    }
     return frame[4];
 }
 
-static inline uint8_t parse_data_length_crc(uint8_t const * frame) {
-    return frame[5];
+static inline uint16_t parse_data_payload_length(uint8_t const * frame) {
+    return 1 + parse_data_payload_raw_length(frame);
+}
+
+static inline uint16_t data_header_size(uint8_t const * frame) {
+    return is_jumbo(frame) ? FBP_FRAMER_JUMBO_HEADER_SIZE : FBP_FRAMER_HEADER_SIZE;
 }
 
-static inline uint16_t parse_data_payload_length(uint8_t const * frame) {
-    return 1 + ((uint16_t) parse_data_payload_raw_length(frame));
+/// The number of header bytes up to and including the length_crc.
+static inline uint16_t length_header_size(uint8_t const * frame) {
+    return data_header_size(frame) - 2;
 }
 
 static inline uint16_t parse_data_metadata(uint8_t const * frame) {
-    return frame[6] | (((uint16_t) frame[7]) << 8);
+    uint8_t const * m = frame + data_header_size(frame) - 2;
+    return m[0] | (((uint16_t) m[1]) << 8);
 }
 
-static bool validate_crc(uint8_t const * frame) {
-    uint16_t frame_sz;
-    if (parse_frame_type(frame) == FBP_FRAMER_FT_DATA) {
-        frame_sz = parse_data_payload_length(frame) + FBP_FRAMER_OVERHEAD_SIZE;
-    } else {
-        frame_sz = FBP_FRAMER_LINK_SIZE;
+static bool validate_length(uint8_t const * frame) {
+    if (is_jumbo(frame)) {
+        if ((frame[5] & 0xf0) || (parse_data_payload_length(frame) > FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE)) {
+            return false;
+        }
+        return length_crc_table[length_crc_table[frame[4]] ^ frame[5]] == frame[6];
     }
+    return length_crc_table[frame[4]] == frame[5];
+}
+
+static uint16_t frame_size(uint8_t const * frame) {
+    switch (parse_frame_type(frame)) {
+        case FBP_FRAMER_FT_DATA:
+            return parse_data_payload_length(frame) + FBP_FRAMER_OVERHEAD_SIZE;
+#if JUMBO_ENABLE
+        case FBP_FRAMER_FT_DATA_JUMBO:
+            return parse_data_payload_length(frame) + FBP_FRAMER_JUMBO_OVERHEAD_SIZE;
+#endif
+        case FBP_FRAMER_FT_ACK_BITMAP:
+            return FBP_FRAMER_ACK_BITMAP_SIZE;
+        default:
+            return FBP_FRAMER_LINK_SIZE;
+    }
+}
+
+static bool validate_crc(uint8_t const * frame) {
+    uint16_t frame_sz = frame_size(frame);
     // check EOF (SOF of next frame)
     if (frame[frame_sz] != FBP_FRAMER_SOF1) {
         return false;
     }
+#if JUMBO_ENABLE
+    if (is_jumbo(frame)) {
+        uint8_t const * crc_value = frame + frame_sz - FBP_FRAMER_JUMBO_FOOTER_SIZE;
+        uint64_t crc_rx = 0;
+        for (int i = FBP_FRAMER_JUMBO_FOOTER_SIZE - 1; i >= 0; --i) {
+            crc_rx = (crc_rx << 8) | crc_value[i];
+        }
+        uint64_t crc_calc = FBP_FRAMER_CRC64(0, frame + 2, frame_sz - FBP_FRAMER_JUMBO_FOOTER_SIZE - 2);
+        return (crc_rx == crc_calc);
+    }
+#endif
     uint8_t const * crc_value = frame + frame_sz - FBP_FRAMER_FOOTER_SIZE;
     uint32_t crc_rx = ((uint32_t) crc_value[0])
         | (((uint32_t) crc_value[1]) << 8)
@@ -163,29 +217,40 @@ static void reprocess_buffer(struct fbp_framer_s * self) {
     };
     self->status.ignored_bytes += 1;
     self->buf_offset = 0;
-    recv(self, &buf);
+    recv(self, &buf, false);
+}
+
+static void dispatch_frame(struct fbp_framer_s * self, uint8_t const * frame) {
+    uint8_t frame_type = parse_frame_type(frame);
+    uint16_t frame_id = parse_frame_id(frame);
+    if ((frame_type == FBP_FRAMER_FT_DATA) || is_jumbo(frame)) {
+        if (self->api.data_fn) {
+            uint16_t metadata = parse_data_metadata(frame);
+            uint16_t payload_length = parse_data_payload_length(frame);
+            // The receiver must treat msg as read-only, see fbp_framer_api_s.
+            self->api.data_fn(self->api.user_data, frame_id, metadata,
+                              (uint8_t *) (frame + data_header_size(frame)), payload_length);
+        }
+    } else if (frame_type == FBP_FRAMER_FT_ACK_BITMAP) {
+        if (self->api.ack_bitmap_fn) {
+            uint64_t bitmap = 0;
+            for (int i = 7; i >= 0; --i) {
+                bitmap = (bitmap << 8) | frame[4 + i];
+            }
+            self->api.ack_bitmap_fn(self->api.user_data, frame_id, bitmap);
+        }
+    } else if (self->api.link_fn) {
+        self->api.link_fn(self->api.user_data, frame_type, frame_id);
+    }
 }
 
 static void handle_frame(struct fbp_framer_s * self) {
-    uint8_t frame_type = parse_frame_type(self->buf);
     if (self->buf_offset != self->length) {
         FBP_LOGW("consume frame length error: %d != %d",
                  (int) self->buf_offset, (int) self->length);
         reprocess_buffer(self);
     } else {
-        uint16_t frame_id = parse_frame_id(self->buf);
-        if (frame_type == FBP_FRAMER_FT_DATA) {
-            if (self->api.data_fn) {
-                uint16_t metadata = parse_data_metadata(self->buf);
-                uint16_t payload_length = parse_data_payload_length(self->buf);
-                self->api.data_fn(self->api.user_data, frame_id, metadata,
-                                  self->buf + FBP_FRAMER_HEADER_SIZE, payload_length);
-            }
-        } else {
-            if (self->api.link_fn) {
-                self->api.link_fn(self->api.user_data, frame_type, frame_id);
-            }
-        }
+        dispatch_frame(self, self->buf);
         self->state = ST_SOF2;
         self->buf[0] = FBP_FRAMER_SOF1;
         self->buf_offset = 1;
@@ -193,8 +258,26 @@ static void handle_frame(struct fbp_framer_s * self) {
     }
 }
 
-static void recv(struct fbp_framer_s * self, struct recv_buf_s * buf) {
+static inline bool is_frame_boundary(struct fbp_framer_s * self) {
+    return ((self->state == ST_SOF1) && (0 == self->buf_offset))
+        || ((self->state == ST_SOF2) && (1 == self->buf_offset));
+}
+
+/**
+ * @brief Process received bytes one at a time using the state machine.
+ *
+ * @param self The framer instance.
+ * @param buf The received data, which is advanced as bytes are consumed.
+ * @param stop_at_frame When true, return as soon as the framer reaches the
+ *      start of the next frame so that the caller may resume scanning in place.
+ *      When false, consume all of buf.
+ */
+static void recv(struct fbp_framer_s * self, struct recv_buf_s * buf, bool stop_at_frame) {
+    uint8_t const * start = buf->buf;
     while (buf->size) {
+        if (stop_at_frame && (buf->buf != start) && is_frame_boundary(self)) {
+            return;
+        }
         self->buf[self->buf_offset++] = recv_buf_advance(buf);
 
         switch (self->state) {
@@ -228,6 +311,9 @@ static void recv(struct fbp_framer_s * self, struct recv_buf_s * buf) {
             case ST_FRAME_TYPE:
                 switch (parse_frame_type(self->buf)) {
                     case FBP_FRAMER_FT_DATA:
+#if JUMBO_ENABLE
+                    case FBP_FRAMER_FT_DATA_JUMBO:     /* Intentional fall-through */
+#endif
                         self->state = ST_DATA_HEADER;
                         break;
                     case FBP_FRAMER_FT_ACK_ALL:            /* Intentional fall-through */
@@ -238,6 +324,10 @@ static void recv(struct fbp_framer_s * self, struct recv_buf_s * buf) {
                         self->state = ST_STORE;
                         self->length = FBP_FRAMER_LINK_SIZE + 1;
                         break;
+                    case FBP_FRAMER_FT_ACK_BITMAP:
+                        self->state = ST_STORE;
+                        self->length = FBP_FRAMER_ACK_BITMAP_SIZE + 1;
+                        break;
                     default:
                         handle_framing_error_discard(self);
                         break;
@@ -245,15 +335,13 @@ static void recv(struct fbp_framer_s * self, struct recv_buf_s * buf) {
                 break;
 
             case ST_DATA_HEADER:
-                if (self->buf_offset >= (FBP_FRAMER_HEADER_SIZE - 2)) {
-                    self->state = ST_STORE;
-                    self->length = parse_data_payload_length(self->buf) + FBP_FRAMER_OVERHEAD_SIZE + 1;
-                    uint8_t crc1 = length_crc_table[parse_data_payload_raw_length(self->buf)];
-                    uint8_t crc2 = parse_data_length_crc(self->buf);
-                    if (crc1 != crc2) {
+                if (self->buf_offset >= length_header_size(self->buf)) {
+                    if (!validate_length(self->buf)) {
                         handle_framing_error_discard(self);
                         break;
                     }
+                    self->state = ST_STORE;
+                    self->length = frame_size(self->buf) + 1;
                 }
                 break;
 
@@ -286,6 +374,110 @@ static void recv(struct fbp_framer_s * self, struct recv_buf_s * buf) {
     }
 }
 
+/**
+ * @brief Scan for and dispatch complete frames in place.
+ *
+ * @param self The framer instance, which must be at ST_SOF1 with no
+ *      buffered bytes.
+ * @param buf The received data.  On return, buf is either empty or
+ *      starts with SOF1 followed by an incomplete frame.
+ *
+ * Complete frames are validated and dispatched directly from the caller's
+ * buffer without copying into self->buf.  The status counters and
+ * framing error callbacks match the byte-wise state machine in recv().
+ */
+static void scan(struct fbp_framer_s * self, struct recv_buf_s * buf) {
+    uint8_t const * p = buf->buf;
+    uint8_t const * end = p + buf->size;
+    uint32_t frame_sz;
+
+    while (p < end) {
+        if (*p != FBP_FRAMER_SOF1) {
+            uint8_t const * sof = memchr(p, FBP_FRAMER_SOF1, end - p);
+            if (!sof) {
+                sof = end;
+            }
+            if (self->is_sync) {
+                FBP_LOGD1("Expected SOF1 got 0x%02x", *p);
+            }
+            handle_framing_error(self);
+            self->status.ignored_bytes += (uint32_t) (sof - p);
+            p = sof;
+            continue;
+        }
+        uint32_t remaining = (uint32_t) (end - p);
+        if (remaining < 2) {
+            break;
+        } else if (p[1] == FBP_FRAMER_SOF1) {
+            // allow duplicate SOF1 bytes
+            ++self->status.ignored_bytes;
+            ++p;
+            continue;
+        } else if (p[1] != FBP_FRAMER_SOF2) {
+            FBP_LOGD1("Expected SOF2 got 0x%02x", p[1]);
+            handle_framing_error(self);
+            self->status.ignored_bytes += 2;
+            p += 2;
+            continue;
+        } else if (remaining < 3) {
+            break;
+        }
+
+        switch (parse_frame_type(p)) {
+            case FBP_FRAMER_FT_DATA:
+#if JUMBO_ENABLE
+            case FBP_FRAMER_FT_DATA_JUMBO:         /* Intentional fall-through */
+#endif
+                if (remaining < length_header_size(p)) {
+                    goto exit;
+                }
+                if (!validate_length(p)) {
+                    handle_framing_error(self);
+                    self->status.ignored_bytes += length_header_size(p);
+                    p += length_header_size(p);
+                    continue;
+                }
+                frame_sz = frame_size(p);
+                break;
+            case FBP_FRAMER_FT_ACK_ALL:            /* Intentional fall-through */
+            case FBP_FRAMER_FT_ACK_ONE:            /* Intentional fall-through */
+            case FBP_FRAMER_FT_NACK_FRAME_ID:      /* Intentional fall-through */
+            case FBP_FRAMER_FT_NACK_FRAMING_ERROR: /* Intentional fall-through */
+            case FBP_FRAMER_FT_RESET:
+                frame_sz = FBP_FRAMER_LINK_SIZE;
+                break;
+            case FBP_FRAMER_FT_ACK_BITMAP:
+                frame_sz = FBP_FRAMER_ACK_BITMAP_SIZE;
+                break;
+            default:
+                handle_framing_error(self);
+                self->status.ignored_bytes += 3;
+                p += 3;
+                continue;
+        }
+
+        if (remaining < (frame_sz + 1)) {  // need EOF
+            break;
+        }
+        if (!validate_crc(p)) {
+            FBP_LOGD1("crc invalid");
+            ++self->status.resync;
+            handle_framing_error(self);
+            ++self->status.ignored_bytes;
+            ++p;
+            continue;
+        }
+        FBP_LOGD3("frame received, %d bytes", (int) frame_sz);
+        self->is_sync = true;
+        dispatch_frame(self, p);
+        p += frame_sz;  // EOF is SOF1 of the next frame
+    }
+
+exit:
+    buf->size -= (uint32_t) (p - buf->buf);
+    buf->buf = p;
+}
+
 void fbp_framer_ll_recv(struct fbp_framer_s * self, uint8_t const * buffer, uint32_t buffer_size) {
     FBP_LOGD3("received %d bytes", (int) buffer_size);
     self->status.total_bytes += buffer_size;
@@ -293,7 +485,22 @@ void fbp_framer_ll_recv(struct fbp_framer_s * self, uint8_t const * buffer, uint
             .buf = buffer,
             .size = buffer_size,
     };
-    recv(self, &buf);
+    while (buf.size) {
+        if ((self->state == ST_SOF2) && (1 == self->buf_offset)
+                && (buf.buf != buffer) && (buf.buf[-1] == FBP_FRAMER_SOF1)) {
+            // The SOF1 was received in this buffer, restart the frame in place.
+            --buf.buf;
+            ++buf.size;
+            self->state = ST_SOF1;
+            self->buf_offset = 0;
+        }
+        if ((self->state == ST_SOF1) && (0 == self->buf_offset)) {
+            scan(self, &buf);
+            recv(self, &buf, false);  // store partial frame
+        } else {
+            recv(self, &buf, true);   // complete the partial frame from the previous call
+        }
+    }
 }
 
 void fbp_framer_reset(struct fbp_framer_s * self) {
@@ -315,6 +522,48 @@ bool fbp_framer_validate_data(uint16_t frame_id, uint16_t metadata, uint32_t msg
     return true;
 }
 
+bool fbp_framer_validate_jumbo(uint16_t frame_id, uint16_t metadata, uint32_t msg_size) {
+    (void) metadata;  // all 16-bit values are valid, no check needed.
+    if ((msg_size < 1) || (msg_size > FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE)) {
+        return false;
+    }
+    if (frame_id > FBP_FRAMER_FRAME_ID_MAX) {
+        return false;
+    }
+    return true;
+}
+
+int32_t fbp_framer_construct_jumbo(uint8_t * b, uint16_t frame_id, uint16_t metadata,
+                                   uint8_t const *msg, uint32_t msg_size) {
+    if (!fbp_framer_validate_jumbo(frame_id, metadata, msg_size)) {
+        return FBP_ERROR_PARAMETER_INVALID;
+    }
+#if JUMBO_ENABLE
+    uint16_t length_field = (uint16_t) (msg_size - 1);
+    b[0] = FBP_FRAMER_SOF1;
+    b[1] = FBP_FRAMER_SOF2;
+    b[2] = (FBP_FRAMER_FT_DATA_JUMBO << 3) | ((frame_id >> 8) & 0x7);
+    b[3] = (uint8_t) (frame_id & 0xff);
+    b[4] = (uint8_t) (length_field & 0xff);
+    b[5] = (uint8_t) ((length_field >> 8) & 0x0f);
+    b[6] = length_crc_table[length_crc_table[b[4]] ^ b[5]];
+    b[7] = metadata & 0xff;
+    b[8] = (metadata >> 8) & 0xff;
+    memcpy(b + FBP_FRAMER_JUMBO_HEADER_SIZE, msg, msg_size);
+    uint64_t crc = FBP_FRAMER_CRC64(0, b + 2, msg_size + FBP_FRAMER_JUMBO_HEADER_SIZE - 2);
+    uint8_t * footer = b + FBP_FRAMER_JUMBO_HEADER_SIZE + msg_size;
+    for (int i = 0; i < FBP_FRAMER_JUMBO_FOOTER_SIZE; ++i) {
+        footer[i] = (uint8_t) (crc & 0xff);
+        crc >>= 8;
+    }
+    return 0;
+#else
+    (void) b;
+    (void) msg;
+    return FBP_ERROR_NOT_SUPPORTED;
+#endif
+}
+
 int32_t fbp_framer_construct_data(uint8_t * b, uint16_t frame_id, uint16_t metadata,
                                    uint8_t const *msg, uint32_t msg_size) {
     if (!fbp_framer_validate_data(frame_id, metadata, msg_size)) {
@@ -385,6 +634,26 @@ int32_t fbp_framer_construct_link(uint8_t * b, enum fbp_framer_type_e frame_type
     return 0;
 }
 
+int32_t fbp_framer_construct_ack_bitmap(uint8_t * b, uint16_t frame_id, uint64_t bitmap) {
+    if (frame_id > FBP_FRAMER_FRAME_ID_MAX) {
+        return FBP_ERROR_PARAMETER_INVALID;
+    }
+    b[0] = FBP_FRAMER_SOF1;
+    b[1] = FBP_FRAMER_SOF2;
+    b[2] = (FBP_FRAMER_FT_ACK_BITMAP << 3) | ((frame_id >> 8) & 0x7);
+    b[3] = (uint8_t) (frame_id & 0xff);
+    for (int i = 0; i < 8; ++i) {
+        b[4 + i] = (uint8_t) (bitmap & 0xff);
+        bitmap >>= 8;
+    }
+    uint32_t crc = FBP_FRAMER_CRC32(0, b + 2, 10);
+    b[12] = crc & 0xff;
+    b[13] = (crc >> 8) & 0xff;
+    b[14] = (crc >> 16) & 0xff;
+    b[15] = (crc >> 24) & 0xff;
+    return 0;
+}
+
 int32_t fbp_framer_frame_id_subtract(uint16_t a, uint16_t b) {
     uint16_t c = (a - b) & FBP_FRAMER_FRAME_ID_MAX;
     if (c > (FBP_FRAMER_FRAME_ID_MAX / 2)) {
@@ -121,8 +121,9 @@ void on_transport_recv(void *user_data,
                        uint8_t port_data,
                        uint8_t *msg, uint32_t msg_size) {
     (void) port_data;
-    char * p;
-    char * p_end = (char *) (msg + msg_size - 1);  // last char should be null string terminator
+    // msg is a read-only view of the receive buffer, so copy to terminate strings
+    char filename[FBP_LOGH_FILENAME_SIZE_MAX + 1];
+    char message[FBP_LOGH_MESSAGE_SIZE_MAX + 1];
     struct logp_s * self = (struct logp_s *) user_data;
     struct fbp_logh_header_s header;
     if (!self || !self->pub_fn) {
@@ -140,21 +141,23 @@ void on_transport_recv(void *user_data,
     if (header.level > self->level_filter) {
         return;
     }
-    char * filename = (char *) msg + sizeof(header);
-    p = filename;
-    for (int i = 0; (i < FBP_LOGH_FILENAME_SIZE_MAX) && (*p) && (*p != FBP_LOGP_SEP) && (p < p_end); ++i) {
-        p++;
+    const char * p = (const char *) msg + sizeof(header);
+    const char * p_end = (const char *) (msg + msg_size);
+    int i = 0;
+    while ((i < FBP_LOGH_FILENAME_SIZE_MAX) && (p < p_end) && (*p) && (*p != FBP_LOGP_SEP)) {
+        filename[i++] = *p++;
     }
-    if (*p == FBP_LOGP_SEP) {
-        *p++ = 0;  // terminate filename string
+    filename[i] = 0;
+    if ((p < p_end) && (*p == FBP_LOGP_SEP)) {
+        ++p;
     } else {
         // invalid format, process the best we can
     }
-    char * message = p;
-    for (int i = 0; (i < FBP_LOGH_MESSAGE_SIZE_MAX) && (*p) && (p < p_end); ++i) {
-        p++;
+    i = 0;
+    while ((i < FBP_LOGH_MESSAGE_SIZE_MAX) && (p < p_end) && (*p)) {
+        message[i++] = *p++;
     }
-    *p = 0;
+    message[i] = 0;
 
     self->pub_fn(self->pub_user_data, &header, filename, message);
 }
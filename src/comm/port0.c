@@ -31,6 +31,11 @@
 
 
 #define TIMESYNC_INTERVAL_MS  (10000)
+#define NEGOTIATE_COUNT (5)
+#define NEGOTIATE_SIZE (NEGOTIATE_COUNT * sizeof(uint32_t))
+#define NEGOTIATE_SIZE_MIN (4 * sizeof(uint32_t))  // data link 1.0
+#define NEGOTIATE_PAYLOAD_MAX (4)
+#define DL_VERSION_ACK_BITMAP FBP_VERSION_ENCODE_U32(1, 1, 0)
 
 const char FBP_PORT0_META[] = "{\"type\":\"oam\", \"name\": \"oam\"}";
 static const char STATE_TOPIC[] = "0/state";
@@ -446,7 +451,11 @@ static void op_meta_rsp(struct fbp_port0_s * self, uint8_t *msg, uint32_t msg_si
         FBP_LOGW("meta_rsp invalid port_id %d", (int) port_id);
         return;
     }
-    msg[msg_size - 1] = 0;  // enforce null termination
+    if (msg[msg_size - 1]) {
+        // the receive buffer is read-only, so reject rather than terminate
+        FBP_LOGW("meta_rsp not null terminated");
+        return;
+    }
     if (port_id != self->meta_port_id) {
         FBP_LOGW("meta_rsp unexpected port_id %d != %d", (int) port_id, (int) self->meta_port_id);
     }
@@ -464,24 +473,37 @@ static void op_meta_rsp(struct fbp_port0_s * self, uint8_t *msg, uint32_t msg_si
     }
 }
 
+static void negotiate_parse(uint32_t * payload, uint8_t const * msg, uint32_t msg_size) {
+    // fields added after data link 1.0 default to their 1.0 behavior.
+    payload[NEGOTIATE_PAYLOAD_MAX] = FBP_FRAMER_PAYLOAD_MAX_SIZE;
+    memcpy(payload, msg, min_u32(msg_size, NEGOTIATE_SIZE));
+}
+
+static bool is_ack_bitmap_supported(uint32_t version) {
+    return ((version >> 24) == FBP_DL_VERSION_MAJOR) && (version >= DL_VERSION_ACK_BITMAP);
+}
+
 static void op_negotiate_req(struct fbp_port0_s * self, uint8_t *msg, uint32_t msg_size) {
-    uint32_t req[4];  // version, status, down_window_size, up_window_size
-    uint32_t rsp[4] = {FBP_DL_VERSION, 0, 0, 0};
+    uint32_t req[NEGOTIATE_COUNT];  // version, status, down_window_size, up_window_size, payload_max_size
+    uint32_t rsp[NEGOTIATE_COUNT] = {FBP_DL_VERSION, 0, 0, 0, FBP_FRAMER_PAYLOAD_MAX_SIZE};
     if (self->mode != FBP_PORT0_MODE_CLIENT) {
         FBP_LOGE("op_negotiate_rsp, but not client on %s", self->topic_prefix);
         rsp[1] = FBP_ERROR_NOT_SUPPORTED;
-    } else if (msg_size < sizeof(req)) {
+    } else if (msg_size < NEGOTIATE_SIZE_MIN) {
         FBP_LOGE("incompatible negotiate packet on %s", self->topic_prefix);
         rsp[1] = FBP_ERROR_PARAMETER_INVALID;
     } else {
-        memcpy(req, msg, sizeof(req));
+        negotiate_parse(req, msg, msg_size);
         if (FBP_DL_VERSION_MAJOR != (req[0] >> 24)) {
             FBP_LOGE("potentially incompatible negotiate version on %s", self->topic_prefix);
             rsp[1] = 0; // could issue warning
         }
         rsp[2] = min_u32(fbp_dl_rx_window_get(self->dl), req[2]);
         rsp[3] = min_u32(fbp_dl_tx_window_max_get(self->dl), req[3]);
+        rsp[4] = min_u32(fbp_dl_payload_max_get(self->dl), req[4]);
         fbp_dl_tx_window_set(self->dl, rsp[3]);
+        fbp_dl_tx_payload_max_set(self->dl, rsp[4]);
+        fbp_dl_tx_ack_bitmap_set(self->dl, is_ack_bitmap_supported(req[0]));
     }
     if (self->send_fn(self->transport, 0, FBP_TRANSPORT_SEQ_SINGLE, RSP(NEGOTIATE),
                       (uint8_t *) rsp, sizeof(rsp), 0)) {
@@ -491,21 +513,23 @@ static void op_negotiate_req(struct fbp_port0_s * self, uint8_t *msg, uint32_t m
 }
 
 static void op_negotiate_rsp(struct fbp_port0_s * self, uint8_t *msg, uint32_t msg_size) {
-    uint32_t rsp[4];  // version, status, rsv, window_size;
+    uint32_t rsp[NEGOTIATE_COUNT];  // version, status, rsv, window_size, payload_max_size
     if (self->mode != FBP_PORT0_MODE_SERVER) {
         FBP_LOGE("op_negotiate_rsp, but not server on %s", self->topic_prefix);
         // fatal error: await timeout
-    } else if (msg_size < sizeof(rsp)) {
+    } else if (msg_size < NEGOTIATE_SIZE_MIN) {
         FBP_LOGE("incompatible negotiate packeton %s", self->topic_prefix);
         // fatal error: await timeout
     } else {
-        memcpy(rsp, msg, sizeof(rsp));
+        negotiate_parse(rsp, msg, msg_size);
         if (FBP_DL_VERSION_MAJOR != (rsp[0] >> 24)) {
             FBP_LOGE("incompatible negotiate version on %s", self->topic_prefix);
             // fatal error: await timeout.
         } else {
             rsp[2] = min_u32(fbp_dl_tx_window_max_get(self->dl), rsp[2]);
             fbp_dl_tx_window_set(self->dl, rsp[2]);
+            fbp_dl_tx_payload_max_set(self->dl, min_u32(fbp_dl_payload_max_get(self->dl), rsp[4]));
+            fbp_dl_tx_ack_bitmap_set(self->dl, is_ack_bitmap_supported(rsp[0]));
             emit_event(self, EV_NEGOTIATE_DONE);
         }
     }
@@ -593,9 +617,11 @@ static fbp_fsm_state_t on_disconnected_timeout(struct fbp_fsm_s * fsm, fbp_fsm_e
 static fbp_fsm_state_t negotiate_send_req(struct fbp_fsm_s * fsm, fbp_fsm_event_t event) {
     (void) event;
     struct fbp_port0_s * self = (struct fbp_port0_s *) fsm;
-    uint32_t payload[4] = {FBP_DL_VERSION, 0, 0, 0};  // version, status, down_window_size, up_window_size
+    // version, status, down_window_size, up_window_size, payload_max_size
+    uint32_t payload[NEGOTIATE_COUNT] = {FBP_DL_VERSION, 0, 0, 0, 0};
     payload[2] = fbp_dl_tx_window_max_get(self->dl);
     payload[3] = fbp_dl_rx_window_get(self->dl);
+    payload[4] = fbp_dl_payload_max_get(self->dl);
     if (self->send_fn(self->transport, 0, FBP_TRANSPORT_SEQ_SINGLE, REQ(NEGOTIATE),
                       (uint8_t *) payload, sizeof(payload), 0)) {
         // buffer full, schedule retry
@@ -31,6 +31,7 @@ static const char META[] = "{\"type\":\"waveform\"}";
 struct fbp_wavep_s {
     struct fbp_port_api_s api;
     struct fbp_topic_s data_topic;
+    struct fbp_pubsub_topic_s * data_handle;
     struct fbp_pubsub_s * pubsub;
     uint8_t port_id;
 };
@@ -41,7 +42,8 @@ static int32_t initialize(struct fbp_port_api_s * api, const struct fbp_port_con
     self->port_id = config->port_id;
     fbp_topic_set(&self->data_topic, config->topic_prefix.topic);
     fbp_topic_append(&self->data_topic, "data");
-    return 0;
+    self->data_handle = fbp_pubsub_topic_handle(self->pubsub, self->data_topic.topic);
+    return self->data_handle ? 0 : FBP_ERROR_PARAMETER_INVALID;
 }
 
 static int32_t finalize(struct fbp_port_api_s * api) {
@@ -81,7 +83,7 @@ static void on_recv(void *user_data,
             return;
         }
         FBP_LOGD1("port sz=%d", (int) msg_size);
-        fbp_pubsub_publish(self->pubsub, self->data_topic.topic, &fbp_union_bin(msg, msg_size), NULL, NULL);
+        fbp_pubsub_publish_h(self->data_handle, &fbp_union_bin(msg, msg_size), NULL, NULL);
     } else {
         int msg_type = (int) ((port_data >> 4) & 0x0f);
         switch (msg_type) {
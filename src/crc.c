@@ -17,11 +17,38 @@
 #include "fitterbap/crc.h"
 #include "fitterbap/config.h"
 
+#ifndef FBP_CRC_SLICE_BY
+#define FBP_CRC_SLICE_BY 0
+#endif
+
+#if FBP_CRC_SLICE_BY >= 8
+#define CRC_TABLE_COUNT 8
+#elif FBP_CRC_SLICE_BY >= 4
+#define CRC_TABLE_COUNT 4
+#else
+#define CRC_TABLE_COUNT 1
+#endif
+
+#if FBP_CRC_SLICE_BY >= 8
+#define CRC64_TABLE_COUNT 8
+#else
+#define CRC64_TABLE_COUNT 1
+#endif
+
+#if defined(FBP_CRC_CRC32) && FBP_CRC_CRC32 && defined(FBP_CRC_CRC32_PCLMUL) && FBP_CRC_CRC32_PCLMUL \
+    && defined(__x86_64__) && (defined(__GNUC__) || defined(__clang__))
+#define CRC32_PCLMUL_ENABLE 1
+#include <wmmintrin.h>
+#include <smmintrin.h>
+#else
+#define CRC32_PCLMUL_ENABLE 0
+#endif
+
 #define CRC8_POLYNOMIAL ((uint8_t) 0xE0)
 #define CRC16_POLYNOMIAL ((uint16_t) 0x8408)
 #define CRC32_POLYNOMIAL ((uint32_t) 0xEDB88320)
 
-uint8_t fbp_crc_ccitt_8(uint8_t crc, uint8_t const *data, uint32_t length) {
+uint8_t fbp_crc_ccitt_8_bitwise(uint8_t crc, uint8_t const *data, uint32_t length) {
     uint8_t byte;
     uint8_t mask;
     uint8_t const * data_end;
@@ -45,7 +72,7 @@ uint8_t fbp_crc_ccitt_8(uint8_t crc, uint8_t const *data, uint32_t length) {
     return crc;
 }
 
-uint16_t fbp_crc_ccitt_16(uint16_t crc, uint8_t const *data, uint32_t length) {
+uint16_t fbp_crc_ccitt_16_bitwise(uint16_t crc, uint8_t const *data, uint32_t length) {
     uint8_t const * data_end = data + length;
 
     if ((0 == length) || !data) {
@@ -64,56 +91,1467 @@ uint16_t fbp_crc_ccitt_16(uint16_t crc, uint8_t const *data, uint32_t length) {
     return crc;
 }
 
+#if FBP_CRC_SLICE_BY >= 1
+static const uint8_t crc8_table[256] = {
+        0x00, 0x91, 0xe3, 0x72, 0x07, 0x96, 0xe4, 0x75, 0x0e, 0x9f, 0xed, 0x7c, 0x09, 0x98, 0xea, 0x7b,
+        0x1c, 0x8d, 0xff, 0x6e, 0x1b, 0x8a, 0xf8, 0x69, 0x12, 0x83, 0xf1, 0x60, 0x15, 0x84, 0xf6, 0x67,
+        0x38, 0xa9, 0xdb, 0x4a, 0x3f, 0xae, 0xdc, 0x4d, 0x36, 0xa7, 0xd5, 0x44, 0x31, 0xa0, 0xd2, 0x43,
+        0x24, 0xb5, 0xc7, 0x56, 0x23, 0xb2, 0xc0, 0x51, 0x2a, 0xbb, 0xc9, 0x58, 0x2d, 0xbc, 0xce, 0x5f,
+        0x70, 0xe1, 0x93, 0x02, 0x77, 0xe6, 0x94, 0x05, 0x7e, 0xef, 0x9d, 0x0c, 0x79, 0xe8, 0x9a, 0x0b,
+        0x6c, 0xfd, 0x8f, 0x1e, 0x6b, 0xfa, 0x88, 0x19, 0x62, 0xf3, 0x81, 0x10, 0x65, 0xf4, 0x86, 0x17,
+        0x48, 0xd9, 0xab, 0x3a, 0x4f, 0xde, 0xac, 0x3d, 0x46, 0xd7, 0xa5, 0x34, 0x41, 0xd0, 0xa2, 0x33,
+        0x54, 0xc5, 0xb7, 0x26, 0x53, 0xc2, 0xb0, 0x21, 0x5a, 0xcb, 0xb9, 0x28, 0x5d, 0xcc, 0xbe, 0x2f,
+        0xe0, 0x71, 0x03, 0x92, 0xe7, 0x76, 0x04, 0x95, 0xee, 0x7f, 0x0d, 0x9c, 0xe9, 0x78, 0x0a, 0x9b,
+        0xfc, 0x6d, 0x1f, 0x8e, 0xfb, 0x6a, 0x18, 0x89, 0xf2, 0x63, 0x11, 0x80, 0xf5, 0x64, 0x16, 0x87,
+        0xd8, 0x49, 0x3b, 0xaa, 0xdf, 0x4e, 0x3c, 0xad, 0xd6, 0x47, 0x35, 0xa4, 0xd1, 0x40, 0x32, 0xa3,
+        0xc4, 0x55, 0x27, 0xb6, 0xc3, 0x52, 0x20, 0xb1, 0xca, 0x5b, 0x29, 0xb8, 0xcd, 0x5c, 0x2e, 0xbf,
+        0x90, 0x01, 0x73, 0xe2, 0x97, 0x06, 0x74, 0xe5, 0x9e, 0x0f, 0x7d, 0xec, 0x99, 0x08, 0x7a, 0xeb,
+        0x8c, 0x1d, 0x6f, 0xfe, 0x8b, 0x1a, 0x68, 0xf9, 0x82, 0x13, 0x61, 0xf0, 0x85, 0x14, 0x66, 0xf7,
+        0xa8, 0x39, 0x4b, 0xda, 0xaf, 0x3e, 0x4c, 0xdd, 0xa6, 0x37, 0x45, 0xd4, 0xa1, 0x30, 0x42, 0xd3,
+        0xb4, 0x25, 0x57, 0xc6, 0xb3, 0x22, 0x50, 0xc1, 0xba, 0x2b, 0x59, 0xc8, 0xbd, 0x2c, 0x5e, 0xcf
+};
+
+static const uint16_t crc16_table[CRC_TABLE_COUNT][256] = {
+        {
+            0x0000, 0x1021, 0x2042, 0x3063, 0x4084, 0x50a5, 0x60c6, 0x70e7,
+            0x8108, 0x9129, 0xa14a, 0xb16b, 0xc18c, 0xd1ad, 0xe1ce, 0xf1ef,
+            0x1231, 0x0210, 0x3273, 0x2252, 0x52b5, 0x4294, 0x72f7, 0x62d6,
+            0x9339, 0x8318, 0xb37b, 0xa35a, 0xd3bd, 0xc39c, 0xf3ff, 0xe3de,
+            0x2462, 0x3443, 0x0420, 0x1401, 0x64e6, 0x74c7, 0x44a4, 0x5485,
+            0xa56a, 0xb54b, 0x8528, 0x9509, 0xe5ee, 0xf5cf, 0xc5ac, 0xd58d,
+            0x3653, 0x2672, 0x1611, 0x0630, 0x76d7, 0x66f6, 0x5695, 0x46b4,
+            0xb75b, 0xa77a, 0x9719, 0x8738, 0xf7df, 0xe7fe, 0xd79d, 0xc7bc,
+            0x48c4, 0x58e5, 0x6886, 0x78a7, 0x0840, 0x1861, 0x2802, 0x3823,
+            0xc9cc, 0xd9ed, 0xe98e, 0xf9af, 0x8948, 0x9969, 0xa90a, 0xb92b,
+            0x5af5, 0x4ad4, 0x7ab7, 0x6a96, 0x1a71, 0x0a50, 0x3a33, 0x2a12,
+            0xdbfd, 0xcbdc, 0xfbbf, 0xeb9e, 0x9b79, 0x8b58, 0xbb3b, 0xab1a,
+            0x6ca6, 0x7c87, 0x4ce4, 0x5cc5, 0x2c22, 0x3c03, 0x0c60, 0x1c41,
+            0xedae, 0xfd8f, 0xcdec, 0xddcd, 0xad2a, 0xbd0b, 0x8d68, 0x9d49,
+            0x7e97, 0x6eb6, 0x5ed5, 0x4ef4, 0x3e13, 0x2e32, 0x1e51, 0x0e70,
+            0xff9f, 0xefbe, 0xdfdd, 0xcffc, 0xbf1b, 0xaf3a, 0x9f59, 0x8f78,
+            0x9188, 0x81a9, 0xb1ca, 0xa1eb, 0xd10c, 0xc12d, 0xf14e, 0xe16f,
+            0x1080, 0x00a1, 0x30c2, 0x20e3, 0x5004, 0x4025, 0x7046, 0x6067,
+            0x83b9, 0x9398, 0xa3fb, 0xb3da, 0xc33d, 0xd31c, 0xe37f, 0xf35e,
+            0x02b1, 0x1290, 0x22f3, 0x32d2, 0x4235, 0x5214, 0x6277, 0x7256,
+            0xb5ea, 0xa5cb, 0x95a8, 0x8589, 0xf56e, 0xe54f, 0xd52c, 0xc50d,
+            0x34e2, 0x24c3, 0x14a0, 0x0481, 0x7466, 0x6447, 0x5424, 0x4405,
+            0xa7db, 0xb7fa, 0x8799, 0x97b8, 0xe75f, 0xf77e, 0xc71d, 0xd73c,
+            0x26d3, 0x36f2, 0x0691, 0x16b0, 0x6657, 0x7676, 0x4615, 0x5634,
+            0xd94c, 0xc96d, 0xf90e, 0xe92f, 0x99c8, 0x89e9, 0xb98a, 0xa9ab,
+            0x5844, 0x4865, 0x7806, 0x6827, 0x18c0, 0x08e1, 0x3882, 0x28a3,
+            0xcb7d, 0xdb5c, 0xeb3f, 0xfb1e, 0x8bf9, 0x9bd8, 0xabbb, 0xbb9a,
+            0x4a75, 0x5a54, 0x6a37, 0x7a16, 0x0af1, 0x1ad0, 0x2ab3, 0x3a92,
+            0xfd2e, 0xed0f, 0xdd6c, 0xcd4d, 0xbdaa, 0xad8b, 0x9de8, 0x8dc9,
+            0x7c26, 0x6c07, 0x5c64, 0x4c45, 0x3ca2, 0x2c83, 0x1ce0, 0x0cc1,
+            0xef1f, 0xff3e, 0xcf5d, 0xdf7c, 0xaf9b, 0xbfba, 0x8fd9, 0x9ff8,
+            0x6e17, 0x7e36, 0x4e55, 0x5e74, 0x2e93, 0x3eb2, 0x0ed1, 0x1ef0
+        },
+#if FBP_CRC_SLICE_BY >= 4
+        {
+            0x0000, 0x3331, 0x6662, 0x5553, 0xccc4, 0xfff5, 0xaaa6, 0x9997,
+            0x89a9, 0xba98, 0xefcb, 0xdcfa, 0x456d, 0x765c, 0x230f, 0x103e,
+            0x0373, 0x3042, 0x6511, 0x5620, 0xcfb7, 0xfc86, 0xa9d5, 0x9ae4,
+            0x8ada, 0xb9eb, 0xecb8, 0xdf89, 0x461e, 0x752f, 0x207c, 0x134d,
+            0x06e6, 0x35d7, 0x6084, 0x53b5, 0xca22, 0xf913, 0xac40, 0x9f71,
+            0x8f4f, 0xbc7e, 0xe92d, 0xda1c, 0x438b, 0x70ba, 0x25e9, 0x16d8,
+            0x0595, 0x36a4, 0x63f7, 0x50c6, 0xc951, 0xfa60, 0xaf33, 0x9c02,
+            0x8c3c, 0xbf0d, 0xea5e, 0xd96f, 0x40f8, 0x73c9, 0x269a, 0x15ab,
+            0x0dcc, 0x3efd, 0x6bae, 0x589f, 0xc108, 0xf239, 0xa76a, 0x945b,
+            0x8465, 0xb754, 0xe207, 0xd136, 0x48a1, 0x7b90, 0x2ec3, 0x1df2,
+            0x0ebf, 0x3d8e, 0x68dd, 0x5bec, 0xc27b, 0xf14a, 0xa419, 0x9728,
+            0x8716, 0xb427, 0xe174, 0xd245, 0x4bd2, 0x78e3, 0x2db0, 0x1e81,
+            0x0b2a, 0x381b, 0x6d48, 0x5e79, 0xc7ee, 0xf4df, 0xa18c, 0x92bd,
+            0x8283, 0xb1b2, 0xe4e1, 0xd7d0, 0x4e47, 0x7d76, 0x2825, 0x1b14,
+            0x0859, 0x3b68, 0x6e3b, 0x5d0a, 0xc49d, 0xf7ac, 0xa2ff, 0x91ce,
+            0x81f0, 0xb2c1, 0xe792, 0xd4a3, 0x4d34, 0x7e05, 0x2b56, 0x1867,
+            0x1b98, 0x28a9, 0x7dfa, 0x4ecb, 0xd75c, 0xe46d, 0xb13e, 0x820f,
+            0x9231, 0xa100, 0xf453, 0xc762, 0x5ef5, 0x6dc4, 0x3897, 0x0ba6,
+            0x18eb, 0x2bda, 0x7e89, 0x4db8, 0xd42f, 0xe71e, 0xb24d, 0x817c,
+            0x9142, 0xa273, 0xf720, 0xc411, 0x5d86, 0x6eb7, 0x3be4, 0x08d5,
+            0x1d7e, 0x2e4f, 0x7b1c, 0x482d, 0xd1ba, 0xe28b, 0xb7d8, 0x84e9,
+            0x94d7, 0xa7e6, 0xf2b5, 0xc184, 0x5813, 0x6b22, 0x3e71, 0x0d40,
+            0x1e0d, 0x2d3c, 0x786f, 0x4b5e, 0xd2c9, 0xe1f8, 0xb4ab, 0x879a,
+            0x97a4, 0xa495, 0xf1c6, 0xc2f7, 0x5b60, 0x6851, 0x3d02, 0x0e33,
+            0x1654, 0x2565, 0x7036, 0x4307, 0xda90, 0xe9a1, 0xbcf2, 0x8fc3,
+            0x9ffd, 0xaccc, 0xf99f, 0xcaae, 0x5339, 0x6008, 0x355b, 0x066a,
+            0x1527, 0x2616, 0x7345, 0x4074, 0xd9e3, 0xead2, 0xbf81, 0x8cb0,
+            0x9c8e, 0xafbf, 0xfaec, 0xc9dd, 0x504a, 0x637b, 0x3628, 0x0519,
+            0x10b2, 0x2383, 0x76d0, 0x45e1, 0xdc76, 0xef47, 0xba14, 0x8925,
+            0x991b, 0xaa2a, 0xff79, 0xcc48, 0x55df, 0x66ee, 0x33bd, 0x008c,
+            0x13c1, 0x20f0, 0x75a3, 0x4692, 0xdf05, 0xec34, 0xb967, 0x8a56,
+            0x9a68, 0xa959, 0xfc0a, 0xcf3b, 0x56ac, 0x659d, 0x30ce, 0x03ff
+        },
+        {
+            0x0000, 0x3730, 0x6e60, 0x5950, 0xdcc0, 0xebf0, 0xb2a0, 0x8590,
+            0xa9a1, 0x9e91, 0xc7c1, 0xf0f1, 0x7561, 0x4251, 0x1b01, 0x2c31,
+            0x4363, 0x7453, 0x2d03, 0x1a33, 0x9fa3, 0xa893, 0xf1c3, 0xc6f3,
+            0xeac2, 0xddf2, 0x84a2, 0xb392, 0x3602, 0x0132, 0x5862, 0x6f52,
+            0x86c6, 0xb1f6, 0xe8a6, 0xdf96, 0x5a06, 0x6d36, 0x3466, 0x0356,
+            0x2f67, 0x1857, 0x4107, 0x7637, 0xf3a7, 0xc497, 0x9dc7, 0xaaf7,
+            0xc5a5, 0xf295, 0xabc5, 0x9cf5, 0x1965, 0x2e55, 0x7705, 0x4035,
+            0x6c04, 0x5b34, 0x0264, 0x3554, 0xb0c4, 0x87f4, 0xdea4, 0xe994,
+            0x1dad, 0x2a9d, 0x73cd, 0x44fd, 0xc16d, 0xf65d, 0xaf0d, 0x983d,
+            0xb40c, 0x833c, 0xda6c, 0xed5c, 0x68cc, 0x5ffc, 0x06ac, 0x319c,
+            0x5ece, 0x69fe, 0x30ae, 0x079e, 0x820e, 0xb53e, 0xec6e, 0xdb5e,
+            0xf76f, 0xc05f, 0x990f, 0xae3f, 0x2baf, 0x1c9f, 0x45cf, 0x72ff,
+            0x9b6b, 0xac5b, 0xf50b, 0xc23b, 0x47ab, 0x709b, 0x29cb, 0x1efb,
+            0x32ca, 0x05fa, 0x5caa, 0x6b9a, 0xee0a, 0xd93a, 0x806a, 0xb75a,
+            0xd808, 0xef38, 0xb668, 0x8158, 0x04c8, 0x33f8, 0x6aa8, 0x5d98,
+            0x71a9, 0x4699, 0x1fc9, 0x28f9, 0xad69, 0x9a59, 0xc309, 0xf439,
+            0x3b5a, 0x0c6a, 0x553a, 0x620a, 0xe79a, 0xd0aa, 0x89fa, 0xbeca,
+            0x92fb, 0xa5cb, 0xfc9b, 0xcbab, 0x4e3b, 0x790b, 0x205b, 0x176b,
+            0x7839, 0x4f09, 0x1659, 0x2169, 0xa4f9, 0x93c9, 0xca99, 0xfda9,
+            0xd198, 0xe6a8, 0xbff8, 0x88c8, 0x0d58, 0x3a68, 0x6338, 0x5408,
+            0xbd9c, 0x8aac, 0xd3fc, 0xe4cc, 0x615c, 0x566c, 0x0f3c, 0x380c,
+            0x143d, 0x230d, 0x7a5d, 0x4d6d, 0xc8fd, 0xffcd, 0xa69d, 0x91ad,
+            0xfeff, 0xc9cf, 0x909f, 0xa7af, 0x223f, 0x150f, 0x4c5f, 0x7b6f,
+            0x575e, 0x606e, 0x393e, 0x0e0e, 0x8b9e, 0xbcae, 0xe5fe, 0xd2ce,
+            0x26f7, 0x11c7, 0x4897, 0x7fa7, 0xfa37, 0xcd07, 0x9457, 0xa367,
+            0x8f56, 0xb866, 0xe136, 0xd606, 0x5396, 0x64a6, 0x3df6, 0x0ac6,
+            0x6594, 0x52a4, 0x0bf4, 0x3cc4, 0xb954, 0x8e64, 0xd734, 0xe004,
+            0xcc35, 0xfb05, 0xa255, 0x9565, 0x10f5, 0x27c5, 0x7e95, 0x49a5,
+            0xa031, 0x9701, 0xce51, 0xf961, 0x7cf1, 0x4bc1, 0x1291, 0x25a1,
+            0x0990, 0x3ea0, 0x67f0, 0x50c0, 0xd550, 0xe260, 0xbb30, 0x8c00,
+            0xe352, 0xd462, 0x8d32, 0xba02, 0x3f92, 0x08a2, 0x51f2, 0x66c2,
+            0x4af3, 0x7dc3, 0x2493, 0x13a3, 0x9633, 0xa103, 0xf853, 0xcf63
+        },
+        {
+            0x0000, 0x76b4, 0xed68, 0x9bdc, 0xcaf1, 0xbc45, 0x2799, 0x512d,
+            0x85c3, 0xf377, 0x68ab, 0x1e1f, 0x4f32, 0x3986, 0xa25a, 0xd4ee,
+            0x1ba7, 0x6d13, 0xf6cf, 0x807b, 0xd156, 0xa7e2, 0x3c3e, 0x4a8a,
+            0x9e64, 0xe8d0, 0x730c, 0x05b8, 0x5495, 0x2221, 0xb9fd, 0xcf49,
+            0x374e, 0x41fa, 0xda26, 0xac92, 0xfdbf, 0x8b0b, 0x10d7, 0x6663,
+            0xb28d, 0xc439, 0x5fe5, 0x2951, 0x787c, 0x0ec8, 0x9514, 0xe3a0,
+            0x2ce9, 0x5a5d, 0xc181, 0xb735, 0xe618, 0x90ac, 0x0b70, 0x7dc4,
+            0xa92a, 0xdf9e, 0x4442, 0x32f6, 0x63db, 0x156f, 0x8eb3, 0xf807,
+            0x6e9c, 0x1828, 0x83f4, 0xf540, 0xa46d, 0xd2d9, 0x4905, 0x3fb1,
+            0xeb5f, 0x9deb, 0x0637, 0x7083, 0x21ae, 0x571a, 0xccc6, 0xba72,
+            0x753b, 0x038f, 0x9853, 0xeee7, 0xbfca, 0xc97e, 0x52a2, 0x2416,
+            0xf0f8, 0x864c, 0x1d90, 0x6b24, 0x3a09, 0x4cbd, 0xd761, 0xa1d5,
+            0x59d2, 0x2f66, 0xb4ba, 0xc20e, 0x9323, 0xe597, 0x7e4b, 0x08ff,
+            0xdc11, 0xaaa5, 0x3179, 0x47cd, 0x16e0, 0x6054, 0xfb88, 0x8d3c,
+            0x4275, 0x34c1, 0xaf1d, 0xd9a9, 0x8884, 0xfe30, 0x65ec, 0x1358,
+            0xc7b6, 0xb102, 0x2ade, 0x5c6a, 0x0d47, 0x7bf3, 0xe02f, 0x969b,
+            0xdd38, 0xab8c, 0x3050, 0x46e4, 0x17c9, 0x617d, 0xfaa1, 0x8c15,
+            0x58fb, 0x2e4f, 0xb593, 0xc327, 0x920a, 0xe4be, 0x7f62, 0x09d6,
+            0xc69f, 0xb02b, 0x2bf7, 0x5d43, 0x0c6e, 0x7ada, 0xe106, 0x97b2,
+            0x435c, 0x35e8, 0xae34, 0xd880, 0x89ad, 0xff19, 0x64c5, 0x1271,
+            0xea76, 0x9cc2, 0x071e, 0x71aa, 0x2087, 0x5633, 0xcdef, 0xbb5b,
+            0x6fb5, 0x1901, 0x82dd, 0xf469, 0xa544, 0xd3f0, 0x482c, 0x3e98,
+            0xf1d1, 0x8765, 0x1cb9, 0x6a0d, 0x3b20, 0x4d94, 0xd648, 0xa0fc,
+            0x7412, 0x02a6, 0x997a, 0xefce, 0xbee3, 0xc857, 0x538b, 0x253f,
+            0xb3a4, 0xc510, 0x5ecc, 0x2878, 0x7955, 0x0fe1, 0x943d, 0xe289,
+            0x3667, 0x40d3, 0xdb0f, 0xadbb, 0xfc96, 0x8a22, 0x11fe, 0x674a,
+            0xa803, 0xdeb7, 0x456b, 0x33df, 0x62f2, 0x1446, 0x8f9a, 0xf92e,
+            0x2dc0, 0x5b74, 0xc0a8, 0xb61c, 0xe731, 0x9185, 0x0a59, 0x7ced,
+            0x84ea, 0xf25e, 0x6982, 0x1f36, 0x4e1b, 0x38af, 0xa373, 0xd5c7,
+            0x0129, 0x779d, 0xec41, 0x9af5, 0xcbd8, 0xbd6c, 0x26b0, 0x5004,
+            0x9f4d, 0xe9f9, 0x7225, 0x0491, 0x55bc, 0x2308, 0xb8d4, 0xce60,
+            0x1a8e, 0x6c3a, 0xf7e6, 0x8152, 0xd07f, 0xa6cb, 0x3d17, 0x4ba3
+        },
+#endif
+#if FBP_CRC_SLICE_BY >= 8
+        {
+            0x0000, 0xaa51, 0x4483, 0xeed2, 0x8906, 0x2357, 0xcd85, 0x67d4,
+            0x022d, 0xa87c, 0x46ae, 0xecff, 0x8b2b, 0x217a, 0xcfa8, 0x65f9,
+            0x045a, 0xae0b, 0x40d9, 0xea88, 0x8d5c, 0x270d, 0xc9df, 0x638e,
+            0x0677, 0xac26, 0x42f4, 0xe8a5, 0x8f71, 0x2520, 0xcbf2, 0x61a3,
+            0x08b4, 0xa2e5, 0x4c37, 0xe666, 0x81b2, 0x2be3, 0xc531, 0x6f60,
+            0x0a99, 0xa0c8, 0x4e1a, 0xe44b, 0x839f, 0x29ce, 0xc71c, 0x6d4d,
+            0x0cee, 0xa6bf, 0x486d, 0xe23c, 0x85e8, 0x2fb9, 0xc16b, 0x6b3a,
+            0x0ec3, 0xa492, 0x4a40, 0xe011, 0x87c5, 0x2d94, 0xc346, 0x6917,
+            0x1168, 0xbb39, 0x55eb, 0xffba, 0x986e, 0x323f, 0xdced, 0x76bc,
+            0x1345, 0xb914, 0x57c6, 0xfd97, 0x9a43, 0x3012, 0xdec0, 0x7491,
+            0x1532, 0xbf63, 0x51b1, 0xfbe0, 0x9c34, 0x3665, 0xd8b7, 0x72e6,
+            0x171f, 0xbd4e, 0x539c, 0xf9cd, 0x9e19, 0x3448, 0xda9a, 0x70cb,
+            0x19dc, 0xb38d, 0x5d5f, 0xf70e, 0x90da, 0x3a8b, 0xd459, 0x7e08,
+            0x1bf1, 0xb1a0, 0x5f72, 0xf523, 0x92f7, 0x38a6, 0xd674, 0x7c25,
+            0x1d86, 0xb7d7, 0x5905, 0xf354, 0x9480, 0x3ed1, 0xd003, 0x7a52,
+            0x1fab, 0xb5fa, 0x5b28, 0xf179, 0x96ad, 0x3cfc, 0xd22e, 0x787f,
+            0x22d0, 0x8881, 0x6653, 0xcc02, 0xabd6, 0x0187, 0xef55, 0x4504,
+            0x20fd, 0x8aac, 0x647e, 0xce2f, 0xa9fb, 0x03aa, 0xed78, 0x4729,
+            0x268a, 0x8cdb, 0x6209, 0xc858, 0xaf8c, 0x05dd, 0xeb0f, 0x415e,
+            0x24a7, 0x8ef6, 0x6024, 0xca75, 0xada1, 0x07f0, 0xe922, 0x4373,
+            0x2a64, 0x8035, 0x6ee7, 0xc4b6, 0xa362, 0x0933, 0xe7e1, 0x4db0,
+            0x2849, 0x8218, 0x6cca, 0xc69b, 0xa14f, 0x0b1e, 0xe5cc, 0x4f9d,
+            0x2e3e, 0x846f, 0x6abd, 0xc0ec, 0xa738, 0x0d69, 0xe3bb, 0x49ea,
+            0x2c13, 0x8642, 0x6890, 0xc2c1, 0xa515, 0x0f44, 0xe196, 0x4bc7,
+            0x33b8, 0x99e9, 0x773b, 0xdd6a, 0xbabe, 0x10ef, 0xfe3d, 0x546c,
+            0x3195, 0x9bc4, 0x7516, 0xdf47, 0xb893, 0x12c2, 0xfc10, 0x5641,
+            0x37e2, 0x9db3, 0x7361, 0xd930, 0xbee4, 0x14b5, 0xfa67, 0x5036,
+            0x35cf, 0x9f9e, 0x714c, 0xdb1d, 0xbcc9, 0x1698, 0xf84a, 0x521b,
+            0x3b0c, 0x915d, 0x7f8f, 0xd5de, 0xb20a, 0x185b, 0xf689, 0x5cd8,
+            0x3921, 0x9370, 0x7da2, 0xd7f3, 0xb027, 0x1a76, 0xf4a4, 0x5ef5,
+            0x3f56, 0x9507, 0x7bd5, 0xd184, 0xb650, 0x1c01, 0xf2d3, 0x5882,
+            0x3d7b, 0x972a, 0x79f8, 0xd3a9, 0xb47d, 0x1e2c, 0xf0fe, 0x5aaf
+        },
+        {
+            0x0000, 0x45a0, 0x8b40, 0xcee0, 0x06a1, 0x4301, 0x8de1, 0xc841,
+            0x0d42, 0x48e2, 0x8602, 0xc3a2, 0x0be3, 0x4e43, 0x80a3, 0xc503,
+            0x1a84, 0x5f24, 0x91c4, 0xd464, 0x1c25, 0x5985, 0x9765, 0xd2c5,
+            0x17c6, 0x5266, 0x9c86, 0xd926, 0x1167, 0x54c7, 0x9a27, 0xdf87,
+            0x3508, 0x70a8, 0xbe48, 0xfbe8, 0x33a9, 0x7609, 0xb8e9, 0xfd49,
+            0x384a, 0x7dea, 0xb30a, 0xf6aa, 0x3eeb, 0x7b4b, 0xb5ab, 0xf00b,
+            0x2f8c, 0x6a2c, 0xa4cc, 0xe16c, 0x292d, 0x6c8d, 0xa26d, 0xe7cd,
+            0x22ce, 0x676e, 0xa98e, 0xec2e, 0x246f, 0x61cf, 0xaf2f, 0xea8f,
+            0x6a10, 0x2fb0, 0xe150, 0xa4f0, 0x6cb1, 0x2911, 0xe7f1, 0xa251,
+            0x6752, 0x22f2, 0xec12, 0xa9b2, 0x61f3, 0x2453, 0xeab3, 0xaf13,
+            0x7094, 0x3534, 0xfbd4, 0xbe74, 0x7635, 0x3395, 0xfd75, 0xb8d5,
+            0x7dd6, 0x3876, 0xf696, 0xb336, 0x7b77, 0x3ed7, 0xf037, 0xb597,
+            0x5f18, 0x1ab8, 0xd458, 0x91f8, 0x59b9, 0x1c19, 0xd2f9, 0x9759,
+            0x525a, 0x17fa, 0xd91a, 0x9cba, 0x54fb, 0x115b, 0xdfbb, 0x9a1b,
+            0x459c, 0x003c, 0xcedc, 0x8b7c, 0x433d, 0x069d, 0xc87d, 0x8ddd,
+            0x48de, 0x0d7e, 0xc39e, 0x863e, 0x4e7f, 0x0bdf, 0xc53f, 0x809f,
+            0xd420, 0x9180, 0x5f60, 0x1ac0, 0xd281, 0x9721, 0x59c1, 0x1c61,
+            0xd962, 0x9cc2, 0x5222, 0x1782, 0xdfc3, 0x9a63, 0x5483, 0x1123,
+            0xcea4, 0x8b04, 0x45e4, 0x0044, 0xc805, 0x8da5, 0x4345, 0x06e5,
+            0xc3e6, 0x8646, 0x48a6, 0x0d06, 0xc547, 0x80e7, 0x4e07, 0x0ba7,
+            0xe128, 0xa488, 0x6a68, 0x2fc8, 0xe789, 0xa229, 0x6cc9, 0x2969,
+            0xec6a, 0xa9ca, 0x672a, 0x228a, 0xeacb, 0xaf6b, 0x618b, 0x242b,
+            0xfbac, 0xbe0c, 0x70ec, 0x354c, 0xfd0d, 0xb8ad, 0x764d, 0x33ed,
+            0xf6ee, 0xb34e, 0x7dae, 0x380e, 0xf04f, 0xb5ef, 0x7b0f, 0x3eaf,
+            0xbe30, 0xfb90, 0x3570, 0x70d0, 0xb891, 0xfd31, 0x33d1, 0x7671,
+            0xb372, 0xf6d2, 0x3832, 0x7d92, 0xb5d3, 0xf073, 0x3e93, 0x7b33,
+            0xa4b4, 0xe114, 0x2ff4, 0x6a54, 0xa215, 0xe7b5, 0x2955, 0x6cf5,
+            0xa9f6, 0xec56, 0x22b6, 0x6716, 0xaf57, 0xeaf7, 0x2417, 0x61b7,
+            0x8b38, 0xce98, 0x0078, 0x45d8, 0x8d99, 0xc839, 0x06d9, 0x4379,
+            0x867a, 0xc3da, 0x0d3a, 0x489a, 0x80db, 0xc57b, 0x0b9b, 0x4e3b,
+            0x91bc, 0xd41c, 0x1afc, 0x5f5c, 0x971d, 0xd2bd, 0x1c5d, 0x59fd,
+            0x9cfe, 0xd95e, 0x17be, 0x521e, 0x9a5f, 0xdfff, 0x111f, 0x54bf
+        },
+        {
+            0x0000, 0xb861, 0x60e3, 0xd882, 0xc1c6, 0x79a7, 0xa125, 0x1944,
+            0x93ad, 0x2bcc, 0xf34e, 0x4b2f, 0x526b, 0xea0a, 0x3288, 0x8ae9,
+            0x377b, 0x8f1a, 0x5798, 0xeff9, 0xf6bd, 0x4edc, 0x965e, 0x2e3f,
+            0xa4d6, 0x1cb7, 0xc435, 0x7c54, 0x6510, 0xdd71, 0x05f3, 0xbd92,
+            0x6ef6, 0xd697, 0x0e15, 0xb674, 0xaf30, 0x1751, 0xcfd3, 0x77b2,
+            0xfd5b, 0x453a, 0x9db8, 0x25d9, 0x3c9d, 0x84fc, 0x5c7e, 0xe41f,
+            0x598d, 0xe1ec, 0x396e, 0x810f, 0x984b, 0x202a, 0xf8a8, 0x40c9,
+            0xca20, 0x7241, 0xaac3, 0x12a2, 0x0be6, 0xb387, 0x6b05, 0xd364,
+            0xddec, 0x658d, 0xbd0f, 0x056e, 0x1c2a, 0xa44b, 0x7cc9, 0xc4a8,
+            0x4e41, 0xf620, 0x2ea2, 0x96c3, 0x8f87, 0x37e6, 0xef64, 0x5705,
+            0xea97, 0x52f6, 0x8a74, 0x3215, 0x2b51, 0x9330, 0x4bb2, 0xf3d3,
+            0x793a, 0xc15b, 0x19d9, 0xa1b8, 0xb8fc, 0x009d, 0xd81f, 0x607e,
+            0xb31a, 0x0b7b, 0xd3f9, 0x6b98, 0x72dc, 0xcabd, 0x123f, 0xaa5e,
+            0x20b7, 0x98d6, 0x4054, 0xf835, 0xe171, 0x5910, 0x8192, 0x39f3,
+            0x8461, 0x3c00, 0xe482, 0x5ce3, 0x45a7, 0xfdc6, 0x2544, 0x9d25,
+            0x17cc, 0xafad, 0x772f, 0xcf4e, 0xd60a, 0x6e6b, 0xb6e9, 0x0e88,
+            0xabf9, 0x1398, 0xcb1a, 0x737b, 0x6a3f, 0xd25e, 0x0adc, 0xb2bd,
+            0x3854, 0x8035, 0x58b7, 0xe0d6, 0xf992, 0x41f3, 0x9971, 0x2110,
+            0x9c82, 0x24e3, 0xfc61, 0x4400, 0x5d44, 0xe525, 0x3da7, 0x85c6,
+            0x0f2f, 0xb74e, 0x6fcc, 0xd7ad, 0xcee9, 0x7688, 0xae0a, 0x166b,
+            0xc50f, 0x7d6e, 0xa5ec, 0x1d8d, 0x04c9, 0xbca8, 0x642a, 0xdc4b,
+            0x56a2, 0xeec3, 0x3641, 0x8e20, 0x9764, 0x2f05, 0xf787, 0x4fe6,
+            0xf274, 0x4a15, 0x9297, 0x2af6, 0x33b2, 0x8bd3, 0x5351, 0xeb30,
+            0x61d9, 0xd9b8, 0x013a, 0xb95b, 0xa01f, 0x187e, 0xc0fc, 0x789d,
+            0x7615, 0xce74, 0x16f6, 0xae97, 0xb7d3, 0x0fb2, 0xd730, 0x6f51,
+            0xe5b8, 0x5dd9, 0x855b, 0x3d3a, 0x247e, 0x9c1f, 0x449d, 0xfcfc,
+            0x416e, 0xf90f, 0x218d, 0x99ec, 0x80a8, 0x38c9, 0xe04b, 0x582a,
+            0xd2c3, 0x6aa2, 0xb220, 0x0a41, 0x1305, 0xab64, 0x73e6, 0xcb87,
+            0x18e3, 0xa082, 0x7800, 0xc061, 0xd925, 0x6144, 0xb9c6, 0x01a7,
+            0x8b4e, 0x332f, 0xebad, 0x53cc, 0x4a88, 0xf2e9, 0x2a6b, 0x920a,
+            0x2f98, 0x97f9, 0x4f7b, 0xf71a, 0xee5e, 0x563f, 0x8ebd, 0x36dc,
+            0xbc35, 0x0454, 0xdcd6, 0x64b7, 0x7df3, 0xc592, 0x1d10, 0xa571
+        },
+        {
+            0x0000, 0x47d3, 0x8fa6, 0xc875, 0x0f6d, 0x48be, 0x80cb, 0xc718,
+            0x1eda, 0x5909, 0x917c, 0xd6af, 0x11b7, 0x5664, 0x9e11, 0xd9c2,
+            0x3db4, 0x7a67, 0xb212, 0xf5c1, 0x32d9, 0x750a, 0xbd7f, 0xfaac,
+            0x236e, 0x64bd, 0xacc8, 0xeb1b, 0x2c03, 0x6bd0, 0xa3a5, 0xe476,
+            0x7b68, 0x3cbb, 0xf4ce, 0xb31d, 0x7405, 0x33d6, 0xfba3, 0xbc70,
+            0x65b2, 0x2261, 0xea14, 0xadc7, 0x6adf, 0x2d0c, 0xe579, 0xa2aa,
+            0x46dc, 0x010f, 0xc97a, 0x8ea9, 0x49b1, 0x0e62, 0xc617, 0x81c4,
+            0x5806, 0x1fd5, 0xd7a0, 0x9073, 0x576b, 0x10b8, 0xd8cd, 0x9f1e,
+            0xf6d0, 0xb103, 0x7976, 0x3ea5, 0xf9bd, 0xbe6e, 0x761b, 0x31c8,
+            0xe80a, 0xafd9, 0x67ac, 0x207f, 0xe767, 0xa0b4, 0x68c1, 0x2f12,
+            0xcb64, 0x8cb7, 0x44c2, 0x0311, 0xc409, 0x83da, 0x4baf, 0x0c7c,
+            0xd5be, 0x926d, 0x5a18, 0x1dcb, 0xdad3, 0x9d00, 0x5575, 0x12a6,
+            0x8db8, 0xca6b, 0x021e, 0x45cd, 0x82d5, 0xc506, 0x0d73, 0x4aa0,
+            0x9362, 0xd4b1, 0x1cc4, 0x5b17, 0x9c0f, 0xdbdc, 0x13a9, 0x547a,
+            0xb00c, 0xf7df, 0x3faa, 0x7879, 0xbf61, 0xf8b2, 0x30c7, 0x7714,
+            0xaed6, 0xe905, 0x2170, 0x66a3, 0xa1bb, 0xe668, 0x2e1d, 0x69ce,
+            0xfd81, 0xba52, 0x7227, 0x35f4, 0xf2ec, 0xb53f, 0x7d4a, 0x3a99,
+            0xe35b, 0xa488, 0x6cfd, 0x2b2e, 0xec36, 0xabe5, 0x6390, 0x2443,
+            0xc035, 0x87e6, 0x4f93, 0x0840, 0xcf58, 0x888b, 0x40fe, 0x072d,
+            0xdeef, 0x993c, 0x5149, 0x169a, 0xd182, 0x9651, 0x5e24, 0x19f7,
+            0x86e9, 0xc13a, 0x094f, 0x4e9c, 0x8984, 0xce57, 0x0622, 0x41f1,
+            0x9833, 0xdfe0, 0x1795, 0x5046, 0x975e, 0xd08d, 0x18f8, 0x5f2b,
+            0xbb5d, 0xfc8e, 0x34fb, 0x7328, 0xb430, 0xf3e3, 0x3b96, 0x7c45,
+            0xa587, 0xe254, 0x2a21, 0x6df2, 0xaaea, 0xed39, 0x254c, 0x629f,
+            0x0b51, 0x4c82, 0x84f7, 0xc324, 0x043c, 0x43ef, 0x8b9a, 0xcc49,
+            0x158b, 0x5258, 0x9a2d, 0xddfe, 0x1ae6, 0x5d35, 0x9540, 0xd293,
+            0x36e5, 0x7136, 0xb943, 0xfe90, 0x3988, 0x7e5b, 0xb62e, 0xf1fd,
+            0x283f, 0x6fec, 0xa799, 0xe04a, 0x2752, 0x6081, 0xa8f4, 0xef27,
+            0x7039, 0x37ea, 0xff9f, 0xb84c, 0x7f54, 0x3887, 0xf0f2, 0xb721,
+            0x6ee3, 0x2930, 0xe145, 0xa696, 0x618e, 0x265d, 0xee28, 0xa9fb,
+            0x4d8d, 0x0a5e, 0xc22b, 0x85f8, 0x42e0, 0x0533, 0xcd46, 0x8a95,
+            0x5357, 0x1484, 0xdcf1, 0x9b22, 0x5c3a, 0x1be9, 0xd39c, 0x944f
+        },
+#endif
+};
+
+uint8_t fbp_crc_ccitt_8_slice1(uint8_t crc, uint8_t const *data, uint32_t length) {
+    if ((0 == length) || !data) {
+        return crc;
+    }
+    crc = ~crc;
+    while (length--) {
+        crc = crc8_table[crc ^ *data++];
+    }
+    return ~crc;
+}
+
+static inline uint16_t crc16_slice1_raw(uint16_t crc, uint8_t const *data, uint32_t length) {
+    while (length--) {
+        crc = (uint16_t) ((crc << 8) ^ crc16_table[0][(crc >> 8) ^ *data++]);
+    }
+    return crc;
+}
+
+uint16_t fbp_crc_ccitt_16_slice1(uint16_t crc, uint8_t const *data, uint32_t length) {
+    if ((0 == length) || !data) {
+        return crc;
+    }
+    return ~crc16_slice1_raw(~crc, data, length);
+}
+#endif
+
+#if FBP_CRC_SLICE_BY >= 4
+static inline uint16_t crc16_slice4_raw(uint16_t crc, uint8_t const *data, uint32_t length) {
+    while (length >= 4) {
+        crc = crc16_table[3][(crc >> 8) ^ data[0]]
+            ^ crc16_table[2][(crc & 0xff) ^ data[1]]
+            ^ crc16_table[1][data[2]]
+            ^ crc16_table[0][data[3]];
+        data += 4;
+        length -= 4;
+    }
+    return crc16_slice1_raw(crc, data, length);
+}
+
+uint16_t fbp_crc_ccitt_16_slice4(uint16_t crc, uint8_t const *data, uint32_t length) {
+    if ((0 == length) || !data) {
+        return crc;
+    }
+    return ~crc16_slice4_raw(~crc, data, length);
+}
+#endif
+
+#if FBP_CRC_SLICE_BY >= 8
+static inline uint16_t crc16_slice8_raw(uint16_t crc, uint8_t const *data, uint32_t length) {
+    while (length >= 8) {
+        crc = crc16_table[7][(crc >> 8) ^ data[0]]
+            ^ crc16_table[6][(crc & 0xff) ^ data[1]]
+            ^ crc16_table[5][data[2]]
+            ^ crc16_table[4][data[3]]
+            ^ crc16_table[3][data[4]]
+            ^ crc16_table[2][data[5]]
+            ^ crc16_table[1][data[6]]
+            ^ crc16_table[0][data[7]];
+        data += 8;
+        length -= 8;
+    }
+    return crc16_slice4_raw(crc, data, length);
+}
+
+uint16_t fbp_crc_ccitt_16_slice8(uint16_t crc, uint8_t const *data, uint32_t length) {
+    if ((0 == length) || !data) {
+        return crc;
+    }
+    return ~crc16_slice8_raw(~crc, data, length);
+}
+#endif
+
+uint8_t fbp_crc_ccitt_8(uint8_t crc, uint8_t const *data, uint32_t length) {
+#if FBP_CRC_SLICE_BY >= 1
+    return fbp_crc_ccitt_8_slice1(crc, data, length);
+#else
+    return fbp_crc_ccitt_8_bitwise(crc, data, length);
+#endif
+}
+
+uint16_t fbp_crc_ccitt_16(uint16_t crc, uint8_t const *data, uint32_t length) {
+#if FBP_CRC_SLICE_BY >= 8
+    return fbp_crc_ccitt_16_slice8(crc, data, length);
+#elif FBP_CRC_SLICE_BY >= 4
+    return fbp_crc_ccitt_16_slice4(crc, data, length);
+#elif FBP_CRC_SLICE_BY >= 1
+    return fbp_crc_ccitt_16_slice1(crc, data, length);
+#else
+    return fbp_crc_ccitt_16_bitwise(crc, data, length);
+#endif
+}
+
 #if defined(FBP_CRC_CRC32) && FBP_CRC_CRC32
-static const uint32_t crc32_table[256] = {
-        0x00000000, 0x77073096, 0xee0e612c, 0x990951ba, 0x076dc419, 0x706af48f, 0xe963a535, 0x9e6495a3,
-        0x0edb8832, 0x79dcb8a4, 0xe0d5e91e, 0x97d2d988, 0x09b64c2b, 0x7eb17cbd, 0xe7b82d07, 0x90bf1d91,
-        0x1db71064, 0x6ab020f2, 0xf3b97148, 0x84be41de, 0x1adad47d, 0x6ddde4eb, 0xf4d4b551, 0x83d385c7,
-        0x136c9856, 0x646ba8c0, 0xfd62f97a, 0x8a65c9ec, 0x14015c4f, 0x63066cd9, 0xfa0f3d63, 0x8d080df5,
-        0x3b6e20c8, 0x4c69105e, 0xd56041e4, 0xa2677172, 0x3c03e4d1, 0x4b04d447, 0xd20d85fd, 0xa50ab56b,
-        0x35b5a8fa, 0x42b2986c, 0xdbbbc9d6, 0xacbcf940, 0x32d86ce3, 0x45df5c75, 0xdcd60dcf, 0xabd13d59,
-        0x26d930ac, 0x51de003a, 0xc8d75180, 0xbfd06116, 0x21b4f4b5, 0x56b3c423, 0xcfba9599, 0xb8bda50f,
-        0x2802b89e, 0x5f058808, 0xc60cd9b2, 0xb10be924, 0x2f6f7c87, 0x58684c11, 0xc1611dab, 0xb6662d3d,
-        0x76dc4190, 0x01db7106, 0x98d220bc, 0xefd5102a, 0x71b18589, 0x06b6b51f, 0x9fbfe4a5, 0xe8b8d433,
-        0x7807c9a2, 0x0f00f934, 0x9609a88e, 0xe10e9818, 0x7f6a0dbb, 0x086d3d2d, 0x91646c97, 0xe6635c01,
-        0x6b6b51f4, 0x1c6c6162, 0x856530d8, 0xf262004e, 0x6c0695ed, 0x1b01a57b, 0x8208f4c1, 0xf50fc457,
-        0x65b0d9c6, 0x12b7e950, 0x8bbeb8ea, 0xfcb9887c, 0x62dd1ddf, 0x15da2d49, 0x8cd37cf3, 0xfbd44c65,
-        0x4db26158, 0x3ab551ce, 0xa3bc0074, 0xd4bb30e2, 0x4adfa541, 0x3dd895d7, 0xa4d1c46d, 0xd3d6f4fb,
-        0x4369e96a, 0x346ed9fc, 0xad678846, 0xda60b8d0, 0x44042d73, 0x33031de5, 0xaa0a4c5f, 0xdd0d7cc9,
-        0x5005713c, 0x270241aa, 0xbe0b1010, 0xc90c2086, 0x5768b525, 0x206f85b3, 0xb966d409, 0xce61e49f,
-        0x5edef90e, 0x29d9c998, 0xb0d09822, 0xc7d7a8b4, 0x59b33d17, 0x2eb40d81, 0xb7bd5c3b, 0xc0ba6cad,
-        0xedb88320, 0x9abfb3b6, 0x03b6e20c, 0x74b1d29a, 0xead54739, 0x9dd277af, 0x04db2615, 0x73dc1683,
-        0xe3630b12, 0x94643b84, 0x0d6d6a3e, 0x7a6a5aa8, 0xe40ecf0b, 0x9309ff9d, 0x0a00ae27, 0x7d079eb1,
-        0xf00f9344, 0x8708a3d2, 0x1e01f268, 0x6906c2fe, 0xf762575d, 0x806567cb, 0x196c3671, 0x6e6b06e7,
-        0xfed41b76, 0x89d32be0, 0x10da7a5a, 0x67dd4acc, 0xf9b9df6f, 0x8ebeeff9, 0x17b7be43, 0x60b08ed5,
-        0xd6d6a3e8, 0xa1d1937e, 0x38d8c2c4, 0x4fdff252, 0xd1bb67f1, 0xa6bc5767, 0x3fb506dd, 0x48b2364b,
-        0xd80d2bda, 0xaf0a1b4c, 0x36034af6, 0x41047a60, 0xdf60efc3, 0xa867df55, 0x316e8eef, 0x4669be79,
-        0xcb61b38c, 0xbc66831a, 0x256fd2a0, 0x5268e236, 0xcc0c7795, 0xbb0b4703, 0x220216b9, 0x5505262f,
-        0xc5ba3bbe, 0xb2bd0b28, 0x2bb45a92, 0x5cb36a04, 0xc2d7ffa7, 0xb5d0cf31, 0x2cd99e8b, 0x5bdeae1d,
-        0x9b64c2b0, 0xec63f226, 0x756aa39c, 0x026d930a, 0x9c0906a9, 0xeb0e363f, 0x72076785, 0x05005713,
-        0x95bf4a82, 0xe2b87a14, 0x7bb12bae, 0x0cb61b38, 0x92d28e9b, 0xe5d5be0d, 0x7cdcefb7, 0x0bdbdf21,
-        0x86d3d2d4, 0xf1d4e242, 0x68ddb3f8, 0x1fda836e, 0x81be16cd, 0xf6b9265b, 0x6fb077e1, 0x18b74777,
-        0x88085ae6, 0xff0f6a70, 0x66063bca, 0x11010b5c, 0x8f659eff, 0xf862ae69, 0x616bffd3, 0x166ccf45,
-        0xa00ae278, 0xd70dd2ee, 0x4e048354, 0x3903b3c2, 0xa7672661, 0xd06016f7, 0x4969474d, 0x3e6e77db,
-        0xaed16a4a, 0xd9d65adc, 0x40df0b66, 0x37d83bf0, 0xa9bcae53, 0xdebb9ec5, 0x47b2cf7f, 0x30b5ffe9,
-        0xbdbdf21c, 0xcabac28a, 0x53b39330, 0x24b4a3a6, 0xbad03605, 0xcdd70693, 0x54de5729, 0x23d967bf,
-        0xb3667a2e, 0xc4614ab8, 0x5d681b02, 0x2a6f2b94, 0xb40bbe37, 0xc30c8ea1, 0x5a05df1b, 0x2d02ef8d
+static const uint32_t crc32_table[CRC_TABLE_COUNT][256] = {
+        {
+            0x00000000, 0x77073096, 0xee0e612c, 0x990951ba, 0x076dc419, 0x706af48f, 0xe963a535, 0x9e6495a3,
+            0x0edb8832, 0x79dcb8a4, 0xe0d5e91e, 0x97d2d988, 0x09b64c2b, 0x7eb17cbd, 0xe7b82d07, 0x90bf1d91,
+            0x1db71064, 0x6ab020f2, 0xf3b97148, 0x84be41de, 0x1adad47d, 0x6ddde4eb, 0xf4d4b551, 0x83d385c7,
+            0x136c9856, 0x646ba8c0, 0xfd62f97a, 0x8a65c9ec, 0x14015c4f, 0x63066cd9, 0xfa0f3d63, 0x8d080df5,
+            0x3b6e20c8, 0x4c69105e, 0xd56041e4, 0xa2677172, 0x3c03e4d1, 0x4b04d447, 0xd20d85fd, 0xa50ab56b,
+            0x35b5a8fa, 0x42b2986c, 0xdbbbc9d6, 0xacbcf940, 0x32d86ce3, 0x45df5c75, 0xdcd60dcf, 0xabd13d59,
+            0x26d930ac, 0x51de003a, 0xc8d75180, 0xbfd06116, 0x21b4f4b5, 0x56b3c423, 0xcfba9599, 0xb8bda50f,
+            0x2802b89e, 0x5f058808, 0xc60cd9b2, 0xb10be924, 0x2f6f7c87, 0x58684c11, 0xc1611dab, 0xb6662d3d,
+            0x76dc4190, 0x01db7106, 0x98d220bc, 0xefd5102a, 0x71b18589, 0x06b6b51f, 0x9fbfe4a5, 0xe8b8d433,
+            0x7807c9a2, 0x0f00f934, 0x9609a88e, 0xe10e9818, 0x7f6a0dbb, 0x086d3d2d, 0x91646c97, 0xe6635c01,
+            0x6b6b51f4, 0x1c6c6162, 0x856530d8, 0xf262004e, 0x6c0695ed, 0x1b01a57b, 0x8208f4c1, 0xf50fc457,
+            0x65b0d9c6, 0x12b7e950, 0x8bbeb8ea, 0xfcb9887c, 0x62dd1ddf, 0x15da2d49, 0x8cd37cf3, 0xfbd44c65,
+            0x4db26158, 0x3ab551ce, 0xa3bc0074, 0xd4bb30e2, 0x4adfa541, 0x3dd895d7, 0xa4d1c46d, 0xd3d6f4fb,
+            0x4369e96a, 0x346ed9fc, 0xad678846, 0xda60b8d0, 0x44042d73, 0x33031de5, 0xaa0a4c5f, 0xdd0d7cc9,
+            0x5005713c, 0x270241aa, 0xbe0b1010, 0xc90c2086, 0x5768b525, 0x206f85b3, 0xb966d409, 0xce61e49f,
+            0x5edef90e, 0x29d9c998, 0xb0d09822, 0xc7d7a8b4, 0x59b33d17, 0x2eb40d81, 0xb7bd5c3b, 0xc0ba6cad,
+            0xedb88320, 0x9abfb3b6, 0x03b6e20c, 0x74b1d29a, 0xead54739, 0x9dd277af, 0x04db2615, 0x73dc1683,
+            0xe3630b12, 0x94643b84, 0x0d6d6a3e, 0x7a6a5aa8, 0xe40ecf0b, 0x9309ff9d, 0x0a00ae27, 0x7d079eb1,
+            0xf00f9344, 0x8708a3d2, 0x1e01f268, 0x6906c2fe, 0xf762575d, 0x806567cb, 0x196c3671, 0x6e6b06e7,
+            0xfed41b76, 0x89d32be0, 0x10da7a5a, 0x67dd4acc, 0xf9b9df6f, 0x8ebeeff9, 0x17b7be43, 0x60b08ed5,
+            0xd6d6a3e8, 0xa1d1937e, 0x38d8c2c4, 0x4fdff252, 0xd1bb67f1, 0xa6bc5767, 0x3fb506dd, 0x48b2364b,
+            0xd80d2bda, 0xaf0a1b4c, 0x36034af6, 0x41047a60, 0xdf60efc3, 0xa867df55, 0x316e8eef, 0x4669be79,
+            0xcb61b38c, 0xbc66831a, 0x256fd2a0, 0x5268e236, 0xcc0c7795, 0xbb0b4703, 0x220216b9, 0x5505262f,
+            0xc5ba3bbe, 0xb2bd0b28, 0x2bb45a92, 0x5cb36a04, 0xc2d7ffa7, 0xb5d0cf31, 0x2cd99e8b, 0x5bdeae1d,
+            0x9b64c2b0, 0xec63f226, 0x756aa39c, 0x026d930a, 0x9c0906a9, 0xeb0e363f, 0x72076785, 0x05005713,
+            0x95bf4a82, 0xe2b87a14, 0x7bb12bae, 0x0cb61b38, 0x92d28e9b, 0xe5d5be0d, 0x7cdcefb7, 0x0bdbdf21,
+            0x86d3d2d4, 0xf1d4e242, 0x68ddb3f8, 0x1fda836e, 0x81be16cd, 0xf6b9265b, 0x6fb077e1, 0x18b74777,
+            0x88085ae6, 0xff0f6a70, 0x66063bca, 0x11010b5c, 0x8f659eff, 0xf862ae69, 0x616bffd3, 0x166ccf45,
+            0xa00ae278, 0xd70dd2ee, 0x4e048354, 0x3903b3c2, 0xa7672661, 0xd06016f7, 0x4969474d, 0x3e6e77db,
+            0xaed16a4a, 0xd9d65adc, 0x40df0b66, 0x37d83bf0, 0xa9bcae53, 0xdebb9ec5, 0x47b2cf7f, 0x30b5ffe9,
+            0xbdbdf21c, 0xcabac28a, 0x53b39330, 0x24b4a3a6, 0xbad03605, 0xcdd70693, 0x54de5729, 0x23d967bf,
+            0xb3667a2e, 0xc4614ab8, 0x5d681b02, 0x2a6f2b94, 0xb40bbe37, 0xc30c8ea1, 0x5a05df1b, 0x2d02ef8d
+        },
+#if FBP_CRC_SLICE_BY >= 4
+        {
+            0x00000000, 0x191b3141, 0x32366282, 0x2b2d53c3, 0x646cc504, 0x7d77f445, 0x565aa786, 0x4f4196c7,
+            0xc8d98a08, 0xd1c2bb49, 0xfaefe88a, 0xe3f4d9cb, 0xacb54f0c, 0xb5ae7e4d, 0x9e832d8e, 0x87981ccf,
+            0x4ac21251, 0x53d92310, 0x78f470d3, 0x61ef4192, 0x2eaed755, 0x37b5e614, 0x1c98b5d7, 0x05838496,
+            0x821b9859, 0x9b00a918, 0xb02dfadb, 0xa936cb9a, 0xe6775d5d, 0xff6c6c1c, 0xd4413fdf, 0xcd5a0e9e,
+            0x958424a2, 0x8c9f15e3, 0xa7b24620, 0xbea97761, 0xf1e8e1a6, 0xe8f3d0e7, 0xc3de8324, 0xdac5b265,
+            0x5d5daeaa, 0x44469feb, 0x6f6bcc28, 0x7670fd69, 0x39316bae, 0x202a5aef, 0x0b07092c, 0x121c386d,
+            0xdf4636f3, 0xc65d07b2, 0xed705471, 0xf46b6530, 0xbb2af3f7, 0xa231c2b6, 0x891c9175, 0x9007a034,
+            0x179fbcfb, 0x0e848dba, 0x25a9de79, 0x3cb2ef38, 0x73f379ff, 0x6ae848be, 0x41c51b7d, 0x58de2a3c,
+            0xf0794f05, 0xe9627e44, 0xc24f2d87, 0xdb541cc6, 0x94158a01, 0x8d0ebb40, 0xa623e883, 0xbf38d9c2,
+            0x38a0c50d, 0x21bbf44c, 0x0a96a78f, 0x138d96ce, 0x5ccc0009, 0x45d73148, 0x6efa628b, 0x77e153ca,
+            0xbabb5d54, 0xa3a06c15, 0x888d3fd6, 0x91960e97, 0xded79850, 0xc7cca911, 0xece1fad2, 0xf5facb93,
+            0x7262d75c, 0x6b79e61d, 0x4054b5de, 0x594f849f, 0x160e1258, 0x0f152319, 0x243870da, 0x3d23419b,
+            0x65fd6ba7, 0x7ce65ae6, 0x57cb0925, 0x4ed03864, 0x0191aea3, 0x188a9fe2, 0x33a7cc21, 0x2abcfd60,
+            0xad24e1af, 0xb43fd0ee, 0x9f12832d, 0x8609b26c, 0xc94824ab, 0xd05315ea, 0xfb7e4629, 0xe2657768,
+            0x2f3f79f6, 0x362448b7, 0x1d091b74, 0x04122a35, 0x4b53bcf2, 0x52488db3, 0x7965de70, 0x607eef31,
+            0xe7e6f3fe, 0xfefdc2bf, 0xd5d0917c, 0xcccba03d, 0x838a36fa, 0x9a9107bb, 0xb1bc5478, 0xa8a76539,
+            0x3b83984b, 0x2298a90a, 0x09b5fac9, 0x10aecb88, 0x5fef5d4f, 0x46f46c0e, 0x6dd93fcd, 0x74c20e8c,
+            0xf35a1243, 0xea412302, 0xc16c70c1, 0xd8774180, 0x9736d747, 0x8e2de606, 0xa500b5c5, 0xbc1b8484,
+            0x71418a1a, 0x685abb5b, 0x4377e898, 0x5a6cd9d9, 0x152d4f1e, 0x0c367e5f, 0x271b2d9c, 0x3e001cdd,
+            0xb9980012, 0xa0833153, 0x8bae6290, 0x92b553d1, 0xddf4c516, 0xc4eff457, 0xefc2a794, 0xf6d996d5,
+            0xae07bce9, 0xb71c8da8, 0x9c31de6b, 0x852aef2a, 0xca6b79ed, 0xd37048ac, 0xf85d1b6f, 0xe1462a2e,
+            0x66de36e1, 0x7fc507a0, 0x54e85463, 0x4df36522, 0x02b2f3e5, 0x1ba9c2a4, 0x30849167, 0x299fa026,
+            0xe4c5aeb8, 0xfdde9ff9, 0xd6f3cc3a, 0xcfe8fd7b, 0x80a96bbc, 0x99b25afd, 0xb29f093e, 0xab84387f,
+            0x2c1c24b0, 0x350715f1, 0x1e2a4632, 0x07317773, 0x4870e1b4, 0x516bd0f5, 0x7a468336, 0x635db277,
+            0xcbfad74e, 0xd2e1e60f, 0xf9ccb5cc, 0xe0d7848d, 0xaf96124a, 0xb68d230b, 0x9da070c8, 0x84bb4189,
+            0x03235d46, 0x1a386c07, 0x31153fc4, 0x280e0e85, 0x674f9842, 0x7e54a903, 0x5579fac0, 0x4c62cb81,
+            0x8138c51f, 0x9823f45e, 0xb30ea79d, 0xaa1596dc, 0xe554001b, 0xfc4f315a, 0xd7626299, 0xce7953d8,
+            0x49e14f17, 0x50fa7e56, 0x7bd72d95, 0x62cc1cd4, 0x2d8d8a13, 0x3496bb52, 0x1fbbe891, 0x06a0d9d0,
+            0x5e7ef3ec, 0x4765c2ad, 0x6c48916e, 0x7553a02f, 0x3a1236e8, 0x230907a9, 0x0824546a, 0x113f652b,
+            0x96a779e4, 0x8fbc48a5, 0xa4911b66, 0xbd8a2a27, 0xf2cbbce0, 0xebd08da1, 0xc0fdde62, 0xd9e6ef23,
+            0x14bce1bd, 0x0da7d0fc, 0x268a833f, 0x3f91b27e, 0x70d024b9, 0x69cb15f8, 0x42e6463b, 0x5bfd777a,
+            0xdc656bb5, 0xc57e5af4, 0xee530937, 0xf7483876, 0xb809aeb1, 0xa1129ff0, 0x8a3fcc33, 0x9324fd72
+        },
+        {
+            0x00000000, 0x01c26a37, 0x0384d46e, 0x0246be59, 0x0709a8dc, 0x06cbc2eb, 0x048d7cb2, 0x054f1685,
+            0x0e1351b8, 0x0fd13b8f, 0x0d9785d6, 0x0c55efe1, 0x091af964, 0x08d89353, 0x0a9e2d0a, 0x0b5c473d,
+            0x1c26a370, 0x1de4c947, 0x1fa2771e, 0x1e601d29, 0x1b2f0bac, 0x1aed619b, 0x18abdfc2, 0x1969b5f5,
+            0x1235f2c8, 0x13f798ff, 0x11b126a6, 0x10734c91, 0x153c5a14, 0x14fe3023, 0x16b88e7a, 0x177ae44d,
+            0x384d46e0, 0x398f2cd7, 0x3bc9928e, 0x3a0bf8b9, 0x3f44ee3c, 0x3e86840b, 0x3cc03a52, 0x3d025065,
+            0x365e1758, 0x379c7d6f, 0x35dac336, 0x3418a901, 0x3157bf84, 0x3095d5b3, 0x32d36bea, 0x331101dd,
+            0x246be590, 0x25a98fa7, 0x27ef31fe, 0x262d5bc9, 0x23624d4c, 0x22a0277b, 0x20e69922, 0x2124f315,
+            0x2a78b428, 0x2bbade1f, 0x29fc6046, 0x283e0a71, 0x2d711cf4, 0x2cb376c3, 0x2ef5c89a, 0x2f37a2ad,
+            0x709a8dc0, 0x7158e7f7, 0x731e59ae, 0x72dc3399, 0x7793251c, 0x76514f2b, 0x7417f172, 0x75d59b45,
+            0x7e89dc78, 0x7f4bb64f, 0x7d0d0816, 0x7ccf6221, 0x798074a4, 0x78421e93, 0x7a04a0ca, 0x7bc6cafd,
+            0x6cbc2eb0, 0x6d7e4487, 0x6f38fade, 0x6efa90e9, 0x6bb5866c, 0x6a77ec5b, 0x68315202, 0x69f33835,
+            0x62af7f08, 0x636d153f, 0x612bab66, 0x60e9c151, 0x65a6d7d4, 0x6464bde3, 0x662203ba, 0x67e0698d,
+            0x48d7cb20, 0x4915a117, 0x4b531f4e, 0x4a917579, 0x4fde63fc, 0x4e1c09cb, 0x4c5ab792, 0x4d98dda5,
+            0x46c49a98, 0x4706f0af, 0x45404ef6, 0x448224c1, 0x41cd3244, 0x400f5873, 0x4249e62a, 0x438b8c1d,
+            0x54f16850, 0x55330267, 0x5775bc3e, 0x56b7d609, 0x53f8c08c, 0x523aaabb, 0x507c14e2, 0x51be7ed5,
+            0x5ae239e8, 0x5b2053df, 0x5966ed86, 0x58a487b1, 0x5deb9134, 0x5c29fb03, 0x5e6f455a, 0x5fad2f6d,
+            0xe1351b80, 0xe0f771b7, 0xe2b1cfee, 0xe373a5d9, 0xe63cb35c, 0xe7fed96b, 0xe5b86732, 0xe47a0d05,
+            0xef264a38, 0xeee4200f, 0xeca29e56, 0xed60f461, 0xe82fe2e4, 0xe9ed88d3, 0xebab368a, 0xea695cbd,
+            0xfd13b8f0, 0xfcd1d2c7, 0xfe976c9e, 0xff5506a9, 0xfa1a102c, 0xfbd87a1b, 0xf99ec442, 0xf85cae75,
+            0xf300e948, 0xf2c2837f, 0xf0843d26, 0xf1465711, 0xf4094194, 0xf5cb2ba3, 0xf78d95fa, 0xf64fffcd,
+            0xd9785d60, 0xd8ba3757, 0xdafc890e, 0xdb3ee339, 0xde71f5bc, 0xdfb39f8b, 0xddf521d2, 0xdc374be5,
+            0xd76b0cd8, 0xd6a966ef, 0xd4efd8b6, 0xd52db281, 0xd062a404, 0xd1a0ce33, 0xd3e6706a, 0xd2241a5d,
+            0xc55efe10, 0xc49c9427, 0xc6da2a7e, 0xc7184049, 0xc25756cc, 0xc3953cfb, 0xc1d382a2, 0xc011e895,
+            0xcb4dafa8, 0xca8fc59f, 0xc8c97bc6, 0xc90b11f1, 0xcc440774, 0xcd866d43, 0xcfc0d31a, 0xce02b92d,
+            0x91af9640, 0x906dfc77, 0x922b422e, 0x93e92819, 0x96a63e9c, 0x976454ab, 0x9522eaf2, 0x94e080c5,
+            0x9fbcc7f8, 0x9e7eadcf, 0x9c381396, 0x9dfa79a1, 0x98b56f24, 0x99770513, 0x9b31bb4a, 0x9af3d17d,
+            0x8d893530, 0x8c4b5f07, 0x8e0de15e, 0x8fcf8b69, 0x8a809dec, 0x8b42f7db, 0x89044982, 0x88c623b5,
+            0x839a6488, 0x82580ebf, 0x801eb0e6, 0x81dcdad1, 0x8493cc54, 0x8551a663, 0x8717183a, 0x86d5720d,
+            0xa9e2d0a0, 0xa820ba97, 0xaa6604ce, 0xaba46ef9, 0xaeeb787c, 0xaf29124b, 0xad6fac12, 0xacadc625,
+            0xa7f18118, 0xa633eb2f, 0xa4755576, 0xa5b73f41, 0xa0f829c4, 0xa13a43f3, 0xa37cfdaa, 0xa2be979d,
+            0xb5c473d0, 0xb40619e7, 0xb640a7be, 0xb782cd89, 0xb2cddb0c, 0xb30fb13b, 0xb1490f62, 0xb08b6555,
+            0xbbd72268, 0xba15485f, 0xb853f606, 0xb9919c31, 0xbcde8ab4, 0xbd1ce083, 0xbf5a5eda, 0xbe9834ed
+        },
+        {
+            0x00000000, 0xb8bc6765, 0xaa09c88b, 0x12b5afee, 0x8f629757, 0x37def032, 0x256b5fdc, 0x9dd738b9,
+            0xc5b428ef, 0x7d084f8a, 0x6fbde064, 0xd7018701, 0x4ad6bfb8, 0xf26ad8dd, 0xe0df7733, 0x58631056,
+            0x5019579f, 0xe8a530fa, 0xfa109f14, 0x42acf871, 0xdf7bc0c8, 0x67c7a7ad, 0x75720843, 0xcdce6f26,
+            0x95ad7f70, 0x2d111815, 0x3fa4b7fb, 0x8718d09e, 0x1acfe827, 0xa2738f42, 0xb0c620ac, 0x087a47c9,
+            0xa032af3e, 0x188ec85b, 0x0a3b67b5, 0xb28700d0, 0x2f503869, 0x97ec5f0c, 0x8559f0e2, 0x3de59787,
+            0x658687d1, 0xdd3ae0b4, 0xcf8f4f5a, 0x7733283f, 0xeae41086, 0x525877e3, 0x40edd80d, 0xf851bf68,
+            0xf02bf8a1, 0x48979fc4, 0x5a22302a, 0xe29e574f, 0x7f496ff6, 0xc7f50893, 0xd540a77d, 0x6dfcc018,
+            0x359fd04e, 0x8d23b72b, 0x9f9618c5, 0x272a7fa0, 0xbafd4719, 0x0241207c, 0x10f48f92, 0xa848e8f7,
+            0x9b14583d, 0x23a83f58, 0x311d90b6, 0x89a1f7d3, 0x1476cf6a, 0xaccaa80f, 0xbe7f07e1, 0x06c36084,
+            0x5ea070d2, 0xe61c17b7, 0xf4a9b859, 0x4c15df3c, 0xd1c2e785, 0x697e80e0, 0x7bcb2f0e, 0xc377486b,
+            0xcb0d0fa2, 0x73b168c7, 0x6104c729, 0xd9b8a04c, 0x446f98f5, 0xfcd3ff90, 0xee66507e, 0x56da371b,
+            0x0eb9274d, 0xb6054028, 0xa4b0efc6, 0x1c0c88a3, 0x81dbb01a, 0x3967d77f, 0x2bd27891, 0x936e1ff4,
+            0x3b26f703, 0x839a9066, 0x912f3f88, 0x299358ed, 0xb4446054, 0x0cf80731, 0x1e4da8df, 0xa6f1cfba,
+            0xfe92dfec, 0x462eb889, 0x549b1767, 0xec277002, 0x71f048bb, 0xc94c2fde, 0xdbf98030, 0x6345e755,
+            0x6b3fa09c, 0xd383c7f9, 0xc1366817, 0x798a0f72, 0xe45d37cb, 0x5ce150ae, 0x4e54ff40, 0xf6e89825,
+            0xae8b8873, 0x1637ef16, 0x048240f8, 0xbc3e279d, 0x21e91f24, 0x99557841, 0x8be0d7af, 0x335cb0ca,
+            0xed59b63b, 0x55e5d15e, 0x47507eb0, 0xffec19d5, 0x623b216c, 0xda874609, 0xc832e9e7, 0x708e8e82,
+            0x28ed9ed4, 0x9051f9b1, 0x82e4565f, 0x3a58313a, 0xa78f0983, 0x1f336ee6, 0x0d86c108, 0xb53aa66d,
+            0xbd40e1a4, 0x05fc86c1, 0x1749292f, 0xaff54e4a, 0x322276f3, 0x8a9e1196, 0x982bbe78, 0x2097d91d,
+            0x78f4c94b, 0xc048ae2e, 0xd2fd01c0, 0x6a4166a5, 0xf7965e1c, 0x4f2a3979, 0x5d9f9697, 0xe523f1f2,
+            0x4d6b1905, 0xf5d77e60, 0xe762d18e, 0x5fdeb6eb, 0xc2098e52, 0x7ab5e937, 0x680046d9, 0xd0bc21bc,
+            0x88df31ea, 0x3063568f, 0x22d6f961, 0x9a6a9e04, 0x07bda6bd, 0xbf01c1d8, 0xadb46e36, 0x15080953,
+            0x1d724e9a, 0xa5ce29ff, 0xb77b8611, 0x0fc7e174, 0x9210d9cd, 0x2aacbea8, 0x38191146, 0x80a57623,
+            0xd8c66675, 0x607a0110, 0x72cfaefe, 0xca73c99b, 0x57a4f122, 0xef189647, 0xfdad39a9, 0x45115ecc,
+            0x764dee06, 0xcef18963, 0xdc44268d, 0x64f841e8, 0xf92f7951, 0x41931e34, 0x5326b1da, 0xeb9ad6bf,
+            0xb3f9c6e9, 0x0b45a18c, 0x19f00e62, 0xa14c6907, 0x3c9b51be, 0x842736db, 0x96929935, 0x2e2efe50,
+            0x2654b999, 0x9ee8defc, 0x8c5d7112, 0x34e11677, 0xa9362ece, 0x118a49ab, 0x033fe645, 0xbb838120,
+            0xe3e09176, 0x5b5cf613, 0x49e959fd, 0xf1553e98, 0x6c820621, 0xd43e6144, 0xc68bceaa, 0x7e37a9cf,
+            0xd67f4138, 0x6ec3265d, 0x7c7689b3, 0xc4caeed6, 0x591dd66f, 0xe1a1b10a, 0xf3141ee4, 0x4ba87981,
+            0x13cb69d7, 0xab770eb2, 0xb9c2a15c, 0x017ec639, 0x9ca9fe80, 0x241599e5, 0x36a0360b, 0x8e1c516e,
+            0x866616a7, 0x3eda71c2, 0x2c6fde2c, 0x94d3b949, 0x090481f0, 0xb1b8e695, 0xa30d497b, 0x1bb12e1e,
+            0x43d23e48, 0xfb6e592d, 0xe9dbf6c3, 0x516791a6, 0xccb0a91f, 0x740cce7a, 0x66b96194, 0xde0506f1
+        },
+#endif
+#if FBP_CRC_SLICE_BY >= 8
+        {
+            0x00000000, 0x3d6029b0, 0x7ac05360, 0x47a07ad0, 0xf580a6c0, 0xc8e08f70, 0x8f40f5a0, 0xb220dc10,
+            0x30704bc1, 0x0d106271, 0x4ab018a1, 0x77d03111, 0xc5f0ed01, 0xf890c4b1, 0xbf30be61, 0x825097d1,
+            0x60e09782, 0x5d80be32, 0x1a20c4e2, 0x2740ed52, 0x95603142, 0xa80018f2, 0xefa06222, 0xd2c04b92,
+            0x5090dc43, 0x6df0f5f3, 0x2a508f23, 0x1730a693, 0xa5107a83, 0x98705333, 0xdfd029e3, 0xe2b00053,
+            0xc1c12f04, 0xfca106b4, 0xbb017c64, 0x866155d4, 0x344189c4, 0x0921a074, 0x4e81daa4, 0x73e1f314,
+            0xf1b164c5, 0xccd14d75, 0x8b7137a5, 0xb6111e15, 0x0431c205, 0x3951ebb5, 0x7ef19165, 0x4391b8d5,
+            0xa121b886, 0x9c419136, 0xdbe1ebe6, 0xe681c256, 0x54a11e46, 0x69c137f6, 0x2e614d26, 0x13016496,
+            0x9151f347, 0xac31daf7, 0xeb91a027, 0xd6f18997, 0x64d15587, 0x59b17c37, 0x1e1106e7, 0x23712f57,
+            0x58f35849, 0x659371f9, 0x22330b29, 0x1f532299, 0xad73fe89, 0x9013d739, 0xd7b3ade9, 0xead38459,
+            0x68831388, 0x55e33a38, 0x124340e8, 0x2f236958, 0x9d03b548, 0xa0639cf8, 0xe7c3e628, 0xdaa3cf98,
+            0x3813cfcb, 0x0573e67b, 0x42d39cab, 0x7fb3b51b, 0xcd93690b, 0xf0f340bb, 0xb7533a6b, 0x8a3313db,
+            0x0863840a, 0x3503adba, 0x72a3d76a, 0x4fc3feda, 0xfde322ca, 0xc0830b7a, 0x872371aa, 0xba43581a,
+            0x9932774d, 0xa4525efd, 0xe3f2242d, 0xde920d9d, 0x6cb2d18d, 0x51d2f83d, 0x167282ed, 0x2b12ab5d,
+            0xa9423c8c, 0x9422153c, 0xd3826fec, 0xeee2465c, 0x5cc29a4c, 0x61a2b3fc, 0x2602c92c, 0x1b62e09c,
+            0xf9d2e0cf, 0xc4b2c97f, 0x8312b3af, 0xbe729a1f, 0x0c52460f, 0x31326fbf, 0x7692156f, 0x4bf23cdf,
+            0xc9a2ab0e, 0xf4c282be, 0xb362f86e, 0x8e02d1de, 0x3c220dce, 0x0142247e, 0x46e25eae, 0x7b82771e,
+            0xb1e6b092, 0x8c869922, 0xcb26e3f2, 0xf646ca42, 0x44661652, 0x79063fe2, 0x3ea64532, 0x03c66c82,
+            0x8196fb53, 0xbcf6d2e3, 0xfb56a833, 0xc6368183, 0x74165d93, 0x49767423, 0x0ed60ef3, 0x33b62743,
+            0xd1062710, 0xec660ea0, 0xabc67470, 0x96a65dc0, 0x248681d0, 0x19e6a860, 0x5e46d2b0, 0x6326fb00,
+            0xe1766cd1, 0xdc164561, 0x9bb63fb1, 0xa6d61601, 0x14f6ca11, 0x2996e3a1, 0x6e369971, 0x5356b0c1,
+            0x70279f96, 0x4d47b626, 0x0ae7ccf6, 0x3787e546, 0x85a73956, 0xb8c710e6, 0xff676a36, 0xc2074386,
+            0x4057d457, 0x7d37fde7, 0x3a978737, 0x07f7ae87, 0xb5d77297, 0x88b75b27, 0xcf1721f7, 0xf2770847,
+            0x10c70814, 0x2da721a4, 0x6a075b74, 0x576772c4, 0xe547aed4, 0xd8278764, 0x9f87fdb4, 0xa2e7d404,
+            0x20b743d5, 0x1dd76a65, 0x5a7710b5, 0x67173905, 0xd537e515, 0xe857cca5, 0xaff7b675, 0x92979fc5,
+            0xe915e8db, 0xd475c16b, 0x93d5bbbb, 0xaeb5920b, 0x1c954e1b, 0x21f567ab, 0x66551d7b, 0x5b3534cb,
+            0xd965a31a, 0xe4058aaa, 0xa3a5f07a, 0x9ec5d9ca, 0x2ce505da, 0x11852c6a, 0x562556ba, 0x6b457f0a,
+            0x89f57f59, 0xb49556e9, 0xf3352c39, 0xce550589, 0x7c75d999, 0x4115f029, 0x06b58af9, 0x3bd5a349,
+            0xb9853498, 0x84e51d28, 0xc34567f8, 0xfe254e48, 0x4c059258, 0x7165bbe8, 0x36c5c138, 0x0ba5e888,
+            0x28d4c7df, 0x15b4ee6f, 0x521494bf, 0x6f74bd0f, 0xdd54611f, 0xe03448af, 0xa794327f, 0x9af41bcf,
+            0x18a48c1e, 0x25c4a5ae, 0x6264df7e, 0x5f04f6ce, 0xed242ade, 0xd044036e, 0x97e479be, 0xaa84500e,
+            0x4834505d, 0x755479ed, 0x32f4033d, 0x0f942a8d, 0xbdb4f69d, 0x80d4df2d, 0xc774a5fd, 0xfa148c4d,
+            0x78441b9c, 0x4524322c, 0x028448fc, 0x3fe4614c, 0x8dc4bd5c, 0xb0a494ec, 0xf704ee3c, 0xca64c78c
+        },
+        {
+            0x00000000, 0xcb5cd3a5, 0x4dc8a10b, 0x869472ae, 0x9b914216, 0x50cd91b3, 0xd659e31d, 0x1d0530b8,
+            0xec53826d, 0x270f51c8, 0xa19b2366, 0x6ac7f0c3, 0x77c2c07b, 0xbc9e13de, 0x3a0a6170, 0xf156b2d5,
+            0x03d6029b, 0xc88ad13e, 0x4e1ea390, 0x85427035, 0x9847408d, 0x531b9328, 0xd58fe186, 0x1ed33223,
+            0xef8580f6, 0x24d95353, 0xa24d21fd, 0x6911f258, 0x7414c2e0, 0xbf481145, 0x39dc63eb, 0xf280b04e,
+            0x07ac0536, 0xccf0d693, 0x4a64a43d, 0x81387798, 0x9c3d4720, 0x57619485, 0xd1f5e62b, 0x1aa9358e,
+            0xebff875b, 0x20a354fe, 0xa6372650, 0x6d6bf5f5, 0x706ec54d, 0xbb3216e8, 0x3da66446, 0xf6fab7e3,
+            0x047a07ad, 0xcf26d408, 0x49b2a6a6, 0x82ee7503, 0x9feb45bb, 0x54b7961e, 0xd223e4b0, 0x197f3715,
+            0xe82985c0, 0x23755665, 0xa5e124cb, 0x6ebdf76e, 0x73b8c7d6, 0xb8e41473, 0x3e7066dd, 0xf52cb578,
+            0x0f580a6c, 0xc404d9c9, 0x4290ab67, 0x89cc78c2, 0x94c9487a, 0x5f959bdf, 0xd901e971, 0x125d3ad4,
+            0xe30b8801, 0x28575ba4, 0xaec3290a, 0x659ffaaf, 0x789aca17, 0xb3c619b2, 0x35526b1c, 0xfe0eb8b9,
+            0x0c8e08f7, 0xc7d2db52, 0x4146a9fc, 0x8a1a7a59, 0x971f4ae1, 0x5c439944, 0xdad7ebea, 0x118b384f,
+            0xe0dd8a9a, 0x2b81593f, 0xad152b91, 0x6649f834, 0x7b4cc88c, 0xb0101b29, 0x36846987, 0xfdd8ba22,
+            0x08f40f5a, 0xc3a8dcff, 0x453cae51, 0x8e607df4, 0x93654d4c, 0x58399ee9, 0xdeadec47, 0x15f13fe2,
+            0xe4a78d37, 0x2ffb5e92, 0xa96f2c3c, 0x6233ff99, 0x7f36cf21, 0xb46a1c84, 0x32fe6e2a, 0xf9a2bd8f,
+            0x0b220dc1, 0xc07ede64, 0x46eaacca, 0x8db67f6f, 0x90b34fd7, 0x5bef9c72, 0xdd7beedc, 0x16273d79,
+            0xe7718fac, 0x2c2d5c09, 0xaab92ea7, 0x61e5fd02, 0x7ce0cdba, 0xb7bc1e1f, 0x31286cb1, 0xfa74bf14,
+            0x1eb014d8, 0xd5ecc77d, 0x5378b5d3, 0x98246676, 0x852156ce, 0x4e7d856b, 0xc8e9f7c5, 0x03b52460,
+            0xf2e396b5, 0x39bf4510, 0xbf2b37be, 0x7477e41b, 0x6972d4a3, 0xa22e0706, 0x24ba75a8, 0xefe6a60d,
+            0x1d661643, 0xd63ac5e6, 0x50aeb748, 0x9bf264ed, 0x86f75455, 0x4dab87f0, 0xcb3ff55e, 0x006326fb,
+            0xf135942e, 0x3a69478b, 0xbcfd3525, 0x77a1e680, 0x6aa4d638, 0xa1f8059d, 0x276c7733, 0xec30a496,
+            0x191c11ee, 0xd240c24b, 0x54d4b0e5, 0x9f886340, 0x828d53f8, 0x49d1805d, 0xcf45f2f3, 0x04192156,
+            0xf54f9383, 0x3e134026, 0xb8873288, 0x73dbe12d, 0x6eded195, 0xa5820230, 0x2316709e, 0xe84aa33b,
+            0x1aca1375, 0xd196c0d0, 0x5702b27e, 0x9c5e61db, 0x815b5163, 0x4a0782c6, 0xcc93f068, 0x07cf23cd,
+            0xf6999118, 0x3dc542bd, 0xbb513013, 0x700de3b6, 0x6d08d30e, 0xa65400ab, 0x20c07205, 0xeb9ca1a0,
+            0x11e81eb4, 0xdab4cd11, 0x5c20bfbf, 0x977c6c1a, 0x8a795ca2, 0x41258f07, 0xc7b1fda9, 0x0ced2e0c,
+            0xfdbb9cd9, 0x36e74f7c, 0xb0733dd2, 0x7b2fee77, 0x662adecf, 0xad760d6a, 0x2be27fc4, 0xe0beac61,
+            0x123e1c2f, 0xd962cf8a, 0x5ff6bd24, 0x94aa6e81, 0x89af5e39, 0x42f38d9c, 0xc467ff32, 0x0f3b2c97,
+            0xfe6d9e42, 0x35314de7, 0xb3a53f49, 0x78f9ecec, 0x65fcdc54, 0xaea00ff1, 0x28347d5f, 0xe368aefa,
+            0x16441b82, 0xdd18c827, 0x5b8cba89, 0x90d0692c, 0x8dd55994, 0x46898a31, 0xc01df89f, 0x0b412b3a,
+            0xfa1799ef, 0x314b4a4a, 0xb7df38e4, 0x7c83eb41, 0x6186dbf9, 0xaada085c, 0x2c4e7af2, 0xe712a957,
+            0x15921919, 0xdececabc, 0x585ab812, 0x93066bb7, 0x8e035b0f, 0x455f88aa, 0xc3cbfa04, 0x089729a1,
+            0xf9c19b74, 0x329d48d1, 0xb4093a7f, 0x7f55e9da, 0x6250d962, 0xa90c0ac7, 0x2f987869, 0xe4c4abcc
+        },
+        {
+            0x00000000, 0xa6770bb4, 0x979f1129, 0x31e81a9d, 0xf44f2413, 0x52382fa7, 0x63d0353a, 0xc5a73e8e,
+            0x33ef4e67, 0x959845d3, 0xa4705f4e, 0x020754fa, 0xc7a06a74, 0x61d761c0, 0x503f7b5d, 0xf64870e9,
+            0x67de9cce, 0xc1a9977a, 0xf0418de7, 0x56368653, 0x9391b8dd, 0x35e6b369, 0x040ea9f4, 0xa279a240,
+            0x5431d2a9, 0xf246d91d, 0xc3aec380, 0x65d9c834, 0xa07ef6ba, 0x0609fd0e, 0x37e1e793, 0x9196ec27,
+            0xcfbd399c, 0x69ca3228, 0x582228b5, 0xfe552301, 0x3bf21d8f, 0x9d85163b, 0xac6d0ca6, 0x0a1a0712,
+            0xfc5277fb, 0x5a257c4f, 0x6bcd66d2, 0xcdba6d66, 0x081d53e8, 0xae6a585c, 0x9f8242c1, 0x39f54975,
+            0xa863a552, 0x0e14aee6, 0x3ffcb47b, 0x998bbfcf, 0x5c2c8141, 0xfa5b8af5, 0xcbb39068, 0x6dc49bdc,
+            0x9b8ceb35, 0x3dfbe081, 0x0c13fa1c, 0xaa64f1a8, 0x6fc3cf26, 0xc9b4c492, 0xf85cde0f, 0x5e2bd5bb,
+            0x440b7579, 0xe27c7ecd, 0xd3946450, 0x75e36fe4, 0xb044516a, 0x16335ade, 0x27db4043, 0x81ac4bf7,
+            0x77e43b1e, 0xd19330aa, 0xe07b2a37, 0x460c2183, 0x83ab1f0d, 0x25dc14b9, 0x14340e24, 0xb2430590,
+            0x23d5e9b7, 0x85a2e203, 0xb44af89e, 0x123df32a, 0xd79acda4, 0x71edc610, 0x4005dc8d, 0xe672d739,
+            0x103aa7d0, 0xb64dac64, 0x87a5b6f9, 0x21d2bd4d, 0xe47583c3, 0x42028877, 0x73ea92ea, 0xd59d995e,
+            0x8bb64ce5, 0x2dc14751, 0x1c295dcc, 0xba5e5678, 0x7ff968f6, 0xd98e6342, 0xe86679df, 0x4e11726b,
+            0xb8590282, 0x1e2e0936, 0x2fc613ab, 0x89b1181f, 0x4c162691, 0xea612d25, 0xdb8937b8, 0x7dfe3c0c,
+            0xec68d02b, 0x4a1fdb9f, 0x7bf7c102, 0xdd80cab6, 0x1827f438, 0xbe50ff8c, 0x8fb8e511, 0x29cfeea5,
+            0xdf879e4c, 0x79f095f8, 0x48188f65, 0xee6f84d1, 0x2bc8ba5f, 0x8dbfb1eb, 0xbc57ab76, 0x1a20a0c2,
+            0x8816eaf2, 0x2e61e146, 0x1f89fbdb, 0xb9fef06f, 0x7c59cee1, 0xda2ec555, 0xebc6dfc8, 0x4db1d47c,
+            0xbbf9a495, 0x1d8eaf21, 0x2c66b5bc, 0x8a11be08, 0x4fb68086, 0xe9c18b32, 0xd82991af, 0x7e5e9a1b,
+            0xefc8763c, 0x49bf7d88, 0x78576715, 0xde206ca1, 0x1b87522f, 0xbdf0599b, 0x8c184306, 0x2a6f48b2,
+            0xdc27385b, 0x7a5033ef, 0x4bb82972, 0xedcf22c6, 0x28681c48, 0x8e1f17fc, 0xbff70d61, 0x198006d5,
+            0x47abd36e, 0xe1dcd8da, 0xd034c247, 0x7643c9f3, 0xb3e4f77d, 0x1593fcc9, 0x247be654, 0x820cede0,
+            0x74449d09, 0xd23396bd, 0xe3db8c20, 0x45ac8794, 0x800bb91a, 0x267cb2ae, 0x1794a833, 0xb1e3a387,
+            0x20754fa0, 0x86024414, 0xb7ea5e89, 0x119d553d, 0xd43a6bb3, 0x724d6007, 0x43a57a9a, 0xe5d2712e,
+            0x139a01c7, 0xb5ed0a73, 0x840510ee, 0x22721b5a, 0xe7d525d4, 0x41a22e60, 0x704a34fd, 0xd63d3f49,
+            0xcc1d9f8b, 0x6a6a943f, 0x5b828ea2, 0xfdf58516, 0x3852bb98, 0x9e25b02c, 0xafcdaab1, 0x09baa105,
+            0xfff2d1ec, 0x5985da58, 0x686dc0c5, 0xce1acb71, 0x0bbdf5ff, 0xadcafe4b, 0x9c22e4d6, 0x3a55ef62,
+            0xabc30345, 0x0db408f1, 0x3c5c126c, 0x9a2b19d8, 0x5f8c2756, 0xf9fb2ce2, 0xc813367f, 0x6e643dcb,
+            0x982c4d22, 0x3e5b4696, 0x0fb35c0b, 0xa9c457bf, 0x6c636931, 0xca146285, 0xfbfc7818, 0x5d8b73ac,
+            0x03a0a617, 0xa5d7ada3, 0x943fb73e, 0x3248bc8a, 0xf7ef8204, 0x519889b0, 0x6070932d, 0xc6079899,
+            0x304fe870, 0x9638e3c4, 0xa7d0f959, 0x01a7f2ed, 0xc400cc63, 0x6277c7d7, 0x539fdd4a, 0xf5e8d6fe,
+            0x647e3ad9, 0xc209316d, 0xf3e12bf0, 0x55962044, 0x90311eca, 0x3646157e, 0x07ae0fe3, 0xa1d90457,
+            0x579174be, 0xf1e67f0a, 0xc00e6597, 0x66796e23, 0xa3de50ad, 0x05a95b19, 0x34414184, 0x92364a30
+        },
+        {
+            0x00000000, 0xccaa009e, 0x4225077d, 0x8e8f07e3, 0x844a0efa, 0x48e00e64, 0xc66f0987, 0x0ac50919,
+            0xd3e51bb5, 0x1f4f1b2b, 0x91c01cc8, 0x5d6a1c56, 0x57af154f, 0x9b0515d1, 0x158a1232, 0xd92012ac,
+            0x7cbb312b, 0xb01131b5, 0x3e9e3656, 0xf23436c8, 0xf8f13fd1, 0x345b3f4f, 0xbad438ac, 0x767e3832,
+            0xaf5e2a9e, 0x63f42a00, 0xed7b2de3, 0x21d12d7d, 0x2b142464, 0xe7be24fa, 0x69312319, 0xa59b2387,
+            0xf9766256, 0x35dc62c8, 0xbb53652b, 0x77f965b5, 0x7d3c6cac, 0xb1966c32, 0x3f196bd1, 0xf3b36b4f,
+            0x2a9379e3, 0xe639797d, 0x68b67e9e, 0xa41c7e00, 0xaed97719, 0x62737787, 0xecfc7064, 0x205670fa,
+            0x85cd537d, 0x496753e3, 0xc7e85400, 0x0b42549e, 0x01875d87, 0xcd2d5d19, 0x43a25afa, 0x8f085a64,
+            0x562848c8, 0x9a824856, 0x140d4fb5, 0xd8a74f2b, 0xd2624632, 0x1ec846ac, 0x9047414f, 0x5ced41d1,
+            0x299dc2ed, 0xe537c273, 0x6bb8c590, 0xa712c50e, 0xadd7cc17, 0x617dcc89, 0xeff2cb6a, 0x2358cbf4,
+            0xfa78d958, 0x36d2d9c6, 0xb85dde25, 0x74f7debb, 0x7e32d7a2, 0xb298d73c, 0x3c17d0df, 0xf0bdd041,
+            0x5526f3c6, 0x998cf358, 0x1703f4bb, 0xdba9f425, 0xd16cfd3c, 0x1dc6fda2, 0x9349fa41, 0x5fe3fadf,
+            0x86c3e873, 0x4a69e8ed, 0xc4e6ef0e, 0x084cef90, 0x0289e689, 0xce23e617, 0x40ace1f4, 0x8c06e16a,
+            0xd0eba0bb, 0x1c41a025, 0x92cea7c6, 0x5e64a758, 0x54a1ae41, 0x980baedf, 0x1684a93c, 0xda2ea9a2,
+            0x030ebb0e, 0xcfa4bb90, 0x412bbc73, 0x8d81bced, 0x8744b5f4, 0x4beeb56a, 0xc561b289, 0x09cbb217,
+            0xac509190, 0x60fa910e, 0xee7596ed, 0x22df9673, 0x281a9f6a, 0xe4b09ff4, 0x6a3f9817, 0xa6959889,
+            0x7fb58a25, 0xb31f8abb, 0x3d908d58, 0xf13a8dc6, 0xfbff84df, 0x37558441, 0xb9da83a2, 0x7570833c,
+            0x533b85da, 0x9f918544, 0x111e82a7, 0xddb48239, 0xd7718b20, 0x1bdb8bbe, 0x95548c5d, 0x59fe8cc3,
+            0x80de9e6f, 0x4c749ef1, 0xc2fb9912, 0x0e51998c, 0x04949095, 0xc83e900b, 0x46b197e8, 0x8a1b9776,
+            0x2f80b4f1, 0xe32ab46f, 0x6da5b38c, 0xa10fb312, 0xabcaba0b, 0x6760ba95, 0xe9efbd76, 0x2545bde8,
+            0xfc65af44, 0x30cfafda, 0xbe40a839, 0x72eaa8a7, 0x782fa1be, 0xb485a120, 0x3a0aa6c3, 0xf6a0a65d,
+            0xaa4de78c, 0x66e7e712, 0xe868e0f1, 0x24c2e06f, 0x2e07e976, 0xe2ade9e8, 0x6c22ee0b, 0xa088ee95,
+            0x79a8fc39, 0xb502fca7, 0x3b8dfb44, 0xf727fbda, 0xfde2f2c3, 0x3148f25d, 0xbfc7f5be, 0x736df520,
+            0xd6f6d6a7, 0x1a5cd639, 0x94d3d1da, 0x5879d144, 0x52bcd85d, 0x9e16d8c3, 0x1099df20, 0xdc33dfbe,
+            0x0513cd12, 0xc9b9cd8c, 0x4736ca6f, 0x8b9ccaf1, 0x8159c3e8, 0x4df3c376, 0xc37cc495, 0x0fd6c40b,
+            0x7aa64737, 0xb60c47a9, 0x3883404a, 0xf42940d4, 0xfeec49cd, 0x32464953, 0xbcc94eb0, 0x70634e2e,
+            0xa9435c82, 0x65e95c1c, 0xeb665bff, 0x27cc5b61, 0x2d095278, 0xe1a352e6, 0x6f2c5505, 0xa386559b,
+            0x061d761c, 0xcab77682, 0x44387161, 0x889271ff, 0x825778e6, 0x4efd7878, 0xc0727f9b, 0x0cd87f05,
+            0xd5f86da9, 0x19526d37, 0x97dd6ad4, 0x5b776a4a, 0x51b26353, 0x9d1863cd, 0x1397642e, 0xdf3d64b0,
+            0x83d02561, 0x4f7a25ff, 0xc1f5221c, 0x0d5f2282, 0x079a2b9b, 0xcb302b05, 0x45bf2ce6, 0x89152c78,
+            0x50353ed4, 0x9c9f3e4a, 0x121039a9, 0xdeba3937, 0xd47f302e, 0x18d530b0, 0x965a3753, 0x5af037cd,
+            0xff6b144a, 0x33c114d4, 0xbd4e1337, 0x71e413a9, 0x7b211ab0, 0xb78b1a2e, 0x39041dcd, 0xf5ae1d53,
+            0x2c8e0fff, 0xe0240f61, 0x6eab0882, 0xa201081c, 0xa8c40105, 0x646e019b, 0xeae10678, 0x264b06e6
+        },
+#endif
 };
 
-uint32_t fbp_crc32(uint32_t crc, uint8_t const *data, uint32_t length) {
-    uint8_t tbl_idx;
+static inline uint32_t crc32_slice1_raw(uint32_t crc, uint8_t const *data, uint32_t length) {
+    while (length--) {
+        crc = crc32_table[0][(crc ^ *data++) & 0xff] ^ (crc >> 8);
+    }
+    return crc;
+}
 
+uint32_t fbp_crc32_slice1(uint32_t crc, uint8_t const *data, uint32_t length) {
+    if ((0 == length) || !data) {
+        return crc;
+    }
+    return ~crc32_slice1_raw(~crc, data, length);
+}
+
+#if FBP_CRC_SLICE_BY >= 4
+static inline uint32_t crc32_slice4_raw(uint32_t crc, uint8_t const *data, uint32_t length) {
+    while (length >= 4) {
+        crc ^= ((uint32_t) data[0]) | (((uint32_t) data[1]) << 8)
+             | (((uint32_t) data[2]) << 16) | (((uint32_t) data[3]) << 24);
+        crc = crc32_table[3][crc & 0xff]
+            ^ crc32_table[2][(crc >> 8) & 0xff]
+            ^ crc32_table[1][(crc >> 16) & 0xff]
+            ^ crc32_table[0][crc >> 24];
+        data += 4;
+        length -= 4;
+    }
+    return crc32_slice1_raw(crc, data, length);
+}
+
+uint32_t fbp_crc32_slice4(uint32_t crc, uint8_t const *data, uint32_t length) {
+    if ((0 == length) || !data) {
+        return crc;
+    }
+    return ~crc32_slice4_raw(~crc, data, length);
+}
+#endif
+
+#if FBP_CRC_SLICE_BY >= 8
+static inline uint32_t crc32_slice8_raw(uint32_t crc, uint8_t const *data, uint32_t length) {
+    uint32_t hi;
+    while (length >= 8) {
+        crc ^= ((uint32_t) data[0]) | (((uint32_t) data[1]) << 8)
+             | (((uint32_t) data[2]) << 16) | (((uint32_t) data[3]) << 24);
+        hi = ((uint32_t) data[4]) | (((uint32_t) data[5]) << 8)
+             | (((uint32_t) data[6]) << 16) | (((uint32_t) data[7]) << 24);
+        crc = crc32_table[7][crc & 0xff]
+            ^ crc32_table[6][(crc >> 8) & 0xff]
+            ^ crc32_table[5][(crc >> 16) & 0xff]
+            ^ crc32_table[4][crc >> 24]
+            ^ crc32_table[3][hi & 0xff]
+            ^ crc32_table[2][(hi >> 8) & 0xff]
+            ^ crc32_table[1][(hi >> 16) & 0xff]
+            ^ crc32_table[0][hi >> 24];
+        data += 8;
+        length -= 8;
+    }
+    return crc32_slice4_raw(crc, data, length);
+}
+
+uint32_t fbp_crc32_slice8(uint32_t crc, uint8_t const *data, uint32_t length) {
+    if ((0 == length) || !data) {
+        return crc;
+    }
+    return ~crc32_slice8_raw(~crc, data, length);
+}
+#endif
+
+static inline uint32_t crc32_table_raw(uint32_t crc, uint8_t const *data, uint32_t length) {
+#if FBP_CRC_SLICE_BY >= 8
+    return crc32_slice8_raw(crc, data, length);
+#elif FBP_CRC_SLICE_BY >= 4
+    return crc32_slice4_raw(crc, data, length);
+#else
+    return crc32_slice1_raw(crc, data, length);
+#endif
+}
+
+#if CRC32_PCLMUL_ENABLE
+/*
+ * Fold 16-byte blocks using carry-less multiplication, then Barrett
+ * reduce to 32 bits.  The constants are for the bit-reflected
+ * 0x04C11DB7 polynomial from "Fast CRC Computation for Generic
+ * Polynomials Using PCLMULQDQ Instruction", Intel, 2009.
+ *
+ * Requires length >= 64 and a multiple of 16.
+ */
+__attribute__((target("pclmul,sse4.1")))
+static uint32_t crc32_pclmul_raw(uint32_t crc, uint8_t const *data, uint32_t length) {
+    static const uint64_t __attribute__((aligned(16))) k1k2[] = {0x0154442bd4ULL, 0x01c6e41596ULL};
+    static const uint64_t __attribute__((aligned(16))) k3k4[] = {0x01751997d0ULL, 0x00ccaa009eULL};
+    static const uint64_t __attribute__((aligned(16))) k5k0[] = {0x0163cd6124ULL, 0x0000000000ULL};
+    static const uint64_t __attribute__((aligned(16))) poly[] = {0x01db710641ULL, 0x01f7011641ULL};
+    __m128i x0, x1, x2, x3, x4, x5, x6, x7, x8, y5, y6, y7, y8;
+
+    x1 = _mm_loadu_si128((__m128i const *) (data + 0x00));
+    x2 = _mm_loadu_si128((__m128i const *) (data + 0x10));
+    x3 = _mm_loadu_si128((__m128i const *) (data + 0x20));
+    x4 = _mm_loadu_si128((__m128i const *) (data + 0x30));
+    x1 = _mm_xor_si128(x1, _mm_cvtsi32_si128((int) crc));
+    x0 = _mm_load_si128((__m128i const *) k1k2);
+    data += 64;
+    length -= 64;
+
+    while (length >= 64) {  // fold by 4
+        x5 = _mm_clmulepi64_si128(x1, x0, 0x00);
+        x6 = _mm_clmulepi64_si128(x2, x0, 0x00);
+        x7 = _mm_clmulepi64_si128(x3, x0, 0x00);
+        x8 = _mm_clmulepi64_si128(x4, x0, 0x00);
+        x1 = _mm_clmulepi64_si128(x1, x0, 0x11);
+        x2 = _mm_clmulepi64_si128(x2, x0, 0x11);
+        x3 = _mm_clmulepi64_si128(x3, x0, 0x11);
+        x4 = _mm_clmulepi64_si128(x4, x0, 0x11);
+        y5 = _mm_loadu_si128((__m128i const *) (data + 0x00));
+        y6 = _mm_loadu_si128((__m128i const *) (data + 0x10));
+        y7 = _mm_loadu_si128((__m128i const *) (data + 0x20));
+        y8 = _mm_loadu_si128((__m128i const *) (data + 0x30));
+        x1 = _mm_xor_si128(_mm_xor_si128(x1, x5), y5);
+        x2 = _mm_xor_si128(_mm_xor_si128(x2, x6), y6);
+        x3 = _mm_xor_si128(_mm_xor_si128(x3, x7), y7);
+        x4 = _mm_xor_si128(_mm_xor_si128(x4, x8), y8);
+        data += 64;
+        length -= 64;
+    }
+
+    // fold 4 x 128 bits into 128 bits
+    x0 = _mm_load_si128((__m128i const *) k3k4);
+    x5 = _mm_clmulepi64_si128(x1, x0, 0x00);
+    x1 = _mm_clmulepi64_si128(x1, x0, 0x11);
+    x1 = _mm_xor_si128(_mm_xor_si128(x1, x2), x5);
+    x5 = _mm_clmulepi64_si128(x1, x0, 0x00);
+    x1 = _mm_clmulepi64_si128(x1, x0, 0x11);
+    x1 = _mm_xor_si128(_mm_xor_si128(x1, x3), x5);
+    x5 = _mm_clmulepi64_si128(x1, x0, 0x00);
+    x1 = _mm_clmulepi64_si128(x1, x0, 0x11);
+    x1 = _mm_xor_si128(_mm_xor_si128(x1, x4), x5);
+
+    while (length >= 16) {  // fold by 1
+        x2 = _mm_loadu_si128((__m128i const *) data);
+        x5 = _mm_clmulepi64_si128(x1, x0, 0x00);
+        x1 = _mm_clmulepi64_si128(x1, x0, 0x11);
+        x1 = _mm_xor_si128(_mm_xor_si128(x1, x2), x5);
+        data += 16;
+        length -= 16;
+    }
+
+    // fold 128 bits to 64 bits
+    x2 = _mm_clmulepi64_si128(x1, x0, 0x10);
+    x3 = _mm_setr_epi32(~0, 0, ~0, 0);
+    x1 = _mm_srli_si128(x1, 8);
+    x1 = _mm_xor_si128(x1, x2);
+    x0 = _mm_loadl_epi64((__m128i const *) k5k0);
+    x2 = _mm_srli_si128(x1, 4);
+    x1 = _mm_and_si128(x1, x3);
+    x1 = _mm_clmulepi64_si128(x1, x0, 0x00);
+    x1 = _mm_xor_si128(x1, x2);
+
+    // Barrett reduce to 32 bits
+    x0 = _mm_load_si128((__m128i const *) poly);
+    x2 = _mm_and_si128(x1, x3);
+    x2 = _mm_clmulepi64_si128(x2, x0, 0x10);
+    x2 = _mm_and_si128(x2, x3);
+    x2 = _mm_clmulepi64_si128(x2, x0, 0x00);
+    x1 = _mm_xor_si128(x1, x2);
+    return (uint32_t) _mm_extract_epi32(x1, 1);
+}
+#endif
+
+bool fbp_crc32_pclmul_supported() {
+#if CRC32_PCLMUL_ENABLE
+    return __builtin_cpu_supports("pclmul") && __builtin_cpu_supports("sse4.1");
+#else
+    return false;
+#endif
+}
+
+uint32_t fbp_crc32_pclmul(uint32_t crc, uint8_t const *data, uint32_t length) {
     if ((0 == length) || !data) {
         return crc;
     }
     crc = ~crc;
+#if CRC32_PCLMUL_ENABLE
+    if ((length >= 64) && fbp_crc32_pclmul_supported()) {
+        uint32_t sz = length & ~((uint32_t) 15);
+        crc = crc32_pclmul_raw(crc, data, sz);
+        data += sz;
+        length -= sz;
+    }
+#endif
+    return ~crc32_table_raw(crc, data, length);
+}
+
+uint32_t fbp_crc32(uint32_t crc, uint8_t const *data, uint32_t length) {
+#if CRC32_PCLMUL_ENABLE
+    return fbp_crc32_pclmul(crc, data, length);
+#else
+    if ((0 == length) || !data) {
+        return crc;
+    }
+    return ~crc32_table_raw(~crc, data, length);
+#endif
+}
 
+#endif
+
+#if defined(FBP_CRC_CRC64) && FBP_CRC_CRC64
+static const uint64_t crc64_table[CRC64_TABLE_COUNT][256] = {
+        {
+            0x0000000000000000ULL, 0xb32e4cbe03a75f6fULL, 0xf4843657a840a05bULL, 0x47aa7ae9abe7ff34ULL,
+            0x7bd0c384ff8f5e33ULL, 0xc8fe8f3afc28015cULL, 0x8f54f5d357cffe68ULL, 0x3c7ab96d5468a107ULL,
+            0xf7a18709ff1ebc66ULL, 0x448fcbb7fcb9e309ULL, 0x0325b15e575e1c3dULL, 0xb00bfde054f94352ULL,
+            0x8c71448d0091e255ULL, 0x3f5f08330336bd3aULL, 0x78f572daa8d1420eULL, 0xcbdb3e64ab761d61ULL,
+            0x7d9ba13851336649ULL, 0xceb5ed8652943926ULL, 0x891f976ff973c612ULL, 0x3a31dbd1fad4997dULL,
+            0x064b62bcaebc387aULL, 0xb5652e02ad1b6715ULL, 0xf2cf54eb06fc9821ULL, 0x41e11855055bc74eULL,
+            0x8a3a2631ae2dda2fULL, 0x39146a8fad8a8540ULL, 0x7ebe1066066d7a74ULL, 0xcd905cd805ca251bULL,
+            0xf1eae5b551a2841cULL, 0x42c4a90b5205db73ULL, 0x056ed3e2f9e22447ULL, 0xb6409f5cfa457b28ULL,
+            0xfb374270a266cc92ULL, 0x48190ecea1c193fdULL, 0x0fb374270a266cc9ULL, 0xbc9d3899098133a6ULL,
+            0x80e781f45de992a1ULL, 0x33c9cd4a5e4ecdceULL, 0x7463b7a3f5a932faULL, 0xc74dfb1df60e6d95ULL,
+            0x0c96c5795d7870f4ULL, 0xbfb889c75edf2f9bULL, 0xf812f32ef538d0afULL, 0x4b3cbf90f69f8fc0ULL,
+            0x774606fda2f72ec7ULL, 0xc4684a43a15071a8ULL, 0x83c230aa0ab78e9cULL, 0x30ec7c140910d1f3ULL,
+            0x86ace348f355aadbULL, 0x3582aff6f0f2f5b4ULL, 0x7228d51f5b150a80ULL, 0xc10699a158b255efULL,
+            0xfd7c20cc0cdaf4e8ULL, 0x4e526c720f7dab87ULL, 0x09f8169ba49a54b3ULL, 0xbad65a25a73d0bdcULL,
+            0x710d64410c4b16bdULL, 0xc22328ff0fec49d2ULL, 0x85895216a40bb6e6ULL, 0x36a71ea8a7ace989ULL,
+            0x0adda7c5f3c4488eULL, 0xb9f3eb7bf06317e1ULL, 0xfe5991925b84e8d5ULL, 0x4d77dd2c5823b7baULL,
+            0x64b62bcaebc387a1ULL, 0xd7986774e864d8ceULL, 0x90321d9d438327faULL, 0x231c512340247895ULL,
+            0x1f66e84e144cd992ULL, 0xac48a4f017eb86fdULL, 0xebe2de19bc0c79c9ULL, 0x58cc92a7bfab26a6ULL,
+            0x9317acc314dd3bc7ULL, 0x2039e07d177a64a8ULL, 0x67939a94bc9d9b9cULL, 0xd4bdd62abf3ac4f3ULL,
+            0xe8c76f47eb5265f4ULL, 0x5be923f9e8f53a9bULL, 0x1c4359104312c5afULL, 0xaf6d15ae40b59ac0ULL,
+            0x192d8af2baf0e1e8ULL, 0xaa03c64cb957be87ULL, 0xeda9bca512b041b3ULL, 0x5e87f01b11171edcULL,
+            0x62fd4976457fbfdbULL, 0xd1d305c846d8e0b4ULL, 0x96797f21ed3f1f80ULL, 0x2557339fee9840efULL,
+            0xee8c0dfb45ee5d8eULL, 0x5da24145464902e1ULL, 0x1a083bacedaefdd5ULL, 0xa9267712ee09a2baULL,
+            0x955cce7fba6103bdULL, 0x267282c1b9c65cd2ULL, 0x61d8f8281221a3e6ULL, 0xd2f6b4961186fc89ULL,
+            0x9f8169ba49a54b33ULL, 0x2caf25044a02145cULL, 0x6b055fede1e5eb68ULL, 0xd82b1353e242b407ULL,
+            0xe451aa3eb62a1500ULL, 0x577fe680b58d4a6fULL, 0x10d59c691e6ab55bULL, 0xa3fbd0d71dcdea34ULL,
+            0x6820eeb3b6bbf755ULL, 0xdb0ea20db51ca83aULL, 0x9ca4d8e41efb570eULL, 0x2f8a945a1d5c0861ULL,
+            0x13f02d374934a966ULL, 0xa0de61894a93f609ULL, 0xe7741b60e174093dULL, 0x545a57dee2d35652ULL,
+            0xe21ac88218962d7aULL, 0x5134843c1b317215ULL, 0x169efed5b0d68d21ULL, 0xa5b0b26bb371d24eULL,
+            0x99ca0b06e7197349ULL, 0x2ae447b8e4be2c26ULL, 0x6d4e3d514f59d312ULL, 0xde6071ef4cfe8c7dULL,
+            0x15bb4f8be788911cULL, 0xa6950335e42fce73ULL, 0xe13f79dc4fc83147ULL, 0x521135624c6f6e28ULL,
+            0x6e6b8c0f1807cf2fULL, 0xdd45c0b11ba09040ULL, 0x9aefba58b0476f74ULL, 0x29c1f6e6b3e0301bULL,
+            0xc96c5795d7870f42ULL, 0x7a421b2bd420502dULL, 0x3de861c27fc7af19ULL, 0x8ec62d7c7c60f076ULL,
+            0xb2bc941128085171ULL, 0x0192d8af2baf0e1eULL, 0x4638a2468048f12aULL, 0xf516eef883efae45ULL,
+            0x3ecdd09c2899b324ULL, 0x8de39c222b3eec4bULL, 0xca49e6cb80d9137fULL, 0x7967aa75837e4c10ULL,
+            0x451d1318d716ed17ULL, 0xf6335fa6d4b1b278ULL, 0xb199254f7f564d4cULL, 0x02b769f17cf11223ULL,
+            0xb4f7f6ad86b4690bULL, 0x07d9ba1385133664ULL, 0x4073c0fa2ef4c950ULL, 0xf35d8c442d53963fULL,
+            0xcf273529793b3738ULL, 0x7c0979977a9c6857ULL, 0x3ba3037ed17b9763ULL, 0x888d4fc0d2dcc80cULL,
+            0x435671a479aad56dULL, 0xf0783d1a7a0d8a02ULL, 0xb7d247f3d1ea7536ULL, 0x04fc0b4dd24d2a59ULL,
+            0x3886b22086258b5eULL, 0x8ba8fe9e8582d431ULL, 0xcc0284772e652b05ULL, 0x7f2cc8c92dc2746aULL,
+            0x325b15e575e1c3d0ULL, 0x8175595b76469cbfULL, 0xc6df23b2dda1638bULL, 0x75f16f0cde063ce4ULL,
+            0x498bd6618a6e9de3ULL, 0xfaa59adf89c9c28cULL, 0xbd0fe036222e3db8ULL, 0x0e21ac88218962d7ULL,
+            0xc5fa92ec8aff7fb6ULL, 0x76d4de52895820d9ULL, 0x317ea4bb22bfdfedULL, 0x8250e80521188082ULL,
+            0xbe2a516875702185ULL, 0x0d041dd676d77eeaULL, 0x4aae673fdd3081deULL, 0xf9802b81de97deb1ULL,
+            0x4fc0b4dd24d2a599ULL, 0xfceef8632775faf6ULL, 0xbb44828a8c9205c2ULL, 0x086ace348f355aadULL,
+            0x34107759db5dfbaaULL, 0x873e3be7d8faa4c5ULL, 0xc094410e731d5bf1ULL, 0x73ba0db070ba049eULL,
+            0xb86133d4dbcc19ffULL, 0x0b4f7f6ad86b4690ULL, 0x4ce50583738cb9a4ULL, 0xffcb493d702be6cbULL,
+            0xc3b1f050244347ccULL, 0x709fbcee27e418a3ULL, 0x3735c6078c03e797ULL, 0x841b8ab98fa4b8f8ULL,
+            0xadda7c5f3c4488e3ULL, 0x1ef430e13fe3d78cULL, 0x595e4a08940428b8ULL, 0xea7006b697a377d7ULL,
+            0xd60abfdbc3cbd6d0ULL, 0x6524f365c06c89bfULL, 0x228e898c6b8b768bULL, 0x91a0c532682c29e4ULL,
+            0x5a7bfb56c35a3485ULL, 0xe955b7e8c0fd6beaULL, 0xaeffcd016b1a94deULL, 0x1dd181bf68bdcbb1ULL,
+            0x21ab38d23cd56ab6ULL, 0x9285746c3f7235d9ULL, 0xd52f0e859495caedULL, 0x6601423b97329582ULL,
+            0xd041dd676d77eeaaULL, 0x636f91d96ed0b1c5ULL, 0x24c5eb30c5374ef1ULL, 0x97eba78ec690119eULL,
+            0xab911ee392f8b099ULL, 0x18bf525d915feff6ULL, 0x5f1528b43ab810c2ULL, 0xec3b640a391f4fadULL,
+            0x27e05a6e926952ccULL, 0x94ce16d091ce0da3ULL, 0xd3646c393a29f297ULL, 0x604a2087398eadf8ULL,
+            0x5c3099ea6de60cffULL, 0xef1ed5546e415390ULL, 0xa8b4afbdc5a6aca4ULL, 0x1b9ae303c601f3cbULL,
+            0x56ed3e2f9e224471ULL, 0xe5c372919d851b1eULL, 0xa26908783662e42aULL, 0x114744c635c5bb45ULL,
+            0x2d3dfdab61ad1a42ULL, 0x9e13b115620a452dULL, 0xd9b9cbfcc9edba19ULL, 0x6a978742ca4ae576ULL,
+            0xa14cb926613cf817ULL, 0x1262f598629ba778ULL, 0x55c88f71c97c584cULL, 0xe6e6c3cfcadb0723ULL,
+            0xda9c7aa29eb3a624ULL, 0x69b2361c9d14f94bULL, 0x2e184cf536f3067fULL, 0x9d36004b35545910ULL,
+            0x2b769f17cf112238ULL, 0x9858d3a9ccb67d57ULL, 0xdff2a94067518263ULL, 0x6cdce5fe64f6dd0cULL,
+            0x50a65c93309e7c0bULL, 0xe388102d33392364ULL, 0xa4226ac498dedc50ULL, 0x170c267a9b79833fULL,
+            0xdcd7181e300f9e5eULL, 0x6ff954a033a8c131ULL, 0x28532e49984f3e05ULL, 0x9b7d62f79be8616aULL,
+            0xa707db9acf80c06dULL, 0x14299724cc279f02ULL, 0x5383edcd67c06036ULL, 0xe0ada17364673f59ULL
+        },
+#if FBP_CRC_SLICE_BY >= 8
+        {
+            0x0000000000000000ULL, 0x54e979925cd0f10dULL, 0xa9d2f324b9a1e21aULL, 0xfd3b8ab6e5711317ULL,
+            0xc17d4962dc4ddab1ULL, 0x959430f0809d2bbcULL, 0x68afba4665ec38abULL, 0x3c46c3d4393cc9a6ULL,
+            0x10223dee1795abe7ULL, 0x44cb447c4b455aeaULL, 0xb9f0cecaae3449fdULL, 0xed19b758f2e4b8f0ULL,
+            0xd15f748ccbd87156ULL, 0x85b60d1e9708805bULL, 0x788d87a87279934cULL, 0x2c64fe3a2ea96241ULL,
+            0x20447bdc2f2b57ceULL, 0x74ad024e73fba6c3ULL, 0x899688f8968ab5d4ULL, 0xdd7ff16aca5a44d9ULL,
+            0xe13932bef3668d7fULL, 0xb5d04b2cafb67c72ULL, 0x48ebc19a4ac76f65ULL, 0x1c02b80816179e68ULL,
+            0x3066463238befc29ULL, 0x648f3fa0646e0d24ULL, 0x99b4b516811f1e33ULL, 0xcd5dcc84ddcfef3eULL,
+            0xf11b0f50e4f32698ULL, 0xa5f276c2b823d795ULL, 0x58c9fc745d52c482ULL, 0x0c2085e60182358fULL,
+            0x4088f7b85e56af9cULL, 0x14618e2a02865e91ULL, 0xe95a049ce7f74d86ULL, 0xbdb37d0ebb27bc8bULL,
+            0x81f5beda821b752dULL, 0xd51cc748decb8420ULL, 0x28274dfe3bba9737ULL, 0x7cce346c676a663aULL,
+            0x50aaca5649c3047bULL, 0x0443b3c41513f576ULL, 0xf9783972f062e661ULL, 0xad9140e0acb2176cULL,
+            0x91d78334958edecaULL, 0xc53efaa6c95e2fc7ULL, 0x380570102c2f3cd0ULL, 0x6cec098270ffcdddULL,
+            0x60cc8c64717df852ULL, 0x3425f5f62dad095fULL, 0xc91e7f40c8dc1a48ULL, 0x9df706d2940ceb45ULL,
+            0xa1b1c506ad3022e3ULL, 0xf558bc94f1e0d3eeULL, 0x086336221491c0f9ULL, 0x5c8a4fb0484131f4ULL,
+            0x70eeb18a66e853b5ULL, 0x2407c8183a38a2b8ULL, 0xd93c42aedf49b1afULL, 0x8dd53b3c839940a2ULL,
+            0xb193f8e8baa58904ULL, 0xe57a817ae6757809ULL, 0x18410bcc03046b1eULL, 0x4ca8725e5fd49a13ULL,
+            0x8111ef70bcad5f38ULL, 0xd5f896e2e07dae35ULL, 0x28c31c54050cbd22ULL, 0x7c2a65c659dc4c2fULL,
+            0x406ca61260e08589ULL, 0x1485df803c307484ULL, 0xe9be5536d9416793ULL, 0xbd572ca48591969eULL,
+            0x9133d29eab38f4dfULL, 0xc5daab0cf7e805d2ULL, 0x38e121ba129916c5ULL, 0x6c0858284e49e7c8ULL,
+            0x504e9bfc77752e6eULL, 0x04a7e26e2ba5df63ULL, 0xf99c68d8ced4cc74ULL, 0xad75114a92043d79ULL,
+            0xa15594ac938608f6ULL, 0xf5bced3ecf56f9fbULL, 0x088767882a27eaecULL, 0x5c6e1e1a76f71be1ULL,
+            0x6028ddce4fcbd247ULL, 0x34c1a45c131b234aULL, 0xc9fa2eeaf66a305dULL, 0x9d135778aabac150ULL,
+            0xb177a9428413a311ULL, 0xe59ed0d0d8c3521cULL, 0x18a55a663db2410bULL, 0x4c4c23f46162b006ULL,
+            0x700ae020585e79a0ULL, 0x24e399b2048e88adULL, 0xd9d81304e1ff9bbaULL, 0x8d316a96bd2f6ab7ULL,
+            0xc19918c8e2fbf0a4ULL, 0x9570615abe2b01a9ULL, 0x684bebec5b5a12beULL, 0x3ca2927e078ae3b3ULL,
+            0x00e451aa3eb62a15ULL, 0x540d28386266db18ULL, 0xa936a28e8717c80fULL, 0xfddfdb1cdbc73902ULL,
+            0xd1bb2526f56e5b43ULL, 0x85525cb4a9beaa4eULL, 0x7869d6024ccfb959ULL, 0x2c80af90101f4854ULL,
+            0x10c66c44292381f2ULL, 0x442f15d675f370ffULL, 0xb9149f60908263e8ULL, 0xedfde6f2cc5292e5ULL,
+            0xe1dd6314cdd0a76aULL, 0xb5341a8691005667ULL, 0x480f903074714570ULL, 0x1ce6e9a228a1b47dULL,
+            0x20a02a76119d7ddbULL, 0x744953e44d4d8cd6ULL, 0x8972d952a83c9fc1ULL, 0xdd9ba0c0f4ec6eccULL,
+            0xf1ff5efada450c8dULL, 0xa51627688695fd80ULL, 0x582dadde63e4ee97ULL, 0x0cc4d44c3f341f9aULL,
+            0x308217980608d63cULL, 0x646b6e0a5ad82731ULL, 0x9950e4bcbfa93426ULL, 0xcdb99d2ee379c52bULL,
+            0x90fb71cad654a0f5ULL, 0xc41208588a8451f8ULL, 0x392982ee6ff542efULL, 0x6dc0fb7c3325b3e2ULL,
+            0x518638a80a197a44ULL, 0x056f413a56c98b49ULL, 0xf854cb8cb3b8985eULL, 0xacbdb21eef686953ULL,
+            0x80d94c24c1c10b12ULL, 0xd43035b69d11fa1fULL, 0x290bbf007860e908ULL, 0x7de2c69224b01805ULL,
+            0x41a405461d8cd1a3ULL, 0x154d7cd4415c20aeULL, 0xe876f662a42d33b9ULL, 0xbc9f8ff0f8fdc2b4ULL,
+            0xb0bf0a16f97ff73bULL, 0xe4567384a5af0636ULL, 0x196df93240de1521ULL, 0x4d8480a01c0ee42cULL,
+            0x71c2437425322d8aULL, 0x252b3ae679e2dc87ULL, 0xd810b0509c93cf90ULL, 0x8cf9c9c2c0433e9dULL,
+            0xa09d37f8eeea5cdcULL, 0xf4744e6ab23aadd1ULL, 0x094fc4dc574bbec6ULL, 0x5da6bd4e0b9b4fcbULL,
+            0x61e07e9a32a7866dULL, 0x350907086e777760ULL, 0xc8328dbe8b066477ULL, 0x9cdbf42cd7d6957aULL,
+            0xd073867288020f69ULL, 0x849affe0d4d2fe64ULL, 0x79a1755631a3ed73ULL, 0x2d480cc46d731c7eULL,
+            0x110ecf10544fd5d8ULL, 0x45e7b682089f24d5ULL, 0xb8dc3c34edee37c2ULL, 0xec3545a6b13ec6cfULL,
+            0xc051bb9c9f97a48eULL, 0x94b8c20ec3475583ULL, 0x698348b826364694ULL, 0x3d6a312a7ae6b799ULL,
+            0x012cf2fe43da7e3fULL, 0x55c58b6c1f0a8f32ULL, 0xa8fe01dafa7b9c25ULL, 0xfc177848a6ab6d28ULL,
+            0xf037fdaea72958a7ULL, 0xa4de843cfbf9a9aaULL, 0x59e50e8a1e88babdULL, 0x0d0c771842584bb0ULL,
+            0x314ab4cc7b648216ULL, 0x65a3cd5e27b4731bULL, 0x989847e8c2c5600cULL, 0xcc713e7a9e159101ULL,
+            0xe015c040b0bcf340ULL, 0xb4fcb9d2ec6c024dULL, 0x49c73364091d115aULL, 0x1d2e4af655cde057ULL,
+            0x216889226cf129f1ULL, 0x7581f0b03021d8fcULL, 0x88ba7a06d550cbebULL, 0xdc53039489803ae6ULL,
+            0x11ea9eba6af9ffcdULL, 0x4503e72836290ec0ULL, 0xb8386d9ed3581dd7ULL, 0xecd1140c8f88ecdaULL,
+            0xd097d7d8b6b4257cULL, 0x847eae4aea64d471ULL, 0x794524fc0f15c766ULL, 0x2dac5d6e53c5366bULL,
+            0x01c8a3547d6c542aULL, 0x5521dac621bca527ULL, 0xa81a5070c4cdb630ULL, 0xfcf329e2981d473dULL,
+            0xc0b5ea36a1218e9bULL, 0x945c93a4fdf17f96ULL, 0x6967191218806c81ULL, 0x3d8e608044509d8cULL,
+            0x31aee56645d2a803ULL, 0x65479cf41902590eULL, 0x987c1642fc734a19ULL, 0xcc956fd0a0a3bb14ULL,
+            0xf0d3ac04999f72b2ULL, 0xa43ad596c54f83bfULL, 0x59015f20203e90a8ULL, 0x0de826b27cee61a5ULL,
+            0x218cd888524703e4ULL, 0x7565a11a0e97f2e9ULL, 0x885e2bacebe6e1feULL, 0xdcb7523eb73610f3ULL,
+            0xe0f191ea8e0ad955ULL, 0xb418e878d2da2858ULL, 0x492362ce37ab3b4fULL, 0x1dca1b5c6b7bca42ULL,
+            0x5162690234af5051ULL, 0x058b1090687fa15cULL, 0xf8b09a268d0eb24bULL, 0xac59e3b4d1de4346ULL,
+            0x901f2060e8e28ae0ULL, 0xc4f659f2b4327bedULL, 0x39cdd344514368faULL, 0x6d24aad60d9399f7ULL,
+            0x414054ec233afbb6ULL, 0x15a92d7e7fea0abbULL, 0xe892a7c89a9b19acULL, 0xbc7bde5ac64be8a1ULL,
+            0x803d1d8eff772107ULL, 0xd4d4641ca3a7d00aULL, 0x29efeeaa46d6c31dULL, 0x7d0697381a063210ULL,
+            0x712612de1b84079fULL, 0x25cf6b4c4754f692ULL, 0xd8f4e1faa225e585ULL, 0x8c1d9868fef51488ULL,
+            0xb05b5bbcc7c9dd2eULL, 0xe4b2222e9b192c23ULL, 0x1989a8987e683f34ULL, 0x4d60d10a22b8ce39ULL,
+            0x61042f300c11ac78ULL, 0x35ed56a250c15d75ULL, 0xc8d6dc14b5b04e62ULL, 0x9c3fa586e960bf6fULL,
+            0xa0796652d05c76c9ULL, 0xf4901fc08c8c87c4ULL, 0x09ab957669fd94d3ULL, 0x5d42ece4352d65deULL
+        },
+        {
+            0x0000000000000000ULL, 0x3f0be14a916a6dcbULL, 0x7e17c29522d4db96ULL, 0x411c23dfb3beb65dULL,
+            0xfc2f852a45a9b72cULL, 0xc3246460d4c3dae7ULL, 0x823847bf677d6cbaULL, 0xbd33a6f5f6170171ULL,
+            0x6a87a57f245d70ddULL, 0x558c4435b5371d16ULL, 0x149067ea0689ab4bULL, 0x2b9b86a097e3c680ULL,
+            0x96a8205561f4c7f1ULL, 0xa9a3c11ff09eaa3aULL, 0xe8bfe2c043201c67ULL, 0xd7b4038ad24a71acULL,
+            0xd50f4afe48bae1baULL, 0xea04abb4d9d08c71ULL, 0xab18886b6a6e3a2cULL, 0x94136921fb0457e7ULL,
+            0x2920cfd40d135696ULL, 0x162b2e9e9c793b5dULL, 0x57370d412fc78d00ULL, 0x683cec0bbeade0cbULL,
+            0xbf88ef816ce79167ULL, 0x80830ecbfd8dfcacULL, 0xc19f2d144e334af1ULL, 0xfe94cc5edf59273aULL,
+            0x43a76aab294e264bULL, 0x7cac8be1b8244b80ULL, 0x3db0a83e0b9afdddULL, 0x02bb49749af09016ULL,
+            0x38c63ad73e7bddf1ULL, 0x07cddb9daf11b03aULL, 0x46d1f8421caf0667ULL, 0x79da19088dc56bacULL,
+            0xc4e9bffd7bd26addULL, 0xfbe25eb7eab80716ULL, 0xbafe7d685906b14bULL, 0x85f59c22c86cdc80ULL,
+            0x52419fa81a26ad2cULL, 0x6d4a7ee28b4cc0e7ULL, 0x2c565d3d38f276baULL, 0x135dbc77a9981b71ULL,
+            0xae6e1a825f8f1a00ULL, 0x9165fbc8cee577cbULL, 0xd079d8177d5bc196ULL, 0xef72395dec31ac5dULL,
+            0xedc9702976c13c4bULL, 0xd2c29163e7ab5180ULL, 0x93deb2bc5415e7ddULL, 0xacd553f6c57f8a16ULL,
+            0x11e6f50333688b67ULL, 0x2eed1449a202e6acULL, 0x6ff1379611bc50f1ULL, 0x50fad6dc80d63d3aULL,
+            0x874ed556529c4c96ULL, 0xb845341cc3f6215dULL, 0xf95917c370489700ULL, 0xc652f689e122facbULL,
+            0x7b61507c1735fbbaULL, 0x446ab136865f9671ULL, 0x057692e935e1202cULL, 0x3a7d73a3a48b4de7ULL,
+            0x718c75ae7cf7bbe2ULL, 0x4e8794e4ed9dd629ULL, 0x0f9bb73b5e236074ULL, 0x30905671cf490dbfULL,
+            0x8da3f084395e0cceULL, 0xb2a811cea8346105ULL, 0xf3b432111b8ad758ULL, 0xccbfd35b8ae0ba93ULL,
+            0x1b0bd0d158aacb3fULL, 0x2400319bc9c0a6f4ULL, 0x651c12447a7e10a9ULL, 0x5a17f30eeb147d62ULL,
+            0xe72455fb1d037c13ULL, 0xd82fb4b18c6911d8ULL, 0x9933976e3fd7a785ULL, 0xa6387624aebdca4eULL,
+            0xa4833f50344d5a58ULL, 0x9b88de1aa5273793ULL, 0xda94fdc5169981ceULL, 0xe59f1c8f87f3ec05ULL,
+            0x58acba7a71e4ed74ULL, 0x67a75b30e08e80bfULL, 0x26bb78ef533036e2ULL, 0x19b099a5c25a5b29ULL,
+            0xce049a2f10102a85ULL, 0xf10f7b65817a474eULL, 0xb01358ba32c4f113ULL, 0x8f18b9f0a3ae9cd8ULL,
+            0x322b1f0555b99da9ULL, 0x0d20fe4fc4d3f062ULL, 0x4c3cdd90776d463fULL, 0x73373cdae6072bf4ULL,
+            0x494a4f79428c6613ULL, 0x7641ae33d3e60bd8ULL, 0x375d8dec6058bd85ULL, 0x08566ca6f132d04eULL,
+            0xb565ca530725d13fULL, 0x8a6e2b19964fbcf4ULL, 0xcb7208c625f10aa9ULL, 0xf479e98cb49b6762ULL,
+            0x23cdea0666d116ceULL, 0x1cc60b4cf7bb7b05ULL, 0x5dda28934405cd58ULL, 0x62d1c9d9d56fa093ULL,
+            0xdfe26f2c2378a1e2ULL, 0xe0e98e66b212cc29ULL, 0xa1f5adb901ac7a74ULL, 0x9efe4cf390c617bfULL,
+            0x9c4505870a3687a9ULL, 0xa34ee4cd9b5cea62ULL, 0xe252c71228e25c3fULL, 0xdd592658b98831f4ULL,
+            0x606a80ad4f9f3085ULL, 0x5f6161e7def55d4eULL, 0x1e7d42386d4beb13ULL, 0x2176a372fc2186d8ULL,
+            0xf6c2a0f82e6bf774ULL, 0xc9c941b2bf019abfULL, 0x88d5626d0cbf2ce2ULL, 0xb7de83279dd54129ULL,
+            0x0aed25d26bc24058ULL, 0x35e6c498faa82d93ULL, 0x74fae74749169bceULL, 0x4bf1060dd87cf605ULL,
+            0xe318eb5cf9ef77c4ULL, 0xdc130a1668851a0fULL, 0x9d0f29c9db3bac52ULL, 0xa204c8834a51c199ULL,
+            0x1f376e76bc46c0e8ULL, 0x203c8f3c2d2cad23ULL, 0x6120ace39e921b7eULL, 0x5e2b4da90ff876b5ULL,
+            0x899f4e23ddb20719ULL, 0xb694af694cd86ad2ULL, 0xf7888cb6ff66dc8fULL, 0xc8836dfc6e0cb144ULL,
+            0x75b0cb09981bb035ULL, 0x4abb2a430971ddfeULL, 0x0ba7099cbacf6ba3ULL, 0x34ace8d62ba50668ULL,
+            0x3617a1a2b155967eULL, 0x091c40e8203ffbb5ULL, 0x4800633793814de8ULL, 0x770b827d02eb2023ULL,
+            0xca382488f4fc2152ULL, 0xf533c5c265964c99ULL, 0xb42fe61dd628fac4ULL, 0x8b2407574742970fULL,
+            0x5c9004dd9508e6a3ULL, 0x639be59704628b68ULL, 0x2287c648b7dc3d35ULL, 0x1d8c270226b650feULL,
+            0xa0bf81f7d0a1518fULL, 0x9fb460bd41cb3c44ULL, 0xdea84362f2758a19ULL, 0xe1a3a228631fe7d2ULL,
+            0xdbded18bc794aa35ULL, 0xe4d530c156fec7feULL, 0xa5c9131ee54071a3ULL, 0x9ac2f254742a1c68ULL,
+            0x27f154a1823d1d19ULL, 0x18fab5eb135770d2ULL, 0x59e69634a0e9c68fULL, 0x66ed777e3183ab44ULL,
+            0xb15974f4e3c9dae8ULL, 0x8e5295be72a3b723ULL, 0xcf4eb661c11d017eULL, 0xf045572b50776cb5ULL,
+            0x4d76f1dea6606dc4ULL, 0x727d1094370a000fULL, 0x3361334b84b4b652ULL, 0x0c6ad20115dedb99ULL,
+            0x0ed19b758f2e4b8fULL, 0x31da7a3f1e442644ULL, 0x70c659e0adfa9019ULL, 0x4fcdb8aa3c90fdd2ULL,
+            0xf2fe1e5fca87fca3ULL, 0xcdf5ff155bed9168ULL, 0x8ce9dccae8532735ULL, 0xb3e23d8079394afeULL,
+            0x64563e0aab733b52ULL, 0x5b5ddf403a195699ULL, 0x1a41fc9f89a7e0c4ULL, 0x254a1dd518cd8d0fULL,
+            0x9879bb20eeda8c7eULL, 0xa7725a6a7fb0e1b5ULL, 0xe66e79b5cc0e57e8ULL, 0xd96598ff5d643a23ULL,
+            0x92949ef28518cc26ULL, 0xad9f7fb81472a1edULL, 0xec835c67a7cc17b0ULL, 0xd388bd2d36a67a7bULL,
+            0x6ebb1bd8c0b17b0aULL, 0x51b0fa9251db16c1ULL, 0x10acd94de265a09cULL, 0x2fa73807730fcd57ULL,
+            0xf8133b8da145bcfbULL, 0xc718dac7302fd130ULL, 0x8604f9188391676dULL, 0xb90f185212fb0aa6ULL,
+            0x043cbea7e4ec0bd7ULL, 0x3b375fed7586661cULL, 0x7a2b7c32c638d041ULL, 0x45209d785752bd8aULL,
+            0x479bd40ccda22d9cULL, 0x789035465cc84057ULL, 0x398c1699ef76f60aULL, 0x0687f7d37e1c9bc1ULL,
+            0xbbb45126880b9ab0ULL, 0x84bfb06c1961f77bULL, 0xc5a393b3aadf4126ULL, 0xfaa872f93bb52cedULL,
+            0x2d1c7173e9ff5d41ULL, 0x121790397895308aULL, 0x530bb3e6cb2b86d7ULL, 0x6c0052ac5a41eb1cULL,
+            0xd133f459ac56ea6dULL, 0xee3815133d3c87a6ULL, 0xaf2436cc8e8231fbULL, 0x902fd7861fe85c30ULL,
+            0xaa52a425bb6311d7ULL, 0x9559456f2a097c1cULL, 0xd44566b099b7ca41ULL, 0xeb4e87fa08dda78aULL,
+            0x567d210ffecaa6fbULL, 0x6976c0456fa0cb30ULL, 0x286ae39adc1e7d6dULL, 0x176102d04d7410a6ULL,
+            0xc0d5015a9f3e610aULL, 0xffdee0100e540cc1ULL, 0xbec2c3cfbdeaba9cULL, 0x81c922852c80d757ULL,
+            0x3cfa8470da97d626ULL, 0x03f1653a4bfdbbedULL, 0x42ed46e5f8430db0ULL, 0x7de6a7af6929607bULL,
+            0x7f5deedbf3d9f06dULL, 0x40560f9162b39da6ULL, 0x014a2c4ed10d2bfbULL, 0x3e41cd0440674630ULL,
+            0x83726bf1b6704741ULL, 0xbc798abb271a2a8aULL, 0xfd65a96494a49cd7ULL, 0xc26e482e05cef11cULL,
+            0x15da4ba4d78480b0ULL, 0x2ad1aaee46eeed7bULL, 0x6bcd8931f5505b26ULL, 0x54c6687b643a36edULL,
+            0xe9f5ce8e922d379cULL, 0xd6fe2fc403475a57ULL, 0x97e20c1bb0f9ec0aULL, 0xa8e9ed51219381c1ULL
+        },
+        {
+            0x0000000000000000ULL, 0x1dee8a5e222ca1dcULL, 0x3bdd14bc445943b8ULL, 0x26339ee26675e264ULL,
+            0x77ba297888b28770ULL, 0x6a54a326aa9e26acULL, 0x4c673dc4ccebc4c8ULL, 0x5189b79aeec76514ULL,
+            0xef7452f111650ee0ULL, 0xf29ad8af3349af3cULL, 0xd4a9464d553c4d58ULL, 0xc947cc137710ec84ULL,
+            0x98ce7b8999d78990ULL, 0x8520f1d7bbfb284cULL, 0xa3136f35dd8eca28ULL, 0xbefde56bffa26bf4ULL,
+            0x4c300ac98dc40345ULL, 0x51de8097afe8a299ULL, 0x77ed1e75c99d40fdULL, 0x6a03942bebb1e121ULL,
+            0x3b8a23b105768435ULL, 0x2664a9ef275a25e9ULL, 0x0057370d412fc78dULL, 0x1db9bd5363036651ULL,
+            0xa34458389ca10da5ULL, 0xbeaad266be8dac79ULL, 0x98994c84d8f84e1dULL, 0x8577c6dafad4efc1ULL,
+            0xd4fe714014138ad5ULL, 0xc910fb1e363f2b09ULL, 0xef2365fc504ac96dULL, 0xf2cdefa2726668b1ULL,
+            0x986015931b88068aULL, 0x858e9fcd39a4a756ULL, 0xa3bd012f5fd14532ULL, 0xbe538b717dfde4eeULL,
+            0xefda3ceb933a81faULL, 0xf234b6b5b1162026ULL, 0xd4072857d763c242ULL, 0xc9e9a209f54f639eULL,
+            0x771447620aed086aULL, 0x6afacd3c28c1a9b6ULL, 0x4cc953de4eb44bd2ULL, 0x5127d9806c98ea0eULL,
+            0x00ae6e1a825f8f1aULL, 0x1d40e444a0732ec6ULL, 0x3b737aa6c606cca2ULL, 0x269df0f8e42a6d7eULL,
+            0xd4501f5a964c05cfULL, 0xc9be9504b460a413ULL, 0xef8d0be6d2154677ULL, 0xf26381b8f039e7abULL,
+            0xa3ea36221efe82bfULL, 0xbe04bc7c3cd22363ULL, 0x9837229e5aa7c107ULL, 0x85d9a8c0788b60dbULL,
+            0x3b244dab87290b2fULL, 0x26cac7f5a505aaf3ULL, 0x00f95917c3704897ULL, 0x1d17d349e15ce94bULL,
+            0x4c9e64d30f9b8c5fULL, 0x5170ee8d2db72d83ULL, 0x7743706f4bc2cfe7ULL, 0x6aadfa3169ee6e3bULL,
+            0xa218840d981e1391ULL, 0xbff60e53ba32b24dULL, 0x99c590b1dc475029ULL, 0x842b1aeffe6bf1f5ULL,
+            0xd5a2ad7510ac94e1ULL, 0xc84c272b3280353dULL, 0xee7fb9c954f5d759ULL, 0xf391339776d97685ULL,
+            0x4d6cd6fc897b1d71ULL, 0x50825ca2ab57bcadULL, 0x76b1c240cd225ec9ULL, 0x6b5f481eef0eff15ULL,
+            0x3ad6ff8401c99a01ULL, 0x273875da23e53bddULL, 0x010beb384590d9b9ULL, 0x1ce5616667bc7865ULL,
+            0xee288ec415da10d4ULL, 0xf3c6049a37f6b108ULL, 0xd5f59a785183536cULL, 0xc81b102673aff2b0ULL,
+            0x9992a7bc9d6897a4ULL, 0x847c2de2bf443678ULL, 0xa24fb300d931d41cULL, 0xbfa1395efb1d75c0ULL,
+            0x015cdc3504bf1e34ULL, 0x1cb2566b2693bfe8ULL, 0x3a81c88940e65d8cULL, 0x276f42d762cafc50ULL,
+            0x76e6f54d8c0d9944ULL, 0x6b087f13ae213898ULL, 0x4d3be1f1c854dafcULL, 0x50d56bafea787b20ULL,
+            0x3a78919e8396151bULL, 0x27961bc0a1bab4c7ULL, 0x01a58522c7cf56a3ULL, 0x1c4b0f7ce5e3f77fULL,
+            0x4dc2b8e60b24926bULL, 0x502c32b8290833b7ULL, 0x761fac5a4f7dd1d3ULL, 0x6bf126046d51700fULL,
+            0xd50cc36f92f31bfbULL, 0xc8e24931b0dfba27ULL, 0xeed1d7d3d6aa5843ULL, 0xf33f5d8df486f99fULL,
+            0xa2b6ea171a419c8bULL, 0xbf586049386d3d57ULL, 0x996bfeab5e18df33ULL, 0x848574f57c347eefULL,
+            0x76489b570e52165eULL, 0x6ba611092c7eb782ULL, 0x4d958feb4a0b55e6ULL, 0x507b05b56827f43aULL,
+            0x01f2b22f86e0912eULL, 0x1c1c3871a4cc30f2ULL, 0x3a2fa693c2b9d296ULL, 0x27c12ccde095734aULL,
+            0x993cc9a61f3718beULL, 0x84d243f83d1bb962ULL, 0xa2e1dd1a5b6e5b06ULL, 0xbf0f57447942fadaULL,
+            0xee86e0de97859fceULL, 0xf3686a80b5a93e12ULL, 0xd55bf462d3dcdc76ULL, 0xc8b57e3cf1f07daaULL,
+            0xd6e9a7309f3239a7ULL, 0xcb072d6ebd1e987bULL, 0xed34b38cdb6b7a1fULL, 0xf0da39d2f947dbc3ULL,
+            0xa1538e481780bed7ULL, 0xbcbd041635ac1f0bULL, 0x9a8e9af453d9fd6fULL, 0x876010aa71f55cb3ULL,
+            0x399df5c18e573747ULL, 0x24737f9fac7b969bULL, 0x0240e17dca0e74ffULL, 0x1fae6b23e822d523ULL,
+            0x4e27dcb906e5b037ULL, 0x53c956e724c911ebULL, 0x75fac80542bcf38fULL, 0x6814425b60905253ULL,
+            0x9ad9adf912f63ae2ULL, 0x873727a730da9b3eULL, 0xa104b94556af795aULL, 0xbcea331b7483d886ULL,
+            0xed6384819a44bd92ULL, 0xf08d0edfb8681c4eULL, 0xd6be903dde1dfe2aULL, 0xcb501a63fc315ff6ULL,
+            0x75adff0803933402ULL, 0x6843755621bf95deULL, 0x4e70ebb447ca77baULL, 0x539e61ea65e6d666ULL,
+            0x0217d6708b21b372ULL, 0x1ff95c2ea90d12aeULL, 0x39cac2cccf78f0caULL, 0x24244892ed545116ULL,
+            0x4e89b2a384ba3f2dULL, 0x536738fda6969ef1ULL, 0x7554a61fc0e37c95ULL, 0x68ba2c41e2cfdd49ULL,
+            0x39339bdb0c08b85dULL, 0x24dd11852e241981ULL, 0x02ee8f674851fbe5ULL, 0x1f0005396a7d5a39ULL,
+            0xa1fde05295df31cdULL, 0xbc136a0cb7f39011ULL, 0x9a20f4eed1867275ULL, 0x87ce7eb0f3aad3a9ULL,
+            0xd647c92a1d6db6bdULL, 0xcba943743f411761ULL, 0xed9add965934f505ULL, 0xf07457c87b1854d9ULL,
+            0x02b9b86a097e3c68ULL, 0x1f5732342b529db4ULL, 0x3964acd64d277fd0ULL, 0x248a26886f0bde0cULL,
+            0x7503911281ccbb18ULL, 0x68ed1b4ca3e01ac4ULL, 0x4ede85aec595f8a0ULL, 0x53300ff0e7b9597cULL,
+            0xedcdea9b181b3288ULL, 0xf02360c53a379354ULL, 0xd610fe275c427130ULL, 0xcbfe74797e6ed0ecULL,
+            0x9a77c3e390a9b5f8ULL, 0x879949bdb2851424ULL, 0xa1aad75fd4f0f640ULL, 0xbc445d01f6dc579cULL,
+            0x74f1233d072c2a36ULL, 0x691fa96325008beaULL, 0x4f2c37814375698eULL, 0x52c2bddf6159c852ULL,
+            0x034b0a458f9ead46ULL, 0x1ea5801badb20c9aULL, 0x38961ef9cbc7eefeULL, 0x257894a7e9eb4f22ULL,
+            0x9b8571cc164924d6ULL, 0x866bfb923465850aULL, 0xa05865705210676eULL, 0xbdb6ef2e703cc6b2ULL,
+            0xec3f58b49efba3a6ULL, 0xf1d1d2eabcd7027aULL, 0xd7e24c08daa2e01eULL, 0xca0cc656f88e41c2ULL,
+            0x38c129f48ae82973ULL, 0x252fa3aaa8c488afULL, 0x031c3d48ceb16acbULL, 0x1ef2b716ec9dcb17ULL,
+            0x4f7b008c025aae03ULL, 0x52958ad220760fdfULL, 0x74a614304603edbbULL, 0x69489e6e642f4c67ULL,
+            0xd7b57b059b8d2793ULL, 0xca5bf15bb9a1864fULL, 0xec686fb9dfd4642bULL, 0xf186e5e7fdf8c5f7ULL,
+            0xa00f527d133fa0e3ULL, 0xbde1d8233113013fULL, 0x9bd246c15766e35bULL, 0x863ccc9f754a4287ULL,
+            0xec9136ae1ca42cbcULL, 0xf17fbcf03e888d60ULL, 0xd74c221258fd6f04ULL, 0xcaa2a84c7ad1ced8ULL,
+            0x9b2b1fd69416abccULL, 0x86c59588b63a0a10ULL, 0xa0f60b6ad04fe874ULL, 0xbd188134f26349a8ULL,
+            0x03e5645f0dc1225cULL, 0x1e0bee012fed8380ULL, 0x383870e3499861e4ULL, 0x25d6fabd6bb4c038ULL,
+            0x745f4d278573a52cULL, 0x69b1c779a75f04f0ULL, 0x4f82599bc12ae694ULL, 0x526cd3c5e3064748ULL,
+            0xa0a13c6791602ff9ULL, 0xbd4fb639b34c8e25ULL, 0x9b7c28dbd5396c41ULL, 0x8692a285f715cd9dULL,
+            0xd71b151f19d2a889ULL, 0xcaf59f413bfe0955ULL, 0xecc601a35d8beb31ULL, 0xf1288bfd7fa74aedULL,
+            0x4fd56e9680052119ULL, 0x523be4c8a22980c5ULL, 0x74087a2ac45c62a1ULL, 0x69e6f074e670c37dULL,
+            0x386f47ee08b7a669ULL, 0x2581cdb02a9b07b5ULL, 0x03b253524ceee5d1ULL, 0x1e5cd90c6ec2440dULL
+        },
+        {
+            0x0000000000000000ULL, 0x5c2d776033c4205eULL, 0xb85aeec0678840bcULL, 0xe47799a0544c60e2ULL,
+            0xe26d72ab601e9ffdULL, 0xbe4005cb53dabfa3ULL, 0x5a379c6b0796df41ULL, 0x061aeb0b3452ff1fULL,
+            0x56024a7d6f33217fULL, 0x0a2f3d1d5cf70121ULL, 0xee58a4bd08bb61c3ULL, 0xb275d3dd3b7f419dULL,
+            0xb46f38d60f2dbe82ULL, 0xe8424fb63ce99edcULL, 0x0c35d61668a5fe3eULL, 0x5018a1765b61de60ULL,
+            0xac0494fade6642feULL, 0xf029e39aeda262a0ULL, 0x145e7a3ab9ee0242ULL, 0x48730d5a8a2a221cULL,
+            0x4e69e651be78dd03ULL, 0x124491318dbcfd5dULL, 0xf6330891d9f09dbfULL, 0xaa1e7ff1ea34bde1ULL,
+            0xfa06de87b1556381ULL, 0xa62ba9e7829143dfULL, 0x425c3047d6dd233dULL, 0x1e714727e5190363ULL,
+            0x186bac2cd14bfc7cULL, 0x4446db4ce28fdc22ULL, 0xa03142ecb6c3bcc0ULL, 0xfc1c358c85079c9eULL,
+            0xcad186de13c29b79ULL, 0x96fcf1be2006bb27ULL, 0x728b681e744adbc5ULL, 0x2ea61f7e478efb9bULL,
+            0x28bcf47573dc0484ULL, 0x74918315401824daULL, 0x90e61ab514544438ULL, 0xcccb6dd527906466ULL,
+            0x9cd3cca37cf1ba06ULL, 0xc0febbc34f359a58ULL, 0x248922631b79fabaULL, 0x78a4550328bddae4ULL,
+            0x7ebebe081cef25fbULL, 0x2293c9682f2b05a5ULL, 0xc6e450c87b676547ULL, 0x9ac927a848a34519ULL,
+            0x66d51224cda4d987ULL, 0x3af86544fe60f9d9ULL, 0xde8ffce4aa2c993bULL, 0x82a28b8499e8b965ULL,
+            0x84b8608fadba467aULL, 0xd89517ef9e7e6624ULL, 0x3ce28e4fca3206c6ULL, 0x60cff92ff9f62698ULL,
+            0x30d75859a297f8f8ULL, 0x6cfa2f399153d8a6ULL, 0x888db699c51fb844ULL, 0xd4a0c1f9f6db981aULL,
+            0xd2ba2af2c2896705ULL, 0x8e975d92f14d475bULL, 0x6ae0c432a50127b9ULL, 0x36cdb35296c507e7ULL,
+            0x077ba297888b2877ULL, 0x5b56d5f7bb4f0829ULL, 0xbf214c57ef0368cbULL, 0xe30c3b37dcc74895ULL,
+            0xe516d03ce895b78aULL, 0xb93ba75cdb5197d4ULL, 0x5d4c3efc8f1df736ULL, 0x0161499cbcd9d768ULL,
+            0x5179e8eae7b80908ULL, 0x0d549f8ad47c2956ULL, 0xe923062a803049b4ULL, 0xb50e714ab3f469eaULL,
+            0xb3149a4187a696f5ULL, 0xef39ed21b462b6abULL, 0x0b4e7481e02ed649ULL, 0x576303e1d3eaf617ULL,
+            0xab7f366d56ed6a89ULL, 0xf752410d65294ad7ULL, 0x1325d8ad31652a35ULL, 0x4f08afcd02a10a6bULL,
+            0x491244c636f3f574ULL, 0x153f33a60537d52aULL, 0xf148aa06517bb5c8ULL, 0xad65dd6662bf9596ULL,
+            0xfd7d7c1039de4bf6ULL, 0xa1500b700a1a6ba8ULL, 0x452792d05e560b4aULL, 0x190ae5b06d922b14ULL,
+            0x1f100ebb59c0d40bULL, 0x433d79db6a04f455ULL, 0xa74ae07b3e4894b7ULL, 0xfb67971b0d8cb4e9ULL,
+            0xcdaa24499b49b30eULL, 0x91875329a88d9350ULL, 0x75f0ca89fcc1f3b2ULL, 0x29ddbde9cf05d3ecULL,
+            0x2fc756e2fb572cf3ULL, 0x73ea2182c8930cadULL, 0x979db8229cdf6c4fULL, 0xcbb0cf42af1b4c11ULL,
+            0x9ba86e34f47a9271ULL, 0xc7851954c7beb22fULL, 0x23f280f493f2d2cdULL, 0x7fdff794a036f293ULL,
+            0x79c51c9f94640d8cULL, 0x25e86bffa7a02dd2ULL, 0xc19ff25ff3ec4d30ULL, 0x9db2853fc0286d6eULL,
+            0x61aeb0b3452ff1f0ULL, 0x3d83c7d376ebd1aeULL, 0xd9f45e7322a7b14cULL, 0x85d9291311639112ULL,
+            0x83c3c21825316e0dULL, 0xdfeeb57816f54e53ULL, 0x3b992cd842b92eb1ULL, 0x67b45bb8717d0eefULL,
+            0x37acface2a1cd08fULL, 0x6b818dae19d8f0d1ULL, 0x8ff6140e4d949033ULL, 0xd3db636e7e50b06dULL,
+            0xd5c188654a024f72ULL, 0x89ecff0579c66f2cULL, 0x6d9b66a52d8a0fceULL, 0x31b611c51e4e2f90ULL,
+            0x0ef7452f111650eeULL, 0x52da324f22d270b0ULL, 0xb6adabef769e1052ULL, 0xea80dc8f455a300cULL,
+            0xec9a37847108cf13ULL, 0xb0b740e442ccef4dULL, 0x54c0d94416808fafULL, 0x08edae242544aff1ULL,
+            0x58f50f527e257191ULL, 0x04d878324de151cfULL, 0xe0afe19219ad312dULL, 0xbc8296f22a691173ULL,
+            0xba987df91e3bee6cULL, 0xe6b50a992dffce32ULL, 0x02c2933979b3aed0ULL, 0x5eefe4594a778e8eULL,
+            0xa2f3d1d5cf701210ULL, 0xfedea6b5fcb4324eULL, 0x1aa93f15a8f852acULL, 0x468448759b3c72f2ULL,
+            0x409ea37eaf6e8dedULL, 0x1cb3d41e9caaadb3ULL, 0xf8c44dbec8e6cd51ULL, 0xa4e93adefb22ed0fULL,
+            0xf4f19ba8a043336fULL, 0xa8dcecc893871331ULL, 0x4cab7568c7cb73d3ULL, 0x10860208f40f538dULL,
+            0x169ce903c05dac92ULL, 0x4ab19e63f3998cccULL, 0xaec607c3a7d5ec2eULL, 0xf2eb70a39411cc70ULL,
+            0xc426c3f102d4cb97ULL, 0x980bb4913110ebc9ULL, 0x7c7c2d31655c8b2bULL, 0x20515a515698ab75ULL,
+            0x264bb15a62ca546aULL, 0x7a66c63a510e7434ULL, 0x9e115f9a054214d6ULL, 0xc23c28fa36863488ULL,
+            0x9224898c6de7eae8ULL, 0xce09feec5e23cab6ULL, 0x2a7e674c0a6faa54ULL, 0x7653102c39ab8a0aULL,
+            0x7049fb270df97515ULL, 0x2c648c473e3d554bULL, 0xc81315e76a7135a9ULL, 0x943e628759b515f7ULL,
+            0x6822570bdcb28969ULL, 0x340f206bef76a937ULL, 0xd078b9cbbb3ac9d5ULL, 0x8c55ceab88fee98bULL,
+            0x8a4f25a0bcac1694ULL, 0xd66252c08f6836caULL, 0x3215cb60db245628ULL, 0x6e38bc00e8e07676ULL,
+            0x3e201d76b381a816ULL, 0x620d6a1680458848ULL, 0x867af3b6d409e8aaULL, 0xda5784d6e7cdc8f4ULL,
+            0xdc4d6fddd39f37ebULL, 0x806018bde05b17b5ULL, 0x6417811db4177757ULL, 0x383af67d87d35709ULL,
+            0x098ce7b8999d7899ULL, 0x55a190d8aa5958c7ULL, 0xb1d60978fe153825ULL, 0xedfb7e18cdd1187bULL,
+            0xebe19513f983e764ULL, 0xb7cce273ca47c73aULL, 0x53bb7bd39e0ba7d8ULL, 0x0f960cb3adcf8786ULL,
+            0x5f8eadc5f6ae59e6ULL, 0x03a3daa5c56a79b8ULL, 0xe7d443059126195aULL, 0xbbf93465a2e23904ULL,
+            0xbde3df6e96b0c61bULL, 0xe1cea80ea574e645ULL, 0x05b931aef13886a7ULL, 0x599446cec2fca6f9ULL,
+            0xa588734247fb3a67ULL, 0xf9a50422743f1a39ULL, 0x1dd29d8220737adbULL, 0x41ffeae213b75a85ULL,
+            0x47e501e927e5a59aULL, 0x1bc87689142185c4ULL, 0xffbfef29406de526ULL, 0xa392984973a9c578ULL,
+            0xf38a393f28c81b18ULL, 0xafa74e5f1b0c3b46ULL, 0x4bd0d7ff4f405ba4ULL, 0x17fda09f7c847bfaULL,
+            0x11e74b9448d684e5ULL, 0x4dca3cf47b12a4bbULL, 0xa9bda5542f5ec459ULL, 0xf590d2341c9ae407ULL,
+            0xc35d61668a5fe3e0ULL, 0x9f701606b99bc3beULL, 0x7b078fa6edd7a35cULL, 0x272af8c6de138302ULL,
+            0x213013cdea417c1dULL, 0x7d1d64add9855c43ULL, 0x996afd0d8dc93ca1ULL, 0xc5478a6dbe0d1cffULL,
+            0x955f2b1be56cc29fULL, 0xc9725c7bd6a8e2c1ULL, 0x2d05c5db82e48223ULL, 0x7128b2bbb120a27dULL,
+            0x773259b085725d62ULL, 0x2b1f2ed0b6b67d3cULL, 0xcf68b770e2fa1ddeULL, 0x9345c010d13e3d80ULL,
+            0x6f59f59c5439a11eULL, 0x337482fc67fd8140ULL, 0xd7031b5c33b1e1a2ULL, 0x8b2e6c3c0075c1fcULL,
+            0x8d34873734273ee3ULL, 0xd119f05707e31ebdULL, 0x356e69f753af7e5fULL, 0x69431e97606b5e01ULL,
+            0x395bbfe13b0a8061ULL, 0x6576c88108cea03fULL, 0x810151215c82c0ddULL, 0xdd2c26416f46e083ULL,
+            0xdb36cd4a5b141f9cULL, 0x871bba2a68d03fc2ULL, 0x636c238a3c9c5f20ULL, 0x3f4154ea0f587f7eULL
+        },
+        {
+            0x0000000000000000ULL, 0x6184d55f721267c6ULL, 0xc309aabee424cf8cULL, 0xa28d7fe19636a84aULL,
+            0x14cbfa566747819dULL, 0x754f2f091555e65bULL, 0xd7c250e883634e11ULL, 0xb64685b7f17129d7ULL,
+            0x2997f4acce8f033aULL, 0x481321f3bc9d64fcULL, 0xea9e5e122aabccb6ULL, 0x8b1a8b4d58b9ab70ULL,
+            0x3d5c0efaa9c882a7ULL, 0x5cd8dba5dbdae561ULL, 0xfe55a4444dec4d2bULL, 0x9fd1711b3ffe2aedULL,
+            0x532fe9599d1e0674ULL, 0x32ab3c06ef0c61b2ULL, 0x902643e7793ac9f8ULL, 0xf1a296b80b28ae3eULL,
+            0x47e4130ffa5987e9ULL, 0x2660c650884be02fULL, 0x84edb9b11e7d4865ULL, 0xe5696cee6c6f2fa3ULL,
+            0x7ab81df55391054eULL, 0x1b3cc8aa21836288ULL, 0xb9b1b74bb7b5cac2ULL, 0xd8356214c5a7ad04ULL,
+            0x6e73e7a334d684d3ULL, 0x0ff732fc46c4e315ULL, 0xad7a4d1dd0f24b5fULL, 0xccfe9842a2e02c99ULL,
+            0xa65fd2b33a3c0ce8ULL, 0xc7db07ec482e6b2eULL, 0x6556780dde18c364ULL, 0x04d2ad52ac0aa4a2ULL,
+            0xb29428e55d7b8d75ULL, 0xd310fdba2f69eab3ULL, 0x719d825bb95f42f9ULL, 0x10195704cb4d253fULL,
+            0x8fc8261ff4b30fd2ULL, 0xee4cf34086a16814ULL, 0x4cc18ca11097c05eULL, 0x2d4559fe6285a798ULL,
+            0x9b03dc4993f48e4fULL, 0xfa870916e1e6e989ULL, 0x580a76f777d041c3ULL, 0x398ea3a805c22605ULL,
+            0xf5703beaa7220a9cULL, 0x94f4eeb5d5306d5aULL, 0x367991544306c510ULL, 0x57fd440b3114a2d6ULL,
+            0xe1bbc1bcc0658b01ULL, 0x803f14e3b277ecc7ULL, 0x22b26b022441448dULL, 0x4336be5d5653234bULL,
+            0xdce7cf4669ad09a6ULL, 0xbd631a191bbf6e60ULL, 0x1fee65f88d89c62aULL, 0x7e6ab0a7ff9ba1ecULL,
+            0xc82c35100eea883bULL, 0xa9a8e04f7cf8effdULL, 0x0b259faeeace47b7ULL, 0x6aa14af198dc2071ULL,
+            0xde670a4ddb760755ULL, 0xbfe3df12a9646093ULL, 0x1d6ea0f33f52c8d9ULL, 0x7cea75ac4d40af1fULL,
+            0xcaacf01bbc3186c8ULL, 0xab282544ce23e10eULL, 0x09a55aa558154944ULL, 0x68218ffa2a072e82ULL,
+            0xf7f0fee115f9046fULL, 0x96742bbe67eb63a9ULL, 0x34f9545ff1ddcbe3ULL, 0x557d810083cfac25ULL,
+            0xe33b04b772be85f2ULL, 0x82bfd1e800ace234ULL, 0x2032ae09969a4a7eULL, 0x41b67b56e4882db8ULL,
+            0x8d48e31446680121ULL, 0xeccc364b347a66e7ULL, 0x4e4149aaa24cceadULL, 0x2fc59cf5d05ea96bULL,
+            0x99831942212f80bcULL, 0xf807cc1d533de77aULL, 0x5a8ab3fcc50b4f30ULL, 0x3b0e66a3b71928f6ULL,
+            0xa4df17b888e7021bULL, 0xc55bc2e7faf565ddULL, 0x67d6bd066cc3cd97ULL, 0x065268591ed1aa51ULL,
+            0xb014edeeefa08386ULL, 0xd19038b19db2e440ULL, 0x731d47500b844c0aULL, 0x1299920f79962bccULL,
+            0x7838d8fee14a0bbdULL, 0x19bc0da193586c7bULL, 0xbb317240056ec431ULL, 0xdab5a71f777ca3f7ULL,
+            0x6cf322a8860d8a20ULL, 0x0d77f7f7f41fede6ULL, 0xaffa8816622945acULL, 0xce7e5d49103b226aULL,
+            0x51af2c522fc50887ULL, 0x302bf90d5dd76f41ULL, 0x92a686eccbe1c70bULL, 0xf32253b3b9f3a0cdULL,
+            0x4564d6044882891aULL, 0x24e0035b3a90eedcULL, 0x866d7cbaaca64696ULL, 0xe7e9a9e5deb42150ULL,
+            0x2b1731a77c540dc9ULL, 0x4a93e4f80e466a0fULL, 0xe81e9b199870c245ULL, 0x899a4e46ea62a583ULL,
+            0x3fdccbf11b138c54ULL, 0x5e581eae6901eb92ULL, 0xfcd5614fff3743d8ULL, 0x9d51b4108d25241eULL,
+            0x0280c50bb2db0ef3ULL, 0x63041054c0c96935ULL, 0xc1896fb556ffc17fULL, 0xa00dbaea24eda6b9ULL,
+            0x164b3f5dd59c8f6eULL, 0x77cfea02a78ee8a8ULL, 0xd54295e331b840e2ULL, 0xb4c640bc43aa2724ULL,
+            0x2e16bbb019e2102fULL, 0x4f926eef6bf077e9ULL, 0xed1f110efdc6dfa3ULL, 0x8c9bc4518fd4b865ULL,
+            0x3add41e67ea591b2ULL, 0x5b5994b90cb7f674ULL, 0xf9d4eb589a815e3eULL, 0x98503e07e89339f8ULL,
+            0x07814f1cd76d1315ULL, 0x66059a43a57f74d3ULL, 0xc488e5a23349dc99ULL, 0xa50c30fd415bbb5fULL,
+            0x134ab54ab02a9288ULL, 0x72ce6015c238f54eULL, 0xd0431ff4540e5d04ULL, 0xb1c7caab261c3ac2ULL,
+            0x7d3952e984fc165bULL, 0x1cbd87b6f6ee719dULL, 0xbe30f85760d8d9d7ULL, 0xdfb42d0812cabe11ULL,
+            0x69f2a8bfe3bb97c6ULL, 0x08767de091a9f000ULL, 0xaafb0201079f584aULL, 0xcb7fd75e758d3f8cULL,
+            0x54aea6454a731561ULL, 0x352a731a386172a7ULL, 0x97a70cfbae57daedULL, 0xf623d9a4dc45bd2bULL,
+            0x40655c132d3494fcULL, 0x21e1894c5f26f33aULL, 0x836cf6adc9105b70ULL, 0xe2e823f2bb023cb6ULL,
+            0x8849690323de1cc7ULL, 0xe9cdbc5c51cc7b01ULL, 0x4b40c3bdc7fad34bULL, 0x2ac416e2b5e8b48dULL,
+            0x9c82935544999d5aULL, 0xfd06460a368bfa9cULL, 0x5f8b39eba0bd52d6ULL, 0x3e0fecb4d2af3510ULL,
+            0xa1de9dafed511ffdULL, 0xc05a48f09f43783bULL, 0x62d737110975d071ULL, 0x0353e24e7b67b7b7ULL,
+            0xb51567f98a169e60ULL, 0xd491b2a6f804f9a6ULL, 0x761ccd476e3251ecULL, 0x179818181c20362aULL,
+            0xdb66805abec01ab3ULL, 0xbae25505ccd27d75ULL, 0x186f2ae45ae4d53fULL, 0x79ebffbb28f6b2f9ULL,
+            0xcfad7a0cd9879b2eULL, 0xae29af53ab95fce8ULL, 0x0ca4d0b23da354a2ULL, 0x6d2005ed4fb13364ULL,
+            0xf2f174f6704f1989ULL, 0x9375a1a9025d7e4fULL, 0x31f8de48946bd605ULL, 0x507c0b17e679b1c3ULL,
+            0xe63a8ea017089814ULL, 0x87be5bff651affd2ULL, 0x2533241ef32c5798ULL, 0x44b7f141813e305eULL,
+            0xf071b1fdc294177aULL, 0x91f564a2b08670bcULL, 0x33781b4326b0d8f6ULL, 0x52fcce1c54a2bf30ULL,
+            0xe4ba4baba5d396e7ULL, 0x853e9ef4d7c1f121ULL, 0x27b3e11541f7596bULL, 0x4637344a33e53eadULL,
+            0xd9e645510c1b1440ULL, 0xb862900e7e097386ULL, 0x1aefefefe83fdbccULL, 0x7b6b3ab09a2dbc0aULL,
+            0xcd2dbf076b5c95ddULL, 0xaca96a58194ef21bULL, 0x0e2415b98f785a51ULL, 0x6fa0c0e6fd6a3d97ULL,
+            0xa35e58a45f8a110eULL, 0xc2da8dfb2d9876c8ULL, 0x6057f21abbaede82ULL, 0x01d32745c9bcb944ULL,
+            0xb795a2f238cd9093ULL, 0xd61177ad4adff755ULL, 0x749c084cdce95f1fULL, 0x1518dd13aefb38d9ULL,
+            0x8ac9ac0891051234ULL, 0xeb4d7957e31775f2ULL, 0x49c006b67521ddb8ULL, 0x2844d3e90733ba7eULL,
+            0x9e02565ef64293a9ULL, 0xff8683018450f46fULL, 0x5d0bfce012665c25ULL, 0x3c8f29bf60743be3ULL,
+            0x562e634ef8a81b92ULL, 0x37aab6118aba7c54ULL, 0x9527c9f01c8cd41eULL, 0xf4a31caf6e9eb3d8ULL,
+            0x42e599189fef9a0fULL, 0x23614c47edfdfdc9ULL, 0x81ec33a67bcb5583ULL, 0xe068e6f909d93245ULL,
+            0x7fb997e2362718a8ULL, 0x1e3d42bd44357f6eULL, 0xbcb03d5cd203d724ULL, 0xdd34e803a011b0e2ULL,
+            0x6b726db451609935ULL, 0x0af6b8eb2372fef3ULL, 0xa87bc70ab54456b9ULL, 0xc9ff1255c756317fULL,
+            0x05018a1765b61de6ULL, 0x64855f4817a47a20ULL, 0xc60820a98192d26aULL, 0xa78cf5f6f380b5acULL,
+            0x11ca704102f19c7bULL, 0x704ea51e70e3fbbdULL, 0xd2c3daffe6d553f7ULL, 0xb3470fa094c73431ULL,
+            0x2c967ebbab391edcULL, 0x4d12abe4d92b791aULL, 0xef9fd4054f1dd150ULL, 0x8e1b015a3d0fb696ULL,
+            0x385d84edcc7e9f41ULL, 0x59d951b2be6cf887ULL, 0xfb542e53285a50cdULL, 0x9ad0fb0c5a48370bULL
+        },
+        {
+            0x0000000000000000ULL, 0x22ef0d5934f964ecULL, 0x45de1ab269f2c9d8ULL, 0x673117eb5d0bad34ULL,
+            0x8bbc3564d3e593b0ULL, 0xa953383de71cf75cULL, 0xce622fd6ba175a68ULL, 0xec8d228f8eee3e84ULL,
+            0x85a0c5e208c539e5ULL, 0xa74fc8bb3c3c5d09ULL, 0xc07edf506137f03dULL, 0xe291d20955ce94d1ULL,
+            0x0e1cf086db20aa55ULL, 0x2cf3fddfefd9ceb9ULL, 0x4bc2ea34b2d2638dULL, 0x692de76d862b0761ULL,
+            0x999924efbe846d4fULL, 0xbb7629b68a7d09a3ULL, 0xdc473e5dd776a497ULL, 0xfea83304e38fc07bULL,
+            0x1225118b6d61feffULL, 0x30ca1cd259989a13ULL, 0x57fb0b3904933727ULL, 0x75140660306a53cbULL,
+            0x1c39e10db64154aaULL, 0x3ed6ec5482b83046ULL, 0x59e7fbbfdfb39d72ULL, 0x7b08f6e6eb4af99eULL,
+            0x9785d46965a4c71aULL, 0xb56ad930515da3f6ULL, 0xd25bcedb0c560ec2ULL, 0xf0b4c38238af6a2eULL,
+            0xa1eae6f4d206c41bULL, 0x8305ebade6ffa0f7ULL, 0xe434fc46bbf40dc3ULL, 0xc6dbf11f8f0d692fULL,
+            0x2a56d39001e357abULL, 0x08b9dec9351a3347ULL, 0x6f88c92268119e73ULL, 0x4d67c47b5ce8fa9fULL,
+            0x244a2316dac3fdfeULL, 0x06a52e4fee3a9912ULL, 0x619439a4b3313426ULL, 0x437b34fd87c850caULL,
+            0xaff6167209266e4eULL, 0x8d191b2b3ddf0aa2ULL, 0xea280cc060d4a796ULL, 0xc8c70199542dc37aULL,
+            0x3873c21b6c82a954ULL, 0x1a9ccf42587bcdb8ULL, 0x7dadd8a90570608cULL, 0x5f42d5f031890460ULL,
+            0xb3cff77fbf673ae4ULL, 0x9120fa268b9e5e08ULL, 0xf611edcdd695f33cULL, 0xd4fee094e26c97d0ULL,
+            0xbdd307f9644790b1ULL, 0x9f3c0aa050bef45dULL, 0xf80d1d4b0db55969ULL, 0xdae21012394c3d85ULL,
+            0x366f329db7a20301ULL, 0x14803fc4835b67edULL, 0x73b1282fde50cad9ULL, 0x515e2576eaa9ae35ULL,
+            0xd10d62c20b0396b3ULL, 0xf3e26f9b3ffaf25fULL, 0x94d3787062f15f6bULL, 0xb63c752956083b87ULL,
+            0x5ab157a6d8e60503ULL, 0x785e5affec1f61efULL, 0x1f6f4d14b114ccdbULL, 0x3d80404d85eda837ULL,
+            0x54ada72003c6af56ULL, 0x7642aa79373fcbbaULL, 0x1173bd926a34668eULL, 0x339cb0cb5ecd0262ULL,
+            0xdf119244d0233ce6ULL, 0xfdfe9f1de4da580aULL, 0x9acf88f6b9d1f53eULL, 0xb82085af8d2891d2ULL,
+            0x4894462db587fbfcULL, 0x6a7b4b74817e9f10ULL, 0x0d4a5c9fdc753224ULL, 0x2fa551c6e88c56c8ULL,
+            0xc32873496662684cULL, 0xe1c77e10529b0ca0ULL, 0x86f669fb0f90a194ULL, 0xa41964a23b69c578ULL,
+            0xcd3483cfbd42c219ULL, 0xefdb8e9689bba6f5ULL, 0x88ea997dd4b00bc1ULL, 0xaa059424e0496f2dULL,
+            0x4688b6ab6ea751a9ULL, 0x6467bbf25a5e3545ULL, 0x0356ac1907559871ULL, 0x21b9a14033acfc9dULL,
+            0x70e78436d90552a8ULL, 0x5208896fedfc3644ULL, 0x35399e84b0f79b70ULL, 0x17d693dd840eff9cULL,
+            0xfb5bb1520ae0c118ULL, 0xd9b4bc0b3e19a5f4ULL, 0xbe85abe0631208c0ULL, 0x9c6aa6b957eb6c2cULL,
+            0xf54741d4d1c06b4dULL, 0xd7a84c8de5390fa1ULL, 0xb0995b66b832a295ULL, 0x9276563f8ccbc679ULL,
+            0x7efb74b00225f8fdULL, 0x5c1479e936dc9c11ULL, 0x3b256e026bd73125ULL, 0x19ca635b5f2e55c9ULL,
+            0xe97ea0d967813fe7ULL, 0xcb91ad8053785b0bULL, 0xaca0ba6b0e73f63fULL, 0x8e4fb7323a8a92d3ULL,
+            0x62c295bdb464ac57ULL, 0x402d98e4809dc8bbULL, 0x271c8f0fdd96658fULL, 0x05f38256e96f0163ULL,
+            0x6cde653b6f440602ULL, 0x4e3168625bbd62eeULL, 0x29007f8906b6cfdaULL, 0x0bef72d0324fab36ULL,
+            0xe762505fbca195b2ULL, 0xc58d5d068858f15eULL, 0xa2bc4aedd5535c6aULL, 0x805347b4e1aa3886ULL,
+            0x30c26aafb90933e3ULL, 0x122d67f68df0570fULL, 0x751c701dd0fbfa3bULL, 0x57f37d44e4029ed7ULL,
+            0xbb7e5fcb6aeca053ULL, 0x999152925e15c4bfULL, 0xfea04579031e698bULL, 0xdc4f482037e70d67ULL,
+            0xb562af4db1cc0a06ULL, 0x978da21485356eeaULL, 0xf0bcb5ffd83ec3deULL, 0xd253b8a6ecc7a732ULL,
+            0x3ede9a29622999b6ULL, 0x1c31977056d0fd5aULL, 0x7b00809b0bdb506eULL, 0x59ef8dc23f223482ULL,
+            0xa95b4e40078d5eacULL, 0x8bb4431933743a40ULL, 0xec8554f26e7f9774ULL, 0xce6a59ab5a86f398ULL,
+            0x22e77b24d468cd1cULL, 0x0008767de091a9f0ULL, 0x67396196bd9a04c4ULL, 0x45d66ccf89636028ULL,
+            0x2cfb8ba20f486749ULL, 0x0e1486fb3bb103a5ULL, 0x6925911066baae91ULL, 0x4bca9c495243ca7dULL,
+            0xa747bec6dcadf4f9ULL, 0x85a8b39fe8549015ULL, 0xe299a474b55f3d21ULL, 0xc076a92d81a659cdULL,
+            0x91288c5b6b0ff7f8ULL, 0xb3c781025ff69314ULL, 0xd4f696e902fd3e20ULL, 0xf6199bb036045accULL,
+            0x1a94b93fb8ea6448ULL, 0x387bb4668c1300a4ULL, 0x5f4aa38dd118ad90ULL, 0x7da5aed4e5e1c97cULL,
+            0x148849b963cace1dULL, 0x366744e05733aaf1ULL, 0x5156530b0a3807c5ULL, 0x73b95e523ec16329ULL,
+            0x9f347cddb02f5dadULL, 0xbddb718484d63941ULL, 0xdaea666fd9dd9475ULL, 0xf8056b36ed24f099ULL,
+            0x08b1a8b4d58b9ab7ULL, 0x2a5ea5ede172fe5bULL, 0x4d6fb206bc79536fULL, 0x6f80bf5f88803783ULL,
+            0x830d9dd0066e0907ULL, 0xa1e2908932976debULL, 0xc6d387626f9cc0dfULL, 0xe43c8a3b5b65a433ULL,
+            0x8d116d56dd4ea352ULL, 0xaffe600fe9b7c7beULL, 0xc8cf77e4b4bc6a8aULL, 0xea207abd80450e66ULL,
+            0x06ad58320eab30e2ULL, 0x2442556b3a52540eULL, 0x437342806759f93aULL, 0x619c4fd953a09dd6ULL,
+            0xe1cf086db20aa550ULL, 0xc320053486f3c1bcULL, 0xa41112dfdbf86c88ULL, 0x86fe1f86ef010864ULL,
+            0x6a733d0961ef36e0ULL, 0x489c30505516520cULL, 0x2fad27bb081dff38ULL, 0x0d422ae23ce49bd4ULL,
+            0x646fcd8fbacf9cb5ULL, 0x4680c0d68e36f859ULL, 0x21b1d73dd33d556dULL, 0x035eda64e7c43181ULL,
+            0xefd3f8eb692a0f05ULL, 0xcd3cf5b25dd36be9ULL, 0xaa0de25900d8c6ddULL, 0x88e2ef003421a231ULL,
+            0x78562c820c8ec81fULL, 0x5ab921db3877acf3ULL, 0x3d883630657c01c7ULL, 0x1f673b695185652bULL,
+            0xf3ea19e6df6b5bafULL, 0xd10514bfeb923f43ULL, 0xb6340354b6999277ULL, 0x94db0e0d8260f69bULL,
+            0xfdf6e960044bf1faULL, 0xdf19e43930b29516ULL, 0xb828f3d26db93822ULL, 0x9ac7fe8b59405cceULL,
+            0x764adc04d7ae624aULL, 0x54a5d15de35706a6ULL, 0x3394c6b6be5cab92ULL, 0x117bcbef8aa5cf7eULL,
+            0x4025ee99600c614bULL, 0x62cae3c054f505a7ULL, 0x05fbf42b09fea893ULL, 0x2714f9723d07cc7fULL,
+            0xcb99dbfdb3e9f2fbULL, 0xe976d6a487109617ULL, 0x8e47c14fda1b3b23ULL, 0xaca8cc16eee25fcfULL,
+            0xc5852b7b68c958aeULL, 0xe76a26225c303c42ULL, 0x805b31c9013b9176ULL, 0xa2b43c9035c2f59aULL,
+            0x4e391e1fbb2ccb1eULL, 0x6cd613468fd5aff2ULL, 0x0be704add2de02c6ULL, 0x290809f4e627662aULL,
+            0xd9bcca76de880c04ULL, 0xfb53c72fea7168e8ULL, 0x9c62d0c4b77ac5dcULL, 0xbe8ddd9d8383a130ULL,
+            0x5200ff120d6d9fb4ULL, 0x70eff24b3994fb58ULL, 0x17dee5a0649f566cULL, 0x3531e8f950663280ULL,
+            0x5c1c0f94d64d35e1ULL, 0x7ef302cde2b4510dULL, 0x19c21526bfbffc39ULL, 0x3b2d187f8b4698d5ULL,
+            0xd7a03af005a8a651ULL, 0xf54f37a93151c2bdULL, 0x927e20426c5a6f89ULL, 0xb0912d1b58a30b65ULL
+        },
+        {
+            0x0000000000000000ULL, 0xdabe95afc7875f40ULL, 0x27a584742000a005ULL, 0xfd1b11dbe787ff45ULL,
+            0x4f4b08e84001400aULL, 0x95f59d4787861f4aULL, 0x68ee8c9c6001e00fULL, 0xb2501933a786bf4fULL,
+            0x9e9611d080028014ULL, 0x4428847f4785df54ULL, 0xb93395a4a0022011ULL, 0x638d000b67857f51ULL,
+            0xd1dd1938c003c01eULL, 0x0b638c9707849f5eULL, 0xf6789d4ce003601bULL, 0x2cc608e327843f5bULL,
+            0xaff48c8aaf0b1eadULL, 0x754a1925688c41edULL, 0x885108fe8f0bbea8ULL, 0x52ef9d51488ce1e8ULL,
+            0xe0bf8462ef0a5ea7ULL, 0x3a0111cd288d01e7ULL, 0xc71a0016cf0afea2ULL, 0x1da495b9088da1e2ULL,
+            0x31629d5a2f099eb9ULL, 0xebdc08f5e88ec1f9ULL, 0x16c7192e0f093ebcULL, 0xcc798c81c88e61fcULL,
+            0x7e2995b26f08deb3ULL, 0xa497001da88f81f3ULL, 0x598c11c64f087eb6ULL, 0x83328469888f21f6ULL,
+            0xcd31b63ef11823dfULL, 0x178f2391369f7c9fULL, 0xea94324ad11883daULL, 0x302aa7e5169fdc9aULL,
+            0x827abed6b11963d5ULL, 0x58c42b79769e3c95ULL, 0xa5df3aa29119c3d0ULL, 0x7f61af0d569e9c90ULL,
+            0x53a7a7ee711aa3cbULL, 0x89193241b69dfc8bULL, 0x7402239a511a03ceULL, 0xaebcb635969d5c8eULL,
+            0x1cecaf06311be3c1ULL, 0xc6523aa9f69cbc81ULL, 0x3b492b72111b43c4ULL, 0xe1f7beddd69c1c84ULL,
+            0x62c53ab45e133d72ULL, 0xb87baf1b99946232ULL, 0x4560bec07e139d77ULL, 0x9fde2b6fb994c237ULL,
+            0x2d8e325c1e127d78ULL, 0xf730a7f3d9952238ULL, 0x0a2bb6283e12dd7dULL, 0xd0952387f995823dULL,
+            0xfc532b64de11bd66ULL, 0x26edbecb1996e226ULL, 0xdbf6af10fe111d63ULL, 0x01483abf39964223ULL,
+            0xb318238c9e10fd6cULL, 0x69a6b6235997a22cULL, 0x94bda7f8be105d69ULL, 0x4e03325779970229ULL,
+            0x08bbc3564d3e593bULL, 0xd20556f98ab9067bULL, 0x2f1e47226d3ef93eULL, 0xf5a0d28daab9a67eULL,
+            0x47f0cbbe0d3f1931ULL, 0x9d4e5e11cab84671ULL, 0x60554fca2d3fb934ULL, 0xbaebda65eab8e674ULL,
+            0x962dd286cd3cd92fULL, 0x4c9347290abb866fULL, 0xb18856f2ed3c792aULL, 0x6b36c35d2abb266aULL,
+            0xd966da6e8d3d9925ULL, 0x03d84fc14abac665ULL, 0xfec35e1aad3d3920ULL, 0x247dcbb56aba6660ULL,
+            0xa74f4fdce2354796ULL, 0x7df1da7325b218d6ULL, 0x80eacba8c235e793ULL, 0x5a545e0705b2b8d3ULL,
+            0xe8044734a234079cULL, 0x32bad29b65b358dcULL, 0xcfa1c3408234a799ULL, 0x151f56ef45b3f8d9ULL,
+            0x39d95e0c6237c782ULL, 0xe367cba3a5b098c2ULL, 0x1e7cda7842376787ULL, 0xc4c24fd785b038c7ULL,
+            0x769256e422368788ULL, 0xac2cc34be5b1d8c8ULL, 0x5137d2900236278dULL, 0x8b89473fc5b178cdULL,
+            0xc58a7568bc267ae4ULL, 0x1f34e0c77ba125a4ULL, 0xe22ff11c9c26dae1ULL, 0x389164b35ba185a1ULL,
+            0x8ac17d80fc273aeeULL, 0x507fe82f3ba065aeULL, 0xad64f9f4dc279aebULL, 0x77da6c5b1ba0c5abULL,
+            0x5b1c64b83c24faf0ULL, 0x81a2f117fba3a5b0ULL, 0x7cb9e0cc1c245af5ULL, 0xa6077563dba305b5ULL,
+            0x14576c507c25bafaULL, 0xcee9f9ffbba2e5baULL, 0x33f2e8245c251affULL, 0xe94c7d8b9ba245bfULL,
+            0x6a7ef9e2132d6449ULL, 0xb0c06c4dd4aa3b09ULL, 0x4ddb7d96332dc44cULL, 0x9765e839f4aa9b0cULL,
+            0x2535f10a532c2443ULL, 0xff8b64a594ab7b03ULL, 0x0290757e732c8446ULL, 0xd82ee0d1b4abdb06ULL,
+            0xf4e8e832932fe45dULL, 0x2e567d9d54a8bb1dULL, 0xd34d6c46b32f4458ULL, 0x09f3f9e974a81b18ULL,
+            0xbba3e0dad32ea457ULL, 0x611d757514a9fb17ULL, 0x9c0664aef32e0452ULL, 0x46b8f10134a95b12ULL,
+            0x117786ac9a7cb276ULL, 0xcbc913035dfbed36ULL, 0x36d202d8ba7c1273ULL, 0xec6c97777dfb4d33ULL,
+            0x5e3c8e44da7df27cULL, 0x84821beb1dfaad3cULL, 0x79990a30fa7d5279ULL, 0xa3279f9f3dfa0d39ULL,
+            0x8fe1977c1a7e3262ULL, 0x555f02d3ddf96d22ULL, 0xa84413083a7e9267ULL, 0x72fa86a7fdf9cd27ULL,
+            0xc0aa9f945a7f7268ULL, 0x1a140a3b9df82d28ULL, 0xe70f1be07a7fd26dULL, 0x3db18e4fbdf88d2dULL,
+            0xbe830a263577acdbULL, 0x643d9f89f2f0f39bULL, 0x99268e5215770cdeULL, 0x43981bfdd2f0539eULL,
+            0xf1c802ce7576ecd1ULL, 0x2b769761b2f1b391ULL, 0xd66d86ba55764cd4ULL, 0x0cd3131592f11394ULL,
+            0x20151bf6b5752ccfULL, 0xfaab8e5972f2738fULL, 0x07b09f8295758ccaULL, 0xdd0e0a2d52f2d38aULL,
+            0x6f5e131ef5746cc5ULL, 0xb5e086b132f33385ULL, 0x48fb976ad574ccc0ULL, 0x924502c512f39380ULL,
+            0xdc4630926b6491a9ULL, 0x06f8a53dace3cee9ULL, 0xfbe3b4e64b6431acULL, 0x215d21498ce36eecULL,
+            0x930d387a2b65d1a3ULL, 0x49b3add5ece28ee3ULL, 0xb4a8bc0e0b6571a6ULL, 0x6e1629a1cce22ee6ULL,
+            0x42d02142eb6611bdULL, 0x986eb4ed2ce14efdULL, 0x6575a536cb66b1b8ULL, 0xbfcb30990ce1eef8ULL,
+            0x0d9b29aaab6751b7ULL, 0xd725bc056ce00ef7ULL, 0x2a3eadde8b67f1b2ULL, 0xf08038714ce0aef2ULL,
+            0x73b2bc18c46f8f04ULL, 0xa90c29b703e8d044ULL, 0x5417386ce46f2f01ULL, 0x8ea9adc323e87041ULL,
+            0x3cf9b4f0846ecf0eULL, 0xe647215f43e9904eULL, 0x1b5c3084a46e6f0bULL, 0xc1e2a52b63e9304bULL,
+            0xed24adc8446d0f10ULL, 0x379a386783ea5050ULL, 0xca8129bc646daf15ULL, 0x103fbc13a3eaf055ULL,
+            0xa26fa520046c4f1aULL, 0x78d1308fc3eb105aULL, 0x85ca2154246cef1fULL, 0x5f74b4fbe3ebb05fULL,
+            0x19cc45fad742eb4dULL, 0xc372d05510c5b40dULL, 0x3e69c18ef7424b48ULL, 0xe4d7542130c51408ULL,
+            0x56874d129743ab47ULL, 0x8c39d8bd50c4f407ULL, 0x7122c966b7430b42ULL, 0xab9c5cc970c45402ULL,
+            0x875a542a57406b59ULL, 0x5de4c18590c73419ULL, 0xa0ffd05e7740cb5cULL, 0x7a4145f1b0c7941cULL,
+            0xc8115cc217412b53ULL, 0x12afc96dd0c67413ULL, 0xefb4d8b637418b56ULL, 0x350a4d19f0c6d416ULL,
+            0xb638c9707849f5e0ULL, 0x6c865cdfbfceaaa0ULL, 0x919d4d04584955e5ULL, 0x4b23d8ab9fce0aa5ULL,
+            0xf973c1983848b5eaULL, 0x23cd5437ffcfeaaaULL, 0xded645ec184815efULL, 0x0468d043dfcf4aafULL,
+            0x28aed8a0f84b75f4ULL, 0xf2104d0f3fcc2ab4ULL, 0x0f0b5cd4d84bd5f1ULL, 0xd5b5c97b1fcc8ab1ULL,
+            0x67e5d048b84a35feULL, 0xbd5b45e77fcd6abeULL, 0x4040543c984a95fbULL, 0x9afec1935fcdcabbULL,
+            0xd4fdf3c4265ac892ULL, 0x0e43666be1dd97d2ULL, 0xf35877b0065a6897ULL, 0x29e6e21fc1dd37d7ULL,
+            0x9bb6fb2c665b8898ULL, 0x41086e83a1dcd7d8ULL, 0xbc137f58465b289dULL, 0x66adeaf781dc77ddULL,
+            0x4a6be214a6584886ULL, 0x90d577bb61df17c6ULL, 0x6dce66608658e883ULL, 0xb770f3cf41dfb7c3ULL,
+            0x0520eafce659088cULL, 0xdf9e7f5321de57ccULL, 0x22856e88c659a889ULL, 0xf83bfb2701def7c9ULL,
+            0x7b097f4e8951d63fULL, 0xa1b7eae14ed6897fULL, 0x5cacfb3aa951763aULL, 0x86126e956ed6297aULL,
+            0x344277a6c9509635ULL, 0xeefce2090ed7c975ULL, 0x13e7f3d2e9503630ULL, 0xc959667d2ed76970ULL,
+            0xe59f6e9e0953562bULL, 0x3f21fb31ced4096bULL, 0xc23aeaea2953f62eULL, 0x18847f45eed4a96eULL,
+            0xaad4667649521621ULL, 0x706af3d98ed54961ULL, 0x8d71e2026952b624ULL, 0x57cf77adaed5e964ULL
+        },
+#endif
+};
+
+static inline uint64_t crc64_slice1_raw(uint64_t crc, uint8_t const *data, uint32_t length) {
     while (length--) {
-        tbl_idx = (uint8_t) ((crc ^ *data) & 0xff);
-        crc = (crc32_table[tbl_idx] ^ (crc >> 8)) & 0xffffffff;
-        data++;
+        crc = crc64_table[0][(crc ^ *data++) & 0xff] ^ (crc >> 8);
     }
-    return ~crc;
+    return crc;
+}
+
+uint64_t fbp_crc64_slice1(uint64_t crc, uint8_t const *data, uint32_t length) {
+    if ((0 == length) || !data) {
+        return crc;
+    }
+    return ~crc64_slice1_raw(~crc, data, length);
+}
+
+#if FBP_CRC_SLICE_BY >= 8
+static inline uint64_t crc64_slice8_raw(uint64_t crc, uint8_t const *data, uint32_t length) {
+    while (length >= 8) {
+        crc ^= ((uint64_t) data[0]) | (((uint64_t) data[1]) << 8)
+             | (((uint64_t) data[2]) << 16) | (((uint64_t) data[3]) << 24)
+             | (((uint64_t) data[4]) << 32) | (((uint64_t) data[5]) << 40)
+             | (((uint64_t) data[6]) << 48) | (((uint64_t) data[7]) << 56);
+        crc = crc64_table[7][crc & 0xff]
+            ^ crc64_table[6][(crc >> 8) & 0xff]
+            ^ crc64_table[5][(crc >> 16) & 0xff]
+            ^ crc64_table[4][(crc >> 24) & 0xff]
+            ^ crc64_table[3][(crc >> 32) & 0xff]
+            ^ crc64_table[2][(crc >> 40) & 0xff]
+            ^ crc64_table[1][(crc >> 48) & 0xff]
+            ^ crc64_table[0][crc >> 56];
+        data += 8;
+        length -= 8;
+    }
+    return crc64_slice1_raw(crc, data, length);
+}
+
+uint64_t fbp_crc64_slice8(uint64_t crc, uint8_t const *data, uint32_t length) {
+    if ((0 == length) || !data) {
+        return crc;
+    }
+    return ~crc64_slice8_raw(~crc, data, length);
+}
+#endif
+
+uint64_t fbp_crc64(uint64_t crc, uint8_t const *data, uint32_t length) {
+    if ((0 == length) || !data) {
+        return crc;
+    }
+#if FBP_CRC_SLICE_BY >= 8
+    return ~crc64_slice8_raw(~crc, data, length);
+#else
+    return ~crc64_slice1_raw(~crc, data, length);
+#endif
 }
 
 #endif
@@ -0,0 +1,417 @@
+/*
+ * Copyright 2014-2021 Jetperch LLC
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#define _GNU_SOURCE
+#define FBP_LOG_LEVEL FBP_LOG_LEVEL_NOTICE
+#include "fitterbap/host/loopback.h"
+#include "fitterbap/collections/ring_buffer_u8.h"
+#include "fitterbap/comm/stack.h"
+#include "fitterbap/comm/framer.h"
+#include "fitterbap/event_manager.h"
+#include "fitterbap/os/mutex.h"
+#include "fitterbap/ec.h"
+#include "fitterbap/log.h"
+#include "fitterbap/platform.h"
+#include "fitterbap/time.h"
+#include <errno.h>
+#include <fcntl.h>
+#include <poll.h>
+#include <pthread.h>
+#include <stdlib.h>
+#include <string.h>
+#include <termios.h>
+#include <unistd.h>
+#include <sys/eventfd.h>
+
+
+#define PUBSUB_BUFFER_SIZE (200000)
+#define STACK_PREFIX FBP_LOOPBACK_TOPIC_PREFIX "c/"
+#define TX_BUFFER_SIZE (65536)
+#define RX_BUFFER_SIZE (4096)
+#define PATH_SIZE (128)
+
+
+struct fbp_loopback_s {
+    struct fbp_loopback_config_s config;
+    uint32_t rand_state;
+    int master_fd;
+    int slave_fd;       // hold open to prevent POLLHUP before the host opens the device.
+    int signal_fd;
+    char path[PATH_SIZE];
+
+    fbp_os_mutex_t mutex;
+    struct fbp_evm_s * evm;
+    struct fbp_evm_api_s evm_api;
+    struct fbp_pubsub_s * pubsub;
+    struct fbp_stack_s * stack;
+
+    uint8_t tx_buffer[TX_BUFFER_SIZE];
+    struct fbp_rbu8_s tx;
+    uint8_t rx_buffer[RX_BUFFER_SIZE];
+
+    pthread_t thread;
+    int thread_running;
+    volatile int quit;
+
+    struct fbp_loopback_status_s status;
+};
+
+static uint32_t rand_u32(struct fbp_loopback_s * self) {
+    // xorshift32
+    uint32_t x = self->rand_state;
+    x ^= x << 13;
+    x ^= x >> 17;
+    x ^= x << 5;
+    self->rand_state = x;
+    return x;
+}
+
+/**
+ * @brief Inject errors into a buffer in place.
+ *
+ * @param self The instance.
+ * @param buffer The buffer to modify.
+ * @param buffer_size The number of valid bytes in buffer.
+ * @return The number of valid bytes in buffer after byte drops.
+ */
+static uint32_t inject(struct fbp_loopback_s * self, uint8_t * buffer, uint32_t buffer_size) {
+    uint32_t drop_rate = self->config.byte_drop_rate;
+    uint32_t bit_error_rate = self->config.bit_error_rate;
+    self->status.bytes += buffer_size;
+    if (!drop_rate && !bit_error_rate) {
+        return buffer_size;
+    }
+    uint32_t k = 0;
+    for (uint32_t i = 0; i < buffer_size; ++i) {
+        uint8_t b = buffer[i];
+        if (drop_rate && (0 == (rand_u32(self) % drop_rate))) {
+            ++self->status.bytes_dropped;
+            continue;
+        }
+        if (bit_error_rate && (0 == (rand_u32(self) % bit_error_rate))) {
+            b ^= (uint8_t) (1 << (rand_u32(self) & 7));
+            ++self->status.bit_errors;
+        }
+        buffer[k++] = b;
+    }
+    return k;
+}
+
+static void signal_set(struct fbp_loopback_s * self) {
+    uint64_t value = 1;
+    if (write(self->signal_fd, &value, sizeof(value)) < 0) {
+        // already signalled, counter saturated
+    }
+}
+
+static void signal_clear(struct fbp_loopback_s * self) {
+    uint64_t value;
+    if (read(self->signal_fd, &value, sizeof(value)) < 0) {
+        // not signalled
+    }
+}
+
+static void on_schedule(void * user_data, int64_t next_time) {
+    struct fbp_loopback_s * self = (struct fbp_loopback_s *) user_data;
+    (void) next_time;
+    signal_set(self);
+}
+
+static void on_publish_fn(void * user_data) {
+    struct fbp_loopback_s * self = (struct fbp_loopback_s *) user_data;
+    signal_set(self);
+}
+
+static void tx_process(struct fbp_loopback_s * self) {
+    while (fbp_rbu8_size(&self->tx)) {
+        uint32_t tail = self->tx.tail;
+        uint32_t head = self->tx.head;
+        uint32_t sz = (head >= tail) ? (head - tail) : (self->tx.buf_size - tail);
+        ssize_t rc = write(self->master_fd, fbp_rbu8_tail(&self->tx), sz);
+        if (rc <= 0) {
+            return;
+        }
+        fbp_rbu8_discard(&self->tx, (uint32_t) rc);
+    }
+}
+
+static void ll_send(void * user_data, uint8_t const * buffer, uint32_t buffer_size) {
+    struct fbp_loopback_s * self = (struct fbp_loopback_s *) user_data;
+    uint8_t frame[FBP_FRAMER_MAX_SIZE];
+    while (buffer_size) {
+        // data link may send jumbo frames or batched link frames
+        uint32_t sz = (buffer_size > sizeof(frame)) ? (uint32_t) sizeof(frame) : buffer_size;
+        fbp_memcpy(frame, buffer, sz);
+        buffer += sz;
+        buffer_size -= sz;
+        sz = inject(self, frame, sz);
+        if (!fbp_rbu8_add(&self->tx, frame, sz)) {
+            // ring full: drop this chunk and the rest, the data link retransmits
+            uint32_t dropped = sz + buffer_size;
+            self->status.tx_overflow_bytes += dropped;
+            FBP_LOGW("tx buffer full, dropped %u bytes", (unsigned int) dropped);
+            break;
+        }
+    }
+    tx_process(self);
+}
+
+static uint32_t ll_send_available(void * user_data) {
+    struct fbp_loopback_s * self = (struct fbp_loopback_s *) user_data;
+    return fbp_rbu8_empty_size(&self->tx);
+}
+
+static void rx_process(struct fbp_loopback_s * self) {
+    while (1) {
+        ssize_t rc = read(self->master_fd, self->rx_buffer, sizeof(self->rx_buffer));
+        if (rc <= 0) {
+            return;
+        }
+        uint32_t sz = inject(self, self->rx_buffer, (uint32_t) rc);
+        fbp_dl_ll_recv(self->stack->dl, self->rx_buffer, sz);
+    }
+}
+
+static void * task(void * arg) {
+    struct fbp_loopback_s * self = (struct fbp_loopback_s *) arg;
+    struct pollfd fds[2];
+    fds[0].fd = self->signal_fd;
+    fds[0].events = POLLIN;
+    fds[1].fd = self->master_fd;
+
+    while (!self->quit) {
+        fbp_os_mutex_lock(self->mutex);
+        fds[1].events = POLLIN | (fbp_rbu8_size(&self->tx) ? POLLOUT : 0);
+        fbp_os_mutex_unlock(self->mutex);
+        fds[0].revents = 0;
+        fds[1].revents = 0;
+        int64_t duration_i64 = fbp_evm_interval_next(self->evm, fbp_time_rel());
+        duration_i64 = fbp_time_min(duration_i64, 25 * FBP_TIME_MILLISECOND);
+        int64_t duration_ms = FBP_TIME_TO_COUNTER(duration_i64, 1000);
+        if (duration_ms < 0) {
+            duration_ms = 0;
+        }
+        if (poll(fds, 2, (int) duration_ms) < 0) {
+            if (errno != EINTR) {
+                FBP_LOGW("poll failed: %s", strerror(errno));
+            }
+        }
+        if (fds[0].revents & POLLIN) {
+            signal_clear(self);
+        }
+
+        fbp_os_mutex_lock(self->mutex);
+        rx_process(self);
+        tx_process(self);
+        fbp_os_mutex_unlock(self->mutex);
+        fbp_evm_process(self->evm, fbp_time_rel());
+        fbp_pubsub_process(self->pubsub);
+    }
+    return NULL;
+}
+
+bool fbp_loopback_is_device(const char * device) {
+    return (device && (0 == strncmp(device, FBP_LOOPBACK_PREFIX, sizeof(FBP_LOOPBACK_PREFIX) - 1)));
+}
+
+int32_t fbp_loopback_parse(const char * device, struct fbp_loopback_config_s * config) {
+    char key[32];
+    uint32_t key_sz;
+    char * end;
+
+    if (!fbp_loopback_is_device(device) || !config) {
+        return FBP_ERROR_PARAMETER_INVALID;
+    }
+    fbp_memset(config, 0, sizeof(*config));
+    config->seed = 1;
+    const char * s = device + sizeof(FBP_LOOPBACK_PREFIX) - 1;
+    if (*s == 0) {
+        return 0;
+    } else if (*s != '?') {
+        return FBP_ERROR_PARAMETER_INVALID;
+    }
+    ++s;
+    while (*s) {
+        key_sz = 0;
+        while (*s && (*s != '=')) {
+            if (key_sz >= (sizeof(key) - 1)) {
+                return FBP_ERROR_PARAMETER_INVALID;
+            }
+            key[key_sz++] = *s++;
+        }
+        key[key_sz] = 0;
+        if (*s++ != '=') {
+            return FBP_ERROR_PARAMETER_INVALID;
+        }
+        unsigned long value = strtoul(s, &end, 0);
+        if ((end == s) || ((*end != 0) && (*end != '&')) || (value > UINT32_MAX)) {
+            return FBP_ERROR_PARAMETER_INVALID;
+        }
+        if (0 == strcmp(key, "byte_drop_rate")) {
+            config->byte_drop_rate = (uint32_t) value;
+        } else if (0 == strcmp(key, "bit_error_rate")) {
+            config->bit_error_rate = (uint32_t) value;
+        } else if (0 == strcmp(key, "seed")) {
+            config->seed = (uint32_t) value;
+        } else {
+            FBP_LOGW("unsupported loopback parameter: %s", key);
+            return FBP_ERROR_PARAMETER_INVALID;
+        }
+        s = (*end) ? (end + 1) : end;
+    }
+    return 0;
+}
+
+static int32_t pty_open(struct fbp_loopback_s * self) {
+    struct termios tty;
+    self->master_fd = posix_openpt(O_RDWR | O_NOCTTY | O_CLOEXEC);
+    if (self->master_fd < 0) {
+        FBP_LOGE("posix_openpt failed: %s", strerror(errno));
+        return FBP_ERROR_IO;
+    }
+    if (grantpt(self->master_fd) || unlockpt(self->master_fd)
+            || ptsname_r(self->master_fd, self->path, sizeof(self->path))) {
+        FBP_LOGE("pty setup failed: %s", strerror(errno));
+        return FBP_ERROR_IO;
+    }
+    fcntl(self->master_fd, F_SETFL, fcntl(self->master_fd, F_GETFL) | O_NONBLOCK);
+    self->slave_fd = open(self->path, O_RDWR | O_NOCTTY | O_CLOEXEC);
+    if (self->slave_fd < 0) {
+        FBP_LOGE("pty slave open failed: %s", strerror(errno));
+        return FBP_ERROR_IO;
+    }
+    if (0 == tcgetattr(self->slave_fd, &tty)) {
+        cfmakeraw(&tty);
+        tcsetattr(self->slave_fd, TCSANOW, &tty);
+    }
+    return 0;
+}
+
+struct fbp_loopback_s * fbp_loopback_initialize(
+        struct fbp_dl_config_s const * dl_config,
+        struct fbp_loopback_config_s const * config) {
+    struct fbp_loopback_s * self = fbp_alloc_clr(sizeof(struct fbp_loopback_s));
+    if (!self) {
+        return NULL;
+    }
+    self->master_fd = -1;
+    self->slave_fd = -1;
+    self->config = *config;
+    self->rand_state = config->seed ? config->seed : 1;
+    fbp_rbu8_init(&self->tx, self->tx_buffer, sizeof(self->tx_buffer));
+    FBP_LOGI("fbp_loopback_initialize(byte_drop_rate=%u, bit_error_rate=%u)",
+             (unsigned int) config->byte_drop_rate, (unsigned int) config->bit_error_rate);
+
+    self->signal_fd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    if (self->signal_fd < 0) {
+        goto on_error;
+    }
+    if (pty_open(self)) {
+        goto on_error;
+    }
+
+    self->mutex = fbp_os_mutex_alloc();
+    self->evm = fbp_evm_allocate();
+    fbp_evm_register_schedule_callback(self->evm, on_schedule, self);
+    fbp_evm_register_mutex(self->evm, self->mutex);
+    fbp_evm_api_get(self->evm, &self->evm_api);
+
+    self->pubsub = fbp_pubsub_initialize(FBP_LOOPBACK_TOPIC_PREFIX, PUBSUB_BUFFER_SIZE);
+    if (!self->pubsub) {
+        goto on_error;
+    }
+    fbp_pubsub_register_mutex(self->pubsub, self->mutex);
+    fbp_pubsub_register_on_publish(self->pubsub, on_publish_fn, self);
+
+    struct fbp_dl_ll_s ll = {
+            .user_data = self,
+            .send = ll_send,
+            .send_available = ll_send_available,
+    };
+    self->stack = fbp_stack_initialize(dl_config, FBP_PORT0_MODE_CLIENT, STACK_PREFIX,
+                                       &self->evm_api, &ll, self->pubsub, NULL);
+    if (!self->stack) {
+        goto on_error;
+    }
+    fbp_stack_mutex_set(self->stack, self->mutex);
+
+    if (pthread_create(&self->thread, NULL, task, self)) {
+        goto on_error;
+    }
+    self->thread_running = 1;
+    return self;
+
+on_error:
+    FBP_LOGE("fbp_loopback_initialize failed");
+    fbp_loopback_finalize(self);
+    return NULL;
+}
+
+void fbp_loopback_finalize(struct fbp_loopback_s * self) {
+    if (self) {
+        self->quit = 1;
+        if (self->thread_running) {
+            signal_set(self);
+            pthread_join(self->thread, NULL);
+            self->thread_running = 0;
+        }
+        if (self->stack) {
+            fbp_stack_finalize(self->stack);
+            self->stack = NULL;
+        }
+        if (self->pubsub) {
+            fbp_pubsub_finalize(self->pubsub);
+            self->pubsub = NULL;
+        }
+        if (self->evm) {
+            fbp_evm_free(self->evm);
+            self->evm = NULL;
+        }
+        if (self->mutex) {
+            fbp_os_mutex_free(self->mutex);
+            self->mutex = NULL;
+        }
+        if (self->slave_fd >= 0) {
+            close(self->slave_fd);
+        }
+        if (self->master_fd >= 0) {
+            close(self->master_fd);
+        }
+        if (self->signal_fd >= 0) {
+            close(self->signal_fd);
+        }
+        fbp_free(self);
+    }
+}
+
+const char * fbp_loopback_device_path(struct fbp_loopback_s * self) {
+    return self->path;
+}
+
+struct fbp_pubsub_s * fbp_loopback_pubsub(struct fbp_loopback_s * self) {
+    return self->pubsub;
+}
+
+int32_t fbp_loopback_dl_status_get(struct fbp_loopback_s * self, struct fbp_dl_status_s * status) {
+    return fbp_dl_status_get(self->stack->dl, status);
+}
+
+int32_t fbp_loopback_status_get(struct fbp_loopback_s * self, struct fbp_loopback_status_s * status) {
+    fbp_os_mutex_lock(self->mutex);
+    *status = self->status;
+    fbp_os_mutex_unlock(self->mutex);
+    return 0;
+}
@@ -0,0 +1,77 @@
+/*
+ * Copyright 2014-2021 Jetperch LLC
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#define _GNU_SOURCE
+#include "fitterbap/os/mutex.h"
+#include "fitterbap/assert.h"
+#include "fitterbap/ec.h"
+#include "fitterbap/log.h"
+#include "fitterbap/platform.h"
+#include <errno.h>
+#include <pthread.h>
+#include <time.h>
+
+
+#define MUTEX_LOCK_TIMEOUT_MS  (500)
+
+fbp_os_mutex_t fbp_os_mutex_alloc() {
+    pthread_mutexattr_t attr;
+    pthread_mutex_t * mutex = fbp_alloc_clr(sizeof(pthread_mutex_t));
+    FBP_ASSERT_ALLOC(mutex);
+    pthread_mutexattr_init(&attr);
+    // Match the Windows & FreeRTOS implementations which are recursive.
+    pthread_mutexattr_settype(&attr, PTHREAD_MUTEX_RECURSIVE);
+    if (pthread_mutex_init(mutex, &attr)) {
+        FBP_FATAL("mutex init failed");
+    }
+    pthread_mutexattr_destroy(&attr);
+    return mutex;
+}
+
+void fbp_os_mutex_free(fbp_os_mutex_t mutex) {
+    if (mutex) {
+        pthread_mutex_destroy((pthread_mutex_t *) mutex);
+        fbp_free(mutex);
+    }
+}
+
+void fbp_os_mutex_lock(fbp_os_mutex_t mutex) {
+    struct timespec ts;
+    if (mutex) {
+        clock_gettime(CLOCK_REALTIME, &ts);
+        ts.tv_nsec += (MUTEX_LOCK_TIMEOUT_MS % 1000) * 1000000L;
+        ts.tv_sec += MUTEX_LOCK_TIMEOUT_MS / 1000 + ts.tv_nsec / 1000000000L;
+        ts.tv_nsec %= 1000000000L;
+        int rc = pthread_mutex_timedlock((pthread_mutex_t *) mutex, &ts);
+        if (rc) {
+            FBP_LOG_CRITICAL("mutex lock failed: %d", rc);
+            FBP_FATAL("mutex lock failed");
+        }
+    } else {
+        FBP_LOGD1("lock, but mutex is null");
+    }
+}
+
+void fbp_os_mutex_unlock(fbp_os_mutex_t mutex) {
+    if (mutex) {
+        if (pthread_mutex_unlock((pthread_mutex_t *) mutex)) {
+            FBP_LOG_CRITICAL("mutex unlock failed");
+            FBP_FATAL("mutex unlock failed");
+        }
+    } else {
+        FBP_LOGD1("unlock, but mutex is null");
+    }
+}
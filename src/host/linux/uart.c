@@ -0,0 +1,265 @@
+/*
+ * Copyright 2014-2021 Jetperch LLC
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#define FBP_LOG_LEVEL FBP_LOG_LEVEL_NOTICE
+#include "fitterbap/host/uart.h"
+#include "fitterbap/collections/ring_buffer_u8.h"
+#include "fitterbap/ec.h"
+#include "fitterbap/log.h"
+#include "fitterbap/platform.h"
+#include <errno.h>
+#include <fcntl.h>
+#include <string.h>
+#include <termios.h>
+#include <unistd.h>
+#include <sys/ioctl.h>
+#ifdef __linux__
+#include <linux/serial.h>
+#endif
+
+
+struct uart_s {
+    int fd;
+    uart_recv_fn recv_fn;
+    void * recv_user_data;
+
+    uint8_t * write_buffer;
+    struct fbp_rbu8_s write_rb;
+
+    uint8_t * read_buffer;
+    uint32_t read_buffer_size;
+
+    struct uart_status_s status;
+};
+
+struct baud_map_s {
+    uint32_t baudrate;
+    speed_t speed;
+};
+
+static const struct baud_map_s baud_map[] = {
+        {9600, B9600},
+        {19200, B19200},
+        {38400, B38400},
+        {57600, B57600},
+        {115200, B115200},
+        {230400, B230400},
+        {460800, B460800},
+        {500000, B500000},
+        {576000, B576000},
+        {921600, B921600},
+        {1000000, B1000000},
+        {1152000, B1152000},
+        {1500000, B1500000},
+        {2000000, B2000000},
+        {2500000, B2500000},
+        {3000000, B3000000},
+        {3500000, B3500000},
+        {4000000, B4000000},
+        {0, B0},
+};
+
+static int32_t baudrate_to_speed(uint32_t baudrate, speed_t * speed) {
+    for (const struct baud_map_s * m = baud_map; m->baudrate; ++m) {
+        if (m->baudrate == baudrate) {
+            *speed = m->speed;
+            return 0;
+        }
+    }
+    return FBP_ERROR_PARAMETER_INVALID;
+}
+
+struct uart_s *uart_alloc() {
+    struct uart_s * self = fbp_alloc_clr(sizeof(struct uart_s));
+    if (self) {
+        self->fd = -1;
+    }
+    return self;
+}
+
+void uart_free(struct uart_s * self) {
+    if (self) {
+        uart_close(self);
+        fbp_free(self);
+    }
+}
+
+static void low_latency_set(struct uart_s *self) {
+#if defined(__linux__) && defined(ASYNC_LOW_LATENCY)
+    struct serial_struct serial;
+    if (0 == ioctl(self->fd, TIOCGSERIAL, &serial)) {
+        serial.flags |= ASYNC_LOW_LATENCY;
+        if (ioctl(self->fd, TIOCSSERIAL, &serial)) {
+            FBP_LOGD1("could not set ASYNC_LOW_LATENCY: %d", errno);
+        }
+    }
+#else
+    (void) self;
+#endif
+}
+
+int32_t uart_open(struct uart_s *self, const char *device_path, struct uart_config_s const * config) {
+    struct termios tty;
+    speed_t speed;
+    uart_close(self);
+    if (baudrate_to_speed(config->baudrate, &speed)) {
+        FBP_LOGE("unsupported baudrate %d", (int) config->baudrate);
+        return FBP_ERROR_PARAMETER_INVALID;
+    }
+
+    self->recv_fn = config->recv_fn;
+    self->recv_user_data = config->recv_user_data;
+    uint32_t write_size = config->send_buffer_size * config->send_buffer_count + 1;
+    self->read_buffer_size = config->recv_buffer_size * config->recv_buffer_count;
+    self->write_buffer = fbp_alloc_clr(write_size);
+    self->read_buffer = fbp_alloc_clr(self->read_buffer_size);
+    if (!self->write_buffer || !self->read_buffer) {
+        uart_close(self);
+        return FBP_ERROR_NOT_ENOUGH_MEMORY;
+    }
+    fbp_rbu8_init(&self->write_rb, self->write_buffer, write_size);
+
+    self->fd = open(device_path, O_RDWR | O_NOCTTY | O_NONBLOCK | O_CLOEXEC);
+    if (self->fd < 0) {
+        FBP_LOGE("open %s failed: %s", device_path, strerror(errno));
+        uart_close(self);
+        return FBP_ERROR_NOT_FOUND;
+    }
+
+    if (isatty(self->fd)) {
+        if (tcgetattr(self->fd, &tty)) {
+            FBP_LOGE("tcgetattr failed: %s", strerror(errno));
+            uart_close(self);
+            return FBP_ERROR_IO;
+        }
+        cfmakeraw(&tty);
+        tty.c_cflag |= (CLOCAL | CREAD);
+        tty.c_cflag &= ~(CSTOPB | CRTSCTS);
+        tty.c_cc[VMIN] = 0;
+        tty.c_cc[VTIME] = 0;
+        cfsetispeed(&tty, speed);
+        cfsetospeed(&tty, speed);
+        if (tcsetattr(self->fd, TCSANOW, &tty)) {
+            FBP_LOGE("tcsetattr failed: %s", strerror(errno));
+            uart_close(self);
+            return FBP_ERROR_IO;
+        }
+        low_latency_set(self);
+        tcflush(self->fd, TCIOFLUSH);
+    }
+    return 0;
+}
+
+void uart_close(struct uart_s *self) {
+    if (self->fd >= 0) {
+        close(self->fd);
+        self->fd = -1;
+    }
+    if (self->write_buffer) {
+        fbp_free(self->write_buffer);
+        self->write_buffer = NULL;
+    }
+    if (self->read_buffer) {
+        fbp_free(self->read_buffer);
+        self->read_buffer = NULL;
+    }
+    fbp_memset(&self->write_rb, 0, sizeof(self->write_rb));
+}
+
+static void write_process(struct uart_s *self) {
+    while (fbp_rbu8_size(&self->write_rb)) {
+        uint32_t tail = self->write_rb.tail;
+        uint32_t head = self->write_rb.head;
+        uint32_t sz = (head >= tail) ? (head - tail) : (self->write_rb.buf_size - tail);
+        ssize_t rc = write(self->fd, fbp_rbu8_tail(&self->write_rb), sz);
+        if (rc < 0) {
+            if ((errno != EAGAIN) && (errno != EWOULDBLOCK) && (errno != EINTR)) {
+                FBP_LOGW("write failed: %s", strerror(errno));
+            }
+            return;
+        } else if (rc == 0) {
+            return;
+        }
+        fbp_rbu8_discard(&self->write_rb, (uint32_t) rc);
+        self->status.write_bytes += (uint64_t) rc;
+        ++self->status.write_buffer_count;
+    }
+}
+
+int32_t uart_write(struct uart_s *self, uint8_t const *buffer, uint32_t buffer_size) {
+    if (self->fd < 0) {
+        return FBP_ERROR_UNAVAILABLE;
+    }
+    if (!fbp_rbu8_add(&self->write_rb, buffer, buffer_size)) {
+        return FBP_ERROR_FULL;
+    }
+    write_process(self);  // send immediately when possible
+    return 0;
+}
+
+uint32_t uart_send_available(struct uart_s *self) {
+    if (self->fd < 0) {
+        return 0;
+    }
+    return fbp_rbu8_empty_size(&self->write_rb);
+}
+
+static void read_process(struct uart_s *self) {
+    while (1) {
+        ssize_t rc = read(self->fd, self->read_buffer, self->read_buffer_size);
+        if (rc < 0) {
+            if ((errno != EAGAIN) && (errno != EWOULDBLOCK) && (errno != EINTR)) {
+                FBP_LOGW("read failed: %s", strerror(errno));
+            }
+            return;
+        } else if (rc == 0) {
+            return;
+        }
+        self->status.read_bytes += (uint64_t) rc;
+        ++self->status.read_buffer_count;
+        if (self->recv_fn) {
+            self->recv_fn(self->recv_user_data, self->read_buffer, (uint32_t) rc);
+        }
+        if ((uint32_t) rc < self->read_buffer_size) {
+            return;  // drained
+        }
+    }
+}
+
+void uart_process(struct uart_s *self) {
+    if (self->fd < 0) {
+        return;
+    }
+    read_process(self);
+    write_process(self);
+}
+
+void uart_handles(struct uart_s *self, uint32_t * handle_count, void ** handles) {
+    // handles[0] is the file descriptor, present handles[1] requests write (POLLOUT) notification.
+    uint32_t count = 0;
+    if (self->fd >= 0) {
+        handles[count++] = (void *) (intptr_t) self->fd;
+        if (fbp_rbu8_size(&self->write_rb)) {
+            handles[count++] = (void *) (intptr_t) self->fd;
+        }
+    }
+    *handle_count = count;
+}
+
+int32_t uart_status_get(struct uart_s *self, struct uart_status_s * stats) {
+    *stats = self->status;
+    return 0;
+}
@@ -0,0 +1,232 @@
+/*
+ * Copyright 2014-2021 Jetperch LLC
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#define FBP_LOG_LEVEL FBP_LOG_LEVEL_NOTICE
+#include "fitterbap/host/uart_thread.h"
+#include "fitterbap/host/uart.h"
+#include "fitterbap/event_manager.h"
+#include "fitterbap/ec.h"
+#include "fitterbap/log.h"
+#include "fitterbap/platform.h"
+#include "fitterbap/os/mutex.h"
+#include "fitterbap/time.h"
+#include <errno.h>
+#include <poll.h>
+#include <pthread.h>
+#include <string.h>
+#include <unistd.h>
+#include <sys/eventfd.h>
+
+
+struct fbp_uartt_s {
+    struct fbp_evm_s * evm;
+    int signal_fd;
+    fbp_os_mutex_t mutex;
+    pthread_t thread;
+    int thread_running;
+    volatile int quit;
+    struct uart_s * uart;
+};
+
+static void signal_set(struct fbp_uartt_s * self) {
+    uint64_t value = 1;
+    if (write(self->signal_fd, &value, sizeof(value)) < 0) {
+        // already signalled, counter saturated
+    }
+}
+
+static void signal_clear(struct fbp_uartt_s * self) {
+    uint64_t value;
+    if (read(self->signal_fd, &value, sizeof(value)) < 0) {
+        // not signalled
+    }
+}
+
+static void on_schedule(void * user_data, int64_t next_time) {
+    struct fbp_uartt_s * self = (struct fbp_uartt_s *) user_data;
+    (void) next_time;
+    signal_set(self);
+}
+
+struct fbp_uartt_s * fbp_uartt_initialize(const char *device_path, struct uart_config_s const * config) {
+    struct fbp_uartt_s * self = fbp_alloc_clr(sizeof(struct fbp_uartt_s));
+    if (!self) {
+        return NULL;
+    }
+
+    self->signal_fd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    if (self->signal_fd < 0) {
+        FBP_LOGE("signal_fd alloc failed: %s", strerror(errno));
+        fbp_uartt_finalize(self);
+        return NULL;
+    }
+
+    FBP_LOGI("fbp_uartt_initialize(%s, %d)", device_path, (int) config->baudrate);
+    self->mutex = fbp_os_mutex_alloc();
+    self->evm = fbp_evm_allocate();
+    fbp_evm_register_schedule_callback(self->evm, on_schedule, self);
+    fbp_evm_register_mutex(self->evm, self->mutex);
+
+    self->uart = uart_alloc();
+    if (!self->uart) {
+        FBP_LOGE("uart_alloc failed");
+        fbp_uartt_finalize(self);
+        return NULL;
+    }
+
+    int32_t rv = uart_open(self->uart, device_path, config);
+    if (rv) {
+        FBP_LOGE("uart_open failed with %d", (int) rv);
+        fbp_uartt_finalize(self);
+        return NULL;
+    }
+
+    return self;
+}
+
+void fbp_uartt_finalize(struct fbp_uartt_s *self) {
+    if (self) {
+        fbp_uartt_stop(self);
+        fbp_os_mutex_t mutex = self->mutex;
+        if (mutex) {
+            fbp_os_mutex_lock(mutex);
+            self->mutex = NULL;
+        }
+        if (self->uart) {
+            uart_free(self->uart);
+            self->uart = NULL;
+        }
+        if (self->evm) {
+            fbp_evm_free(self->evm);
+            self->evm = NULL;
+        }
+        if (self->signal_fd >= 0) {
+            close(self->signal_fd);
+            self->signal_fd = -1;
+        }
+        fbp_free(self);
+        if (mutex) {
+            fbp_os_mutex_unlock(mutex);
+            fbp_os_mutex_free(mutex);
+        }
+    }
+}
+
+static void * task(void * arg) {
+    uint32_t handle_count;
+    void * handles[16];
+    struct pollfd fds[2];
+    nfds_t fds_count;
+
+    struct fbp_uartt_s * self = (struct fbp_uartt_s *) arg;
+    fds[0].fd = self->signal_fd;
+    fds[0].events = POLLIN;
+    while (!self->quit) {
+        handle_count = 0;
+        fbp_os_mutex_lock(self->mutex);
+        uart_handles(self->uart, &handle_count, handles);
+        fbp_os_mutex_unlock(self->mutex);
+        fds_count = 1;
+        if (handle_count) {
+            // handles[0] is the fd, a second entry indicates pending write data.
+            fds[1].fd = (int) (intptr_t) handles[0];
+            fds[1].events = POLLIN | ((handle_count > 1) ? POLLOUT : 0);
+            fds[1].revents = 0;
+            fds_count = 2;
+        }
+        int64_t time_start = fbp_time_rel();
+        int64_t duration_i64 = fbp_evm_interval_next(self->evm, time_start);
+        duration_i64 = fbp_time_min(duration_i64, 25 * FBP_TIME_MILLISECOND);
+        int64_t duration_ms = FBP_TIME_TO_COUNTER(duration_i64, 1000);
+        if (duration_ms < 0) {
+            duration_ms = 0;
+        }
+        fds[0].revents = 0;
+        if (poll(fds, fds_count, (int) duration_ms) < 0) {
+            if (errno != EINTR) {
+                FBP_LOGW("poll failed: %s", strerror(errno));
+            }
+        }
+        if (fds[0].revents & POLLIN) {
+            signal_clear(self);
+        }
+
+        fbp_os_mutex_lock(self->mutex);
+        uart_process(self->uart);
+        fbp_os_mutex_unlock(self->mutex);
+        fbp_evm_process(self->evm, fbp_time_rel());
+    }
+    return NULL;
+}
+
+int32_t fbp_uartt_start(struct fbp_uartt_s * self) {
+    if (self->thread_running) {
+        FBP_LOGW("fbp_udl_start but already running");
+        return FBP_ERROR_BUSY;
+    }
+
+    self->quit = 0;
+    if (pthread_create(&self->thread, NULL, task, self)) {
+        return FBP_ERROR_NOT_ENOUGH_MEMORY;
+    }
+    self->thread_running = 1;
+
+    struct sched_param param = {.sched_priority = sched_get_priority_max(SCHED_FIFO)};
+    if (pthread_setschedparam(self->thread, SCHED_FIFO, &param)) {
+        // Requires CAP_SYS_NICE, which is usually not available.
+        FBP_LOGD1("Could not elevate thread priority");
+    }
+    return 0;
+}
+
+int32_t fbp_uartt_stop(struct fbp_uartt_s * self) {
+    int rc = 0;
+    if (self) {
+        self->quit = 1;
+        if (self->signal_fd >= 0) {
+            signal_set(self);
+        }
+        if (self->thread_running) {
+            if (pthread_join(self->thread, NULL)) {
+                FBP_LOGW("UART thread failed to shut down gracefully");
+                rc = FBP_ERROR_TIMED_OUT;
+            }
+            self->thread_running = 0;
+        }
+    }
+    return rc;
+}
+
+int32_t fbp_uartt_evm_api(struct fbp_uartt_s * self, struct fbp_evm_api_s * api) {
+    return fbp_evm_api_get(self->evm, api);
+}
+
+void fbp_uartt_send(struct fbp_uartt_s * self, uint8_t const * buffer, uint32_t buffer_size) {
+    fbp_os_mutex_lock(self->mutex);
+    if (uart_send_available(self->uart) >= buffer_size) {
+        uart_write(self->uart, buffer, buffer_size);
+        signal_set(self);  // reschedule
+    }
+    fbp_os_mutex_unlock(self->mutex);
+}
+
+uint32_t fbp_uartt_send_available(struct fbp_uartt_s * self) {
+    return uart_send_available(self->uart);
+}
+
+void fbp_uartt_mutex(struct fbp_uartt_s * self, fbp_os_mutex_t * mutex) {
+    *mutex = self->mutex;
+}
@@ -48,6 +48,7 @@ struct fbp_comm_s {
     struct fbp_evm_api_s evm_api;
     fbp_pubsub_subscribe_fn subscriber_fn;
     void * subscriber_user_data;
+    struct fbp_pubsub_topic_s * port_din[FBP_TRANSPORT_PORT_MAX + 1];
 };
 
 static void ll_send(void * user_data, uint8_t const * buffer, uint32_t buffer_size) {
@@ -77,32 +78,37 @@ static void on_port_recv_default(void *user_data,
                                  enum fbp_transport_seq_e seq,
                                  uint8_t port_data,
                                  uint8_t *msg, uint32_t msg_size) {
-    char topic[FBP_PUBSUB_TOPIC_LENGTH_MAX];
     struct fbp_comm_s * self = (struct fbp_comm_s *) user_data;
-    if (msg_size > FBP_FRAMER_PAYLOAD_MAX_SIZE) {
+    if (msg_size > FBP_FRAMER_LARGEST_PAYLOAD_SIZE) {
         return;
     }
 
-    // Construct topic string
-    char * src = STACK_PREFIX;
-    char * t = topic;
-    while (*src) {
-        *t++ = *src++;
-    }
-    if (port_id >= 10) {
-        *t++ = '0' + (port_id / 10);
-    }
-    *t++ = '0' + (port_id % 10);
-    src = "/din";
-    while (*src) {
-        *t++ = *src++;
+    struct fbp_pubsub_topic_s * handle = self->port_din[port_id & FBP_TRANSPORT_PORT_MAX];
+    if (!handle) {
+        // Construct topic string
+        char topic[FBP_PUBSUB_TOPIC_LENGTH_MAX];
+        char * src = STACK_PREFIX;
+        char * t = topic;
+        while (*src) {
+            *t++ = *src++;
+        }
+        if (port_id >= 10) {
+            *t++ = '0' + (port_id / 10);
+        }
+        *t++ = '0' + (port_id % 10);
+        src = "/din";
+        while (*src) {
+            *t++ = *src++;
+        }
+        *t = 0;
+        handle = fbp_pubsub_topic_handle(self->pubsub, topic);
+        self->port_din[port_id & FBP_TRANSPORT_PORT_MAX] = handle;
     }
-    *t = 0;
 
     if (seq != FBP_TRANSPORT_SEQ_SINGLE) {
         FBP_LOGW("unexpected seq %d on port %d", (int) seq, (int) port_id);
     }
-    fbp_pubsub_publish(self->pubsub, topic, &fbp_union_bin(msg, msg_size), NULL, NULL);
+    fbp_pubsub_publish_h(handle, &fbp_union_bin(msg, msg_size), NULL, NULL);
 }
 
 static DWORD WINAPI pubsub_task(LPVOID lpParam) {
@@ -202,7 +208,7 @@ struct fbp_comm_s * fbp_comm_initialize(struct fbp_dl_config_s const * config,
     struct uart_config_s uart_config = {
             .baudrate = baudrate,
             .send_buffer_size = (FBP_FRAMER_MAX_SIZE + 4) / 2,
-            .send_buffer_count = 8,
+            .send_buffer_count = 8 * ((FBP_FRAMER_LARGEST_SIZE + FBP_FRAMER_MAX_SIZE - 1) / FBP_FRAMER_MAX_SIZE),
             .recv_buffer_size = FBP_FRAMER_MAX_SIZE,
             .recv_buffer_count = 16,
             .recv_fn = on_uart_recv,
@@ -278,16 +284,56 @@ int32_t fbp_comm_publish(struct fbp_comm_s * self,
     return fbp_pubsub_publish(self->pubsub, topic, value, self->subscriber_fn, self->subscriber_user_data);
 }
 
+int32_t fbp_comm_publish_many(struct fbp_comm_s * self,
+                               const char * const * topics, const struct fbp_union_s * values,
+                               uint32_t count) {
+    int32_t rc = 0;
+    FBP_LOGD1("publish_many(count=%d)", (int) count);
+    // recursive mutex: hold across all messages so that they queue together
+    fbp_os_mutex_lock(self->pubsub_mutex);
+    for (uint32_t i = 0; i < count; ++i) {
+        rc = fbp_pubsub_publish(self->pubsub, topics[i], &values[i],
+                                self->subscriber_fn, self->subscriber_user_data);
+        if (rc) {
+            break;
+        }
+    }
+    fbp_os_mutex_unlock(self->pubsub_mutex);
+    return rc;
+}
+
+struct fbp_pubsub_topic_s * fbp_comm_topic_handle(struct fbp_comm_s * self, const char * topic) {
+    return fbp_pubsub_topic_handle(self->pubsub, topic);
+}
+
+int32_t fbp_comm_publish_h(struct fbp_comm_s * self,
+                           struct fbp_pubsub_topic_s * handle, const struct fbp_union_s * value) {
+    return fbp_pubsub_publish_h(handle, value, self->subscriber_fn, self->subscriber_user_data);
+}
+
 int32_t fbp_comm_query(struct fbp_comm_s * self, const char * topic, struct fbp_union_s * value) {
     return fbp_pubsub_query(self->pubsub, topic, value);
 }
 
+int32_t fbp_comm_query_copy(struct fbp_comm_s * self, const char * topic, struct fbp_union_s * value,
+                            uint8_t * buf, uint32_t buf_size) {
+    return fbp_pubsub_query_copy(self->pubsub, topic, value, buf, buf_size);
+}
+
 int32_t fbp_comm_status_get(
         struct fbp_comm_s * self,
         struct fbp_dl_status_s * status) {
     return fbp_dl_status_get(self->stack->dl, status);
 }
 
+int32_t fbp_comm_loopback_status_get(
+        struct fbp_comm_s * self,
+        struct fbp_loopback_status_s * status) {
+    (void) self;
+    (void) status;
+    return FBP_ERROR_NOT_SUPPORTED;
+}
+
 void fbp_comm_log_recv_register(struct fbp_comm_s * self, fbp_logp_publish_formatted fn, void * user_data) {
     fbp_logp_handler_register(self->stack->logp, fn, user_data);
 }
@@ -23,6 +23,32 @@
 #include "fitterbap/topic_list.h"
 #include "fitterbap/collections/list.h"
 #include "fitterbap/cstr.h"
+#include "fitterbap/memory/pool.h"
+
+#if !FBP_PUBSUB_SPSC
+#define SPSC_SUPPORTED (0)
+#elif defined(__STDC_VERSION__) && (__STDC_VERSION__ >= 201112L) && !defined(__STDC_NO_ATOMICS__)
+#include <stdatomic.h>
+#define SPSC_SUPPORTED (1)
+#define SPSC_ATOMIC _Atomic
+#define SPSC_THREAD_LOCAL _Thread_local
+#define spsc_load_relaxed(p) atomic_load_explicit(p, memory_order_relaxed)
+#define spsc_load_acquire(p) atomic_load_explicit(p, memory_order_acquire)
+#define spsc_store_release(p, v) atomic_store_explicit(p, v, memory_order_release)
+#elif defined(__GNUC__)
+// gnu99 and earlier: the builtins implement the same memory model
+#define SPSC_SUPPORTED (1)
+#define SPSC_ATOMIC
+#define SPSC_THREAD_LOCAL __thread
+#define spsc_load_relaxed(p) __atomic_load_n(p, __ATOMIC_RELAXED)
+#define spsc_load_acquire(p) __atomic_load_n(p, __ATOMIC_ACQUIRE)
+#define spsc_store_release(p, v) __atomic_store_n(p, v, __ATOMIC_RELEASE)
+#else
+#define SPSC_SUPPORTED (0)
+#endif
+
+#define SPSC_CACHE_LINE_SIZE (64)
+#define SPSC_BUF_END_NONE (UINT32_MAX)
 
 enum op_e {
     OP_PUBLISH,
@@ -36,24 +62,80 @@ struct subscriber_s {
     struct fbp_list_s item;
 };
 
+#if FBP_PUBSUB_TOPIC_CACHE_SIZE & (FBP_PUBSUB_TOPIC_CACHE_SIZE - 1)
+#error "FBP_PUBSUB_TOPIC_CACHE_SIZE must be a power of 2"
+#endif
+
+#define CHILD_INDEX_SIZE_MIN (32)
+
 struct topic_s {
     struct fbp_union_s value;
+    uint8_t * value_buf;                // owned copy of a retained non-const pointer value
     struct topic_s * parent;
     const char * meta;
     struct fbp_list_s item;  // used by parent->children list
     struct fbp_list_s children;
     struct fbp_list_s subscribers;
+    uint32_t hash;                      // hash of name
+    uint32_t child_count;
+    uint32_t child_index_size;          // power of 2, 0 when no index
+    struct topic_s ** child_index;      // open addressing, linear probing
+    uint32_t pattern_gen;               // self->pattern_gen when patterns computed
+    uint32_t pattern_count;
+    struct pattern_s ** patterns;       // matching wildcard patterns
     char name[FBP_PUBSUB_TOPIC_LENGTH_PER_LEVEL];
 };
 
+/// A compiled wildcard subscription containing '+' levels.
+struct pattern_s {
+    struct fbp_list_s item;             // used by self->patterns list
+    struct fbp_list_s subscribers;
+    bool multi;                         // true for a final '#' level
+    char str[FBP_PUBSUB_TOPIC_LENGTH_MAX];  // excluding any final '#' level
+};
+
+struct topic_cache_s {
+    struct topic_s * topic;
+    char name[FBP_PUBSUB_TOPIC_LENGTH_MAX];
+};
+
+struct fbp_pubsub_topic_s {
+    struct fbp_pubsub_s * pubsub;
+    struct topic_s * topic;             // resolved by process
+    struct message_s * pending;         // coalesce target, protected by lock
+    bool coalesce;
+    struct fbp_list_s item;
+    char name[FBP_PUBSUB_TOPIC_LENGTH_MAX];
+};
+
 struct message_s {
     char name[FBP_PUBSUB_TOPIC_LENGTH_MAX];
+    struct fbp_pubsub_topic_s * handle;  // when not NULL, use instead of name
     struct fbp_union_s value;
     fbp_pubsub_subscribe_fn src_fn;
     void * src_user_data;
     struct fbp_list_s item;
+    uint32_t buf_end;       // SPSC ring: buffer offset to release, or SPSC_BUF_END_NONE
+    uint8_t * heap_payload; // SPSC process thread: copied payload to free
+};
+
+#if SPSC_SUPPORTED
+struct spsc_s {
+    struct message_s * ring;            // NULL when not registered
+    uint32_t mask;                      // capacity - 1
+    uint32_t buf_head;                  // producer only
+    SPSC_ATOMIC uint32_t head;          // written by producer
+    uint8_t pad1[SPSC_CACHE_LINE_SIZE];
+    SPSC_ATOMIC uint32_t tail;          // written by consumer
+    SPSC_ATOMIC uint32_t buf_tail;      // written by consumer
+    uint8_t pad2[SPSC_CACHE_LINE_SIZE];
+    struct fbp_list_s local;            // consumer only, published from process
 };
 
+// The instance currently running fbp_pubsub_process on this thread.
+static SPSC_THREAD_LOCAL struct fbp_pubsub_s * spsc_process_self_ = NULL;
+#endif
+
 struct fbp_pubsub_s {
     char topic_prefix[FBP_PUBSUB_TOPIC_LENGTH_MAX];     // The top-level topic name for this instance
     struct fbp_topic_list_s topic_list;
@@ -64,6 +146,21 @@ struct fbp_pubsub_s {
     struct fbp_list_s subscriber_free;
     struct fbp_list_s msg_pend;
     struct fbp_list_s msg_free;
+    struct fbp_list_s handles;
+    struct fbp_list_s patterns;
+    uint32_t pattern_gen;                   // incremented when patterns added
+    uint64_t coalesced;
+    struct fbp_pool_s * msg_pool;           // NULL to allocate from heap
+    struct fbp_pool_s * subscriber_pool;    // NULL to allocate from heap
+    struct fbp_pubsub_status_s status;
+
+#if FBP_PUBSUB_TOPIC_CACHE_SIZE
+    struct topic_cache_s topic_cache[FBP_PUBSUB_TOPIC_CACHE_SIZE];  // only accessed by process
+#endif
+
+#if SPSC_SUPPORTED
+    struct spsc_s spsc;
+#endif
 
     struct fbp_rbm_s mrb;                               // for mutable message payloads
     uint8_t buffer[];
@@ -71,7 +168,7 @@ struct fbp_pubsub_s {
 
 const char RESERVED_SUFFIX[] = "/?#$'\"\\`&@%";
 
-static uint8_t publish(struct topic_s * topic, struct message_s * msg);
+static uint8_t publish(struct topic_s * topic, const char * name, struct message_s * msg);
 
 static inline void lock(struct fbp_pubsub_s * self) {
     if (self->mutex) {
@@ -85,35 +182,184 @@ static inline void unlock(struct fbp_pubsub_s * self) {
     }
 }
 
-static struct message_s * msg_alloc(struct fbp_pubsub_s * self) {
-    struct message_s * msg;
-    lock(self);
-    if (fbp_list_is_empty(&self->msg_free)) {
-        msg = fbp_alloc(sizeof(struct message_s));
+static inline bool spsc_is_active(struct fbp_pubsub_s * self) {
+#if SPSC_SUPPORTED
+    return NULL != self->spsc.ring;
+#else
+    (void) self;
+    return false;
+#endif
+}
+
+#if SPSC_SUPPORTED
+static inline bool spsc_is_producer(struct fbp_pubsub_s * self) {
+    return self->spsc.ring && (spsc_process_self_ != self);
+}
+
+static inline bool spsc_is_ring_msg(struct fbp_pubsub_s * self, struct message_s * msg) {
+    struct spsc_s * q = &self->spsc;
+    return q->ring && (msg >= q->ring) && (msg <= (q->ring + q->mask));
+}
+
+static struct message_s * spsc_msg_alloc(struct fbp_pubsub_s * self) {
+    struct spsc_s * q = &self->spsc;
+    uint32_t head = spsc_load_relaxed(&q->head);
+    uint32_t tail = spsc_load_acquire(&q->tail);
+    if ((head - tail) > q->mask) {
+        return NULL;  // full
+    }
+    return &q->ring[head & q->mask];
+}
+
+/**
+ * @brief Allocate payload from the instance buffer in ring order.
+ *
+ * @param self The instance.
+ * @param size The payload size in bytes.
+ * @param[out] end The buffer offset to release after processing.
+ * @return The payload or NULL when full.
+ *
+ * Only the producer advances buf_head, and only the consumer advances
+ * buf_tail.  Keep one byte free to distinguish full from empty.
+ */
+static uint8_t * spsc_buf_alloc(struct fbp_pubsub_s * self, uint32_t size, uint32_t * end) {
+    struct spsc_s * q = &self->spsc;
+    uint32_t cap = self->mrb.buf_size;
+    uint32_t h = q->buf_head;
+    uint32_t t = spsc_load_acquire(&q->buf_tail);
+    uint32_t offset;
+    if (h >= t) {
+        if ((cap - h) > size) {
+            offset = h;
+            h += size;
+        } else if (((cap - h) == size) && t) {
+            offset = h;
+            h = 0;
+        } else if (t > size) {
+            offset = 0;
+            h = size;
+        } else {
+            return NULL;
+        }
+    } else if ((t - h) > size) {
+        offset = h;
+        h += size;
     } else {
-        struct fbp_list_s * item = fbp_list_remove_head(&self->msg_free);
-        msg = FBP_CONTAINER_OF(item, struct message_s, item);
+        return NULL;
+    }
+    q->buf_head = h;
+    *end = h;
+    return self->buffer + offset;
+}
+#endif
+
+static inline void alloc_status_inc(struct fbp_pubsub_alloc_status_s * status) {
+    ++status->in_use;
+    if (status->in_use > status->high_water) {
+        status->high_water = status->in_use;
+    }
+}
+
+static int32_t msg_alloc(struct fbp_pubsub_s * self, struct message_s ** msg_out) {
+    struct message_s * msg;
+#if SPSC_SUPPORTED
+    if (spsc_is_producer(self)) {
+        msg = spsc_msg_alloc(self);
+        if (!msg) {
+            return FBP_ERROR_FULL;
+        }
+    } else
+#endif
+    {
+        lock(self);
+        if (self->msg_pool) {
+            msg = fbp_pool_alloc_unsafe(self->msg_pool);
+        } else if (fbp_list_is_empty(&self->msg_free)) {
+            msg = fbp_alloc(sizeof(struct message_s));
+        } else {
+            struct fbp_list_s * item = fbp_list_remove_head(&self->msg_free);
+            msg = FBP_CONTAINER_OF(item, struct message_s, item);
+        }
+        if (msg) {
+            alloc_status_inc(&self->status.message);
+        } else {
+            ++self->status.message.alloc_fail;
+        }
+        unlock(self);
+        if (!msg) {
+            return FBP_ERROR_NOT_ENOUGH_MEMORY;
+        }
     }
     fbp_list_initialize(&msg->item);
     msg->name[0] = 0;
+    msg->handle = NULL;
     msg->value.op = OP_PUBLISH;
     msg->value.type = FBP_UNION_NULL;
     msg->value.size = 0;
     msg->src_fn = NULL;
     msg->src_user_data = NULL;
-    unlock(self);
-    return msg;
+    msg->buf_end = SPSC_BUF_END_NONE;
+    msg->heap_payload = NULL;
+    *msg_out = msg;
+    return 0;
+}
+
+// Return a message to the pool or free list, must hold lock.
+static void msg_release(struct fbp_pubsub_s * self, struct message_s * msg) {
+    --self->status.message.in_use;
+    if (self->msg_pool) {
+        fbp_pool_free(self->msg_pool, msg);
+    } else {
+        fbp_list_add_tail(&self->msg_free, &msg->item);
+    }
 }
 
 static void msg_free(struct fbp_pubsub_s * self, struct message_s * msg) {
+#if SPSC_SUPPORTED
+    if (spsc_is_ring_msg(self, msg)) {
+        return;  // never committed, so the slot remains available
+    }
+#endif
+    if (msg->heap_payload) {
+        fbp_free(msg->heap_payload);
+        msg->heap_payload = NULL;
+    }
     lock(self);
-    fbp_list_add_tail(&self->msg_free, &msg->item);
+    msg_release(self, msg);
     unlock(self);
 }
 
+/**
+ * @brief Allocate space for a copied payload.
+ *
+ * @param self The instance.
+ * @param msg The message which will own the payload.
+ * @param size The payload size in bytes.
+ * @return The payload or NULL when full.
+ */
+static uint8_t * msg_payload_alloc(struct fbp_pubsub_s * self, struct message_s * msg, uint32_t size) {
+    uint8_t * buf;
+#if SPSC_SUPPORTED
+    if (spsc_is_ring_msg(self, msg)) {
+        return spsc_buf_alloc(self, size, &msg->buf_end);
+    } else if (spsc_is_active(self)) {
+        // published by a subscriber from within fbp_pubsub_process
+        msg->heap_payload = fbp_alloc(size);
+        return msg->heap_payload;
+    }
+#endif
+    lock(self);
+    buf = fbp_rbm_alloc(&self->mrb, size);
+    unlock(self);
+    return buf;
+}
+
 static struct subscriber_s * subscriber_alloc(struct fbp_pubsub_s * self) {
     struct subscriber_s * sub;
-    if (!fbp_list_is_empty(&self->subscriber_free)) {
+    lock(self);
+    if (self->subscriber_pool) {
+        sub = fbp_pool_alloc_unsafe(self->subscriber_pool);
+    } else if (!fbp_list_is_empty(&self->subscriber_free)) {
         struct fbp_list_s * item;
         item = fbp_list_remove_head(&self->subscriber_free);
         sub = FBP_CONTAINER_OF(item, struct subscriber_s, item);
@@ -121,6 +367,15 @@ static struct subscriber_s * subscriber_alloc(struct fbp_pubsub_s * self) {
         sub = fbp_alloc_clr(sizeof(struct subscriber_s));
         FBP_LOGD3("subscriber alloc: %p", (void *) sub);
     }
+    if (sub) {
+        alloc_status_inc(&self->status.subscriber);
+    } else {
+        ++self->status.subscriber.alloc_fail;
+    }
+    unlock(self);
+    if (!sub) {
+        return NULL;
+    }
     fbp_list_initialize(&sub->item);
     sub->flags = 0;
     sub->cbk_fn = NULL;
@@ -128,8 +383,14 @@ static struct subscriber_s * subscriber_alloc(struct fbp_pubsub_s * self) {
     return sub;
 }
 
+// Return a subscriber to the pool or free list, must hold lock.
 static void subscriber_free(struct fbp_pubsub_s * self, struct subscriber_s * sub) {
-    fbp_list_add_tail(&self->subscriber_free, &sub->item);
+    --self->status.subscriber.in_use;
+    if (self->subscriber_pool) {
+        fbp_pool_free(self->subscriber_pool, sub);
+    } else {
+        fbp_list_add_tail(&self->subscriber_free, &sub->item);
+    }
 }
 
 static bool is_reserved_char(char ch) {
@@ -141,6 +402,16 @@ static bool is_reserved_char(char ch) {
     return false;
 }
 
+static inline uint32_t hash_str(const char * s) {
+    // 32-bit FNV-1a
+    uint32_t h = 2166136261U;
+    while (*s) {
+        h ^= (uint8_t) *s++;
+        h *= 16777619U;
+    }
+    return h;
+}
+
 static bool topic_name_set(struct topic_s * topic, const char * name) {
     const char * name_orig = name;
     for (int i = 0; i < FBP_PUBSUB_TOPIC_LENGTH_PER_LEVEL; ++i) {
@@ -177,6 +448,20 @@ static bool topic_str_copy(char * topic_str, const char * src, size_t * str_len)
     return true;
 }
 
+/**
+ * @brief Remove trailing '/' separators from a topic string.
+ *
+ * @param topic_str The topic string, which is modified in place.
+ * @param sz The topic string length.
+ * @return The new topic string length.
+ */
+static size_t topic_str_rstrip_sep(char * topic_str, size_t sz) {
+    while (sz && (topic_str[sz - 1] == '/')) {
+        topic_str[--sz] = 0;
+    }
+    return sz;
+}
+
 static void topic_str_append(char * topic_str, const char * topic_sub_str) {
     // WARNING: topic_str must be >= TOPIC_LENGTH_MAX
     // topic_sub_str <= TOPIC_LENGTH_PER_LEVEL
@@ -233,6 +518,7 @@ static struct topic_s * topic_alloc(struct fbp_pubsub_s * self, const char * nam
     fbp_list_initialize(&topic->children);
     fbp_list_initialize(&topic->subscribers);
     topic_name_set(topic, name);
+    topic->hash = hash_str(topic->name);
     FBP_LOGD3("topic alloc: %p", (void *)topic);
     return topic;
 }
@@ -251,6 +537,15 @@ static void topic_free(struct fbp_pubsub_s * self, struct topic_s * topic) {
         fbp_list_remove(item);
         topic_free(self, subtopic);
     }
+    if (topic->child_index) {
+        fbp_free(topic->child_index);
+    }
+    if (topic->patterns) {
+        fbp_free(topic->patterns);
+    }
+    if (topic->value_buf) {
+        fbp_free(topic->value_buf);
+    }
     FBP_LOGD3("topic free: %p", (void *)topic);
     fbp_free(topic);
 }
@@ -282,12 +577,61 @@ static bool subtopic_get_str(const char ** topic, char * subtopic) {
     return false;
 }
 
-struct topic_s * subtopic_find(struct topic_s * parent, const char * subtopic_str) {
+static void child_index_insert(struct topic_s * parent, struct topic_s * child) {
+    uint32_t mask = parent->child_index_size - 1;
+    uint32_t idx = child->hash & mask;
+    while (parent->child_index[idx]) {
+        idx = (idx + 1) & mask;
+    }
+    parent->child_index[idx] = child;
+}
+
+static void child_index_build(struct topic_s * parent, uint32_t size) {
+    struct fbp_list_s * item;
+    if (parent->child_index) {
+        fbp_free(parent->child_index);
+    }
+    FBP_LOGD1("%s: child index size %d", parent->name, (int) size);
+    parent->child_index = fbp_alloc_clr(size * sizeof(struct topic_s *));
+    parent->child_index_size = size;
+    fbp_list_foreach(&parent->children, item) {
+        child_index_insert(parent, FBP_CONTAINER_OF(item, struct topic_s, item));
+    }
+}
+
+// Caller must hold the mutex, since this may rebuild parent->child_index.
+static void child_add(struct topic_s * parent, struct topic_s * child) {
+    child->parent = parent;
+    fbp_list_add_tail(&parent->children, &child->item);
+    ++parent->child_count;
+    if (FBP_PUBSUB_CHILD_INDEX_THRESHOLD && (parent->child_count > FBP_PUBSUB_CHILD_INDEX_THRESHOLD)) {
+        if ((parent->child_count * 2) > parent->child_index_size) {
+            // keep load factor <= 50%, build includes child
+            uint32_t size = parent->child_index_size ? (parent->child_index_size * 2) : CHILD_INDEX_SIZE_MIN;
+            child_index_build(parent, size);
+        } else {
+            child_index_insert(parent, child);
+        }
+    }
+}
+
+static struct topic_s * subtopic_find(struct topic_s * parent, const char * subtopic_str, uint32_t hash) {
     struct fbp_list_s * item;
     struct topic_s * topic;
+    if (parent->child_index) {
+        uint32_t mask = parent->child_index_size - 1;
+        uint32_t idx = hash & mask;
+        while (NULL != (topic = parent->child_index[idx])) {
+            if ((topic->hash == hash) && (0 == strcmp(subtopic_str, topic->name))) {
+                return topic;
+            }
+            idx = (idx + 1) & mask;
+        }
+        return NULL;
+    }
     fbp_list_foreach(&parent->children, item) {
         topic = FBP_CONTAINER_OF(item, struct topic_s, item);
-        if (0 == strcmp(subtopic_str, topic->name)) {
+        if ((topic->hash == hash) && (0 == strcmp(subtopic_str, topic->name))) {
             return topic;
         }
     }
@@ -300,25 +644,58 @@ static struct topic_s * topic_find(struct fbp_pubsub_s * self, const char * topi
 
     struct topic_s * t = self->root_topic;
     struct topic_s * subtopic;
+    uint32_t hash;
     while (*c != 0) {
         if (!subtopic_get_str(&c, subtopic_str)) {
             return NULL;
         }
-        subtopic = subtopic_find(t, subtopic_str);
+        hash = hash_str(subtopic_str);
+        subtopic = subtopic_find(t, subtopic_str, hash);
         if (!subtopic) {
             if (!create) {
                 return NULL;
             }
-            FBP_LOGD1("%s: create new topic %s", topic, subtopic_str);
-            subtopic = topic_alloc(self, subtopic_str);
-            subtopic->parent = t;
-            fbp_list_add_tail(&t->children, &subtopic->item);
+            // other threads traverse children and child_index under the mutex
+            lock(self);
+            subtopic = subtopic_find(t, subtopic_str, hash);
+            if (!subtopic) {
+                FBP_LOGD1("%s: create new topic %s", topic, subtopic_str);
+                subtopic = topic_alloc(self, subtopic_str);
+                child_add(t, subtopic);
+            }
+            unlock(self);
         }
         t = subtopic;
     }
     return t;
 }
 
+/**
+ * @brief Find or create a topic using the published topic cache.
+ *
+ * @param self The instance.
+ * @param topic The topic string.
+ * @return The topic instance or NULL.
+ *
+ * Topics are only freed by fbp_pubsub_finalize(), so cache entries
+ * never need invalidation.  Only call from fbp_pubsub_process().
+ */
+static struct topic_s * topic_find_cached(struct fbp_pubsub_s * self, const char * topic) {
+#if FBP_PUBSUB_TOPIC_CACHE_SIZE
+    struct topic_cache_s * entry = &self->topic_cache[hash_str(topic) & (FBP_PUBSUB_TOPIC_CACHE_SIZE - 1)];
+    if (entry->topic && (0 == strcmp(topic, entry->name))) {
+        return entry->topic;
+    }
+    struct topic_s * t = topic_find(self, topic, true);
+    if (t) {
+        entry->topic = (0 == fbp_cstr_copy(entry->name, topic, sizeof(entry->name))) ? t : NULL;
+    }
+    return t;
+#else
+    return topic_find(self, topic, true);
+#endif
+}
+
 /**
  * @brief Find a topic most closely matching a topic string.
  *
@@ -352,6 +729,132 @@ static struct topic_s * topic_find_existing_base(struct fbp_pubsub_s * self, con
     return t;
 }
 
+/**
+ * @brief Parse a subscription topic that may contain wildcards.
+ *
+ * @param topic The subscription topic.
+ * @param str[out] The topic excluding any final '#' level, which must
+ *      be at least FBP_PUBSUB_TOPIC_LENGTH_MAX bytes.
+ * @param multi[out] True when topic ends with a '#' level.
+ * @param is_pattern[out] True when topic contains a '+' level.
+ * @return 0 or FBP_ERROR_PARAMETER_INVALID.
+ */
+static int32_t pattern_parse(const char * topic, char * str, bool * multi, bool * is_pattern) {
+    size_t sz = 0;
+    *multi = false;
+    *is_pattern = false;
+    if (!topic_str_copy(str, topic, &sz)) {
+        return FBP_ERROR_PARAMETER_INVALID;
+    }
+    sz = topic_str_rstrip_sep(str, sz);
+    for (size_t i = 0; i < sz; ++i) {
+        char ch = str[i];
+        if ((ch != '+') && (ch != '#')) {
+            continue;
+        }
+        bool level_start = (i == 0) || (str[i - 1] == '/');
+        bool level_end = (i + 1 == sz) || (str[i + 1] == '/');
+        if (!level_start || !level_end || ((ch == '#') && (i + 1 != sz))) {
+            FBP_LOGW("invalid wildcard: %s", topic);
+            return FBP_ERROR_PARAMETER_INVALID;
+        }
+        if (ch == '+') {
+            *is_pattern = true;
+        } else {
+            *multi = true;
+            str[(i > 0) ? (i - 1) : 0] = 0;
+        }
+    }
+    return 0;
+}
+
+static bool pattern_match(const struct pattern_s * p, const char * topic) {
+    const char * s = p->str;
+    const char * t = topic;
+    while (1) {
+        if (*s == '+') {
+            ++s;
+            while (*t && (*t != '/')) {
+                ++t;
+            }
+        } else {
+            while (*s && (*s != '/')) {
+                if (*s++ != *t++) {
+                    return false;
+                }
+            }
+            if (*t && (*t != '/')) {
+                return false;
+            }
+        }
+        if (!*s) {
+            return (!*t) || p->multi;
+        } else if (!*t) {
+            return false;
+        }
+        ++s;
+        ++t;
+    }
+}
+
+static struct pattern_s * pattern_find(struct fbp_pubsub_s * self, const char * str, bool multi) {
+    struct fbp_list_s * item;
+    struct pattern_s * p;
+    fbp_list_foreach(&self->patterns, item) {
+        p = FBP_CONTAINER_OF(item, struct pattern_s, item);
+        if ((p->multi == multi) && (0 == strcmp(p->str, str))) {
+            return p;
+        }
+    }
+    return NULL;
+}
+
+static void pattern_free(struct fbp_pubsub_s * self, struct pattern_s * p) {
+    struct fbp_list_s * item;
+    struct subscriber_s * subscriber;
+    fbp_list_foreach(&p->subscribers, item) {
+        subscriber = FBP_CONTAINER_OF(item, struct subscriber_s, item);
+        fbp_list_remove(item);
+        subscriber_free(self, subscriber);
+    }
+    fbp_free(p);
+}
+
+/**
+ * @brief Update the cached wildcard patterns that match a topic.
+ *
+ * @param self The instance.
+ * @param t The topic instance.
+ * @param name The full topic name for t.
+ *
+ * Only call from fbp_pubsub_process().
+ */
+static void topic_patterns_update(struct fbp_pubsub_s * self, struct topic_s * t, const char * name) {
+    struct fbp_list_s * item;
+    struct pattern_s * p;
+    uint32_t count = 0;
+    if (t->patterns) {
+        fbp_free(t->patterns);
+        t->patterns = NULL;
+    }
+    fbp_list_foreach(&self->patterns, item) {
+        p = FBP_CONTAINER_OF(item, struct pattern_s, item);
+        count += pattern_match(p, name) ? 1 : 0;
+    }
+    if (count) {
+        t->patterns = fbp_alloc(count * sizeof(struct pattern_s *));
+        count = 0;
+        fbp_list_foreach(&self->patterns, item) {
+            p = FBP_CONTAINER_OF(item, struct pattern_s, item);
+            if (pattern_match(p, name)) {
+                t->patterns[count++] = p;
+            }
+        }
+    }
+    t->pattern_count = count;
+    t->pattern_gen = self->pattern_gen;
+}
+
 static void topic_list_update(struct fbp_pubsub_s * self, bool do_publish) {
     struct topic_s * t = topic_find(self, FBP_PUBSUB_TOPIC_LIST, true);
     t->value.type = FBP_UNION_STR;
@@ -367,7 +870,7 @@ static void topic_list_update(struct fbp_pubsub_s * self, bool do_publish) {
         .src_user_data = NULL,
     };
     if (do_publish) {
-        publish(t, &msg);
+        publish(t, msg.name, &msg);
     }
 }
 
@@ -387,9 +890,32 @@ static uint8_t on_topic_remove(void * user_data, const char * topic, const struc
     return 0;
 }
 
+static struct fbp_pool_s * pool_alloc(uint32_t count, uint32_t size, struct fbp_pubsub_alloc_status_s * status) {
+    if (!count) {
+        return NULL;
+    }
+    struct fbp_pool_s * pool = fbp_alloc(fbp_pool_instance_size((int32_t) count, (int32_t) size));
+    fbp_pool_initialize(pool, (int32_t) count, (int32_t) size);
+    status->size = count;
+    return pool;
+}
+
 struct fbp_pubsub_s * fbp_pubsub_initialize(const char * topic_prefix, uint32_t buffer_size) {
+    return fbp_pubsub_initialize_config(topic_prefix, buffer_size, NULL);
+}
+
+struct fbp_pubsub_s * fbp_pubsub_initialize_config(const char * topic_prefix, uint32_t buffer_size,
+                                                   const struct fbp_pubsub_config_s * config) {
     FBP_LOGI("initialize");
     struct fbp_pubsub_s * self = (struct fbp_pubsub_s *) fbp_alloc_clr(sizeof(struct fbp_pubsub_s) + buffer_size);
+    if (config) {
+        uint32_t subscriber_count = config->subscriber_count;
+        if (subscriber_count && (subscriber_count < 2)) {
+            subscriber_count = 2;  // for the internal topic list subscribers
+        }
+        self->msg_pool = pool_alloc(config->message_count, sizeof(struct message_s), &self->status.message);
+        self->subscriber_pool = pool_alloc(subscriber_count, sizeof(struct subscriber_s), &self->status.subscriber);
+    }
     fbp_cstr_copy(self->topic_prefix, topic_prefix, fbp_sizeof(self->topic_prefix));
     fbp_topic_list_clear(&self->topic_list);
     fbp_topic_list_append(&self->topic_list, topic_prefix);
@@ -397,6 +923,11 @@ struct fbp_pubsub_s * fbp_pubsub_initialize(const char * topic_prefix, uint32_t
     fbp_list_initialize(&self->subscriber_free);
     fbp_list_initialize(&self->msg_pend);
     fbp_list_initialize(&self->msg_free);
+    fbp_list_initialize(&self->handles);
+    fbp_list_initialize(&self->patterns);
+#if SPSC_SUPPORTED
+    fbp_list_initialize(&self->spsc.local);
+#endif
     fbp_rbm_init(&self->mrb, self->buffer, buffer_size);
 
     struct topic_s * t;
@@ -434,12 +965,27 @@ void subscriber_list_free(struct fbp_list_s * list) {
     fbp_list_initialize(list);
 }
 
-void msg_list_free(struct fbp_list_s * list) {
+void msg_list_free(struct fbp_pubsub_s * self, struct fbp_list_s * list) {
     struct fbp_list_s * item;
     struct message_s * msg;
     fbp_list_foreach(list, item) {
         msg = FBP_CONTAINER_OF(item, struct message_s, item);
-        fbp_free(msg);
+        if (msg->heap_payload) {
+            fbp_free(msg->heap_payload);
+        }
+        if (!self->msg_pool) {
+            fbp_free(msg);
+        }  // else freed with msg_pool
+    }
+    fbp_list_initialize(list);
+}
+
+static void handle_list_free(struct fbp_list_s * list) {
+    struct fbp_list_s * item;
+    struct fbp_pubsub_topic_s * handle;
+    fbp_list_foreach(list, item) {
+        handle = FBP_CONTAINER_OF(item, struct fbp_pubsub_topic_s, item);
+        fbp_free(handle);
     }
     fbp_list_initialize(list);
 }
@@ -451,9 +997,29 @@ void fbp_pubsub_finalize(struct fbp_pubsub_s * self) {
         fbp_os_mutex_t mutex = self->mutex;
         lock(self);
         topic_free(self, self->root_topic);
+        struct fbp_list_s * item;
+        fbp_list_foreach(&self->patterns, item) {
+            fbp_list_remove(item);
+            pattern_free(self, FBP_CONTAINER_OF(item, struct pattern_s, item));
+        }
         subscriber_list_free(&self->subscriber_free);
-        msg_list_free(&self->msg_pend);
-        msg_list_free(&self->msg_free);
+        msg_list_free(self, &self->msg_pend);
+        msg_list_free(self, &self->msg_free);
+#if SPSC_SUPPORTED
+        msg_list_free(self, &self->spsc.local);
+        if (self->spsc.ring) {
+            fbp_free(self->spsc.ring);
+        }
+#endif
+        handle_list_free(&self->handles);
+        if (self->msg_pool) {
+            fbp_pool_finalize(self->msg_pool);
+            fbp_free(self->msg_pool);
+        }
+        if (self->subscriber_pool) {
+            fbp_pool_finalize(self->subscriber_pool);
+            fbp_free(self->subscriber_pool);
+        }
         fbp_free(self);
         if (mutex) {
             fbp_os_mutex_unlock(mutex);
@@ -487,10 +1053,40 @@ void subscribe_traverse(struct topic_s * topic, char * topic_str, fbp_pubsub_sub
     }
 }
 
+static void pattern_traverse(struct pattern_s * p, struct topic_s * topic, char * topic_str,
+                             fbp_pubsub_subscribe_fn cbk_fn, void * cbk_user_data) {
+    size_t topic_str_len = strlen(topic_str);
+    char * topic_str_last = topic_str + topic_str_len;
+    if ((topic->value.type != FBP_UNION_NULL) && (topic->value.flags & FBP_UNION_FLAG_RETAIN)
+            && pattern_match(p, topic_str)) {
+        cbk_fn(cbk_user_data, topic_str, &topic->value);
+    }
+    struct fbp_list_s * item;
+    struct topic_s * subtopic;
+    fbp_list_foreach(&topic->children, item) {
+        subtopic = FBP_CONTAINER_OF(item, struct topic_s, item);
+        topic_str_append(topic_str, subtopic->name);
+        pattern_traverse(p, subtopic, topic_str, cbk_fn, cbk_user_data);
+        *topic_str_last = 0;  // reset string to original
+    }
+}
+
 static int32_t msg_enqueue(struct fbp_pubsub_s * self, struct message_s * msg) {
-    lock(self);
-    fbp_list_add_tail(&self->msg_pend, &msg->item);
-    unlock(self);
+#if SPSC_SUPPORTED
+    if (spsc_is_ring_msg(self, msg)) {
+        struct spsc_s * q = &self->spsc;
+        spsc_store_release(&q->head, spsc_load_relaxed(&q->head) + 1);
+    } else if (spsc_is_active(self)) {
+        // from within fbp_pubsub_process, which drains this list
+        fbp_list_add_tail(&self->spsc.local, &msg->item);
+        return 0;
+    } else
+#endif
+    {
+        lock(self);
+        fbp_list_add_tail(&self->msg_pend, &msg->item);
+        unlock(self);
+    }
     if (self->cbk_fn) {
         self->cbk_fn(self->cbk_user_data);
     }
@@ -499,21 +1095,26 @@ static int32_t msg_enqueue(struct fbp_pubsub_s * self, struct message_s * msg) {
 
 int32_t fbp_pubsub_subscribe(struct fbp_pubsub_s * self, const char * topic,
         uint8_t flags, fbp_pubsub_subscribe_fn cbk_fn, void * cbk_user_data) {
-    if (!self || !cbk_fn) {
+    char str[FBP_PUBSUB_TOPIC_LENGTH_MAX];
+    bool multi = false;
+    bool is_pattern = false;
+    if (!self || !cbk_fn || pattern_parse(topic, str, &multi, &is_pattern)) {
         return FBP_ERROR_PARAMETER_INVALID;
     }
-    if ((flags & (FBP_PUBSUB_SFLAG_REQ | FBP_PUBSUB_SFLAG_RSP)) && topic[0]) {
+    if ((flags & (FBP_PUBSUB_SFLAG_REQ | FBP_PUBSUB_SFLAG_RSP)) && (str[0] || is_pattern)) {
         FBP_LOGW("req | rsp subscribers must only subscribe to root");
         return FBP_ERROR_PARAMETER_INVALID;
     }
 
     FBP_LOGI("subscribe \"%s\"", topic);
 
-    struct message_s * msg = msg_alloc(self);
-    if (!topic_str_copy(msg->name, topic, NULL)) {
-        msg_free(self, msg);
-        return FBP_ERROR_PARAMETER_INVALID;
+    struct message_s * msg = NULL;
+    int32_t rc = msg_alloc(self, &msg);
+    if (rc) {
+        return rc;
     }
+    // patterns keep '#' for subscribe(), other topics use the parent
+    fbp_cstr_copy(msg->name, is_pattern ? topic : str, sizeof(msg->name));
 
     msg->src_fn = cbk_fn;
     msg->src_user_data = cbk_user_data;
@@ -524,17 +1125,12 @@ int32_t fbp_pubsub_subscribe(struct fbp_pubsub_s * self, const char * topic,
     return msg_enqueue(self, msg);
 }
 
-int32_t fbp_pubsub_unsubscribe(struct fbp_pubsub_s * self, const char * topic,
-                                fbp_pubsub_subscribe_fn cbk_fn, void * cbk_user_data) {
-    struct topic_s * t = topic_find(self, topic, false);
+static int subscriber_list_remove(struct fbp_pubsub_s * self, struct fbp_list_s * list,
+                                  fbp_pubsub_subscribe_fn cbk_fn, void * cbk_user_data) {
     struct fbp_list_s * item;
     struct subscriber_s * subscriber;
     int count = 0;
-    if (!t) {
-        return FBP_ERROR_NOT_FOUND;
-    }
-    lock(self);
-    fbp_list_foreach(&t->subscribers, item) {
+    fbp_list_foreach(list, item) {
         subscriber = FBP_CONTAINER_OF(item, struct subscriber_s, item);
         if ((subscriber->cbk_fn == cbk_fn) && (subscriber->cbk_user_data == cbk_user_data)) {
             fbp_list_remove(item);
@@ -542,6 +1138,30 @@ int32_t fbp_pubsub_unsubscribe(struct fbp_pubsub_s * self, const char * topic,
             ++count;
         }
     }
+    return count;
+}
+
+int32_t fbp_pubsub_unsubscribe(struct fbp_pubsub_s * self, const char * topic,
+                                fbp_pubsub_subscribe_fn cbk_fn, void * cbk_user_data) {
+    char str[FBP_PUBSUB_TOPIC_LENGTH_MAX];
+    bool multi = false;
+    bool is_pattern = false;
+    int count = 0;
+    if (pattern_parse(topic, str, &multi, &is_pattern)) {
+        return FBP_ERROR_PARAMETER_INVALID;
+    }
+    lock(self);
+    if (is_pattern) {
+        struct pattern_s * p = pattern_find(self, str, multi);
+        if (p) {  // keep empty patterns since topics cache them
+            count = subscriber_list_remove(self, &p->subscribers, cbk_fn, cbk_user_data);
+        }
+    } else {
+        struct topic_s * t = topic_find(self, str, false);
+        if (t) {
+            count = subscriber_list_remove(self, &t->subscribers, cbk_fn, cbk_user_data);
+        }
+    }
     unlock(self);
     if (!count) {
         return FBP_ERROR_NOT_FOUND;
@@ -552,14 +1172,7 @@ int32_t fbp_pubsub_unsubscribe(struct fbp_pubsub_s * self, const char * topic,
 void unsubscribe_traverse(struct fbp_pubsub_s * self, struct topic_s * topic, fbp_pubsub_subscribe_fn cbk_fn, void * cbk_user_data) {
     struct fbp_list_s * item;
     struct topic_s * subtopic;
-    struct subscriber_s * subscriber;
-    fbp_list_foreach(&topic->subscribers, item) {
-        subscriber = FBP_CONTAINER_OF(item, struct subscriber_s, item);
-        if ((subscriber->cbk_fn == cbk_fn) && (subscriber->cbk_user_data == cbk_user_data)) {
-            fbp_list_remove(item);
-            subscriber_free(self, subscriber);
-        }
-    }
+    subscriber_list_remove(self, &topic->subscribers, cbk_fn, cbk_user_data);
 
     fbp_list_foreach(&topic->children, item) {
         subtopic = FBP_CONTAINER_OF(item, struct topic_s, item);
@@ -570,8 +1183,13 @@ void unsubscribe_traverse(struct fbp_pubsub_s * self, struct topic_s * topic, fb
 int32_t fbp_pubsub_unsubscribe_from_all(struct fbp_pubsub_s * self,
                                fbp_pubsub_subscribe_fn cbk_fn, void * cbk_user_data) {
     struct topic_s * t = self->root_topic;
+    struct fbp_list_s * item;
     lock(self);
     unsubscribe_traverse(self, t, cbk_fn, cbk_user_data);
+    fbp_list_foreach(&self->patterns, item) {
+        struct pattern_s * p = FBP_CONTAINER_OF(item, struct pattern_s, item);
+        subscriber_list_remove(self, &p->subscribers, cbk_fn, cbk_user_data);
+    }
     unlock(self);
     return 0;
 }
@@ -597,8 +1215,42 @@ static bool is_str_type(uint8_t type) {
     }
 }
 
-int32_t fbp_pubsub_publish(struct fbp_pubsub_s * self,
-        const char * topic, const struct fbp_union_s * value,
+static int32_t publish_coalesce(struct fbp_pubsub_s * self,
+        struct fbp_pubsub_topic_s * handle,
+        const struct fbp_union_s * value, uint32_t size,
+        fbp_pubsub_subscribe_fn src_fn, void * src_user_data) {
+    lock(self);
+    struct message_s * msg = handle->pending;
+    bool is_new = (NULL == msg);
+    if (is_new) {
+        int32_t rc = msg_alloc(self, &msg);
+        if (rc) {
+            unlock(self);
+            return rc;
+        }
+        msg->handle = handle;
+        handle->pending = msg;
+    } else {
+        ++self->coalesced;
+    }
+    msg->src_fn = src_fn;
+    msg->src_user_data = src_user_data;
+    msg->value = *value;
+    msg->value.op = OP_PUBLISH;
+    msg->value.size = size;
+    if (is_new) {
+        fbp_list_add_tail(&self->msg_pend, &msg->item);
+    }
+    unlock(self);
+    if (is_new && self->cbk_fn) {
+        self->cbk_fn(self->cbk_user_data);
+    }
+    return 0;
+}
+
+static int32_t publish_enqueue(struct fbp_pubsub_s * self,
+        const char * topic, struct fbp_pubsub_topic_s * handle,
+        const struct fbp_union_s * value,
         fbp_pubsub_subscribe_fn src_fn, void * src_user_data) {
 
     bool do_copy = false;
@@ -612,10 +1264,6 @@ int32_t fbp_pubsub_publish(struct fbp_pubsub_s * self,
             size = (uint32_t) sz;
         }
         if (0 == (value->flags & FBP_UNION_FLAG_CONST)) {
-            if (value->flags & FBP_UNION_FLAG_RETAIN) {
-                FBP_LOGE("non-const retained ptr not allowed");
-                return FBP_ERROR_PARAMETER_INVALID;
-            }
             do_copy = true;
             if (size > (self->mrb.buf_size / 2)) {
                 FBP_LOGE("too big for available buffer");
@@ -626,8 +1274,19 @@ int32_t fbp_pubsub_publish(struct fbp_pubsub_s * self,
         size = 0;
     }
 
-    struct message_s * msg = msg_alloc(self);
-    if (!topic_str_copy(msg->name, topic, NULL)) {
+    if (handle && handle->coalesce && (value->flags & FBP_UNION_FLAG_RETAIN) && !do_copy && !spsc_is_active(self)) {
+        // const pointers are never in mrb: safe to replace
+        return publish_coalesce(self, handle, value, size, src_fn, src_user_data);
+    }
+
+    struct message_s * msg = NULL;
+    int32_t rc = msg_alloc(self, &msg);
+    if (rc) {
+        return rc;
+    }
+    if (handle) {
+        msg->handle = handle;
+    } else if (!topic_str_copy(msg->name, topic, NULL)) {
         msg_free(self, msg);
         return FBP_ERROR_PARAMETER_INVALID;
     }
@@ -638,24 +1297,89 @@ int32_t fbp_pubsub_publish(struct fbp_pubsub_s * self,
     msg->value.op = OP_PUBLISH;
     msg->value.size = size;
     if (do_copy && size) {
-        lock(self);
-        uint8_t *buf = fbp_rbm_alloc(&self->mrb, size);
+        uint8_t *buf = msg_payload_alloc(self, msg, size);
         if (!buf) { // full!
-            fbp_list_add_tail(&self->msg_free, &msg->item);
             msg_free(self, msg);
-            unlock(self);
             return FBP_ERROR_NOT_ENOUGH_MEMORY;
         }
         fbp_memcpy(buf, value->value.str, size);
         msg->value.value.bin = buf;
-        unlock(self);
     }
     return msg_enqueue(self, msg);
 }
 
+int32_t fbp_pubsub_publish(struct fbp_pubsub_s * self,
+        const char * topic, const struct fbp_union_s * value,
+        fbp_pubsub_subscribe_fn src_fn, void * src_user_data) {
+    return publish_enqueue(self, topic, NULL, value, src_fn, src_user_data);
+}
+
+struct fbp_pubsub_topic_s * fbp_pubsub_topic_handle(struct fbp_pubsub_s * self, const char * topic) {
+    struct fbp_list_s * item;
+    struct fbp_pubsub_topic_s * handle;
+    size_t sz = 0;
+    char name[FBP_PUBSUB_TOPIC_LENGTH_MAX];
+    if (!topic_str_copy(name, topic, &sz) || !sz || is_reserved_char(name[sz - 1])) {
+        FBP_LOGW("invalid topic handle: %s", topic);
+        return NULL;
+    }
+    lock(self);
+    fbp_list_foreach(&self->handles, item) {
+        handle = FBP_CONTAINER_OF(item, struct fbp_pubsub_topic_s, item);
+        if (0 == strcmp(name, handle->name)) {
+            unlock(self);
+            return handle;
+        }
+    }
+    handle = fbp_alloc_clr(sizeof(struct fbp_pubsub_topic_s));
+    handle->pubsub = self;
+    fbp_list_initialize(&handle->item);
+    fbp_memcpy(handle->name, name, sz + 1);
+    fbp_list_add_tail(&self->handles, &handle->item);
+    unlock(self);
+    return handle;
+}
+
+const char * fbp_pubsub_topic_handle_name(struct fbp_pubsub_topic_s * handle) {
+    return handle->name;
+}
+
+void fbp_pubsub_topic_coalesce(struct fbp_pubsub_topic_s * handle, bool enable) {
+    struct fbp_pubsub_s * self = handle->pubsub;
+    lock(self);
+    handle->coalesce = enable;
+    unlock(self);
+}
+
+void fbp_pubsub_status(struct fbp_pubsub_s * self, struct fbp_pubsub_status_s * status) {
+    lock(self);
+    *status = self->status;
+    unlock(self);
+}
+
+uint64_t fbp_pubsub_coalesced(struct fbp_pubsub_s * self) {
+    lock(self);
+    uint64_t count = self->coalesced;
+    unlock(self);
+    return count;
+}
+
+int32_t fbp_pubsub_publish_h(struct fbp_pubsub_topic_s * handle,
+        const struct fbp_union_s * value,
+        fbp_pubsub_subscribe_fn src_fn, void * src_user_data) {
+    if (!handle) {
+        return FBP_ERROR_PARAMETER_INVALID;
+    }
+    return publish_enqueue(handle->pubsub, NULL, handle, value, src_fn, src_user_data);
+}
+
 int32_t fbp_pubsub_meta(struct fbp_pubsub_s * self, const char * topic, const char * meta_json) {
     size_t sz = 0;
-    struct message_s * msg = msg_alloc(self);
+    struct message_s * msg = NULL;
+    int32_t rc = msg_alloc(self, &msg);
+    if (rc) {
+        return rc;
+    }
     if (!topic_str_copy(msg->name, topic, &sz)) {
         msg_free(self, msg);
         return FBP_ERROR_PARAMETER_INVALID;
@@ -682,17 +1406,47 @@ int32_t fbp_pubsub_meta(struct fbp_pubsub_s * self, const char * topic, const ch
     return msg_enqueue(self, msg);
 }
 
+int32_t fbp_pubsub_snapshot(struct fbp_pubsub_s * self, const char * prefix,
+                            fbp_pubsub_subscribe_fn cbk_fn, void * cbk_user_data) {
+    char topic_str[FBP_PUBSUB_TOPIC_LENGTH_MAX];
+    size_t sz = 0;
+    if (!self || !cbk_fn || !topic_str_copy(topic_str, prefix ? prefix : "", &sz)) {
+        return FBP_ERROR_PARAMETER_INVALID;
+    }
+    topic_str_rstrip_sep(topic_str, sz);  // subscribe_traverse appends "/name"
+    lock(self);
+    struct topic_s * t = topic_find(self, topic_str, false);
+    if (t) {
+        subscribe_traverse(t, topic_str, cbk_fn, cbk_user_data);
+    }
+    unlock(self);
+    return t ? 0 : FBP_ERROR_NOT_FOUND;
+}
+
 int32_t fbp_pubsub_query(struct fbp_pubsub_s * self, const char * topic, struct fbp_union_s * value) {
-    lock(self);  // fbp_list_foreach not thread-safe.  Need mutex.
+    return fbp_pubsub_query_copy(self, topic, value, NULL, 0);
+}
+
+int32_t fbp_pubsub_query_copy(struct fbp_pubsub_s * self, const char * topic, struct fbp_union_s * value,
+                              uint8_t * buf, uint32_t buf_size) {
+    int32_t rc = 0;
+    lock(self);  // fbp_list_foreach not thread-safe & topic_value_set frees value_buf.  Need mutex.
     struct topic_s * t = topic_find(self, topic, false);
-    unlock(self);
     if (!t || (0 == (t->value.flags & FBP_UNION_FLAG_RETAIN))) {
-        return FBP_ERROR_PARAMETER_INVALID;
-    }
-    if (value) {
+        rc = FBP_ERROR_PARAMETER_INVALID;
+    } else if (value) {
         *value = t->value;
+        if (buf && is_ptr_type(value->type)) {
+            if (value->size > buf_size) {
+                rc = FBP_ERROR_TOO_SMALL;  // value->size is the required size
+            } else {
+                fbp_memcpy(buf, t->value.value.bin, value->size);
+                value->value.bin = buf;
+            }
+        }
     }
-    return 0;
+    unlock(self);
+    return rc;
 }
 
 static void metadata_req_forward(struct fbp_pubsub_s * self, struct message_s * msg) {
@@ -824,11 +1578,87 @@ static void publish_meta(struct fbp_pubsub_s * self, struct message_s * msg, siz
     }
 }
 
+static void retained_rsp_handle(struct topic_s * topic, char * topic_str) {
+    struct fbp_list_s * item;
+    struct subscriber_s * subscriber;
+
+    if (!topic || (topic->value.type == FBP_UNION_NULL) || !(topic->value.flags & FBP_UNION_FLAG_RETAIN)) {
+        return;
+    }
+    size_t idx = strlen(topic_str);
+    if ((idx + 2) > FBP_PUBSUB_TOPIC_LENGTH_MAX) {
+        FBP_LOGW("query response topic too long: %s", topic_str);
+        return;
+    }
+    topic_str[idx] = '?';
+    topic_str[idx + 1] = 0;
+    struct fbp_union_s value = topic->value;
+    while (topic) {
+        fbp_list_foreach(&topic->subscribers, item) {
+            subscriber = FBP_CONTAINER_OF(item, struct subscriber_s, item);
+            if (subscriber->flags & FBP_PUBSUB_SFLAG_RSP) {
+                subscriber->cbk_fn(subscriber->cbk_user_data, topic_str, &value);
+            }
+        }
+        topic = topic->parent;
+    }
+    topic_str[idx] = 0;
+}
+
+static void retained_req_handle(struct topic_s * t, char * topic_str) {
+    size_t topic_str_len = strlen(topic_str);
+    char * topic_str_last = topic_str + topic_str_len;
+    struct fbp_list_s * item;
+    struct topic_s * subtopic;
+    retained_rsp_handle(t, topic_str);
+    fbp_list_foreach(&t->children, item) {
+        subtopic = FBP_CONTAINER_OF(item, struct topic_s, item);
+        topic_str_append(topic_str, subtopic->name);
+        retained_req_handle(subtopic, topic_str);
+        *topic_str_last = 0;  // reset string to original
+    }
+}
+
 static void publish_retained(struct fbp_pubsub_s * self, struct message_s * msg, size_t name_sz) {
-    (void) self;
-    (void) msg;
-    (void) name_sz;
-    // todo
+    struct topic_s * t;
+    if ((name_sz == 0) || (msg->name[name_sz - 1] != '?')) {
+        FBP_LOGE("publish_retained, but invalid topic %s", msg->name);
+        return;
+    } else if (name_sz == 1) {
+        // query root, respond with our owned topics
+        fbp_cstr_copy(msg->name, self->topic_prefix, sizeof(msg->name));
+        t = topic_find(self, msg->name, false);
+        if (t) {
+            retained_req_handle(t, msg->name);
+        }
+        msg->name[0] = '?';
+        msg->name[1] = 0;
+        metadata_req_forward(self, msg);
+    } else if (msg->name[name_sz - 2] == '/') {
+        // query all retained values under topic
+        msg->name[name_sz - 2] = 0;
+        if (fbp_cstr_starts_with(msg->name, self->topic_prefix)) {
+            // we own this topic, fulfill query
+            t = topic_find(self, msg->name, false);
+            if (t) {
+                retained_req_handle(t, msg->name);
+            }
+        } else {
+            // not for us, forward request to link subscribers
+            msg->name[name_sz - 2] = '/';
+            metadata_req_forward(self, msg);
+        }
+    } else if (fbp_cstr_starts_with(msg->name, self->topic_prefix)) {
+        // query single owned topic
+        msg->name[name_sz - 1] = 0;
+        retained_rsp_handle(topic_find(self, msg->name, false), msg->name);
+    } else if (msg->value.type == FBP_UNION_NULL) {
+        // query for another instance, forward request to link subscribers
+        metadata_req_forward(self, msg);
+    } else {
+        // response from another instance, forward to response subscribers
+        metadata_rsp_forward(self, msg);
+    }
 }
 
 static void publish_error(struct fbp_pubsub_s * self, struct message_s * msg, size_t name_sz) {
@@ -855,42 +1685,110 @@ static void publish_error(struct fbp_pubsub_s * self, struct message_s * msg, si
     }
 }
 
-static uint8_t publish(struct topic_s * topic, struct message_s * msg) {
+static uint8_t publish_subscribers(struct fbp_list_s * subscribers, const char * name, struct message_s * msg) {
     uint8_t status = 0;
     struct fbp_list_s * item;
     struct subscriber_s * subscriber;
+    fbp_list_foreach(subscribers, item) {
+        subscriber = FBP_CONTAINER_OF(item, struct subscriber_s, item);
+        if ((msg->src_fn == subscriber->cbk_fn) && (msg->src_user_data == subscriber->cbk_user_data)) {
+            continue;
+        }
+        if (subscriber->flags & FBP_PUBSUB_SFLAG_NOPUB) {
+            continue;
+        }
+        uint8_t rv = subscriber->cbk_fn(subscriber->cbk_user_data, name, &msg->value);
+        if (!status && rv) {
+            status = rv;
+        }
+    }
+    return status;
+}
+
+static uint8_t publish(struct topic_s * topic, const char * name, struct message_s * msg) {
+    uint8_t status = 0;
     while (topic) {
-        fbp_list_foreach(&topic->subscribers, item) {
-            subscriber = FBP_CONTAINER_OF(item, struct subscriber_s, item);
-            if ((msg->src_fn == subscriber->cbk_fn) && (msg->src_user_data == subscriber->cbk_user_data)) {
-                continue;
-            }
-            if (subscriber->flags & FBP_PUBSUB_SFLAG_NOPUB) {
-                continue;
-            }
-            uint8_t rv = subscriber->cbk_fn(subscriber->cbk_user_data, msg->name, &msg->value);
-            if (!status && rv) {
-                status = rv;
-            }
+        uint8_t rv = publish_subscribers(&topic->subscribers, name, msg);
+        if (!status && rv) {
+            status = rv;
         }
         topic = topic->parent;
     }
     return status;
 }
 
-static void publish_normal(struct fbp_pubsub_s * self, struct message_s * msg) {
+static uint8_t publish_patterns(struct fbp_pubsub_s * self, struct topic_s * t, const char * name, struct message_s * msg) {
+    uint8_t status = 0;
+    if (t->pattern_gen != self->pattern_gen) {
+        topic_patterns_update(self, t, name);
+    }
+    for (uint32_t i = 0; i < t->pattern_count; ++i) {
+        uint8_t rv = publish_subscribers(&t->patterns[i]->subscribers, name, msg);
+        if (!status && rv) {
+            status = rv;
+        }
+    }
+    return status;
+}
+
+/**
+ * @brief Update the topic value.
+ *
+ * @param self The PubSub instance.
+ * @param t The topic.
+ * @param value The new value.
+ *
+ * Retained non-const pointer values only live in the message buffer
+ * until publishing completes, so the topic keeps its own copy and
+ * retains it as const.  The copy is replaced under the mutex, so
+ * fbp_pubsub_query_copy() and fbp_pubsub_snapshot() which read values
+ * under the mutex never see a freed buffer.  fbp_pubsub_query() returns
+ * a pointer to the copy, which the next publish may free.
+ */
+static void topic_value_set(struct fbp_pubsub_s * self, struct topic_s * t, const struct fbp_union_s * value) {
+    uint8_t * buf = NULL;
+    struct fbp_union_s v = *value;
+    if (is_ptr_type(v.type) && (v.flags & FBP_UNION_FLAG_RETAIN) && !(v.flags & FBP_UNION_FLAG_CONST)) {
+        buf = fbp_alloc(v.size ? v.size : 1);
+        if (v.size) {
+            fbp_memcpy(buf, v.value.bin, v.size);
+        } else {
+            buf[0] = 0;
+        }
+        v.value.bin = buf;
+        v.flags |= FBP_UNION_FLAG_CONST;
+    }
+    lock(self);
+    uint8_t * buf_prev = t->value_buf;
+    t->value_buf = buf;
+    t->value = v;
+    unlock(self);
+    if (buf_prev) {
+        fbp_free(buf_prev);
+    }
+}
+
+static void publish_topic(struct fbp_pubsub_s * self, struct topic_s * t, const char * name, struct message_s * msg) {
     uint8_t status = 0;
-    struct topic_s * t = topic_find(self, msg->name, true);
     if (t) {
         // todo map alternate values to actual value using metadata
-        if (fbp_union_eq(&t->value, &msg->value) && (t->value.flags & FBP_UNION_FLAG_RETAIN)) {
+        if ((t->value.flags & FBP_UNION_FLAG_RETAIN) && fbp_union_eq(&t->value, &msg->value)) {
             return; // same value, skip to de-duplicate.
         }
-        t->value = msg->value;
-        status = publish(t, msg);
+        topic_value_set(self, t, &msg->value);
+        status = publish(t, name, msg);
+        if (!fbp_list_is_empty(&self->patterns)) {
+            uint8_t rv = publish_patterns(self, t, name, msg);
+            if (!status && rv) {
+                status = rv;
+            }
+        }
     }
     if (status) { // error
-        size_t topic_sz = strlen(msg->name);
+        size_t topic_sz = strlen(name);
+        if (name != msg->name) {
+            fbp_memcpy(msg->name, name, topic_sz);
+        }
         msg->name[topic_sz] = '#';
         msg->name[topic_sz + 1] = 0;
         msg->value.type = FBP_UNION_U32;
@@ -900,8 +1798,63 @@ static void publish_normal(struct fbp_pubsub_s * self, struct message_s * msg) {
     }
 }
 
+static void publish_normal(struct fbp_pubsub_s * self, struct message_s * msg) {
+    publish_topic(self, topic_find_cached(self, msg->name), msg->name, msg);
+}
+
+static void publish_handle(struct fbp_pubsub_s * self, struct message_s * msg) {
+    struct fbp_pubsub_topic_s * handle = msg->handle;
+    if (!handle->topic) {
+        handle->topic = topic_find(self, handle->name, true);
+    }
+    publish_topic(self, handle->topic, handle->name, msg);
+}
+
+static void subscribe_pattern(struct fbp_pubsub_s * self, struct message_s * msg) {
+    char str[FBP_PUBSUB_TOPIC_LENGTH_MAX];
+    bool multi = false;
+    bool is_pattern = false;
+    if (pattern_parse(msg->name, str, &multi, &is_pattern)) {
+        return;  // validated by fbp_pubsub_subscribe
+    }
+    struct pattern_s * p = pattern_find(self, str, multi);
+    if (!p) {
+        p = fbp_alloc_clr(sizeof(struct pattern_s));
+        fbp_list_initialize(&p->item);
+        fbp_list_initialize(&p->subscribers);
+        p->multi = multi;
+        fbp_cstr_copy(p->str, str, sizeof(p->str));
+        lock(self);
+        fbp_list_add_tail(&self->patterns, &p->item);
+        unlock(self);
+        ++self->pattern_gen;  // invalidate all topic pattern caches
+    }
+
+    struct subscriber_s * sub = subscriber_alloc(self);
+    if (!sub) {
+        FBP_LOGE("subscriber pool exhausted: %s", msg->name);
+        return;
+    }
+    sub->flags = (uint32_t) msg->value.value.u32;
+    sub->cbk_fn = msg->src_fn;
+    sub->cbk_user_data = msg->src_user_data;
+    lock(self);
+    fbp_list_add_tail(&p->subscribers, &sub->item);
+    unlock(self);
+
+    if (sub->flags & FBP_PUBSUB_SFLAG_RETAIN) {
+        FBP_LOGI("subscribe traverse \"%s\"", msg->name);
+        str[0] = 0;
+        pattern_traverse(p, self->root_topic, str, sub->cbk_fn, sub->cbk_user_data);
+    }
+}
+
 static void subscribe(struct fbp_pubsub_s * self, struct message_s * msg) {
     struct topic_s * t;
+    if (strchr(msg->name, '+')) {
+        subscribe_pattern(self, msg);
+        return;
+    }
     t = topic_find(self, msg->name, true);
     if (!t) {
         FBP_LOGE("could not find/create subscribe topic");
@@ -909,6 +1862,10 @@ static void subscribe(struct fbp_pubsub_s * self, struct message_s * msg) {
     }
 
     struct subscriber_s * sub = subscriber_alloc(self);
+    if (!sub) {
+        FBP_LOGE("subscriber pool exhausted: %s", msg->name);
+        return;
+    }
     sub->flags = (uint32_t) msg->value.value.u32;
     sub->cbk_fn = msg->src_fn;
     sub->cbk_user_data = msg->src_user_data;
@@ -942,6 +1899,11 @@ static void process_one(struct fbp_pubsub_s * self, struct message_s * msg) {
             return;
     }
 
+    if (msg->handle) {
+        publish_handle(self, msg);
+        return;
+    }
+
     size_t name_sz = strlen(msg->name);  // excluding terminator
     if (msg->value.op == OP_PUBLISH) {
         if (0 == name_sz) {
@@ -961,17 +1923,58 @@ static void process_one(struct fbp_pubsub_s * self, struct message_s * msg) {
     }
 }
 
+#if SPSC_SUPPORTED
+static void process_spsc(struct fbp_pubsub_s * self) {
+    struct spsc_s * q = &self->spsc;
+    struct fbp_pubsub_s * self_prev = spsc_process_self_;
+    struct fbp_list_s * item;
+    struct message_s * msg;
+    spsc_process_self_ = self;
+    while (1) {
+        item = fbp_list_remove_head(&q->local);
+        if (item) {
+            msg = FBP_CONTAINER_OF(item, struct message_s, item);
+            process_one(self, msg);
+            msg_free(self, msg);
+            continue;
+        }
+        uint32_t tail = spsc_load_relaxed(&q->tail);
+        if (tail == spsc_load_acquire(&q->head)) {
+            break;
+        }
+        msg = &q->ring[tail & q->mask];
+        process_one(self, msg);
+        if (msg->buf_end != SPSC_BUF_END_NONE) {
+            spsc_store_release(&q->buf_tail, msg->buf_end);
+        }
+        spsc_store_release(&q->tail, tail + 1);
+    }
+    spsc_process_self_ = self_prev;
+}
+#endif
+
 void fbp_pubsub_process(struct fbp_pubsub_s * self) {
     struct fbp_list_s * item;
     struct message_s * msg;
+#if SPSC_SUPPORTED
+    if (self->spsc.ring) {
+        process_spsc(self);
+        return;
+    }
+#endif
     while (1) {
         lock(self);
         item = fbp_list_remove_head(&self->msg_pend);
+        if (item) {
+            msg = FBP_CONTAINER_OF(item, struct message_s, item);
+            if (msg->handle && (msg->handle->pending == msg)) {
+                msg->handle->pending = NULL;  // no longer replaceable
+            }
+        }
         unlock(self);
         if (!item) {
             return;
         }
-        msg = FBP_CONTAINER_OF(item, struct message_s, item);
         process_one(self, msg);
 
         lock(self);
@@ -982,7 +1985,7 @@ void fbp_pubsub_process(struct fbp_pubsub_s * self) {
                 FBP_LOGE("internal msgbuf sync error");
             }
         }
-        fbp_list_add_tail(&self->msg_free, item);
+        msg_release(self, msg);
         unlock(self);
     }
 }
@@ -990,3 +1993,30 @@ void fbp_pubsub_process(struct fbp_pubsub_s * self) {
 void fbp_pubsub_register_mutex(struct fbp_pubsub_s * self, fbp_os_mutex_t mutex) {
     self->mutex = mutex;
 }
+
+int32_t fbp_pubsub_register_spsc(struct fbp_pubsub_s * self, uint32_t capacity) {
+#if SPSC_SUPPORTED
+    if (!self || !capacity || (capacity & (capacity - 1))) {
+        return FBP_ERROR_PARAMETER_INVALID;
+    }
+    lock(self);
+    bool busy = (NULL != self->spsc.ring) || !fbp_list_is_empty(&self->msg_pend);
+    unlock(self);
+    if (busy) {
+        return FBP_ERROR_BUSY;
+    }
+    struct spsc_s * q = &self->spsc;
+    fbp_list_initialize(&q->local);
+    q->mask = capacity - 1;
+    q->buf_head = 0;
+    spsc_store_release(&q->head, 0);
+    spsc_store_release(&q->tail, 0);
+    spsc_store_release(&q->buf_tail, 0);
+    q->ring = fbp_alloc_clr(capacity * sizeof(struct message_s));
+    return 0;
+#else
+    (void) self;
+    (void) capacity;
+    return FBP_ERROR_NOT_SUPPORTED;
+#endif
+}
@@ -78,14 +78,24 @@ static void ll_send(void * user_data, uint8_t const * buffer, uint32_t buffer_si
     (void) self;
     if ((buffer_size == 1) && (buffer[0] == FBP_FRAMER_SOF1)) {
         return;  // EOF
-    } else if (buffer[2] & 0xF8) {
+    } else if ((buffer[2] & 0xF8) && ((buffer[2] >> 3) != FBP_FRAMER_FT_DATA_JUMBO)) {
         while (buffer_size) {
             uint8_t event = (buffer[2] >> 3) & 0x1f;
             uint16_t frame_id = (((uint16_t) (buffer[2] & 0x7)) << 8) | buffer[3];
             check_expected(event);
             check_expected(frame_id);
-            buffer += FBP_FRAMER_LINK_SIZE;
-            buffer_size -= FBP_FRAMER_LINK_SIZE;
+            if (event == FBP_FRAMER_FT_ACK_BITMAP) {
+                uint64_t bitmap = 0;
+                for (int i = 7; i >= 0; --i) {
+                    bitmap = (bitmap << 8) | buffer[4 + i];
+                }
+                check_expected(bitmap);
+                buffer += FBP_FRAMER_ACK_BITMAP_SIZE;
+                buffer_size -= FBP_FRAMER_ACK_BITMAP_SIZE;
+            } else {
+                buffer += FBP_FRAMER_LINK_SIZE;
+                buffer_size -= FBP_FRAMER_LINK_SIZE;
+            }
         }
     } else {
         check_expected(buffer_size);
@@ -135,6 +145,7 @@ static struct test_s * setup() {
         .rx_window_size = 16,
         .tx_timeout = 10 * FBP_TIME_MILLISECOND,
         .tx_link_size = 16,
+        .payload_max_size = FBP_FRAMER_LARGEST_PAYLOAD_SIZE,
     };
 
     struct fbp_dl_ll_s ll = {
@@ -150,7 +161,7 @@ static struct test_s * setup() {
     };
 
     self->now = 0;
-    self->send_available = FBP_FRAMER_MAX_SIZE;
+    self->send_available = FBP_FRAMER_LARGEST_SIZE;
     self->dl = fbp_dl_initialize(&config, &evm_api, &ll);
     assert_non_null(self->dl);
     fbp_dl_register_upper_layer(self->dl, &ul);
@@ -212,6 +223,19 @@ static void expect_send_link(struct test_s *self, enum fbp_framer_type_e frame_t
     expect_value(ll_send, frame_id, frame_id);
 }
 
+static void expect_send_ack_bitmap(struct test_s *self, uint16_t frame_id, uint64_t bitmap) {
+    (void) self;
+    expect_value(ll_send, event, FBP_FRAMER_FT_ACK_BITMAP);
+    expect_value(ll_send, frame_id, frame_id);
+    expect_value(ll_send, bitmap, bitmap);
+}
+
+static void recv_ack_bitmap(struct test_s *self, uint16_t frame_id, uint64_t bitmap) {
+    uint8_t b[FBP_FRAMER_ACK_BITMAP_SIZE];
+    assert_int_equal(0, fbp_framer_construct_ack_bitmap(b, frame_id, bitmap));
+    fbp_dl_ll_recv(self->dl, b, sizeof(b));
+}
+
 static void recv_eof(struct test_s *self) {
     uint8_t eof[] = {FBP_FRAMER_SOF1};
     fbp_dl_ll_recv(self->dl, eof, sizeof(eof));
@@ -260,6 +284,18 @@ void on_schedule_fn(void * user_data, int64_t next_time) {
     check_expected(next_time);
 }
 
+static void test_disconnected_time(void ** state) {
+    SETUP();
+    self->now += 5 * FBP_TIME_MILLISECOND;
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(5 * FBP_TIME_MILLISECOND, status.disconnected_time);
+    connect(self);  // clears status
+    self->now += 5 * FBP_TIME_MILLISECOND;
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(0, status.disconnected_time);
+    TEARDOWN();
+}
+
 static void test_send_when_not_connected(void ** state) {
     SETUP();
     assert_int_equal(FBP_ERROR_UNAVAILABLE, fbp_dl_send(self->dl, 1, PAYLOAD1, sizeof(PAYLOAD1), 0));
@@ -387,6 +423,48 @@ static void test_send_data_timeout_then_ack(void ** state) {
     TEARDOWN();
 }
 
+static void test_send_adaptive_rto(void ** state) {
+    SETUP();
+    connect(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(0, status.tx.rtt);
+    assert_int_equal(10 * FBP_TIME_MILLISECOND, status.tx.rto);
+
+    // first sample: rtt=2 ms, rtt_var=1 ms, rto=rtt+4*rtt_var=6 ms
+    send_and_expect(self, 0, 1, PAYLOAD1, sizeof(PAYLOAD1));
+    process_now(self);
+    self->now += 2 * FBP_TIME_MILLISECOND;
+    recv_link(self, FBP_FRAMER_FT_ACK_ALL, 0);
+    recv_eof(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(2 * FBP_TIME_MILLISECOND, status.tx.rtt);
+    assert_int_equal(1 * FBP_TIME_MILLISECOND, status.tx.rtt_var);
+    assert_int_equal(6 * FBP_TIME_MILLISECOND, status.tx.rto);
+    assert_int_equal(1, status.tx.ack_latency[10]);  // 1024 to 2047 us
+
+    // timeout at the adapted rto, then exponential backoff
+    send_and_expect(self, 1, 1, PAYLOAD1, sizeof(PAYLOAD1));
+    process_now(self);
+    self->now += 5 * FBP_TIME_MILLISECOND;
+    process_now(self);
+    self->now += 1 * FBP_TIME_MILLISECOND;
+    expect_send_data(self, 1, 1, PAYLOAD1, sizeof(PAYLOAD1));
+    process_now(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(12 * FBP_TIME_MILLISECOND, status.tx.rto);
+
+    // retransmitted frame does not update the estimate
+    self->now += 1 * FBP_TIME_MILLISECOND;
+    recv_link(self, FBP_FRAMER_FT_ACK_ALL, 1);
+    recv_eof(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(2 * FBP_TIME_MILLISECOND, status.tx.rtt);
+    assert_int_equal(12 * FBP_TIME_MILLISECOND, status.tx.rto);
+    assert_int_equal(2, status.tx.data_frames);
+    assert_int_equal(1, status.tx.retransmissions);
+    TEARDOWN();
+}
+
 static void test_send_multiple_with_buffer_wrap(void ** state) {
     SETUP();
     uint32_t count = (1 << 16) / sizeof(PAYLOAD_MAX);
@@ -465,6 +543,213 @@ static void test_recv_out_of_order(void ** state) {
 
     expect_send_link(self, FBP_FRAMER_FT_ACK_ALL, 2);
     process_n(self, 5);
+
+    recv_data(self, 2, 0x33, PAYLOAD_MAX, sizeof(PAYLOAD_MAX));
+    recv_eof(self);
+    expect_send_link(self, FBP_FRAMER_FT_ACK_ALL, 2);
+    process_n(self, 5);
+
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(3, status.rx.data_frames);
+    assert_int_equal(1, status.rx.duplicate_frames);
+    assert_int_equal(2, status.rx.window_high_water);
+    assert_int_equal(1, status.tx.nack_frame_id);
+    assert_int_equal(0, status.tx.nack_framing_error);
+    assert_int_equal(4, status.rx.ack_latency[0]);  // acknowledged immediately
+    TEARDOWN();
+}
+
+#if FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE
+static void test_send_jumbo(void ** state) {
+    SETUP();
+    uint8_t payload[FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE];
+    uint8_t b[FBP_FRAMER_LARGEST_SIZE];
+    for (size_t i = 0; i < sizeof(payload); ++i) {
+        payload[i] = (uint8_t) i;
+    }
+    connect(self);
+    fbp_dl_tx_window_set(self->dl, 16);
+    assert_int_equal(FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE, fbp_dl_payload_max_get(self->dl));
+    assert_int_equal(FBP_FRAMER_PAYLOAD_MAX_SIZE, fbp_dl_tx_payload_max_get(self->dl));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_dl_send(self->dl, 1, payload, 257, 0));
+
+    fbp_dl_tx_payload_max_set(self->dl, 1024);
+    assert_int_equal(1024, fbp_dl_tx_payload_max_get(self->dl));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_dl_send(self->dl, 1, payload, 1025, 0));
+    fbp_dl_tx_payload_max_set(self->dl, sizeof(payload) * 2);
+    assert_int_equal(sizeof(payload), fbp_dl_tx_payload_max_get(self->dl));
+
+    assert_int_equal(0, fbp_framer_construct_jumbo(b, 0, 1, payload, sizeof(payload)));
+    expect_value(ll_send, buffer_size, sizeof(payload) + FBP_FRAMER_JUMBO_OVERHEAD_SIZE);
+    expect_memory(ll_send, buffer, b, sizeof(payload) + FBP_FRAMER_JUMBO_OVERHEAD_SIZE);
+    assert_int_equal(0, fbp_dl_send(self->dl, 1, payload, sizeof(payload), 0));
+    send_and_expect(self, 1, 2, PAYLOAD1, sizeof(PAYLOAD1));
+    process_n(self, 2);
+
+    recv_link(self, FBP_FRAMER_FT_ACK_ALL, 1);
+    recv_eof(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(2, status.tx.data_frames);
+    TEARDOWN();
+}
+
+static void test_recv_jumbo(void ** state) {
+    SETUP();
+    uint8_t payload[2000];
+    uint8_t b[sizeof(payload) + FBP_FRAMER_JUMBO_OVERHEAD_SIZE];
+    for (size_t i = 0; i < sizeof(payload); ++i) {
+        payload[i] = (uint8_t) (i * 3);
+    }
+    connect(self);
+    assert_int_equal(0, fbp_framer_construct_jumbo(b, 0, 0x11, payload, sizeof(payload)));
+    fbp_dl_ll_recv(self->dl, b, sizeof(b));
+    expect_recv(0x11, payload, sizeof(payload));
+    recv_eof(self);
+    expect_send_link(self, FBP_FRAMER_FT_ACK_ALL, 0);
+    process_n(self, 5);
+
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(sizeof(payload), status.rx.msg_bytes);
+    assert_int_equal(1, status.rx.data_frames);
+    TEARDOWN();
+}
+#endif
+
+static void test_recv_out_of_order_ack_bitmap(void ** state) {
+    SETUP();
+    connect(self);
+    fbp_dl_tx_ack_bitmap_set(self->dl, true);
+    expect_recv(0x10, PAYLOAD1, sizeof(PAYLOAD1));
+    recv_data(self, 0, 0x10, PAYLOAD1, sizeof(PAYLOAD1));
+    recv_eof(self);
+    expect_send_link(self, FBP_FRAMER_FT_ACK_ALL, 0);
+    process_now(self);
+
+    // lose 1 and 4, single coalesced ACK_BITMAP instead of NACK + ACK_ONE per frame
+    recv_data(self, 2, 0x12, PAYLOAD1, sizeof(PAYLOAD1));
+    recv_data(self, 3, 0x13, PAYLOAD1, sizeof(PAYLOAD1));
+    recv_data(self, 5, 0x15, PAYLOAD1, sizeof(PAYLOAD1));
+    recv_eof(self);
+    expect_send_ack_bitmap(self, 0, 0x16);  // frame_id + 1 + bit: 2, 3, 5
+    process_now(self);
+
+    expect_recv(0x11, PAYLOAD1, sizeof(PAYLOAD1));
+    expect_recv(0x12, PAYLOAD1, sizeof(PAYLOAD1));
+    expect_recv(0x13, PAYLOAD1, sizeof(PAYLOAD1));
+    recv_data(self, 1, 0x11, PAYLOAD1, sizeof(PAYLOAD1));
+    recv_eof(self);
+    expect_send_ack_bitmap(self, 3, 0x02);  // 5
+    process_now(self);
+
+    expect_recv(0x14, PAYLOAD1, sizeof(PAYLOAD1));
+    expect_recv(0x15, PAYLOAD1, sizeof(PAYLOAD1));
+    recv_data(self, 4, 0x14, PAYLOAD1, sizeof(PAYLOAD1));
+    recv_eof(self);
+    expect_send_link(self, FBP_FRAMER_FT_ACK_ALL, 5);
+    process_now(self);
+
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(6, status.rx.data_frames);
+    TEARDOWN();
+}
+
+static void test_send_ack_bitmap_retransmit(void ** state) {
+    SETUP();
+    connect(self);
+    fbp_dl_tx_window_set(self->dl, 16);
+    for (uint16_t frame_id = 0; frame_id < 5; ++frame_id) {
+        send_and_expect(self, frame_id, 0x10 + frame_id, PAYLOAD1, sizeof(PAYLOAD1));
+    }
+    for (int i = 0; i < 5; ++i) {
+        process_now(self);
+        self->now += FBP_TIME_MICROSECOND * 100;  // data link minimum interval
+    }
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(5 * (sizeof(PAYLOAD1) + FBP_FRAMER_OVERHEAD_SIZE) + 1, status.tx.bytes);
+
+    // 0 in order, 2 & 4 received, so 1 & 3 were lost
+    expect_send_data(self, 1, 0x11, PAYLOAD1, sizeof(PAYLOAD1));
+    expect_send_data(self, 3, 0x13, PAYLOAD1, sizeof(PAYLOAD1));
+    recv_ack_bitmap(self, 0, 0x0a);
+    recv_eof(self);
+    process_now(self);
+    self->now += FBP_TIME_MICROSECOND * 100;
+    process_now(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(1, status.tx.data_frames);
+    assert_int_equal(2, status.tx.retransmissions);
+
+    // duplicate ACK_BITMAP sent before the retransmissions arrived: no resend
+    recv_ack_bitmap(self, 0, 0x0a);
+    recv_eof(self);
+    process_now(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(2, status.tx.retransmissions);
+
+    recv_link(self, FBP_FRAMER_FT_ACK_ALL, 4);
+    recv_eof(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(5, status.tx.data_frames);
+    TEARDOWN();
+}
+
+static void send_window(struct test_s *self, uint16_t frame_id, uint16_t count) {
+    for (uint16_t i = 0; i < count; ++i) {
+        send_and_expect(self, frame_id + i, 0x10 + i, PAYLOAD1, sizeof(PAYLOAD1));
+    }
+    for (uint16_t i = 0; i < count; ++i) {
+        process_now(self);
+        self->now += FBP_TIME_MICROSECOND * 100;  // data link minimum interval
+    }
+}
+
+static void test_send_congestion_window(void ** state) {
+    SETUP();
+    connect(self);
+    fbp_dl_tx_window_set(self->dl, 16);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(8, status.tx.window);
+    assert_int_equal(16, status.tx.window_max);
+
+    // slow start: grow by one frame per acknowledged frame
+    send_window(self, 0, 8);
+    assert_int_equal(FBP_ERROR_FULL, fbp_dl_send(self->dl, 0x18, PAYLOAD1, sizeof(PAYLOAD1), 0));
+    recv_link(self, FBP_FRAMER_FT_ACK_ALL, 7);
+    recv_eof(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(8, status.tx.data_frames);
+    assert_int_equal(16, status.tx.window);
+
+    // multiplicative decrease, once per congestion event
+    send_window(self, 8, 4);
+    recv_link(self, FBP_FRAMER_FT_NACK_FRAME_ID, 8);
+    recv_eof(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(8, status.tx.window);
+    recv_link(self, FBP_FRAMER_FT_NACK_FRAME_ID, 9);
+    recv_eof(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(8, status.tx.window);
+    assert_int_equal(2, status.rx.nack_frame_id);
+    assert_int_equal(8, status.tx.window_high_water);
+
+    expect_send_data(self, 8, 0x10, PAYLOAD1, sizeof(PAYLOAD1));
+    expect_send_data(self, 9, 0x11, PAYLOAD1, sizeof(PAYLOAD1));
+    process_now(self);
+    self->now += FBP_TIME_MICROSECOND * 100;
+    process_now(self);
+
+    // additive increase: one frame per window of acknowledged frames
+    recv_link(self, FBP_FRAMER_FT_ACK_ALL, 11);
+    recv_eof(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(12, status.tx.data_frames);
+    assert_int_equal(8, status.tx.window);
+    send_window(self, 12, 4);
+    recv_link(self, FBP_FRAMER_FT_ACK_ALL, 15);
+    recv_eof(self);
+    assert_int_equal(0, fbp_dl_status_get(self->dl, &status));
+    assert_int_equal(9, status.tx.window);
     TEARDOWN();
 }
 
@@ -490,6 +775,7 @@ int main(void) {
     hal_test_initialize();
     const struct CMUnitTest tests[] = {
             cmocka_unit_test(test_initial_state),
+            cmocka_unit_test(test_disconnected_time),
             cmocka_unit_test(test_send_when_not_connected),
             cmocka_unit_test(test_on_invalid_send),
             cmocka_unit_test(test_on_send_cbk),
@@ -498,10 +784,18 @@ int main(void) {
             cmocka_unit_test(test_send_two_before_tx_window_set),
             cmocka_unit_test(test_send_nack_resend_ack),
             cmocka_unit_test(test_send_data_timeout_then_ack),
+            cmocka_unit_test(test_send_adaptive_rto),
             cmocka_unit_test(test_send_multiple_with_buffer_wrap),
             cmocka_unit_test(test_recv_and_ack),
             cmocka_unit_test(test_recv_multiple_all_acks),
             cmocka_unit_test(test_recv_out_of_order),
+            cmocka_unit_test(test_recv_out_of_order_ack_bitmap),
+            cmocka_unit_test(test_send_ack_bitmap_retransmit),
+            cmocka_unit_test(test_send_congestion_window),
+#if FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE
+            cmocka_unit_test(test_send_jumbo),
+            cmocka_unit_test(test_recv_jumbo),
+#endif
             cmocka_unit_test(test_reset_retry),
     };
 
@@ -93,6 +93,22 @@ static void send_link(struct test_s * self, enum fbp_framer_type_e frame_type, u
     send_eof(&self->f);
 }
 
+static void on_ack_bitmap(void * user_data, uint16_t frame_id, uint64_t bitmap) {
+    struct test_s * self = (struct test_s *) user_data;
+    (void) self;
+    check_expected(frame_id);
+    check_expected(bitmap);
+}
+
+static void send_ack_bitmap(struct test_s * self, uint16_t frame_id, uint64_t bitmap) {
+    uint8_t b[FBP_FRAMER_ACK_BITMAP_SIZE];
+    assert_int_equal(0, fbp_framer_construct_ack_bitmap(b, frame_id, bitmap));
+    fbp_framer_ll_recv(&self->f, b, sizeof(b));
+    expect_value(on_ack_bitmap, frame_id, frame_id);
+    expect_value(on_ack_bitmap, bitmap, bitmap);
+    send_eof(&self->f);
+}
+
 static void on_framing_error(void * user_data) {
     struct test_s * self = (struct test_s *) user_data;
     (void) self;
@@ -110,6 +126,7 @@ static int setup(void ** state) {
     self->f.api.framing_error_fn = on_framing_error;
     self->f.api.link_fn = on_link;
     self->f.api.data_fn = on_data;
+    self->f.api.ack_bitmap_fn = on_ack_bitmap;
     fbp_framer_construct_data(self->frame1, 1, 2, PAYLOAD1, sizeof(PAYLOAD1));
     fbp_framer_reset(&self->f);
     *state = self;
@@ -146,6 +163,33 @@ static void test_nack_framing_error(void ** state) {
     send_link(self, FBP_FRAMER_FT_NACK_FRAMING_ERROR, 0);
 }
 
+static void test_ack_bitmap(void ** state) {
+    struct test_s *self = (struct test_s *) *state;
+    send_ack_bitmap(self, 0, 0);
+    send_ack_bitmap(self, 1, 0x8000000000000001ULL);
+    send_ack_bitmap(self, FBP_FRAMER_FRAME_ID_MAX, 0x0123456789abcdefULL);
+    send_link(self, FBP_FRAMER_FT_ACK_ALL, 2);
+    send_data(self, 1, 2, PAYLOAD1, sizeof(PAYLOAD1));
+    send_ack_bitmap(self, 3, 0x55);  // SOF1 in bitmap
+    assert_int_equal(0, self->f.status.resync);
+
+    uint8_t b[FBP_FRAMER_ACK_BITMAP_SIZE];
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_framer_construct_ack_bitmap(b, FBP_FRAMER_FRAME_ID_MAX + 1, 0));
+    assert_false(fbp_framer_validate_link(FBP_FRAMER_FT_ACK_BITMAP, 0));
+}
+
+static void test_ack_bitmap_corrupt(void ** state) {
+    struct test_s *self = (struct test_s *) *state;
+    uint8_t b[FBP_FRAMER_ACK_BITMAP_SIZE];
+    send_link(self, FBP_FRAMER_FT_ACK_ALL, 1);
+    assert_int_equal(0, fbp_framer_construct_ack_bitmap(b, 2, 0x0f));
+    b[6] ^= 0x10;
+    expect_framing_error();
+    fbp_framer_ll_recv(&self->f, b, sizeof(b));
+    send_eof(&self->f);
+    send_ack_bitmap(self, 3, 0xf0);
+}
+
 static void test_garbage(void ** state) {
     struct test_s *self = (struct test_s *) *state;
     fbp_framer_ll_recv(&self->f, GARBAGE1, sizeof(GARBAGE1));
@@ -247,6 +291,162 @@ static void test_truncated_flush_with_sof(void ** state) {
     send_data(self, 1, 2, PAYLOAD1, sizeof(PAYLOAD1));
 }
 
+static uint32_t construct_stream(uint8_t * b, uint16_t frame_id_start, uint16_t frame_count, bool garbage) {
+    uint32_t sz = 0;
+    for (uint16_t i = 0; i < frame_count; ++i) {
+        if (garbage) {
+            if (i) {
+                b[sz++] = FBP_FRAMER_SOF1;  // EOF
+            }
+            memcpy(b + sz, GARBAGE1, sizeof(GARBAGE1));
+            sz += sizeof(GARBAGE1);
+        }
+        if (i & 1) {
+            assert_int_equal(0, fbp_framer_construct_link(b + sz, FBP_FRAMER_FT_ACK_ONE, frame_id_start + i));
+            sz += FBP_FRAMER_LINK_SIZE;
+        } else {
+            assert_int_equal(0, fbp_framer_construct_data(b + sz, frame_id_start + i, 2, PAYLOAD1, sizeof(PAYLOAD1)));
+            sz += sizeof(PAYLOAD1) + FBP_FRAMER_OVERHEAD_SIZE;
+        }
+    }
+    b[sz++] = FBP_FRAMER_SOF1;
+    return sz;
+}
+
+static void expect_stream(uint16_t frame_id_start, uint16_t frame_count) {
+    for (uint16_t i = 0; i < frame_count; ++i) {
+        if (i & 1) {
+            expect_link(FBP_FRAMER_FT_ACK_ONE, frame_id_start + i);
+        } else {
+            expect_data(frame_id_start + i, 2, PAYLOAD1, sizeof(PAYLOAD1));
+        }
+    }
+}
+
+#if FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE
+static void send_jumbo(struct test_s * self, uint16_t frame_id, uint16_t metadata,
+                       uint8_t const *msg_buffer, uint32_t msg_size) {
+    uint8_t b[FBP_FRAMER_LARGEST_SIZE];
+    assert_int_equal(0, fbp_framer_construct_jumbo(b, frame_id, metadata, msg_buffer, msg_size));
+    fbp_framer_ll_recv(&self->f, b, msg_size + FBP_FRAMER_JUMBO_OVERHEAD_SIZE);
+    expect_data(frame_id, metadata, msg_buffer, msg_size);
+    send_eof(&self->f);
+}
+
+static void test_jumbo(void ** state) {
+    struct test_s *self = (struct test_s *) *state;
+    uint8_t b[FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE];
+    for (size_t i = 0; i < sizeof(b); ++i) {
+        b[i] = (uint8_t) ((i * 7) & 0xff);
+    }
+    send_jumbo(self, 1, 2, b, 1);
+    send_jumbo(self, 2, 3, b, 257);
+    send_jumbo(self, FBP_FRAMER_FRAME_ID_MAX, 0xffff, b, sizeof(b));
+    send_data(self, 3, 4, PAYLOAD1, sizeof(PAYLOAD1));
+    assert_int_equal(0, self->f.status.resync);
+}
+
+static void test_jumbo_split(void ** state) {
+    struct test_s *self = (struct test_s *) *state;
+    uint8_t payload[300];
+    uint8_t b[sizeof(payload) + FBP_FRAMER_JUMBO_OVERHEAD_SIZE];
+    for (size_t i = 0; i < sizeof(payload); ++i) {
+        payload[i] = (uint8_t) i;
+    }
+    assert_int_equal(0, fbp_framer_construct_jumbo(b, 5, 6, payload, sizeof(payload)));
+    for (uint32_t split = 1; split < sizeof(b); ++split) {
+        fbp_framer_ll_recv(&self->f, b, split);
+        fbp_framer_ll_recv(&self->f, b + split, sizeof(b) - split);
+        expect_data(5, 6, payload, sizeof(payload));
+        send_eof(&self->f);
+    }
+    assert_int_equal(0, self->f.status.resync);
+}
+
+static void test_jumbo_corrupt(void ** state) {
+    struct test_s *self = (struct test_s *) *state;
+    uint8_t payload[512];
+    uint8_t b[sizeof(payload) + FBP_FRAMER_JUMBO_OVERHEAD_SIZE];
+    memset(payload, 0x5a, sizeof(payload));
+    send_jumbo(self, 4, 5, payload, sizeof(payload));
+
+    // corrupt length
+    assert_int_equal(0, fbp_framer_construct_jumbo(b, 5, 6, payload, sizeof(payload)));
+    b[5] ^= 0x01;
+    expect_framing_error();
+    fbp_framer_ll_recv(&self->f, b, sizeof(b));
+    send_link(self, FBP_FRAMER_FT_ACK_ALL, 1);
+
+    // corrupt payload
+    assert_int_equal(0, fbp_framer_construct_jumbo(b, 5, 6, payload, sizeof(payload)));
+    b[FBP_FRAMER_JUMBO_HEADER_SIZE + 100] ^= 0x80;
+    expect_framing_error();
+    fbp_framer_ll_recv(&self->f, b, sizeof(b));
+    send_eof(&self->f);
+    send_jumbo(self, 7, 8, payload, sizeof(payload));
+}
+
+static void test_construct_jumbo_checks(void ** state) {
+    struct test_s *self = (struct test_s *) *state;
+    (void) self;
+    uint8_t b[FBP_FRAMER_LARGEST_SIZE];
+    uint8_t payload[FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE + 1];
+    memset(payload, 0, sizeof(payload));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_framer_construct_jumbo(b, FBP_FRAMER_FRAME_ID_MAX + 1, 0, payload, 300));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_framer_construct_jumbo(b, 0, 0, payload, 0));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_framer_construct_jumbo(b, 0, 0, payload, sizeof(payload)));
+    assert_false(fbp_framer_validate_jumbo(0, 0, sizeof(payload)));
+    assert_true(fbp_framer_validate_jumbo(0, 0, sizeof(payload) - 1));
+}
+#endif
+
+static void test_multiple_frames_in_buffer(void ** state) {
+    struct test_s *self = (struct test_s *) *state;
+    uint8_t b[16 * FBP_FRAMER_MAX_SIZE];
+    uint32_t sz = construct_stream(b, 1, 16, false);
+    expect_stream(1, 16);
+    fbp_framer_ll_recv(&self->f, b, sz);
+    assert_int_equal(sz, self->f.status.total_bytes);
+    assert_int_equal(0, self->f.status.ignored_bytes);
+    assert_int_equal(0, self->f.status.resync);
+}
+
+static void test_garbage_between_frames(void ** state) {
+    struct test_s *self = (struct test_s *) *state;
+    struct fbp_framer_s f_bytewise;
+    uint8_t b[8 * (FBP_FRAMER_MAX_SIZE + sizeof(GARBAGE1) + 1)];
+    uint32_t sz = construct_stream(b, 1, 8, true);
+    expect_stream(1, 8);
+    expect_any_count(on_framing_error, self, 7);
+    fbp_framer_ll_recv(&self->f, b, sz);
+
+    // byte-at-a-time processing must match the bulk scanner status
+    memcpy(&f_bytewise, &self->f, sizeof(f_bytewise));
+    fbp_framer_reset(&f_bytewise);
+    f_bytewise.api.data_fn = NULL;
+    f_bytewise.api.link_fn = NULL;
+    f_bytewise.api.framing_error_fn = NULL;
+    for (uint32_t i = 0; i < sz; ++i) {
+        fbp_framer_ll_recv(&f_bytewise, b + i, 1);
+    }
+    assert_int_equal(f_bytewise.status.total_bytes, self->f.status.total_bytes);
+    assert_int_equal(f_bytewise.status.ignored_bytes, self->f.status.ignored_bytes);
+    assert_int_equal(f_bytewise.status.resync, self->f.status.resync);
+}
+
+static void test_stream_split(void ** state) {
+    struct test_s *self = (struct test_s *) *state;
+    uint8_t b[4 * FBP_FRAMER_MAX_SIZE];
+    uint32_t sz = construct_stream(b, 1, 4, false);
+    for (uint32_t split = 1; split < sz; ++split) {
+        fbp_framer_reset(&self->f);
+        expect_stream(1, 4);
+        fbp_framer_ll_recv(&self->f, b, split);
+        fbp_framer_ll_recv(&self->f, b + split, sz - split);
+        assert_int_equal(0, self->f.status.ignored_bytes);
+    }
+}
+
 static void test_frame_id_subtract(void ** state) {
     struct test_s *self = (struct test_s *) *state;
     (void) self;
@@ -323,6 +523,8 @@ int main(void) {
             cmocka_unit_test_setup_teardown(test_ack_one, setup, teardown),
             cmocka_unit_test_setup_teardown(test_nack_frame_id, setup, teardown),
             cmocka_unit_test_setup_teardown(test_nack_framing_error, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_ack_bitmap, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_ack_bitmap_corrupt, setup, teardown),
             cmocka_unit_test_setup_teardown(test_garbage, setup, teardown),
             cmocka_unit_test_setup_teardown(test_garbage_then_ack_all, setup, teardown),
             cmocka_unit_test_setup_teardown(test_sofs_garbage_sofs_link, setup, teardown),
@@ -336,6 +538,15 @@ int main(void) {
             cmocka_unit_test_setup_teardown(test_construct_data_checks, setup, teardown),
             cmocka_unit_test_setup_teardown(test_reset, setup, teardown),
             cmocka_unit_test_setup_teardown(test_truncated_flush_with_sof, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_multiple_frames_in_buffer, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_garbage_between_frames, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_stream_split, setup, teardown),
+#if FBP_FRAMER_JUMBO_PAYLOAD_MAX_SIZE
+            cmocka_unit_test_setup_teardown(test_jumbo, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_jumbo_split, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_jumbo_corrupt, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_construct_jumbo_checks, setup, teardown),
+#endif
             cmocka_unit_test_setup_teardown(test_frame_id_subtract, setup, teardown),
             cmocka_unit_test_setup_teardown(test_length_crc, setup, teardown),
     };
@@ -141,7 +141,7 @@ int main(int argc, char * argv[]) {
     struct uart_config_s uart_config = {
             .baudrate = baudrate,
             .send_buffer_size = (FBP_FRAMER_MAX_SIZE + 4) / 2,
-            .send_buffer_count = 8,
+            .send_buffer_count = 8 * ((FBP_FRAMER_LARGEST_SIZE + FBP_FRAMER_MAX_SIZE - 1) / FBP_FRAMER_MAX_SIZE),
             .recv_buffer_size = FBP_FRAMER_MAX_SIZE,
             .recv_buffer_count = 16,
             .recv_fn = on_uart_recv,
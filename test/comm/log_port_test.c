@@ -150,6 +150,25 @@ static void test_receive(void ** state) {
     TEARDOWN();
 }
 
+static void test_receive_read_only(void ** state) {
+    SETUP();
+    fbp_logp_handler_register(api, on_recv, api);
+    api->on_event(api, FBP_DL_EV_APP_CONNECTED);
+    uint8_t buf[MSG_SZ];
+    uint8_t expect[MSG_SZ];
+    uint32_t length = msg_format(buf, &HEADER(CRITICAL, 'a', 0, 10, 42), "file.c", "hi?");
+    memcpy(expect, buf, sizeof(buf));
+    expect_recv(&HEADER(CRITICAL, 'a', 0, 10, 42), "file.c", "hi?");
+    api->on_recv(api, 2, FBP_TRANSPORT_SEQ_SINGLE, 0, (uint8_t *) &buf, length);
+    assert_memory_equal(expect, buf, sizeof(buf));  // receive buffer unmodified
+
+    // message without null terminator is bounded by msg_size
+    expect_recv(&HEADER(CRITICAL, 'a', 0, 10, 42), "file.c", "hi");
+    api->on_recv(api, 2, FBP_TRANSPORT_SEQ_SINGLE, 0, (uint8_t *) &buf, length - 2);
+    assert_memory_equal(expect, buf, sizeof(buf));
+    TEARDOWN();
+}
+
 int main(void) {
     hal_test_initialize();
     const struct CMUnitTest tests[] = {
@@ -157,6 +176,7 @@ int main(void) {
             cmocka_unit_test(test_publish_one),
             cmocka_unit_test(test_publish_filtered),
             cmocka_unit_test(test_receive),
+            cmocka_unit_test(test_receive_read_only),
     };
 
     return cmocka_run_group_tests(tests, NULL, NULL);
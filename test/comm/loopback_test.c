@@ -0,0 +1,119 @@
+/*
+ * Copyright 2014-2021 Jetperch LLC
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "../hal_test_impl.h"
+#include <stdarg.h>
+#include <stddef.h>
+#include <setjmp.h>
+#include <cmocka.h>
+#include <stdlib.h>
+#include <string.h>
+#include "fitterbap/host/comm.h"
+#include "fitterbap/host/loopback.h"
+#include "fitterbap/os/task.h"
+#include "fitterbap/platform.h"
+#include "fitterbap/time.h"
+#include "fitterbap/ec.h"
+
+
+#define CONNECTED_TOPIC FBP_LOOPBACK_TOPIC_PREFIX "c/0/state"
+
+static volatile int connected_ = 0;
+
+// cmocka's test_malloc is not thread safe, use the system allocator.
+static void * alloc_threadsafe(fbp_size_t size_bytes) {
+    return malloc((size_t) size_bytes);
+}
+
+static void test_parse_default(void **state) {
+    (void) state;
+    struct fbp_loopback_config_s config;
+    assert_true(fbp_loopback_is_device("loop://"));
+    assert_false(fbp_loopback_is_device("/dev/ttyACM0"));
+    assert_int_equal(0, fbp_loopback_parse("loop://", &config));
+    assert_int_equal(0, config.byte_drop_rate);
+    assert_int_equal(0, config.bit_error_rate);
+    assert_int_equal(1, config.seed);
+}
+
+static void test_parse_params(void **state) {
+    (void) state;
+    struct fbp_loopback_config_s config;
+    assert_int_equal(0, fbp_loopback_parse("loop://?byte_drop_rate=1000&bit_error_rate=2000&seed=3", &config));
+    assert_int_equal(1000, config.byte_drop_rate);
+    assert_int_equal(2000, config.bit_error_rate);
+    assert_int_equal(3, config.seed);
+}
+
+static void test_parse_invalid(void **state) {
+    (void) state;
+    struct fbp_loopback_config_s config;
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_loopback_parse("loop:/", &config));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_loopback_parse("loop://x", &config));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_loopback_parse("loop://?seed", &config));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_loopback_parse("loop://?seed=x", &config));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_loopback_parse("loop://?unknown=1", &config));
+}
+
+static uint8_t on_pubsub(void * user_data, const char * topic, const struct fbp_union_s * value) {
+    (void) user_data;
+    if ((0 == strcmp(topic, CONNECTED_TOPIC)) && (value->value.u32 == 1)) {
+        connected_ = 1;
+    }
+    return 0;
+}
+
+static void connect_and_finalize(const char * device) {
+    struct fbp_dl_config_s config = {
+            .tx_link_size = 64,
+            .tx_window_size = 64,
+            .rx_window_size = 64,
+            .tx_timeout = 16 * FBP_TIME_MILLISECOND,
+    };
+    fbp_allocator_set(alloc_threadsafe, free);
+    connected_ = 0;
+    struct fbp_comm_s * comm = fbp_comm_initialize(&config, device, 3000000, on_pubsub, NULL);
+    assert_non_null(comm);
+    for (int i = 0; !connected_ && (i < 500); ++i) {
+        fbp_os_sleep(10 * FBP_TIME_MILLISECOND);
+    }
+    fbp_comm_finalize(comm);
+    hal_test_initialize();
+    assert_int_equal(1, connected_);
+}
+
+static void test_connect(void **state) {
+    (void) state;
+    connect_and_finalize("loop://");
+}
+
+static void test_connect_with_errors(void **state) {
+    (void) state;
+    connect_and_finalize("loop://?byte_drop_rate=500&bit_error_rate=500&seed=7");
+}
+
+int main(void) {
+    hal_test_initialize();
+    const struct CMUnitTest tests[] = {
+            cmocka_unit_test(test_parse_default),
+            cmocka_unit_test(test_parse_params),
+            cmocka_unit_test(test_parse_invalid),
+            cmocka_unit_test(test_connect),
+            cmocka_unit_test(test_connect_with_errors),
+    };
+
+    return cmocka_run_group_tests(tests, NULL, NULL);
+}
@@ -66,6 +66,7 @@ struct fbp_transport_s * instance_;
 #define META_MSG_PORT1 "\x21" META_PORT1
 #define TX_WINDOW_SIZE 16
 #define RX_WINDOW_SIZE 12
+#define PAYLOAD_MAX_SIZE 4096
 
 struct fbp_time_counter_s fbp_time_counter() {
     return (struct fbp_time_counter_s) {.frequency = 1000, .value = instance_->counter};
@@ -123,6 +124,31 @@ uint32_t fbp_dl_rx_window_get(struct fbp_dl_s * self) {
     return RX_WINDOW_SIZE;
 }
 
+uint32_t fbp_dl_payload_max_get(struct fbp_dl_s * self) {
+    (void) self;
+    return PAYLOAD_MAX_SIZE;
+}
+
+void fbp_dl_tx_payload_max_set(struct fbp_dl_s * self, uint32_t payload_max_size) {
+    intptr_t dl = (intptr_t) self;
+    check_expected(dl);
+    check_expected(payload_max_size);
+}
+
+#define expect_tx_payload_max_set(dl_, payload_max_size_) \
+    expect_value(fbp_dl_tx_payload_max_set, dl, dl_);   \
+    expect_value(fbp_dl_tx_payload_max_set, payload_max_size, payload_max_size_);
+
+void fbp_dl_tx_ack_bitmap_set(struct fbp_dl_s * self, bool enable) {
+    intptr_t dl = (intptr_t) self;
+    check_expected(dl);
+    check_expected(enable);
+}
+
+#define expect_tx_ack_bitmap_set(dl_, enable_) \
+    expect_value(fbp_dl_tx_ack_bitmap_set, dl, dl_);   \
+    expect_value(fbp_dl_tx_ack_bitmap_set, enable, enable_);
+
 void fbp_transport_event_inject(struct fbp_transport_s * self, enum fbp_dl_event_e event) {
     (void) self;
     check_expected(event);
@@ -322,13 +348,16 @@ static void test_server_connect(void ** state) {
     fbp_port0_on_event_cbk(p, FBP_DL_EV_CONNECTED);
 
     // process tick to initiate negotiation req
-    uint32_t negotiate_payload[4] = {FBP_DL_VERSION, 0, TX_WINDOW_SIZE, RX_WINDOW_SIZE};
+    uint32_t negotiate_payload[5] = {FBP_DL_VERSION, 0, TX_WINDOW_SIZE, RX_WINDOW_SIZE, PAYLOAD_MAX_SIZE};
     expect_send(0, FBP_TRANSPORT_SEQ_SINGLE, REQ(NEGOTIATE), negotiate_payload, sizeof(negotiate_payload));
     evm_process_next(self);
 
     // negotiate -> meta
     negotiate_payload[2] = RX_WINDOW_SIZE;
+    negotiate_payload[4] = 1024;
     expect_tx_window_set(&self->dl1, RX_WINDOW_SIZE);
+    expect_tx_payload_max_set(&self->dl1, 1024);
+    expect_tx_ack_bitmap_set(&self->dl1, true);
     fbp_port0_on_recv_cbk(p, 0, FBP_TRANSPORT_SEQ_SINGLE, RSP(NEGOTIATE), (uint8_t *) negotiate_payload, sizeof(negotiate_payload));
 
     // client is in timestamp states, should handle these in all server states
@@ -380,12 +409,14 @@ static void test_client_connect(void ** state) {
     fbp_port0_on_event_cbk(p, FBP_DL_EV_CONNECTED);
 
     // negotiate -> timesync
-    uint32_t negotiate_req[4] = {FBP_DL_VERSION, 0, TX_WINDOW_SIZE, RX_WINDOW_SIZE};
-    uint32_t negotiate_rsq[4] = {FBP_DL_VERSION, 0, RX_WINDOW_SIZE, RX_WINDOW_SIZE};
+    uint32_t negotiate_req[5] = {FBP_DL_VERSION, 0, TX_WINDOW_SIZE, RX_WINDOW_SIZE, 1024};
+    uint32_t negotiate_rsq[5] = {FBP_DL_VERSION, 0, RX_WINDOW_SIZE, RX_WINDOW_SIZE, 1024};
     expect_send(0, FBP_TRANSPORT_SEQ_SINGLE, RSP(NEGOTIATE), negotiate_rsq, sizeof(negotiate_rsq));
 
     // negotiate -> timestamp
     expect_tx_window_set(&self->dl1, RX_WINDOW_SIZE);
+    expect_tx_payload_max_set(&self->dl1, 1024);
+    expect_tx_ack_bitmap_set(&self->dl1, true);
     fbp_port0_on_recv_cbk(p, 0, FBP_TRANSPORT_SEQ_SINGLE, REQ(NEGOTIATE), (uint8_t *) negotiate_req, sizeof(negotiate_req));
 
     client_timestamp(self);
@@ -412,6 +443,22 @@ static void test_client_connect(void ** state) {
     FINALIZE();
 }
 
+static void test_server_negotiate_v1_0(void ** state) {
+    INITIALIZE(SERVER);
+    fbp_port0_on_event_cbk(p, FBP_DL_EV_CONNECTED);
+    uint32_t negotiate_payload[5] = {FBP_DL_VERSION, 0, TX_WINDOW_SIZE, RX_WINDOW_SIZE, PAYLOAD_MAX_SIZE};
+    expect_send(0, FBP_TRANSPORT_SEQ_SINGLE, REQ(NEGOTIATE), negotiate_payload, sizeof(negotiate_payload));
+    evm_process_next(self);
+
+    // data link 1.0 response without payload_max_size
+    uint32_t negotiate_rsp[4] = {FBP_VERSION_ENCODE_U32(1, 0, 0), 0, RX_WINDOW_SIZE, RX_WINDOW_SIZE};
+    expect_tx_window_set(&self->dl1, RX_WINDOW_SIZE);
+    expect_tx_payload_max_set(&self->dl1, FBP_FRAMER_PAYLOAD_MAX_SIZE);
+    expect_tx_ack_bitmap_set(&self->dl1, false);
+    fbp_port0_on_recv_cbk(p, 0, FBP_TRANSPORT_SEQ_SINGLE, RSP(NEGOTIATE), (uint8_t *) negotiate_rsp, sizeof(negotiate_rsp));
+    FINALIZE();
+}
+
 static void test_server_timeout_in_negotiate(void ** state) {
     INITIALIZE(SERVER);
 
@@ -420,7 +467,7 @@ static void test_server_timeout_in_negotiate(void ** state) {
     fbp_port0_on_event_cbk(p, FBP_DL_EV_CONNECTED);
 
     // await_client -> negotiate
-    uint32_t negotiate_payload[4] = {FBP_DL_VERSION, 0, TX_WINDOW_SIZE, RX_WINDOW_SIZE};
+    uint32_t negotiate_payload[5] = {FBP_DL_VERSION, 0, TX_WINDOW_SIZE, RX_WINDOW_SIZE, PAYLOAD_MAX_SIZE};
     expect_send(0, FBP_TRANSPORT_SEQ_SINGLE, REQ(NEGOTIATE), negotiate_payload, sizeof(negotiate_payload));
     evm_process_next(self);
 
@@ -482,7 +529,11 @@ static void test_connect(void ** state) {
     self->timestamp += FBP_TIME_MILLISECOND * 10;
 
     expect_tx_window_set(&self->dl2, RX_WINDOW_SIZE);
+    expect_tx_payload_max_set(&self->dl2, PAYLOAD_MAX_SIZE);
+    expect_tx_ack_bitmap_set(&self->dl2, true);
     expect_tx_window_set(&self->dl1, RX_WINDOW_SIZE);
+    expect_tx_payload_max_set(&self->dl1, PAYLOAD_MAX_SIZE);
+    expect_tx_ack_bitmap_set(&self->dl1, true);
 
     expect_dl_event_inject(&self->dl1, FBP_DL_EV_TRANSPORT_CONNECTED);
     expect_dl_event_inject(&self->dl2, FBP_DL_EV_TRANSPORT_CONNECTED);
@@ -505,6 +556,7 @@ int main(void) {
     const struct CMUnitTest tests[] = {
             cmocka_unit_test_setup_teardown(test_server_connect, setup, teardown),
             cmocka_unit_test_setup_teardown(test_client_connect, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_server_negotiate_v1_0, setup, teardown),
             cmocka_unit_test_setup_teardown(test_server_timeout_in_negotiate, setup, teardown),
             cmocka_unit_test_setup_teardown(test_connect, setup, teardown),
     };
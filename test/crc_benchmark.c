@@ -0,0 +1,138 @@
+/*
+ * Copyright 2014-2021 Jetperch LLC
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+/*
+ * Report the throughput for each CRC implementation.
+ *
+ * Usage: crc_benchmark [block_size]
+ */
+
+#include "fitterbap/crc.h"
+#include "fitterbap/config.h"
+#include "fitterbap/platform.h"
+#include "fitterbap/time.h"
+#include <stdio.h>
+#include <stdlib.h>
+
+
+#define DURATION (FBP_TIME_MILLISECOND * 250)
+
+typedef uint32_t (*crc_fn)(uint32_t crc, uint8_t const *data, uint32_t length);
+
+static uint32_t crc8_bitwise(uint32_t crc, uint8_t const *data, uint32_t length) {
+    return fbp_crc_ccitt_8_bitwise((uint8_t) crc, data, length);
+}
+
+static uint32_t crc16_bitwise(uint32_t crc, uint8_t const *data, uint32_t length) {
+    return fbp_crc_ccitt_16_bitwise((uint16_t) crc, data, length);
+}
+
+#if FBP_CRC_SLICE_BY >= 1
+static uint32_t crc8_slice1(uint32_t crc, uint8_t const *data, uint32_t length) {
+    return fbp_crc_ccitt_8_slice1((uint8_t) crc, data, length);
+}
+
+static uint32_t crc16_slice1(uint32_t crc, uint8_t const *data, uint32_t length) {
+    return fbp_crc_ccitt_16_slice1((uint16_t) crc, data, length);
+}
+#endif
+
+#if FBP_CRC_SLICE_BY >= 4
+static uint32_t crc16_slice4(uint32_t crc, uint8_t const *data, uint32_t length) {
+    return fbp_crc_ccitt_16_slice4((uint16_t) crc, data, length);
+}
+#endif
+
+#if FBP_CRC_SLICE_BY >= 8
+static uint32_t crc16_slice8(uint32_t crc, uint8_t const *data, uint32_t length) {
+    return fbp_crc_ccitt_16_slice8((uint16_t) crc, data, length);
+}
+#endif
+
+struct variant_s {
+    const char * name;
+    crc_fn fn;
+};
+
+static const struct variant_s variants[] = {
+        {"crc8_bitwise", crc8_bitwise},
+#if FBP_CRC_SLICE_BY >= 1
+        {"crc8_slice1", crc8_slice1},
+#endif
+        {"crc16_bitwise", crc16_bitwise},
+#if FBP_CRC_SLICE_BY >= 1
+        {"crc16_slice1", crc16_slice1},
+#endif
+#if FBP_CRC_SLICE_BY >= 4
+        {"crc16_slice4", crc16_slice4},
+#endif
+#if FBP_CRC_SLICE_BY >= 8
+        {"crc16_slice8", crc16_slice8},
+#endif
+        {"crc32_slice1", fbp_crc32_slice1},
+#if FBP_CRC_SLICE_BY >= 4
+        {"crc32_slice4", fbp_crc32_slice4},
+#endif
+#if FBP_CRC_SLICE_BY >= 8
+        {"crc32_slice8", fbp_crc32_slice8},
+#endif
+        {"crc32_pclmul", fbp_crc32_pclmul},
+        {NULL, NULL},
+};
+
+static double benchmark(crc_fn fn, uint8_t const * data, uint32_t length) {
+    volatile uint32_t crc = 0;
+    uint64_t iterations = 0;
+    int64_t t_start = fbp_time_rel();
+    int64_t t_end = t_start + DURATION;
+    int64_t t_now = t_start;
+    while (t_now < t_end) {
+        for (int i = 0; i < 64; ++i) {
+            crc = fn(crc, data, length);
+        }
+        iterations += 64;
+        t_now = fbp_time_rel();
+    }
+    double duration = FBP_TIME_TO_F64(t_now - t_start);
+    return ((double) iterations * length) / duration;
+}
+
+int main(int argc, char * argv[]) {
+    uint32_t length = 272;  // FBP_FRAMER_MAX_SIZE
+    if (argc > 1) {
+        length = (uint32_t) strtoul(argv[1], NULL, 0);
+    }
+    if (!length) {
+        printf("invalid block size\n");
+        return 1;
+    }
+    uint8_t * data = malloc(length);
+    if (!data) {
+        return 1;
+    }
+    for (uint32_t i = 0; i < length; ++i) {
+        data[i] = (uint8_t) (rand() & 0xff);
+    }
+
+    printf("FBP_CRC_SLICE_BY=%d, pclmul_supported=%d, block_size=%u\n",
+           (int) FBP_CRC_SLICE_BY, fbp_crc32_pclmul_supported() ? 1 : 0, (unsigned int) length);
+    for (const struct variant_s * v = variants; v->name; ++v) {
+        double rate = benchmark(v->fn, data, length);
+        printf("%-16s %10.1f MB/s\n", v->name, rate / 1e6);
+    }
+    free(data);
+    return 0;
+}
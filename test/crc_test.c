@@ -19,6 +19,8 @@
 #include <setjmp.h>
 #include <cmocka.h>
 #include "fitterbap/crc.h"
+#include "fitterbap/config.h"
+#include <stdlib.h>
 
 
 uint8_t const MSG0[] = { 0x00, 0x00, 0x00, 0x00 };
@@ -112,19 +114,124 @@ static void crc32_invalid_args(void **state) {
     assert_int_equal(0x00000000, fbp_crc32(0, MSG_00, 0));
 }
 
+static void crc64_well_known(void **state) {
+    (void) state;
+    assert_true(0x995dc9bbdf1939faULL == fbp_crc64(0, MSG4, sizeof(MSG4)));
+    assert_true(0x330284772e652b05ULL == fbp_crc64(0, (uint8_t const *) "a", 1));
+}
+
+static void crc64_incremental(void **state) {
+    (void) state;
+    uint64_t crc = 0;
+    crc = fbp_crc64(crc, MSG4, 5);
+    crc = fbp_crc64(crc, MSG4 + 5, sizeof(MSG4) - 5);
+    assert_true(0x995dc9bbdf1939faULL == crc);
+}
+
+static void crc64_invalid_args(void **state) {
+    (void) state;
+    assert_true(0 == fbp_crc64(0, 0, 4));
+    assert_true(0 == fbp_crc64(0, MSG_00, 0));
+}
+
+static void fill_random(uint8_t * data, uint32_t length) {
+    srand(1);
+    for (uint32_t i = 0; i < length; ++i) {
+        data[i] = (uint8_t) (rand() & 0xff);
+    }
+}
+
+static void crc_ccitt_8_variants(void **state) {
+    (void) state;
+    uint8_t data[520];
+    fill_random(data, sizeof(data));
+    for (uint32_t offset = 0; offset < 8; ++offset) {
+        for (uint32_t length = 0; length < (sizeof(data) - offset); length += 7) {
+            uint8_t expect = fbp_crc_ccitt_8_bitwise(0x5a, data + offset, length);
+            assert_int_equal(expect, fbp_crc_ccitt_8(0x5a, data + offset, length));
+#if FBP_CRC_SLICE_BY >= 1
+            assert_int_equal(expect, fbp_crc_ccitt_8_slice1(0x5a, data + offset, length));
+#endif
+        }
+    }
+}
+
+static void crc_ccitt_16_variants(void **state) {
+    (void) state;
+    uint8_t data[520];
+    fill_random(data, sizeof(data));
+    for (uint32_t offset = 0; offset < 8; ++offset) {
+        for (uint32_t length = 0; length < (sizeof(data) - offset); ++length) {
+            uint16_t expect = fbp_crc_ccitt_16_bitwise(0x5a5a, data + offset, length);
+            assert_int_equal(expect, fbp_crc_ccitt_16(0x5a5a, data + offset, length));
+#if FBP_CRC_SLICE_BY >= 1
+            assert_int_equal(expect, fbp_crc_ccitt_16_slice1(0x5a5a, data + offset, length));
+#endif
+#if FBP_CRC_SLICE_BY >= 4
+            assert_int_equal(expect, fbp_crc_ccitt_16_slice4(0x5a5a, data + offset, length));
+#endif
+#if FBP_CRC_SLICE_BY >= 8
+            assert_int_equal(expect, fbp_crc_ccitt_16_slice8(0x5a5a, data + offset, length));
+#endif
+        }
+    }
+}
+
+static void crc32_variants(void **state) {
+    (void) state;
+    uint8_t data[520];
+    fill_random(data, sizeof(data));
+    for (uint32_t offset = 0; offset < 8; ++offset) {
+        for (uint32_t length = 0; length < (sizeof(data) - offset); ++length) {
+            uint32_t expect = fbp_crc32_slice1(0x5a5a5a5a, data + offset, length);
+            assert_int_equal(expect, fbp_crc32(0x5a5a5a5a, data + offset, length));
+            assert_int_equal(expect, fbp_crc32_pclmul(0x5a5a5a5a, data + offset, length));
+#if FBP_CRC_SLICE_BY >= 4
+            assert_int_equal(expect, fbp_crc32_slice4(0x5a5a5a5a, data + offset, length));
+#endif
+#if FBP_CRC_SLICE_BY >= 8
+            assert_int_equal(expect, fbp_crc32_slice8(0x5a5a5a5a, data + offset, length));
+#endif
+        }
+    }
+}
+
+static void crc64_variants(void **state) {
+    (void) state;
+    uint8_t data[520];
+    fill_random(data, sizeof(data));
+    for (uint32_t offset = 0; offset < 8; ++offset) {
+        for (uint32_t length = 0; length < (sizeof(data) - offset); ++length) {
+            uint64_t expect = fbp_crc64_slice1(0x5a5a5a5a5a5a5a5aULL, data + offset, length);
+            assert_true(expect == fbp_crc64(0x5a5a5a5a5a5a5a5aULL, data + offset, length));
+#if FBP_CRC_SLICE_BY >= 8
+            assert_true(expect == fbp_crc64_slice8(0x5a5a5a5a5a5a5a5aULL, data + offset, length));
+#endif
+        }
+    }
+}
+
 int main(void) {
     const struct CMUnitTest tests[] = {
             cmocka_unit_test(crc_ccitt_8_well_known),
             cmocka_unit_test(crc_ccitt_8_incremental),
             cmocka_unit_test(crc_ccitt_8_invalid_args),
+            cmocka_unit_test(crc_ccitt_8_variants),
 
             cmocka_unit_test(crc_ccitt_16_well_known),
             cmocka_unit_test(crc_ccitt_16_incremental),
             cmocka_unit_test(crc_ccitt_16_invalid_args),
+            cmocka_unit_test(crc_ccitt_16_variants),
 
             cmocka_unit_test(crc32_well_known),
             cmocka_unit_test(crc32_incremental),
             cmocka_unit_test(crc32_invalid_args),
+            cmocka_unit_test(crc32_variants),
+
+            cmocka_unit_test(crc64_well_known),
+            cmocka_unit_test(crc64_incremental),
+            cmocka_unit_test(crc64_invalid_args),
+            cmocka_unit_test(crc64_variants),
     };
 
     return cmocka_run_group_tests(tests, NULL, NULL);
@@ -0,0 +1,102 @@
+/*
+ * Copyright 2014-2021 Jetperch LLC
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ */
+
+/*
+ * Report the pubsub publish rate versus the number of topics for
+ * both fbp_pubsub_publish() and fbp_pubsub_publish_h().
+ *
+ * All topics are children of a single parent, which is the common
+ * host-side case of many device topics under a few parents.
+ *
+ * Usage: pubsub_benchmark
+ */
+
+#include "fitterbap/pubsub.h"
+#include "fitterbap/platform.h"
+#include "fitterbap/time.h"
+#include <stdio.h>
+#include <stdlib.h>
+
+
+#define DURATION (FBP_TIME_MILLISECOND * 250)
+#define PUBLISH_PER_PROCESS (64)
+
+static const uint32_t topic_counts[] = {1, 8, 32, 128, 512, 2048, 0};
+
+static void * bench_alloc(fbp_size_t size_bytes) {
+    return malloc((size_t) size_bytes);
+}
+
+static void bench_free(void * ptr) {
+    free(ptr);
+}
+
+static double benchmark(uint32_t topic_count, bool use_handle) {
+    char * topics = malloc(topic_count * FBP_PUBSUB_TOPIC_LENGTH_MAX);
+    struct fbp_pubsub_topic_s ** handles = malloc(topic_count * sizeof(struct fbp_pubsub_topic_s *));
+    if (!topics || !handles) {
+        free(topics);
+        free(handles);
+        return 0.0;
+    }
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize("h", 0);
+    for (uint32_t i = 0; i < topic_count; ++i) {
+        char * topic = topics + i * FBP_PUBSUB_TOPIC_LENGTH_MAX;
+        snprintf(topic, FBP_PUBSUB_TOPIC_LENGTH_MAX, "h/dev/%u", (unsigned int) i);
+        handles[i] = fbp_pubsub_topic_handle(ps, topic);
+    }
+
+    uint32_t idx = 0;
+    uint32_t value = 0;
+    uint64_t iterations = 0;
+    int64_t t_start = fbp_time_rel();
+    int64_t t_end = t_start + DURATION;
+    int64_t t_now = t_start;
+    while (t_now < t_end) {
+        for (int i = 0; i < PUBLISH_PER_PROCESS; ++i) {
+            if (use_handle) {
+                fbp_pubsub_publish_h(handles[idx], &fbp_union_u32_r(value++), NULL, NULL);
+            } else {
+                fbp_pubsub_publish(ps, topics + idx * FBP_PUBSUB_TOPIC_LENGTH_MAX, &fbp_union_u32_r(value++), NULL, NULL);
+            }
+            if (++idx >= topic_count) {
+                idx = 0;
+            }
+        }
+        fbp_pubsub_process(ps);
+        iterations += PUBLISH_PER_PROCESS;
+        t_now = fbp_time_rel();
+    }
+    double duration = FBP_TIME_TO_F64(t_now - t_start);
+    fbp_pubsub_finalize(ps);
+    free(topics);
+    free(handles);
+    return ((double) iterations) / duration;
+}
+
+int main(int argc, char * argv[]) {
+    (void) argc;
+    (void) argv;
+    fbp_allocator_set(bench_alloc, bench_free);
+    printf("FBP_PUBSUB_CHILD_INDEX_THRESHOLD=%d, FBP_PUBSUB_TOPIC_CACHE_SIZE=%d\n",
+           (int) FBP_PUBSUB_CHILD_INDEX_THRESHOLD, (int) FBP_PUBSUB_TOPIC_CACHE_SIZE);
+    printf("topics    publish M/s  publish_h M/s\n");
+    for (const uint32_t * count = topic_counts; *count; ++count) {
+        double rate = benchmark(*count, false);
+        double rate_h = benchmark(*count, true);
+        printf("%-6u %13.3f %14.3f\n", (unsigned int) *count, rate / 1e6, rate_h / 1e6);
+    }
+    return 0;
+}
@@ -0,0 +1,182 @@
+/*
+ * Copyright 2014-2021 Jetperch LLC
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+/*
+ * Compare the pubsub mutex queue with the lock-free SPSC queue.
+ *
+ * One producer thread publishes timestamps while a consumer thread runs
+ * fbp_pubsub_process().  The subscriber records the latency from publish
+ * to delivery.  The producer limits the number of messages in flight so
+ * that both modes measure the same queue depth.
+ *
+ * Usage: pubsub_spsc_benchmark [message_count]
+ */
+
+#include "fitterbap/pubsub.h"
+#include "fitterbap/ec.h"
+#include "fitterbap/os/mutex.h"
+#include "fitterbap/platform.h"
+#include <pthread.h>
+#include <sched.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+
+#define MESSAGE_COUNT_DEFAULT (1000000)
+#define SPSC_CAPACITY (1024)
+#define IN_FLIGHT_MAX (256)
+
+struct bench_s {
+    struct fbp_pubsub_s * ps;
+    uint32_t count;
+    uint32_t received;      // written by consumer
+    uint32_t done;          // written by producer
+    uint32_t full;          // publish retries, producer only
+    uint64_t * latency;     // nanoseconds, consumer only
+};
+
+static void * bench_alloc(fbp_size_t size_bytes) {
+    return malloc((size_t) size_bytes);
+}
+
+static void bench_free(void * ptr) {
+    free(ptr);
+}
+
+static uint64_t now_ns(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ((uint64_t) ts.tv_sec) * 1000000000LLU + (uint64_t) ts.tv_nsec;
+}
+
+static uint8_t on_value(void * user_data, const char * topic, const struct fbp_union_s * value) {
+    (void) topic;
+    struct bench_s * b = (struct bench_s *) user_data;
+    uint32_t idx = __atomic_load_n(&b->received, __ATOMIC_RELAXED);
+    if (idx < b->count) {
+        b->latency[idx] = now_ns() - value->value.u64;
+    }
+    __atomic_store_n(&b->received, idx + 1, __ATOMIC_RELEASE);
+    return 0;
+}
+
+static void * consumer(void * arg) {
+    struct bench_s * b = (struct bench_s *) arg;
+    while (!__atomic_load_n(&b->done, __ATOMIC_ACQUIRE)
+            || (__atomic_load_n(&b->received, __ATOMIC_ACQUIRE) < b->count)) {
+        fbp_pubsub_process(b->ps);
+        sched_yield();
+    }
+    return NULL;
+}
+
+static void * producer(void * arg) {
+    struct bench_s * b = (struct bench_s *) arg;
+    for (uint32_t i = 0; i < b->count; ++i) {
+        while ((i - __atomic_load_n(&b->received, __ATOMIC_ACQUIRE)) >= IN_FLIGHT_MAX) {
+            sched_yield();
+        }
+        while (FBP_ERROR_FULL == fbp_pubsub_publish(b->ps, "h/v", &fbp_union_u64(now_ns()), NULL, NULL)) {
+            ++b->full;
+            sched_yield();
+        }
+    }
+    __atomic_store_n(&b->done, 1, __ATOMIC_RELEASE);
+    return NULL;
+}
+
+static int u64_compare(const void * a, const void * b) {
+    uint64_t x = *((const uint64_t *) a);
+    uint64_t y = *((const uint64_t *) b);
+    return (x > y) - (x < y);
+}
+
+static double percentile_us(const uint64_t * sorted, uint32_t count, double p) {
+    uint32_t idx = (uint32_t) (p * (count - 1));
+    return sorted[idx] / 1000.0;
+}
+
+static int benchmark(const char * name, uint32_t count, bool spsc) {
+    struct bench_s b = {.count = count};
+    fbp_os_mutex_t mutex = NULL;
+    b.latency = malloc(count * sizeof(uint64_t));
+    b.ps = fbp_pubsub_initialize("h", 0);
+    if (!b.latency) {
+        return 1;
+    }
+    if (spsc) {
+        int32_t rc = fbp_pubsub_register_spsc(b.ps, SPSC_CAPACITY);
+        if (rc) {
+            printf("%-6s not supported: %d\n", name, (int) rc);
+            fbp_pubsub_finalize(b.ps);
+            free(b.latency);
+            return 0;
+        }
+    } else {
+        mutex = fbp_os_mutex_alloc();
+        fbp_pubsub_register_mutex(b.ps, mutex);
+    }
+    fbp_pubsub_subscribe(b.ps, "h/v", 0, on_value, &b);
+    fbp_pubsub_process(b.ps);
+
+    pthread_t consumer_thread;
+    pthread_t producer_thread;
+    uint64_t t_start = now_ns();
+    if (pthread_create(&consumer_thread, NULL, consumer, &b)) {
+        return 1;
+    }
+    if (pthread_create(&producer_thread, NULL, producer, &b)) {
+        return 1;
+    }
+    pthread_join(producer_thread, NULL);
+    pthread_join(consumer_thread, NULL);
+    double duration = (now_ns() - t_start) * 1e-9;
+
+    qsort(b.latency, count, sizeof(uint64_t), u64_compare);
+    printf("%-6s %10.3f %10.2f %10.2f %10.2f %10u\n", name,
+           count / duration / 1e6,
+           percentile_us(b.latency, count, 0.5),
+           percentile_us(b.latency, count, 0.99),
+           percentile_us(b.latency, count, 0.999),
+           (unsigned int) b.full);
+
+    fbp_pubsub_finalize(b.ps);
+    if (mutex) {
+        fbp_os_mutex_free(mutex);
+    }
+    free(b.latency);
+    return 0;
+}
+
+int main(int argc, char * argv[]) {
+    uint32_t count = MESSAGE_COUNT_DEFAULT;
+    if (argc > 1) {
+        count = (uint32_t) strtoul(argv[1], NULL, 0);
+    }
+    if (!count) {
+        printf("usage: pubsub_spsc_benchmark [message_count]\n");
+        return 1;
+    }
+    fbp_allocator_set(bench_alloc, bench_free);
+    printf("messages=%u, in_flight_max=%d, spsc_capacity=%d\n",
+           (unsigned int) count, IN_FLIGHT_MAX, SPSC_CAPACITY);
+    printf("mode         M/s    p50 us     p99 us   p99.9 us       full\n");
+    if (benchmark("mutex", count, false) || benchmark("spsc", count, true)) {
+        return 1;
+    }
+    return 0;
+}
@@ -208,6 +208,49 @@ static void test_str(void ** state) {
     fbp_pubsub_finalize(ps);
 }
 
+static void test_str_retained(void ** state) {
+    (void) state;
+    char msg[16] = "hello world";
+    struct fbp_union_s value = fbp_union_str(msg);
+    value.flags = FBP_UNION_FLAG_RETAIN;
+
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize("s", 128);
+    assert_non_null(ps);
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/hello/world", &value, NULL, NULL));
+    msg[0] = '!';  // overwrite local data, ensure copy occurred.
+    fbp_pubsub_process(ps);
+
+    // the topic owns a const copy of the retained value
+    struct fbp_union_s q;
+    assert_int_equal(0, fbp_pubsub_query(ps, "s/hello/world", &q));
+    assert_int_equal(FBP_UNION_STR, q.type);
+    assert_int_equal(FBP_UNION_FLAG_RETAIN | FBP_UNION_FLAG_CONST, q.flags & (FBP_UNION_FLAG_RETAIN | FBP_UNION_FLAG_CONST));
+    assert_string_equal("hello world", q.value.str);
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/hello/world", FBP_PUBSUB_SFLAG_RETAIN, on_pub, NULL));
+    expect_pub_cstr("s/hello/world", "hello world");
+    fbp_pubsub_process(ps);
+
+    // replace the retained value, which frees the previous copy
+    strcpy(msg, "there");
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/hello/world", &value, NULL, NULL));
+    expect_pub_cstr("s/hello/world", "there");
+    fbp_pubsub_process(ps);
+    assert_int_equal(0, fbp_pubsub_query(ps, "s/hello/world", &q));
+    assert_string_equal("there", q.value.str);
+
+    // copy into caller-owned storage
+    uint8_t buf[8];
+    assert_int_equal(FBP_ERROR_TOO_SMALL, fbp_pubsub_query_copy(ps, "s/hello/world", &q, buf, 4));
+    assert_int_equal(6, q.size);
+    assert_int_equal(0, fbp_pubsub_query_copy(ps, "s/hello/world", &q, buf, sizeof(buf)));
+    assert_ptr_equal(buf, q.value.str);
+    assert_string_equal("there", q.value.str);
+    assert_int_equal(0, fbp_pubsub_query_copy(ps, "s/hello/world", NULL, buf, sizeof(buf)));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_pubsub_query_copy(ps, "s/hello/missing", &q, buf, sizeof(buf)));
+
+    fbp_pubsub_finalize(ps);
+}
+
 static void test_str_but_too_big(void ** state) {
     (void) state;
     char msg[] = "hello world, this is a very long message that will exceed the buffer size";
@@ -377,6 +420,210 @@ static void test_retained_value_query(void ** state) {
     fbp_pubsub_finalize(ps);
 }
 
+static void test_many_children(void ** state) {
+    (void) state;
+    char topic[FBP_PUBSUB_TOPIC_LENGTH_MAX];
+    struct fbp_union_s value;
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize("s", 0);
+    for (uint32_t k = 0; k < 2; ++k) {  // second pass uses existing topics & cache
+        for (uint32_t i = 0; i < 200; ++i) {
+            snprintf(topic, sizeof(topic), "s/c/%u", (unsigned int) i);
+            assert_int_equal(0, fbp_pubsub_publish(ps, topic, &fbp_union_u32_r(i + k * 1000), NULL, NULL));
+        }
+        fbp_pubsub_process(ps);
+        for (uint32_t i = 0; i < 200; ++i) {
+            snprintf(topic, sizeof(topic), "s/c/%u", (unsigned int) i);
+            assert_int_equal(0, fbp_pubsub_query(ps, topic, &value));
+            assert_int_equal(i + k * 1000, value.value.u32);
+        }
+    }
+    assert_int_not_equal(0, fbp_pubsub_query(ps, "s/c/200", &value));
+
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/c/17", FBP_PUBSUB_SFLAG_RETAIN, on_pub, NULL));
+    expect_pub_u32("s/c/17", 1017);
+    fbp_pubsub_process(ps);
+    fbp_pubsub_finalize(ps);
+}
+
+static void test_topic_handle(void ** state) {
+    (void) state;
+    struct fbp_union_s value;
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize("s", 0);
+    struct fbp_pubsub_topic_s * h = fbp_pubsub_topic_handle(ps, "s/hello/u32");
+    assert_non_null(h);
+    assert_ptr_equal(h, fbp_pubsub_topic_handle(ps, "s/hello/u32"));
+    assert_string_equal("s/hello/u32", fbp_pubsub_topic_handle_name(h));
+    assert_null(fbp_pubsub_topic_handle(ps, ""));
+    assert_null(fbp_pubsub_topic_handle(ps, "s/hello/u32$"));
+    assert_null(fbp_pubsub_topic_handle(ps, "s/hello/u32?"));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_pubsub_publish_h(NULL, &fbp_union_u32_r(1), NULL, NULL));
+
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/hello", 0, on_pub, NULL));
+    assert_int_equal(0, fbp_pubsub_publish_h(h, &fbp_union_u32_r(42), NULL, NULL));
+    expect_pub_u32("s/hello/u32", 42);
+    fbp_pubsub_process(ps);
+    assert_int_equal(0, fbp_pubsub_query(ps, "s/hello/u32", &value));
+    assert_int_equal(42, value.value.u32);
+
+    assert_int_equal(0, fbp_pubsub_publish_h(h, &fbp_union_u32_r(43), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/hello/u32", &fbp_union_u32_r(44), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish_h(h, &fbp_union_cstr("hello"), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish_h(h, &fbp_union_u32_r(44), on_pub, NULL));  // skip source
+    expect_pub_u32("s/hello/u32", 43);
+    expect_pub_u32("s/hello/u32", 44);
+    expect_pub_cstr("s/hello/u32", "hello");
+    fbp_pubsub_process(ps);
+    fbp_pubsub_finalize(ps);
+}
+
+static void test_topic_handle_coalesce(void ** state) {
+    (void) state;
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize("s", 0);
+    struct fbp_pubsub_topic_s * h1 = fbp_pubsub_topic_handle(ps, "s/h/1");
+    struct fbp_pubsub_topic_s * h2 = fbp_pubsub_topic_handle(ps, "s/h/2");
+    fbp_pubsub_topic_coalesce(h1, true);
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/h", 0, on_pub, NULL));
+    fbp_pubsub_process(ps);
+
+    for (uint32_t i = 1; i <= 5; ++i) {
+        assert_int_equal(0, fbp_pubsub_publish_h(h1, &fbp_union_u32_r(i), NULL, NULL));
+        assert_int_equal(0, fbp_pubsub_publish_h(h2, &fbp_union_u32_r(i), NULL, NULL));
+    }
+    assert_int_equal(0, fbp_pubsub_publish_h(h1, &fbp_union_u32(10), NULL, NULL));  // unretained
+    assert_int_equal(4, fbp_pubsub_coalesced(ps));
+    expect_pub_u32("s/h/1", 5);  // keeps first queue position
+    for (uint32_t i = 1; i <= 5; ++i) {
+        expect_pub_u32("s/h/2", i);
+    }
+    expect_pub_u32("s/h/1", 10);
+    fbp_pubsub_process(ps);
+
+    // after processing, the next value queues normally
+    assert_int_equal(0, fbp_pubsub_publish_h(h1, &fbp_union_u32_r(6), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish_h(h1, &fbp_union_u32_r(7), NULL, NULL));
+    assert_int_equal(5, fbp_pubsub_coalesced(ps));
+    expect_pub_u32("s/h/1", 7);
+    fbp_pubsub_process(ps);
+
+    fbp_pubsub_topic_coalesce(h1, false);
+    assert_int_equal(0, fbp_pubsub_publish_h(h1, &fbp_union_u32_r(8), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish_h(h1, &fbp_union_u32_r(9), NULL, NULL));
+    expect_pub_u32("s/h/1", 8);
+    expect_pub_u32("s/h/1", 9);
+    fbp_pubsub_process(ps);
+    assert_int_equal(5, fbp_pubsub_coalesced(ps));
+    fbp_pubsub_finalize(ps);
+}
+
+static uint8_t on_republish(void * user_data, const char * topic, const struct fbp_union_s * value) {
+    (void) topic;
+    (void) value;
+    struct fbp_pubsub_s * ps = (struct fbp_pubsub_s *) user_data;
+    char str[] = "copy";  // not const, so pubsub must copy
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/r", &fbp_union_str(str), NULL, NULL));
+    return 0;
+}
+
+static void test_spsc(void ** state) {
+    (void) state;
+    // 19 characters + null terminator = 20 bytes
+    char str[] = "0123456789abcdefghi";
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize("s", 64);
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_pubsub_register_spsc(ps, 3));
+    assert_int_equal(0, fbp_pubsub_register_spsc(ps, 4));
+    assert_int_equal(FBP_ERROR_BUSY, fbp_pubsub_register_spsc(ps, 4));
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/h", 0, on_pub, NULL));
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/r", 0, on_pub, NULL));
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/x", 0, on_republish, ps));
+    fbp_pubsub_process(ps);
+
+    // message ring full
+    for (uint32_t i = 0; i < 4; ++i) {
+        assert_int_equal(0, fbp_pubsub_publish(ps, "s/h/u32", &fbp_union_u32(i), NULL, NULL));
+        expect_pub_u32("s/h/u32", i);
+    }
+    assert_int_equal(FBP_ERROR_FULL, fbp_pubsub_publish(ps, "s/h/u32", &fbp_union_u32(4), NULL, NULL));
+    fbp_pubsub_process(ps);
+
+    // payload buffer full, then wrap
+    for (uint32_t i = 0; i < 3; ++i) {
+        assert_int_equal(0, fbp_pubsub_publish(ps, "s/h/str", &fbp_union_str(str), NULL, NULL));
+        expect_pub_cstr("s/h/str", str);
+    }
+    assert_int_equal(FBP_ERROR_NOT_ENOUGH_MEMORY, fbp_pubsub_publish(ps, "s/h/str", &fbp_union_str(str), NULL, NULL));
+    fbp_pubsub_process(ps);
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/h/str", &fbp_union_str(str), NULL, NULL));
+    expect_pub_cstr("s/h/str", str);
+    fbp_pubsub_process(ps);
+
+    // publish from within process
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/x", &fbp_union_u32(1), NULL, NULL));
+    expect_pub_cstr("s/r", "copy");
+    fbp_pubsub_process(ps);
+    fbp_pubsub_finalize(ps);
+}
+
+static void test_pool(void ** state) {
+    (void) state;
+    struct fbp_pubsub_status_s status;
+    struct fbp_pubsub_config_s config = {
+        .message_count = 4,
+        .subscriber_count = 3,
+    };
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize_config("s", 0, &config);
+    fbp_pubsub_status(ps, &status);
+    assert_int_equal(4, status.message.size);
+    assert_int_equal(3, status.subscriber.size);
+    assert_int_equal(2, status.subscriber.in_use);  // topic list
+
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/h", 0, on_pub, NULL));
+    fbp_pubsub_process(ps);
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/x", 0, on_pub, NULL));
+    fbp_pubsub_process(ps);  // subscriber pool exhausted
+    fbp_pubsub_status(ps, &status);
+    assert_int_equal(0, status.message.in_use);
+    assert_int_equal(1, status.message.high_water);
+    assert_int_equal(3, status.subscriber.in_use);
+    assert_int_equal(1, status.subscriber.alloc_fail);
+
+    for (uint32_t i = 0; i < 4; ++i) {
+        assert_int_equal(0, fbp_pubsub_publish(ps, "s/h/u32", &fbp_union_u32(i), NULL, NULL));
+        expect_pub_u32("s/h/u32", i);
+    }
+    assert_int_equal(FBP_ERROR_NOT_ENOUGH_MEMORY, fbp_pubsub_publish(ps, "s/h/u32", &fbp_union_u32(4), NULL, NULL));
+    fbp_pubsub_status(ps, &status);
+    assert_int_equal(4, status.message.in_use);
+    assert_int_equal(4, status.message.high_water);
+    assert_int_equal(1, status.message.alloc_fail);
+    fbp_pubsub_process(ps);
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/h/u32", &fbp_union_u32(5), NULL, NULL));
+    expect_pub_u32("s/h/u32", 5);
+    fbp_pubsub_process(ps);
+
+    assert_int_equal(0, fbp_pubsub_unsubscribe(ps, "s/h", on_pub, NULL));
+    fbp_pubsub_status(ps, &status);
+    assert_int_equal(0, status.message.in_use);
+    assert_int_equal(2, status.subscriber.in_use);
+    fbp_pubsub_finalize(ps);
+}
+
+static void test_pool_heap_status(void ** state) {
+    (void) state;
+    struct fbp_pubsub_status_s status;
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize("s", 0);
+    for (uint32_t i = 0; i < 3; ++i) {
+        assert_int_equal(0, fbp_pubsub_publish(ps, "s/h/u32", &fbp_union_u32(i), NULL, NULL));
+    }
+    fbp_pubsub_process(ps);
+    fbp_pubsub_status(ps, &status);
+    assert_int_equal(0, status.message.size);
+    assert_int_equal(0, status.message.in_use);
+    assert_int_equal(3, status.message.high_water);
+    assert_int_equal(0, status.subscriber.size);
+    assert_int_equal(2, status.subscriber.in_use);
+    fbp_pubsub_finalize(ps);
+}
+
 static void test_do_not_update_same(void ** state) {
     (void) state;
     struct fbp_pubsub_s * ps = fbp_pubsub_initialize("s", 0);
@@ -410,6 +657,129 @@ static void test_unsubscribe_from_all(void ** state) {
     fbp_pubsub_finalize(ps);
 }
 
+static void test_wildcard(void ** state) {
+    (void) state;
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize("s", 0);
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_pubsub_subscribe(ps, "s/#/v", 0, on_pub, NULL));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_pubsub_subscribe(ps, "s/v+", 0, on_pub, NULL));
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/a/v", &fbp_union_u32_r(1), NULL, NULL));
+    fbp_pubsub_process(ps);
+
+    // subscribe gets matching retained values
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/+/v", FBP_PUBSUB_SFLAG_RETAIN, on_pub, NULL));
+    expect_pub_u32("s/a/v", 1);
+    fbp_pubsub_process(ps);
+
+    expect_pub_u32("s/b/v", 2);
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/b/v", &fbp_union_u32_r(2), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/b/w", &fbp_union_u32_r(3), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/b/v/x", &fbp_union_u32_r(4), NULL, NULL));
+    fbp_pubsub_process(ps);
+
+    // new patterns apply to topics with cached pattern matches
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "+/b/#", 0, on_pub, NULL));
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/a/#", 0, on_pub, NULL));
+    fbp_pubsub_process(ps);
+    expect_pub_u32("s/b/v", 5);  // s/+/v
+    expect_pub_u32("s/b/v", 5);  // +/b/#
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/b/v", &fbp_union_u32_r(5), NULL, NULL));
+    expect_pub_u32("s/b/v/x", 6);  // +/b/#
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/b/v/x", &fbp_union_u32_r(6), NULL, NULL));
+    expect_pub_u32("s/a/v", 7);  // s/a/#
+    expect_pub_u32("s/a/v", 7);  // s/+/v
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/a/v", &fbp_union_u32_r(7), NULL, NULL));
+    fbp_pubsub_process(ps);
+
+    assert_int_equal(0, fbp_pubsub_unsubscribe(ps, "s/+/v", on_pub, NULL));
+    assert_int_equal(FBP_ERROR_NOT_FOUND, fbp_pubsub_unsubscribe(ps, "s/+/v", on_pub, NULL));
+    expect_pub_u32("s/b/v", 8);  // +/b/#
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/b/v", &fbp_union_u32_r(8), NULL, NULL));
+    fbp_pubsub_process(ps);
+
+    assert_int_equal(0, fbp_pubsub_unsubscribe_from_all(ps, on_pub, NULL));
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/b/v", &fbp_union_u32_r(9), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/a/v", &fbp_union_u32_r(9), NULL, NULL));
+    fbp_pubsub_process(ps);
+
+    // trailing separator is ignored
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "s/+/v/", 0, on_pub, NULL));
+    fbp_pubsub_process(ps);
+    expect_pub_u32("s/b/v", 10);
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/b/v", &fbp_union_u32_r(10), NULL, NULL));
+    fbp_pubsub_process(ps);
+    assert_int_equal(0, fbp_pubsub_unsubscribe(ps, "s/+/v", on_pub, NULL));
+    fbp_pubsub_finalize(ps);
+}
+
+static void test_snapshot(void ** state) {
+    (void) state;
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize("s", 0);
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/a/v1", &fbp_union_u32_r(1), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/a/v2", &fbp_union_u32(2), NULL, NULL));  // not retained
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/a/v3/x", &fbp_union_u32_r(3), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/b", &fbp_union_u32_r(4), NULL, NULL));
+    fbp_pubsub_process(ps);
+
+    expect_pub_u32("s/a/v1", 1);
+    expect_pub_u32("s/a/v3/x", 3);
+    assert_int_equal(0, fbp_pubsub_snapshot(ps, "s/a", on_pub, NULL));
+    expect_pub_u32("s/a/v1", 1);
+    expect_pub_u32("s/a/v3/x", 3);
+    assert_int_equal(0, fbp_pubsub_snapshot(ps, "s/a/", on_pub, NULL));
+    assert_int_equal(FBP_ERROR_NOT_FOUND, fbp_pubsub_snapshot(ps, "s/c", on_pub, NULL));
+    assert_int_equal(FBP_ERROR_PARAMETER_INVALID, fbp_pubsub_snapshot(ps, "s/a", NULL, NULL));
+    fbp_pubsub_finalize(ps);
+}
+
+static void test_query(void ** state) {
+    (void) state;
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize("s", 0);
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/a/v1", &fbp_union_u32_r(1), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/a/v2", &fbp_union_u32_r(2), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/b", &fbp_union_u32_r(3), NULL, NULL));
+    fbp_pubsub_process(ps);
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "", FBP_PUBSUB_SFLAG_RSP | FBP_PUBSUB_SFLAG_NOPUB, on_pub, NULL));
+    fbp_pubsub_process(ps);
+
+    expect_pub_u32("s/a/v1?", 1);
+    expect_pub_u32("s/a/v2?", 2);
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/a/?", &fbp_union_null(), NULL, NULL));
+    fbp_pubsub_process(ps);
+
+    expect_pub_u32("s/b?", 3);
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/b?", &fbp_union_null(), NULL, NULL));
+    fbp_pubsub_process(ps);
+
+    expect_pub_u32("s/a/v1?", 1);
+    expect_pub_u32("s/a/v2?", 2);
+    expect_pub_u32("s/b?", 3);
+    assert_int_equal(0, fbp_pubsub_publish(ps, "?", &fbp_union_null(), NULL, NULL));
+    fbp_pubsub_process(ps);
+
+    // responses from other instances are forwarded
+    expect_pub_u32("h/v?", 4);
+    assert_int_equal(0, fbp_pubsub_publish(ps, "h/v?", &fbp_union_u32_r(4), NULL, NULL));
+    fbp_pubsub_process(ps);
+    fbp_pubsub_finalize(ps);
+}
+
+static void test_query_req_forward(void ** state) {
+    (void) state;
+    struct fbp_pubsub_s * ps = fbp_pubsub_initialize("s", 0);
+    assert_int_equal(0, fbp_pubsub_subscribe(ps, "", FBP_PUBSUB_SFLAG_REQ | FBP_PUBSUB_SFLAG_NOPUB, on_pub, NULL));
+    fbp_pubsub_process(ps);
+
+    expect_pub_null("?");
+    assert_int_equal(0, fbp_pubsub_publish(ps, "?", &fbp_union_null(), NULL, NULL));
+    expect_pub_null("h/?");
+    assert_int_equal(0, fbp_pubsub_publish(ps, "h/?", &fbp_union_null(), NULL, NULL));
+    expect_pub_null("h/v?");
+    assert_int_equal(0, fbp_pubsub_publish(ps, "h/v?", &fbp_union_null(), NULL, NULL));
+    assert_int_equal(0, fbp_pubsub_publish(ps, "s/?", &fbp_union_null(), NULL, NULL));  // owned
+    fbp_pubsub_process(ps);
+    fbp_pubsub_finalize(ps);
+}
+
 static void test_unretained(void ** state) {
     (void) state;
     struct fbp_union_s value;
@@ -640,6 +1010,7 @@ int main(void) {
             cmocka_unit_test_setup_teardown(test_initialize, setup, teardown),
             cmocka_unit_test_setup_teardown(test_cstr, setup, teardown),
             cmocka_unit_test_setup_teardown(test_str, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_str_retained, setup, teardown),
             cmocka_unit_test_setup_teardown(test_str_but_too_big, setup, teardown),
             cmocka_unit_test_setup_teardown(test_str_full_buffer, setup, teardown),
             cmocka_unit_test_setup_teardown(test_integers, setup, teardown),
@@ -649,9 +1020,19 @@ int main(void) {
             cmocka_unit_test_setup_teardown(test_subscribe_first, setup, teardown),
             cmocka_unit_test_setup_teardown(test_on_publish_cbk, setup, teardown),
             cmocka_unit_test_setup_teardown(test_retained_value_query, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_many_children, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_topic_handle, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_topic_handle_coalesce, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_spsc, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_pool, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_pool_heap_status, setup, teardown),
             cmocka_unit_test_setup_teardown(test_do_not_update_same, setup, teardown),
             cmocka_unit_test_setup_teardown(test_unsubscribe, setup, teardown),
             cmocka_unit_test_setup_teardown(test_unsubscribe_from_all, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_wildcard, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_snapshot, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_query, setup, teardown),
+            cmocka_unit_test_setup_teardown(test_query_req_forward, setup, teardown),
             cmocka_unit_test_setup_teardown(test_unretained, setup, teardown),
             cmocka_unit_test_setup_teardown(test_nopub, setup, teardown),
             cmocka_unit_test_setup_teardown(test_meta_when_not_req_or_rsp_subscriber, setup, teardown),